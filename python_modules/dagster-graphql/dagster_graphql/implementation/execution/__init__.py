@@ -216,6 +216,42 @@ def get_chunk_size() -> int:
     )
 
 
+def get_live_event_batch_size() -> int:
+    """Maximum number of live events sent in one subscription message."""
+    return int(os.getenv("DAGSTER_UI_LIVE_EVENT_BATCH_SIZE", "100"))
+
+
+def get_live_event_batch_interval() -> float:
+    """Seconds to wait for more live events before sending the ones received."""
+    return int(os.getenv("DAGSTER_UI_LIVE_EVENT_BATCH_INTERVAL_MS", "50")) / 1000
+
+
+async def _gen_batches(
+    queue: "asyncio.Queue[Tuple[Any, Any]]",
+    max_batch_size: int,
+    max_batch_interval: float,
+) -> AsyncIterator[Sequence[Tuple[Any, Any]]]:
+    """Yield the items put on the queue in batches. A batch is yielded once it holds
+    max_batch_size items, or max_batch_interval seconds after its first item arrived.
+    """
+    loop = asyncio.get_event_loop()
+    while True:
+        batch = [await queue.get()]
+        deadline = loop.time() + max_batch_interval
+        while len(batch) < max_batch_size:
+            if not queue.empty():
+                batch.append(queue.get_nowait())
+                continue
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        yield batch
+
+
 async def gen_events_for_run(
     graphene_info: "ResolveInfo",
     run_id: str,
@@ -246,6 +282,8 @@ async def gen_events_for_run(
         return
 
     run = record.dagster_run
+    # the record is loaded once per subscription, so every message shares its resolved run
+    graphene_run = GrapheneRun(record)
 
     dont_send_past_records = False
     # special sigil cursor that signals to start watching for updates only after the current point in time
@@ -266,7 +304,7 @@ async def gen_events_for_run(
         )
         if not dont_send_past_records:
             yield GraphenePipelineRunLogsSubscriptionSuccess(
-                run=GrapheneRun(record),
+                run=graphene_run,
                 messages=[
                     from_event_record(record.event_log_entry, run.job_name)
                     for record in connection.records
@@ -283,16 +321,17 @@ async def gen_events_for_run(
     def _enqueue(event, cursor):
         loop.call_soon_threadsafe(queue.put_nowait, (event, cursor))
 
-    # watch for live events
+    # watch for live events, coalescing the events that arrive close together into one message
     instance.watch_event_logs(run_id, after_cursor, _enqueue)
     try:
-        while True:
-            event, cursor = await queue.get()
+        async for batch in _gen_batches(
+            queue, get_live_event_batch_size(), get_live_event_batch_interval()
+        ):
             yield GraphenePipelineRunLogsSubscriptionSuccess(
-                run=GrapheneRun(record),
-                messages=[from_event_record(event, run.job_name)],
+                run=graphene_run,
+                messages=[from_event_record(event, run.job_name) for event, _cursor in batch],
                 hasMorePastEvents=False,
-                cursor=cursor,
+                cursor=batch[-1][1],
             )
     finally:
         instance.end_watch_event_logs(run_id, _enqueue)
@@ -24,6 +24,7 @@
 )
 from dagster._core.definitions.asset_graph_differ import AssetGraphDiffer
 from dagster._core.definitions.data_time import CachingDataTimeResolver
+from dagster._core.definitions.multi_dimensional_partitions import MULTIPARTITION_KEY_DELIMITER
 from dagster._core.definitions.partition import (
     CachingDynamicPartitionsLoader,
     PartitionsDefinition,
@@ -56,6 +57,7 @@
 from dagster._core.workspace.context import WorkspaceRequestContext
 
 from dagster_graphql.implementation.loader import CrossRepoAssetDependedByLoader, StaleStatusLoader
+from dagster_graphql.implementation.resolver_cache import get_cached_resolver_result
 
 if TYPE_CHECKING:
     from ..schema.asset_graph import GrapheneAssetNode, GrapheneAssetNodeDefinitionCollision
@@ -197,24 +199,9 @@ def get_asset_node_definition_collisions(
     return results
 
 
-def get_asset_nodes_by_asset_key(
-    graphene_info: "ResolveInfo", asset_keys: Optional[Set[AssetKey]] = None
-) -> Mapping[AssetKey, "GrapheneAssetNode"]:
-    """If multiple repositories have asset nodes for the same asset key, chooses the asset node that
-    has an op.
-    """
-    from ..schema.asset_graph import GrapheneAssetNode
-    from .asset_checks_loader import AssetChecksLoader
-
-    depended_by_loader = CrossRepoAssetDependedByLoader(context=graphene_info.context)
-
-    stale_status_loader = StaleStatusLoader(
-        instance=graphene_info.context.instance,
-        asset_graph=lambda: graphene_info.context.asset_graph,
-    )
-
-    dynamic_partitions_loader = CachingDynamicPartitionsLoader(graphene_info.context.instance)
-
+def _choose_external_asset_nodes(
+    graphene_info: "ResolveInfo", asset_keys: Optional[Set[AssetKey]]
+) -> Mapping[AssetKey, Tuple[CodeLocation, ExternalRepository, ExternalAssetNode]]:
     asset_nodes_by_asset_key: Dict[
         AssetKey, Tuple[CodeLocation, ExternalRepository, ExternalAssetNode]
     ] = {}
@@ -234,6 +221,37 @@ def get_asset_nodes_by_asset_key(
                     external_asset_node,
                 )
 
+    return asset_nodes_by_asset_key
+
+
+def get_asset_nodes_by_asset_key(
+    graphene_info: "ResolveInfo", asset_keys: Optional[Set[AssetKey]] = None
+) -> Mapping[AssetKey, "GrapheneAssetNode"]:
+    """If multiple repositories have asset nodes for the same asset key, chooses the asset node that
+    has an op.
+    """
+    from ..schema.asset_graph import GrapheneAssetNode
+    from .asset_checks_loader import AssetChecksLoader
+
+    depended_by_loader = CrossRepoAssetDependedByLoader(context=graphene_info.context)
+
+    stale_status_loader = StaleStatusLoader(
+        instance=graphene_info.context.instance,
+        asset_graph=lambda: graphene_info.context.asset_graph,
+    )
+
+    dynamic_partitions_loader = CachingDynamicPartitionsLoader(graphene_info.context.instance)
+
+    # Choosing the nodes walks every asset node of the workspace, so share the choice with other
+    # requests until the workspace is reloaded.
+    asset_nodes_by_asset_key = get_cached_resolver_result(
+        graphene_info,
+        "assetNodesByAssetKey",
+        frozenset(asset_keys) if asset_keys is not None else None,
+        lambda: _choose_external_asset_nodes(graphene_info, asset_keys),
+        depends_on_event_log=False,
+    )
+
     asset_checks_loader = AssetChecksLoader(
         context=graphene_info.context,
         asset_keys=asset_nodes_by_asset_key.keys(),
@@ -581,6 +599,58 @@ def build_partition_statuses(
         check.failed("Should not reach this point")
 
 
+def _secondary_bitsets_by_primary_index(
+    partitions_subset: PartitionsSubset,
+    partitions_def: MultiPartitionsDefinition,
+    primary_index: Mapping[str, int],
+    secondary_index: Dict[str, int],
+    secondary_keys: List[str],
+) -> List[int]:
+    """Index a subset of a multipartitions definition as a 2D matrix of bits: one integer per
+    primary dimension key, whose bit j is set if the subset holds the j-th secondary dimension key.
+
+    Secondary keys that are not in secondary_index, e.g. removed dynamic partitions, are appended to
+    secondary_keys and indexed too. Keys of primary dimension keys that are not in primary_index
+    are ignored.
+    """
+    dimension_names = [dim.name for dim in partitions_def.partitions_defs]
+    primary_position = dimension_names.index(partitions_def.primary_dimension.name)
+    secondary_position = 1 - primary_position
+
+    bits_by_primary_index: Dict[int, List[int]] = defaultdict(list)
+    for partition_key in partitions_subset.get_partition_keys():
+        dimension_keys = partition_key.split(MULTIPARTITION_KEY_DELIMITER)
+        if len(dimension_keys) != len(dimension_names):
+            # raises with an informative error
+            partitions_def.get_partition_key_from_str(partition_key)
+        primary_idx = primary_index.get(dimension_keys[primary_position])
+        if primary_idx is None:
+            continue
+        secondary_key = dimension_keys[secondary_position]
+        secondary_idx = secondary_index.get(secondary_key)
+        if secondary_idx is None:
+            secondary_idx = secondary_index[secondary_key] = len(secondary_keys)
+            secondary_keys.append(secondary_key)
+        bits_by_primary_index[primary_idx].append(secondary_idx)
+
+    bitsets = [0] * len(primary_index)
+    for primary_idx, secondary_idxs in bits_by_primary_index.items():
+        bitset = 0
+        for secondary_idx in secondary_idxs:
+            bitset |= 1 << secondary_idx
+        bitsets[primary_idx] = bitset
+    return bitsets
+
+
+def _keys_in_bitset(keys: Sequence[str], bitset: int) -> List[str]:
+    result = []
+    while bitset:
+        lowest_bit = bitset & -bitset
+        result.append(keys[lowest_bit.bit_length() - 1])
+        bitset ^= lowest_bit
+    return result
+
+
 def get_2d_run_length_encoded_partitions(
     dynamic_partitions_store: DynamicPartitionsStore,
     materialized_partitions_subset: PartitionsSubset,
@@ -601,107 +671,92 @@ def get_2d_run_length_encoded_partitions(
     primary_dim = partitions_def.primary_dimension
     secondary_dim = partitions_def.secondary_dimension
 
-    dim2_materialized_partition_subset_by_dim1: Dict[str, PartitionsSubset] = defaultdict(
-        lambda: secondary_dim.partitions_def.empty_subset()
-    )
-    for partition_key in materialized_partitions_subset.get_partition_keys():
-        multipartition_key = partitions_def.get_partition_key_from_str(partition_key)
-        dim2_materialized_partition_subset_by_dim1[
-            multipartition_key.keys_by_dimension[primary_dim.name]
-        ] = dim2_materialized_partition_subset_by_dim1[
-            multipartition_key.keys_by_dimension[primary_dim.name]
-        ].with_partition_keys([multipartition_key.keys_by_dimension[secondary_dim.name]])
-
-    dim2_failed_partition_subset_by_dim1: Dict[str, PartitionsSubset] = defaultdict(
-        lambda: secondary_dim.partitions_def.empty_subset()
+    dim1_keys = primary_dim.partitions_def.get_partition_keys(
+        dynamic_partitions_store=dynamic_partitions_store
     )
-    for partition_key in failed_partitions_subset.get_partition_keys():
-        multipartition_key = partitions_def.get_partition_key_from_str(partition_key)
-        dim2_failed_partition_subset_by_dim1[
-            multipartition_key.keys_by_dimension[primary_dim.name]
-        ] = dim2_failed_partition_subset_by_dim1[
-            multipartition_key.keys_by_dimension[primary_dim.name]
-        ].with_partition_keys([multipartition_key.keys_by_dimension[secondary_dim.name]])
-
-    dim2_in_progress_partition_subset_by_dim1: Dict[str, PartitionsSubset] = defaultdict(
-        lambda: secondary_dim.partitions_def.empty_subset()
+    dim2_keys = list(
+        secondary_dim.partitions_def.get_partition_keys(
+            dynamic_partitions_store=dynamic_partitions_store
+        )
     )
-    for partition_key in in_progress_partitions_subset.get_partition_keys():
-        multipartition_key = partitions_def.get_partition_key_from_str(partition_key)
-        dim2_in_progress_partition_subset_by_dim1[
-            multipartition_key.keys_by_dimension[primary_dim.name]
-        ] = dim2_in_progress_partition_subset_by_dim1[
-            multipartition_key.keys_by_dimension[primary_dim.name]
-        ].with_partition_keys([multipartition_key.keys_by_dimension[secondary_dim.name]])
-
-    materialized_2d_ranges = []
+    if len(dim1_keys) == 0 or len(dim2_keys) == 0:
+        return GrapheneMultiPartitionStatuses(ranges=[], primaryDimensionName=primary_dim.name)
 
-    dim1_keys = primary_dim.partitions_def.get_partition_keys(
-        dynamic_partitions_store=dynamic_partitions_store
+    # statuses as a matrix of primary dimension index x secondary dimension index, with the
+    # secondary dimension of each primary key packed into the bits of an integer
+    dim1_index = {key: idx for idx, key in enumerate(dim1_keys)}
+    dim2_index = {key: idx for idx, key in enumerate(dim2_keys)}
+    materialized_bitsets, failed_bitsets, in_progress_bitsets = (
+        _secondary_bitsets_by_primary_index(
+            partitions_subset, partitions_def, dim1_index, dim2_index, dim2_keys
+        )
+        for partitions_subset in (
+            materialized_partitions_subset,
+            failed_partitions_subset,
+            in_progress_partitions_subset,
+        )
     )
-    unevaluated_idx = 0
-    range_start_idx = 0  # pointer to first dim1 partition with same dim2 materialization status
 
-    if (
-        len(dim1_keys) == 0
-        or len(
-            secondary_dim.partitions_def.get_partition_keys(
-                dynamic_partitions_store=dynamic_partitions_store
+    # secondary dimension statuses are built once per distinct combination of subsets
+    secondary_dim_statuses_by_bitsets = {}
+
+    def _get_secondary_dim_statuses(bitsets: Tuple[int, int, int]):
+        if bitsets not in secondary_dim_statuses_by_bitsets:
+            secondary_dim_statuses_by_bitsets[bitsets] = build_partition_statuses(
+                dynamic_partitions_store,
+                *(
+                    secondary_dim.partitions_def.empty_subset().with_partition_keys(
+                        _keys_in_bitset(dim2_keys, bitset)
+                    )
+                    for bitset in bitsets
+                ),
+                secondary_dim.partitions_def,
             )
-        )
-        == 0
-    ):
-        return GrapheneMultiPartitionStatuses(ranges=[], primaryDimensionName=primary_dim.name)
+        return secondary_dim_statuses_by_bitsets[bitsets]
 
-    while unevaluated_idx <= len(dim1_keys):
-        if (
-            unevaluated_idx == len(dim1_keys)
-            or dim2_materialized_partition_subset_by_dim1[dim1_keys[unevaluated_idx]]
-            != dim2_materialized_partition_subset_by_dim1[dim1_keys[range_start_idx]]
-            or dim2_failed_partition_subset_by_dim1[dim1_keys[unevaluated_idx]]
-            != dim2_failed_partition_subset_by_dim1[dim1_keys[range_start_idx]]
-            or dim2_in_progress_partition_subset_by_dim1[dim1_keys[unevaluated_idx]]
-            != dim2_in_progress_partition_subset_by_dim1[dim1_keys[range_start_idx]]
+    materialized_2d_ranges = []
+    range_start_idx = 0  # first dim1 partition with the same dim2 statuses
+    for unevaluated_idx in range(1, len(dim1_keys) + 1):
+        range_bitsets = (
+            materialized_bitsets[range_start_idx],
+            failed_bitsets[range_start_idx],
+            in_progress_bitsets[range_start_idx],
+        )
+        if unevaluated_idx < len(dim1_keys) and range_bitsets == (
+            materialized_bitsets[unevaluated_idx],
+            failed_bitsets[unevaluated_idx],
+            in_progress_bitsets[unevaluated_idx],
         ):
-            # Add new multipartition range if we've reached the end of the dim1 keys or if the
-            # second dimension subsets are different than for the previous dim1 key
-            if (
-                len(dim2_materialized_partition_subset_by_dim1[dim1_keys[range_start_idx]]) > 0
-                or len(dim2_failed_partition_subset_by_dim1[dim1_keys[range_start_idx]]) > 0
-                or len(dim2_in_progress_partition_subset_by_dim1[dim1_keys[range_start_idx]]) > 0
-            ):
-                # Do not add to materialized_2d_ranges if the dim2 partition subset is empty
-                start_key = dim1_keys[range_start_idx]
-                end_key = dim1_keys[unevaluated_idx - 1]
-
-                primary_partitions_def = primary_dim.partitions_def
-                if isinstance(primary_partitions_def, TimeWindowPartitionsDefinition):
-                    time_windows = cast(
-                        TimeWindowPartitionsDefinition, primary_partitions_def
-                    ).time_windows_for_partition_keys(frozenset([start_key, end_key]))
-                    start_time = time_windows[0].start.timestamp()
-                    end_time = time_windows[-1].end.timestamp()
-                else:
-                    start_time = None
-                    end_time = None
-
-                materialized_2d_ranges.append(
-                    GrapheneMultiPartitionRangeStatuses(
-                        primaryDimStartKey=start_key,
-                        primaryDimEndKey=end_key,
-                        primaryDimStartTime=start_time,
-                        primaryDimEndTime=end_time,
-                        secondaryDim=build_partition_statuses(
-                            dynamic_partitions_store,
-                            dim2_materialized_partition_subset_by_dim1[start_key],
-                            dim2_failed_partition_subset_by_dim1[start_key],
-                            dim2_in_progress_partition_subset_by_dim1[start_key],
-                            secondary_dim.partitions_def,
-                        ),
-                    )
+            continue
+
+        # Add new multipartition range if we've reached the end of the dim1 keys or if the
+        # second dimension subsets are different than for the previous dim1 key.
+        # Do not add a range if all of its dim2 partition subsets are empty
+        if any(range_bitsets):
+            start_key = dim1_keys[range_start_idx]
+            end_key = dim1_keys[unevaluated_idx - 1]
+
+            primary_partitions_def = primary_dim.partitions_def
+            if isinstance(primary_partitions_def, TimeWindowPartitionsDefinition):
+                time_windows = cast(
+                    TimeWindowPartitionsDefinition, primary_partitions_def
+                ).time_windows_for_partition_keys(frozenset([start_key, end_key]))
+                start_time = time_windows[0].start.timestamp()
+                end_time = time_windows[-1].end.timestamp()
+            else:
+                start_time = None
+                end_time = None
+
+            materialized_2d_ranges.append(
+                GrapheneMultiPartitionRangeStatuses(
+                    primaryDimStartKey=start_key,
+                    primaryDimEndKey=end_key,
+                    primaryDimStartTime=start_time,
+                    primaryDimEndTime=end_time,
+                    secondaryDim=_get_secondary_dim_statuses(range_bitsets),
                 )
-            range_start_idx = unevaluated_idx
-        unevaluated_idx += 1
+            )
+        range_start_idx = unevaluated_idx
 
     return GrapheneMultiPartitionStatuses(
         ranges=materialized_2d_ranges, primaryDimensionName=primary_dim.name
@@ -6,6 +6,7 @@
     Dict,
     List,
     Mapping,
+    NamedTuple,
     Optional,
     Sequence,
     Tuple,
@@ -26,6 +27,7 @@
 from .external import ensure_valid_config, get_external_job_or_raise
 
 if TYPE_CHECKING:
+    from dagster._core.events.log import EventLogEntry
     from dagster._core.storage.batch_asset_record_loader import BatchAssetRecordLoader
 
     from ..schema.asset_graph import GrapheneAssetLatestInfo
@@ -173,26 +175,69 @@ def get_assets_latest_info(
     step_keys_by_asset: Mapping[AssetKey, Sequence[str]],
     asset_record_loader: "BatchAssetRecordLoader",
 ) -> Sequence["GrapheneAssetLatestInfo"]:
-    from dagster_graphql.implementation.fetch_assets import get_asset_nodes_by_asset_key
-
     from ..schema.asset_graph import GrapheneAssetLatestInfo
     from ..schema.logs.events import GrapheneMaterializationEvent
     from ..schema.pipelines.pipeline import GrapheneRun
+    from .resolver_cache import get_cached_resolver_result
+
+    if not step_keys_by_asset:
+        return []
+
+    # The result only depends on the asset keys, so share it with other requests for the same
+    # assets until new events are written. Graphene objects are built per request.
+    latest_infos = get_cached_resolver_result(
+        graphene_info,
+        "assetsLatestInfo",
+        tuple(step_keys_by_asset.keys()),
+        lambda: _get_assets_latest_info_data(
+            graphene_info, step_keys_by_asset, asset_record_loader
+        ),
+    )
+
+    return [
+        GrapheneAssetLatestInfo(
+            id=info.id,
+            assetKey=info.asset_key,
+            latestMaterialization=(
+                GrapheneMaterializationEvent(event=info.latest_materialization)
+                if info.latest_materialization
+                else None
+            ),
+            unstartedRunIds=list(info.unstarted_run_ids),
+            inProgressRunIds=list(info.in_progress_run_ids),
+            latestRun=GrapheneRun(info.latest_run_record) if info.latest_run_record else None,
+        )
+        for info in latest_infos
+    ]
+
+
+class _AssetLatestInfoData(NamedTuple):
+    id: str
+    asset_key: AssetKey
+    latest_materialization: Optional["EventLogEntry"]
+    unstarted_run_ids: AbstractSet[str]
+    in_progress_run_ids: AbstractSet[str]
+    latest_run_record: Optional[RunRecord]
+
+
+def _get_assets_latest_info_data(
+    graphene_info: "ResolveInfo",
+    step_keys_by_asset: Mapping[AssetKey, Sequence[str]],
+    asset_record_loader: "BatchAssetRecordLoader",
+) -> Sequence[_AssetLatestInfoData]:
+    from dagster_graphql.implementation.fetch_assets import get_asset_nodes_by_asset_key
 
     instance = graphene_info.context.instance
 
     asset_keys = list(step_keys_by_asset.keys())
 
-    if not asset_keys:
-        return []
-
     asset_nodes = get_asset_nodes_by_asset_key(graphene_info, set(asset_keys))
 
     asset_records = asset_record_loader.get_asset_records(asset_keys)
 
     latest_materialization_by_asset = {
         asset_record.asset_entry.asset_key: (
-            GrapheneMaterializationEvent(event=asset_record.asset_entry.last_materialization)
+            asset_record.asset_entry.last_materialization
             if asset_record.asset_entry.last_materialization
             and asset_record.asset_entry.asset_key in step_keys_by_asset
             else None
@@ -246,7 +291,7 @@ def get_assets_latest_info(
     from .fetch_assets import get_unique_asset_id
 
     return [
-        GrapheneAssetLatestInfo(
+        _AssetLatestInfoData(
             id=(
                 get_unique_asset_id(
                     asset_key,
@@ -256,12 +301,12 @@ def get_assets_latest_info(
                 if asset_nodes[asset_key]
                 else get_unique_asset_id(asset_key)
             ),
-            assetKey=asset_key,
-            latestMaterialization=latest_materialization_by_asset.get(asset_key),
-            unstartedRunIds=list(unstarted_run_ids_by_asset.get(asset_key, [])),
-            inProgressRunIds=list(in_progress_run_ids_by_asset.get(asset_key, [])),
-            latestRun=(
-                GrapheneRun(run_records_by_run_id[latest_planned_run_ids_by_asset[asset_key]])
+            asset_key=asset_key,
+            latest_materialization=latest_materialization_by_asset.get(asset_key),
+            unstarted_run_ids=unstarted_run_ids_by_asset.get(asset_key, frozenset()),
+            in_progress_run_ids=in_progress_run_ids_by_asset.get(asset_key, frozenset()),
+            latest_run_record=(
+                run_records_by_run_id[latest_planned_run_ids_by_asset[asset_key]]
                 # Dagster UI error occurs if a run is terminated at the same time that this endpoint is
                 # called so we check to make sure the run ID exists in the run records.
                 if asset_key in latest_planned_run_ids_by_asset
@@ -0,0 +1,192 @@
+"""Process-wide cache of expensive resolver results, shared by all requests to the webserver.
+
+Dashboards that auto-refresh issue the same asset queries from every open browser tab. Results of
+resolvers wrapped with :py:func:`get_cached_resolver_result` are shared between those requests for as
+long as they are valid: an entry is only served while
+
+* the workspace has not been reloaded since it was computed,
+* no event has been written to the event log since it was computed, if it depends on the event log,
+* and its TTL has not expired.
+
+The event log high-water mark covers new materializations, observations and planned events of the
+asset keys a result was computed for, and also the run events that move their partitions and runs
+between in progress, failed and succeeded, which are not keyed by asset. Changes that are not
+recorded in the event log, such as deleting a run or wiping an asset, are visible once the TTL
+expires. Event log storages without a global high-water mark, such as the run sharded SQLite
+storage, never share results that depend on the event log.
+
+The cache is disabled unless ``DAGSTER_UI_RESOLVER_CACHE_TTL_SECONDS`` is set.
+"""
+
+import os
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Hashable,
+    NamedTuple,
+    Optional,
+    Sized,
+    Tuple,
+    TypeVar,
+)
+
+from dagster._core.instance import DagsterInstance
+from dagster._core.workspace.context import BaseWorkspaceRequestContext
+
+if TYPE_CHECKING:
+    from ..schema.util import ResolveInfo
+
+T = TypeVar("T")
+
+# total weight of the cached results, where a result weighs one plus the number of its items
+DEFAULT_MAX_WEIGHT = 100_000
+
+
+def get_resolver_cache_ttl() -> float:
+    """Seconds a cached resolver result is served for. 0 disables the cache."""
+    return float(os.getenv("DAGSTER_UI_RESOLVER_CACHE_TTL_SECONDS", "0"))
+
+
+def get_resolver_cache_max_weight() -> int:
+    return int(os.getenv("DAGSTER_UI_RESOLVER_CACHE_MAX_WEIGHT", str(DEFAULT_MAX_WEIGHT)))
+
+
+class _CacheEntry(NamedTuple):
+    version: Hashable
+    value: Any
+    weight: int
+    expires_at: float
+
+
+class ResolverCache:
+    """LRU cache of resolver results by resolver name and arguments.
+
+    Each entry holds the result of the latest version it was computed for, so a result computed for
+    a newer workspace or event log replaces the stale one instead of being added next to it.
+    """
+
+    def __init__(self, ttl: float, max_weight: int = DEFAULT_MAX_WEIGHT):
+        self._ttl = ttl
+        self._max_weight = max_weight
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, _CacheEntry]" = OrderedDict()
+        self._weight = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_compute(self, key: Hashable, version: Hashable, compute_fn: Callable[[], T]) -> T:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.version == version and entry.expires_at > now:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry.value
+            self.misses += 1
+
+        value = compute_fn()
+        weight = 1 + (len(value) if isinstance(value, Sized) else 0)
+        if weight > self._max_weight:
+            return value
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._weight -= previous.weight
+            self._entries[key] = _CacheEntry(version, value, weight, now + self._ttl)
+            self._weight += weight
+            while self._weight > self._max_weight:
+                _, evicted = self._entries.popitem(last=False)
+                self._weight -= evicted.weight
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._weight = 0
+
+
+_caches: "weakref.WeakKeyDictionary[DagsterInstance, ResolverCache]" = weakref.WeakKeyDictionary()
+_event_log_marks: "weakref.WeakKeyDictionary[BaseWorkspaceRequestContext, Optional[int]]" = (
+    weakref.WeakKeyDictionary()
+)
+_lock = threading.Lock()
+
+
+def get_resolver_cache(instance: DagsterInstance) -> Optional[ResolverCache]:
+    """The cache shared by all requests made with the instance, or None if caching is disabled."""
+    ttl = get_resolver_cache_ttl()
+    if ttl <= 0:
+        return None
+    with _lock:
+        if instance not in _caches:
+            _caches[instance] = ResolverCache(ttl, get_resolver_cache_max_weight())
+        return _caches[instance]
+
+
+def get_workspace_generation(context: BaseWorkspaceRequestContext) -> Tuple[Tuple[str, float], ...]:
+    """Identifies the loaded code of the workspace; changes whenever a code location is reloaded."""
+    return tuple(
+        sorted(
+            (name, entry.update_timestamp)
+            for name, entry in context.get_workspace_snapshot().items()
+        )
+    )
+
+
+def get_event_log_high_water_mark(context: BaseWorkspaceRequestContext) -> Optional[int]:
+    """The maximum event log record id, read once per request.
+
+    Raises NotImplementedError if the event log storage has no record id that every new event
+    raises, such as storages that shard the event log by run and number each shard separately.
+    """
+    with _lock:
+        if context in _event_log_marks:
+            return _event_log_marks[context]
+    event_log_storage = context.instance.event_log_storage
+    if event_log_storage.is_run_sharded:
+        raise NotImplementedError("Run sharded event log storages have no global maximum record id")
+    mark = event_log_storage.get_maximum_record_id()
+    with _lock:
+        _event_log_marks[context] = mark
+    return mark
+
+
+def get_cached_resolver_result(
+    graphene_info: "ResolveInfo",
+    resolver_name: str,
+    args: Hashable,
+    compute_fn: Callable[[], T],
+    depends_on_event_log: bool = True,
+) -> T:
+    """Return the cached result of the resolver for the arguments if it is still valid, otherwise
+    compute and cache it.
+
+    Args:
+        resolver_name (str): Name of the cached computation.
+        args (Hashable): Arguments the result depends on, besides the workspace and event log.
+        compute_fn (Callable[[], T]): Computes the result. It must not hold on to objects scoped to
+            the request, since the result is shared with other requests.
+        depends_on_event_log (bool): Whether new events invalidate the result. If False, only
+            reloading the workspace does.
+    """
+    context = graphene_info.context
+    cache = get_resolver_cache(context.instance)
+    if cache is None:
+        return compute_fn()
+
+    event_log_mark = None
+    if depends_on_event_log:
+        try:
+            event_log_mark = get_event_log_high_water_mark(context)
+        except NotImplementedError:
+            # new events cannot be detected, so results that depend on them are not shared
+            return compute_fn()
+
+    version = (get_workspace_generation(context), event_log_mark)
+    return cache.get_or_compute((resolver_name, args), version, compute_fn)
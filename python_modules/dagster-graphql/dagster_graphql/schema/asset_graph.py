@@ -4,6 +4,8 @@
 from dagster import (
     AssetKey,
     DagsterError,
+    DynamicPartitionsDefinition,
+    MultiPartitionsDefinition,
     _check as check,
 )
 from dagster._core.definitions.asset_graph_differ import AssetDefinitionChangeType, AssetGraphDiffer
@@ -35,6 +37,7 @@
 from dagster._core.storage.batch_asset_record_loader import BatchAssetRecordLoader
 from dagster._core.utils import is_valid_email
 from dagster._core.workspace.permissions import Permissions
+from dagster._serdes import serialize_value
 from dagster._utils.caching_instance_queryer import CachingInstanceQueryer
 
 from dagster_graphql.implementation.asset_checks_loader import AssetChecksLoader
@@ -68,6 +71,7 @@
     get_partition_subsets,
 )
 from ..implementation.loader import CrossRepoAssetDependedByLoader, StaleStatusLoader
+from ..implementation.resolver_cache import get_cached_resolver_result
 from ..schema.asset_checks import AssetChecksOrErrorUnion, GrapheneAssetChecksOrError
 from . import external
 from .asset_key import GrapheneAssetKey
@@ -1116,34 +1120,53 @@ def resolve_assetPartitionStatuses(
         "GrapheneMultiPartitionStatuses",
     ]:
         asset_key = self._external_asset_node.asset_key
+        partitions_def_data = self._external_asset_node.partitions_def_data
 
         if not self._dynamic_partitions_loader:
             check.failed("dynamic_partitions_loader must be provided to get partition keys")
 
         partitions_def = (
-            self._external_asset_node.partitions_def_data.get_partitions_definition()
-            if self._external_asset_node.partitions_def_data
-            else None
+            partitions_def_data.get_partitions_definition() if partitions_def_data else None
         )
 
-        (
-            materialized_partition_subset,
-            failed_partition_subset,
-            in_progress_subset,
-        ) = get_partition_subsets(
-            graphene_info.context.instance,
-            asset_key,
-            self._dynamic_partitions_loader,
-            self._asset_record_loader,
-            partitions_def,
-        )
+        def _build_partition_statuses():
+            (
+                materialized_partition_subset,
+                failed_partition_subset,
+                in_progress_subset,
+            ) = get_partition_subsets(
+                graphene_info.context.instance,
+                asset_key,
+                self._dynamic_partitions_loader,
+                self._asset_record_loader,
+                partitions_def,
+            )
+
+            return build_partition_statuses(
+                self._dynamic_partitions_loader,
+                materialized_partition_subset,
+                failed_partition_subset,
+                in_progress_subset,
+                partitions_def,
+            )
 
-        return build_partition_statuses(
-            self._dynamic_partitions_loader,
-            materialized_partition_subset,
-            failed_partition_subset,
-            in_progress_subset,
-            partitions_def,
+        # Adding dynamic partitions does not write to the event log, so their statuses would be
+        # served stale from the cache.
+        if isinstance(partitions_def, DynamicPartitionsDefinition) or (
+            isinstance(partitions_def, MultiPartitionsDefinition)
+            and any(
+                isinstance(dimension.partitions_def, DynamicPartitionsDefinition)
+                for dimension in partitions_def.partitions_defs
+            )
+        ):
+            return _build_partition_statuses()
+
+        # Nodes of the same asset in different repositories may be partitioned differently.
+        return get_cached_resolver_result(
+            graphene_info,
+            "assetPartitionStatuses",
+            (asset_key, serialize_value(partitions_def_data) if partitions_def_data else None),
+            _build_partition_statuses,
         )
 
     def resolve_partitionStats(
@@ -0,0 +1,94 @@
+import asyncio
+from unittest import mock
+
+from dagster._core.test_utils import create_run_for_test, instance_for_test
+from dagster_graphql.implementation.execution import _gen_batches, gen_events_for_run
+
+
+def _queue(items):
+    queue = asyncio.Queue()
+    for item in items:
+        queue.put_nowait(item)
+    return queue
+
+
+def test_batch_sent_at_size_limit():
+    async def _test():
+        queue = _queue(range(5))
+        batches = _gen_batches(queue, max_batch_size=2, max_batch_interval=60)
+        # full batches are sent without waiting for the interval
+        first = await asyncio.wait_for(batches.__anext__(), 1)
+        second = await asyncio.wait_for(batches.__anext__(), 1)
+        return first, second
+
+    assert asyncio.run(_test()) == ([0, 1], [2, 3])
+
+
+def test_partial_batch_sent_after_interval():
+    async def _test():
+        queue = _queue([0])
+        batches = _gen_batches(queue, max_batch_size=10, max_batch_interval=0.05)
+        first = await asyncio.wait_for(batches.__anext__(), 1)
+        # an item arriving after the batch was sent starts the next batch
+        queue.put_nowait(1)
+        queue.put_nowait(2)
+        second = await asyncio.wait_for(batches.__anext__(), 1)
+        return first, second
+
+    assert asyncio.run(_test()) == ([0], [1, 2])
+
+
+def _graphene_info(instance):
+    context = mock.MagicMock()
+    context.instance = instance
+    return mock.MagicMock(context=context)
+
+
+def _live_messages(monkeypatch, instance, run, num_events, num_messages):
+    instance.report_engine_event("event", run)
+    [event] = instance.all_logs(run.run_id)
+    callbacks = []
+    monkeypatch.setattr(
+        instance,
+        "watch_event_logs",
+        lambda _run_id, _cursor, callback: callbacks.append(callback),
+    )
+    monkeypatch.setattr(instance, "end_watch_event_logs", lambda _run_id, _callback: None)
+
+    async def _test():
+        messages = gen_events_for_run(_graphene_info(instance), run.run_id, after_cursor="HEAD")
+        # only live events are sent after the HEAD cursor; start watching for them
+        next_message = asyncio.ensure_future(messages.__anext__())
+        while not callbacks:
+            await asyncio.sleep(0)
+        for cursor in range(num_events):
+            callbacks[0](event, str(cursor))
+        results = [await asyncio.wait_for(next_message, 1)]
+        for _ in range(num_messages - 1):
+            results.append(await asyncio.wait_for(messages.__anext__(), 1))
+        await messages.aclose()
+        return results
+
+    return asyncio.run(_test())
+
+
+def test_gen_events_for_run_batches(monkeypatch):
+    monkeypatch.setenv("DAGSTER_UI_LIVE_EVENT_BATCH_SIZE", "2")
+    with instance_for_test() as instance:
+        run = create_run_for_test(instance)
+        messages = _live_messages(monkeypatch, instance, run, 5, 3)
+
+    assert [len(message.messages) for message in messages] == [2, 2, 1]
+    # the cursor of every message is that of its last event
+    assert [message.cursor for message in messages] == ["1", "3", "4"]
+    assert not any(message.hasMorePastEvents for message in messages)
+
+
+def test_gen_events_for_run_batch_size_one(monkeypatch):
+    monkeypatch.setenv("DAGSTER_UI_LIVE_EVENT_BATCH_SIZE", "1")
+    with instance_for_test() as instance:
+        run = create_run_for_test(instance)
+        messages = _live_messages(monkeypatch, instance, run, 3, 3)
+
+    assert [len(message.messages) for message in messages] == [1, 1, 1]
+    assert [message.cursor for message in messages] == ["0", "1", "2"]
@@ -0,0 +1,82 @@
+from dagster import MultiPartitionKey, MultiPartitionsDefinition, StaticPartitionsDefinition
+from dagster._core.test_utils import instance_for_test
+from dagster_graphql.implementation.fetch_assets import get_2d_run_length_encoded_partitions
+
+PARTITIONS_DEF = MultiPartitionsDefinition(
+    {
+        "primary": StaticPartitionsDefinition(["a", "b", "c", "d", "e", "f"]),
+        "secondary": StaticPartitionsDefinition(["x", "y", "z"]),
+    }
+)
+
+
+def _subset(keys):
+    return PARTITIONS_DEF.empty_subset().with_partition_keys(
+        [
+            MultiPartitionKey({"primary": primary, "secondary": secondary})
+            for primary, secondary in keys
+        ]
+    )
+
+
+def _secondary_statuses(statuses):
+    return (
+        set(statuses.materializedPartitions),
+        set(statuses.failedPartitions),
+        set(statuses.materializingPartitions),
+        set(statuses.unmaterializedPartitions),
+    )
+
+
+def test_2d_run_length_encoded_partitions():
+    materialized = _subset(
+        [
+            ("a", "x"),
+            ("a", "y"),
+            ("b", "x"),
+            ("b", "y"),
+            # no statuses for "c"
+            ("d", "x"),
+            ("d", "y"),
+            ("e", "x"),
+            ("e", "y"),
+            ("f", "x"),
+            ("f", "y"),
+            # "w" is no longer a key of the secondary dimension
+            ("f", "w"),
+        ]
+    )
+    failed = _subset([("e", "z")])
+    in_progress = _subset([("e", "x")])
+
+    with instance_for_test() as instance:
+        statuses = get_2d_run_length_encoded_partitions(
+            instance, materialized, failed, in_progress, PARTITIONS_DEF
+        )
+
+    assert statuses.primaryDimensionName == "primary"
+    # "c" has no statuses, so it splits the ranges of identical secondary subsets around it
+    assert [(r.primaryDimStartKey, r.primaryDimEndKey) for r in statuses.ranges] == [
+        ("a", "b"),
+        ("d", "d"),
+        ("e", "e"),
+        ("f", "f"),
+    ]
+    assert all(r.primaryDimStartTime is None for r in statuses.ranges)
+    assert [_secondary_statuses(r.secondaryDim) for r in statuses.ranges] == [
+        ({"x", "y"}, set(), set(), {"z"}),
+        ({"x", "y"}, set(), set(), {"z"}),
+        ({"y"}, {"z"}, {"x"}, {"z"}),
+        ({"w", "x", "y"}, set(), set(), {"z"}),
+    ]
+    # identical secondary subsets share their statuses
+    assert statuses.ranges[0].secondaryDim is statuses.ranges[1].secondaryDim
+
+
+def test_2d_run_length_encoded_partitions_empty():
+    with instance_for_test() as instance:
+        statuses = get_2d_run_length_encoded_partitions(
+            instance, _subset([]), _subset([]), _subset([]), PARTITIONS_DEF
+        )
+
+    assert statuses.ranges == []
@@ -0,0 +1,125 @@
+import time
+from unittest import mock
+
+from dagster import AssetKey, AssetMaterialization, DagsterInstance
+from dagster._core.test_utils import instance_for_test
+from dagster_graphql.implementation.resolver_cache import ResolverCache, get_cached_resolver_result
+
+
+def test_resolver_cache_versions():
+    cache = ResolverCache(ttl=60)
+    calls = []
+
+    def compute(value):
+        def _compute():
+            calls.append(value)
+            return value
+
+        return _compute
+
+    assert cache.get_or_compute("a", 1, compute("a1")) == "a1"
+    assert cache.get_or_compute("a", 1, compute("a1'")) == "a1"
+    assert cache.get_or_compute("a", 2, compute("a2")) == "a2"
+    assert cache.get_or_compute("a", 2, compute("a2'")) == "a2"
+    assert calls == ["a1", "a2"]
+    assert (cache.hits, cache.misses) == (2, 2)
+
+
+def test_resolver_cache_ttl():
+    cache = ResolverCache(ttl=0.01)
+    assert cache.get_or_compute("a", 1, lambda: "first") == "first"
+    time.sleep(0.02)
+    assert cache.get_or_compute("a", 1, lambda: "second") == "second"
+
+
+def test_resolver_cache_eviction():
+    cache = ResolverCache(ttl=60, max_weight=10)
+    cache.get_or_compute("a", 1, lambda: [1, 2, 3])
+    cache.get_or_compute("b", 1, lambda: [1, 2, 3])
+    # touch a, so that b is the least recently used
+    cache.get_or_compute("a", 1, lambda: [])
+    cache.get_or_compute("c", 1, lambda: [1, 2, 3])
+
+    assert cache.get_or_compute("a", 1, lambda: None) == [1, 2, 3]
+    assert cache.get_or_compute("c", 1, lambda: None) == [1, 2, 3]
+    assert cache.get_or_compute("b", 1, lambda: None) is None
+
+    # results heavier than the cache are returned without being cached
+    assert cache.get_or_compute("d", 1, lambda: list(range(20))) == list(range(20))
+    assert cache.get_or_compute("d", 1, lambda: None) is None
+
+
+def _graphene_info(instance):
+    context = mock.MagicMock()
+    context.instance = instance
+    context.get_workspace_snapshot.return_value = {}
+    return mock.MagicMock(context=context)
+
+
+def test_cached_resolver_result_event_log_invalidation(monkeypatch):
+    with DagsterInstance.ephemeral() as instance:
+        calls = []
+
+        def compute():
+            calls.append(None)
+            return len(calls)
+
+        # disabled by default
+        assert get_cached_resolver_result(_graphene_info(instance), "r", "a", compute) == 1
+        assert get_cached_resolver_result(_graphene_info(instance), "r", "a", compute) == 2
+
+        monkeypatch.setenv("DAGSTER_UI_RESOLVER_CACHE_TTL_SECONDS", "60")
+        assert get_cached_resolver_result(_graphene_info(instance), "r", "a", compute) == 3
+        assert get_cached_resolver_result(_graphene_info(instance), "r", "a", compute) == 3
+        assert (
+            get_cached_resolver_result(
+                _graphene_info(instance), "s", "a", compute, depends_on_event_log=False
+            )
+            == 4
+        )
+
+        instance.report_runless_asset_event(AssetMaterialization(AssetKey("asset")))
+
+        assert get_cached_resolver_result(_graphene_info(instance), "r", "a", compute) == 5
+        assert (
+            get_cached_resolver_result(
+                _graphene_info(instance), "s", "a", compute, depends_on_event_log=False
+            )
+            == 4
+        )
+
+
+def test_cached_resolver_result_without_high_water_mark(monkeypatch):
+    monkeypatch.setenv("DAGSTER_UI_RESOLVER_CACHE_TTL_SECONDS", "60")
+    with instance_for_test() as instance:
+        # the default sqlite event log storage is sharded by run
+        assert instance.event_log_storage.is_run_sharded
+        calls = []
+
+        def compute():
+            calls.append(None)
+            return len(calls)
+
+        assert get_cached_resolver_result(_graphene_info(instance), "r", "a", compute) == 1
+        assert get_cached_resolver_result(_graphene_info(instance), "r", "a", compute) == 2
+        assert (
+            get_cached_resolver_result(
+                _graphene_info(instance), "s", "a", compute, depends_on_event_log=False
+            )
+            == 3
+        )
+        assert (
+            get_cached_resolver_result(
+                _graphene_info(instance), "s", "a", compute, depends_on_event_log=False
+            )
+            == 3
+        )
+
+    with DagsterInstance.ephemeral() as instance:
+        monkeypatch.setattr(
+            instance.event_log_storage,
+            "get_maximum_record_id",
+            mock.Mock(side_effect=NotImplementedError()),
+        )
+        assert get_cached_resolver_result(_graphene_info(instance), "r", "a", compute) == 4
+        assert get_cached_resolver_result(_graphene_info(instance), "r", "a", compute) == 5
@@ -0,0 +1,368 @@
+# ruff: noqa: T201
+import argparse
+import logging
+import random
+import resource
+import sys
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import dagster._check as check
+from dagster import (
+    AssetMaterialization,
+    AssetsDefinition,
+    AutomationCondition,
+    DailyPartitionsDefinition,
+    Definitions,
+    HourlyPartitionsDefinition,
+    MultiPartitionsDefinition,
+    PartitionsDefinition,
+    StaticPartitionsDefinition,
+    asset,
+)
+from dagster._core.asset_graph_view.asset_graph_view import AssetGraphView
+from dagster._core.definitions.asset_daemon_cursor import AssetDaemonCursor
+from dagster._core.definitions.asset_key import AssetKey
+from dagster._core.definitions.data_time import CachingDataTimeResolver
+from dagster._core.definitions.declarative_automation.automation_condition_evaluator import (
+    AutomationConditionEvaluator,
+)
+from dagster._core.instance import DagsterInstance
+from dagster._core.instance_for_test import instance_for_test
+from dagster._daemon.asset_daemon import (
+    asset_daemon_cursor_from_instigator_serialized_cursor,
+    asset_daemon_cursor_to_instigator_serialized_cursor,
+)
+from dagster._time import get_current_datetime
+from dagster._utils.warnings import disable_dagster_warnings
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Analyze execution time and memory usage of a declarative automation evaluation over a synthetic
+asset graph. The graph is built in layers, each asset depending on `--num-upstreams` assets of the
+previous layer:
+
+    (hourly roots) --> (daily) --> (daily x region) --> (region) --> (region) --> (unpartitioned)
+
+where `daily x region` is a multi-dimensional partitions definition and `region` a static one.
+`--num-assets` assets are spread over the layers and alternately assigned `AutomationCondition.eager()`
+and an hourly `AutomationCondition.on_cron()`; all partitions definitions start `--days` days ago.
+
+Before the first tick, the SQLite instance is seeded with materializations of the latest partitions
+of a `--materialized-fraction` of the assets. Between ticks, the latest partitions of all root assets
+are materialized. For each of `--num-ticks` ticks the script times:
+
+- prefetching asset records (`AutomationConditionEvaluator.prefetch`),
+- evaluating the conditions of all assets, also reported per condition,
+- serializing the resulting cursor the way the asset daemon stores it, and deserializing it again.
+
+Peak memory is reported as the maximum resident set size of the process after each step.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="automation_evaluation",
+    description=DESC,
+)
+
+parser.add_argument(
+    "--num-assets",
+    type=int,
+    default=1000,
+    help="Number of assets in the synthetic asset graph, e.g. 1000 or 10000.",
+)
+
+parser.add_argument(
+    "--num-upstreams",
+    type=int,
+    default=2,
+    help="Number of upstream assets of each non-root asset.",
+)
+
+parser.add_argument(
+    "--days",
+    type=int,
+    default=30,
+    help="Number of days spanned by the partitions definitions.",
+)
+
+parser.add_argument(
+    "--num-regions",
+    type=int,
+    default=10,
+    help="Number of keys of the static `region` partitions definition.",
+)
+
+parser.add_argument(
+    "--materialized-fraction",
+    type=float,
+    default=0.5,
+    help="Fraction of assets whose latest partitions are materialized before the first tick.",
+)
+
+parser.add_argument(
+    "--num-ticks",
+    type=int,
+    default=2,
+    help="Number of evaluation ticks, each starting from the cursor of the previous one.",
+)
+
+parser.add_argument(
+    "--seed",
+    type=int,
+    default=0,
+    help="Seed for choosing the assets that are materialized before the first tick.",
+)
+
+# ########################
+# ##### DEFINITIONS
+# ########################
+
+# relative number of assets in each layer of the graph, by partitions definition name
+LAYER_WEIGHTS: Sequence[Tuple[str, int]] = [
+    ("hourly", 1),
+    ("daily", 2),
+    ("daily_x_region", 2),
+    ("region", 2),
+    ("region", 2),
+    ("unpartitioned", 1),
+]
+
+
+def get_partitions_defs(
+    start: datetime, num_regions: int
+) -> Dict[str, Optional[PartitionsDefinition]]:
+    daily = DailyPartitionsDefinition(start_date=start.strftime("%Y-%m-%d"))
+    region = StaticPartitionsDefinition([f"region_{i}" for i in range(num_regions)])
+    return {
+        "hourly": HourlyPartitionsDefinition(start_date=start.strftime("%Y-%m-%d-00:00")),
+        "daily": daily,
+        "daily_x_region": MultiPartitionsDefinition({"date": daily, "region": region}),
+        "region": region,
+        "unpartitioned": None,
+    }
+
+
+def build_asset_graph(
+    num_assets: int,
+    num_upstreams: int,
+    partitions_defs: Dict[str, Optional[PartitionsDefinition]],
+) -> List[List[AssetsDefinition]]:
+    conditions = [
+        AutomationCondition.eager(),
+        AutomationCondition.on_cron("0 * * * *"),
+    ]
+    total_weight = sum(weight for _, weight in LAYER_WEIGHTS)
+
+    layers: List[List[AssetsDefinition]] = []
+    for layer_index, (partitions_def_name, weight) in enumerate(LAYER_WEIGHTS):
+        num_layer_assets = max(num_assets * weight // total_weight, 1)
+        layer = []
+        for i in range(num_layer_assets):
+            deps = (
+                {
+                    layers[-1][(i * num_upstreams + j) % len(layers[-1])].key
+                    for j in range(num_upstreams)
+                }
+                if layers
+                else set()
+            )
+
+            @asset(
+                name=f"{partitions_def_name}_{layer_index}_{i}",
+                partitions_def=partitions_defs[partitions_def_name],
+                automation_condition=conditions[(layer_index + i) % len(conditions)],
+                deps=deps,
+            )
+            def _asset() -> None: ...
+
+            layer.append(_asset)
+        layers.append(layer)
+
+    return layers
+
+
+def materialize_latest_partitions(
+    instance: DagsterInstance, assets_defs: Sequence[AssetsDefinition], current_time: datetime
+) -> int:
+    num_materializations = 0
+    for assets_def in assets_defs:
+        partitions_def = assets_def.partitions_def
+        if partitions_def is None:
+            partition_keys = [None]
+        elif isinstance(partitions_def, MultiPartitionsDefinition):
+            date_partitions_def = partitions_def.get_partitions_def_for_dimension("date")
+            partition_keys = partitions_def.get_multipartition_keys_with_dimension_value(
+                "date", check.not_none(date_partitions_def.get_last_partition_key(current_time))
+            )
+        elif isinstance(partitions_def, StaticPartitionsDefinition):
+            partition_keys = partitions_def.get_partition_keys()
+        else:
+            partition_keys = [partitions_def.get_last_partition_key(current_time)]
+
+        for partition_key in partition_keys:
+            instance.report_runless_asset_event(
+                AssetMaterialization(asset_key=assets_def.key, partition=partition_key)
+            )
+        num_materializations += len(partition_keys)
+    return num_materializations
+
+
+def get_peak_memory_mb() -> float:
+    # ru_maxrss is reported in kilobytes on Linux and in bytes on macOS
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return max_rss / (1024 * 1024) if sys.platform == "darwin" else max_rss / 1024
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def evaluate_tick(
+    session: ProfilingSession,
+    tick: int,
+    defs: Definitions,
+    instance: DagsterInstance,
+    cursor: AssetDaemonCursor,
+    current_time: datetime,
+    peak_memory_by_step: Dict[str, float],
+) -> AssetDaemonCursor:
+    asset_graph = defs.get_asset_graph()
+
+    with session.logged_execution_time(f"Tick {tick}: prefetch asset records"):
+        asset_graph_view = AssetGraphView.for_test(
+            defs=defs,
+            instance=instance,
+            effective_dt=current_time,
+            last_event_id=instance.event_log_storage.get_maximum_record_id(),
+        )
+        evaluator = AutomationConditionEvaluator(
+            asset_graph=asset_graph,
+            asset_keys=set(asset_graph.materializable_asset_keys),
+            asset_graph_view=asset_graph_view,
+            logger=logging.getLogger("dagster.automation_evaluation_benchmark"),
+            cursor=cursor,
+            data_time_resolver=CachingDataTimeResolver(
+                asset_graph_view.get_inner_queryer_for_back_compat()
+            ),
+            respect_materialization_data_versions=False,
+            auto_materialize_run_tags={},
+            request_backfills=False,
+        )
+        evaluator.prefetch()
+        # the records were prefetched above, so don't count fetching them again as evaluation time
+        evaluator.prefetch = lambda: None
+    peak_memory_by_step[f"Tick {tick}: prefetch"] = get_peak_memory_mb()
+
+    evaluation_time_by_condition: Dict[str, float] = defaultdict(float)
+    evaluate_asset = evaluator.evaluate_asset
+
+    def _timed_evaluate_asset(asset_key: AssetKey, *args, **kwargs):
+        condition = check.not_none(
+            asset_graph.get(asset_key).auto_materialize_policy
+        ).to_automation_condition()
+        start = time.time()
+        result = evaluate_asset(asset_key, *args, **kwargs)
+        evaluation_time_by_condition[condition.label or condition.description] += (
+            time.time() - start
+        )
+        return result
+
+    evaluator.evaluate_asset = _timed_evaluate_asset
+
+    with session.logged_execution_time(f"Tick {tick}: evaluate conditions"):
+        results, to_request = evaluator.evaluate()
+    peak_memory_by_step[f"Tick {tick}: evaluate"] = get_peak_memory_mb()
+
+    for label, evaluation_time in sorted(evaluation_time_by_condition.items()):
+        print(f"Tick {tick}: evaluated `{label}` conditions in {evaluation_time:.4f} seconds")
+    print(f"Tick {tick}: requested {len(to_request)} asset partitions")
+
+    new_cursor = AssetDaemonCursor(
+        evaluation_id=tick,
+        last_observe_request_timestamp_by_asset_key={},
+        previous_evaluation_state=None,
+        previous_condition_cursors=[result.get_new_cursor() for result in results],
+    )
+    with session.logged_execution_time(f"Tick {tick}: serialize cursor"):
+        serialized_cursor = asset_daemon_cursor_to_instigator_serialized_cursor(new_cursor)
+    with session.logged_execution_time(f"Tick {tick}: deserialize cursor"):
+        asset_daemon_cursor_from_instigator_serialized_cursor(serialized_cursor, asset_graph)
+    peak_memory_by_step[f"Tick {tick}: cursor serialization"] = get_peak_memory_mb()
+    print(f"Tick {tick}: serialized cursor is {len(serialized_cursor) / 1024:.1f} KiB")
+
+    return new_cursor
+
+
+def main(
+    num_assets: int,
+    num_upstreams: int,
+    days: int,
+    num_regions: int,
+    materialized_fraction: float,
+    num_ticks: int,
+    seed: int,
+) -> None:
+    random.seed(seed)
+    current_time = get_current_datetime()
+    partitions_defs = get_partitions_defs(current_time - timedelta(days=days), num_regions)
+    peak_memory_by_step: Dict[str, float] = {}
+
+    session = ProfilingSession(
+        name="Declarative automation evaluation",
+        experiment_settings={
+            "num_assets": num_assets,
+            "num_upstreams": num_upstreams,
+            "days": days,
+            "num_regions": num_regions,
+            "materialized_fraction": materialized_fraction,
+            "num_ticks": num_ticks,
+        },
+    ).start()
+
+    session.log_start_message()
+
+    with disable_dagster_warnings(), instance_for_test() as instance:
+        with session.logged_execution_time("Build asset graph"):
+            layers = build_asset_graph(num_assets, num_upstreams, partitions_defs)
+            all_assets = [assets_def for layer in layers for assets_def in layer]
+            defs = Definitions(assets=all_assets)
+            defs.get_asset_graph()
+        peak_memory_by_step["Build asset graph"] = get_peak_memory_mb()
+
+        with session.logged_execution_time("Seed instance"):
+            num_materializations = materialize_latest_partitions(
+                instance,
+                random.sample(all_assets, int(len(all_assets) * materialized_fraction)),
+                current_time,
+            )
+        print(f"Seeded instance with {num_materializations} materializations")
+
+        cursor = AssetDaemonCursor.empty()
+        for tick in range(num_ticks):
+            if tick > 0:
+                with session.logged_execution_time(f"Tick {tick}: materialize root assets"):
+                    materialize_latest_partitions(instance, layers[0], current_time)
+            cursor = evaluate_tick(
+                session, tick, defs, instance, cursor, current_time, peak_memory_by_step
+            )
+
+    session.log_result_summary()
+    for step, peak_memory in peak_memory_by_step.items():
+        print(f"Peak memory after {step}: {peak_memory:.1f} MiB")
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(
+        args.num_assets,
+        args.num_upstreams,
+        args.days,
+        args.num_regions,
+        args.materialized_fraction,
+        args.num_ticks,
+        args.seed,
+    )
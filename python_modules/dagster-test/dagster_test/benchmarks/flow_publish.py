@@ -0,0 +1,143 @@
+# ruff: noqa: T201
+import argparse
+import json
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Mapping
+
+from dagster._core.storage.runs import SqliteRunStorage
+from dagster._core.storage.runs.sql_run_storage import SqlRunStorage
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Measure the storage writes made when publishing canvas flows: saving each flow definition, the repo
+snapshot rows of its code location, and the code pointers of the published repositories.
+
+Each round is run twice against a fresh sqlite run storage: once with the storage's native upserts
+(`INSERT ... ON CONFLICT`), and once with the row-by-row fallback of `SqlRunStorage`. Flows are
+published once, then republished with every definition changed, and finally republished from
+several threads at once to mimic concurrent editors.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="flow_publish",
+    description=DESC,
+)
+
+parser.add_argument(
+    "--num-flows",
+    type=int,
+    default=200,
+    help="Number of flows to publish.",
+)
+parser.add_argument(
+    "--num-rows",
+    type=int,
+    default=20,
+    help="Number of repo snapshot rows (jobs, assets, ...) per flow.",
+)
+parser.add_argument(
+    "--num-threads",
+    type=int,
+    default=4,
+    help="Number of threads publishing concurrently in the last round.",
+)
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def _repo_rows(flow_name: str, num_rows: int, revision: int) -> List[Mapping[str, str]]:
+    return [
+        {
+            "location_name": "canvas",
+            "name": f"{flow_name}_job_{i}",
+            "main_key": f"{flow_name}_job_{i}",
+            "snap_type": "job",
+            "metadata": "{}",
+            "utilized_env_vars": "{}",
+            "definition": json.dumps({"revision": revision, "index": i}),
+        }
+        for i in range(num_rows)
+    ]
+
+
+def _publish(storage: SqlRunStorage, flow_name: str, num_rows: int, revision: int) -> None:
+    storage.add_definition(flow_name, 0, json.dumps({"revision": revision}))
+    storage.save_repo_definitions(flow_name, _repo_rows(flow_name, num_rows, revision))
+    storage.save_code_pointers(
+        {flow_name: json.dumps({"module": flow_name, "fn_name": "defs", "working_directory": None})}
+    )
+
+
+def _run_rounds(
+    session: ProfilingSession,
+    label: str,
+    storage: SqlRunStorage,
+    flow_names: List[str],
+    num_rows: int,
+    num_threads: int,
+) -> int:
+    with session.logged_execution_time(f"{label}: publish {len(flow_names)} flows"):
+        for flow_name in flow_names:
+            _publish(storage, flow_name, num_rows, revision=1)
+
+    with session.logged_execution_time(f"{label}: republish {len(flow_names)} flows"):
+        for flow_name in flow_names:
+            _publish(storage, flow_name, num_rows, revision=2)
+
+    errors = 0
+    with session.logged_execution_time(f"{label}: republish from {num_threads} threads"):
+        with ThreadPoolExecutor(max_workers=num_threads) as executor:
+            futures = [
+                executor.submit(_publish, storage, flow_name, num_rows, 3 + thread)
+                for thread in range(num_threads)
+                for flow_name in flow_names
+            ]
+            for future in futures:
+                try:
+                    future.result()
+                except Exception:
+                    errors += 1
+    return errors
+
+
+def main(num_flows: int, num_rows: int, num_threads: int) -> None:
+    session = ProfilingSession(
+        name="flow publish",
+        experiment_settings={
+            "num_flows": num_flows,
+            "num_rows": num_rows,
+            "num_threads": num_threads,
+        },
+    ).start()
+
+    session.log_start_message()
+
+    flow_names = [f"flow_{i}" for i in range(num_flows)]
+    errors_by_label = {}
+    for label, upsert_rows in (
+        ("native upsert", SqliteRunStorage._upsert_rows),  # noqa: SLF001
+        ("row-by-row fallback", SqlRunStorage._upsert_rows),  # noqa: SLF001
+    ):
+        with tempfile.TemporaryDirectory() as base_dir:
+            storage = SqliteRunStorage.from_local(base_dir)
+            storage._upsert_rows = upsert_rows.__get__(storage)  # noqa: SLF001
+            start = time.time()
+            errors_by_label[label] = _run_rounds(
+                session, label, storage, flow_names, num_rows, num_threads
+            )
+            storage.dispose()
+            print(f"{label}: {time.time() - start:.2f}s total")
+
+    session.log_result_summary()
+    for label, errors in errors_by_label.items():
+        print(f"{label}: {errors} failed concurrent publishes")
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_flows, args.num_rows, args.num_threads)
@@ -0,0 +1,72 @@
+# ruff: noqa: T201
+import argparse
+import time
+
+from dagster._grpc.client import DagsterGrpcClient, get_grpc_channel_pool
+from dagster._grpc.server import GrpcServerProcess
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Measure the throughput of small gRPC calls made by `DagsterGrpcClient` against a local code server,
+with and without channel reuse (`DAGSTER_GRPC_REUSE_CHANNELS`).
+
+A fresh client is constructed for every call, mirroring how the daemon and webserver create clients
+for each sensor tick, schedule tick, or partition lookup. Without channel reuse every call opens a
+new channel (and connection) to the server; with channel reuse all calls share one pooled channel.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="grpc_channel_reuse",
+    description=DESC,
+)
+
+parser.add_argument(
+    "--num-calls",
+    type=int,
+    default=2000,
+    help="Number of `heartbeat` calls to make in each configuration.",
+)
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def _run_calls(server_process: GrpcServerProcess, num_calls: int, reuse_channel: bool) -> float:
+    start = time.time()
+    for _ in range(num_calls):
+        client = DagsterGrpcClient(
+            port=server_process.port,
+            socket=server_process.socket,
+            reuse_channel=reuse_channel,
+        )
+        assert client.heartbeat("ping") == "ping"
+    return num_calls / (time.time() - start)
+
+
+def main(num_calls: int) -> None:
+    with GrpcServerProcess(instance_ref=None, wait_on_exit=True) as server_process:
+        session = ProfilingSession(
+            name="gRPC channel reuse",
+            experiment_settings={"num_calls": num_calls},
+        ).start()
+
+        session.log_start_message()
+
+        with session.logged_execution_time(f"{num_calls} calls, new channel per call"):
+            unpooled_calls_per_second = _run_calls(server_process, num_calls, reuse_channel=False)
+
+        with session.logged_execution_time(f"{num_calls} calls, pooled channel"):
+            pooled_calls_per_second = _run_calls(server_process, num_calls, reuse_channel=True)
+
+        get_grpc_channel_pool().close_all()
+
+        session.log_result_summary()
+        print(f"New channel per call: {unpooled_calls_per_second:.1f} calls/sec")
+        print(f"Pooled channel: {pooled_calls_per_second:.1f} calls/sec")
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_calls)
@@ -0,0 +1,103 @@
+# ruff: noqa: T201
+import argparse
+import multiprocessing
+import statistics
+import tempfile
+import time
+from typing import List
+
+import jedi
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Measure completion latency of the canvas editor language server, with and without the shared jedi
+project state of `dagster_webserver.lsp.project_cache`.
+
+Each configuration runs in a fresh process, so that parso's module cache starts cold like it does
+after a webserver restart. Every completion uses a new `jedi.Interpreter`, mirroring a request from a
+new editor session. With preloading, the configured modules are parsed before the first keystroke,
+as the webserver does on a background thread when a session initializes.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="lsp_completion",
+    description=DESC,
+)
+
+parser.add_argument(
+    "--num-completions",
+    type=int,
+    default=50,
+    help="Number of steady-state completions to time after the first one.",
+)
+parser.add_argument(
+    "--preload-modules",
+    type=str,
+    nargs="*",
+    default=["dagster"],
+    help="Modules to preload in the shared configuration.",
+)
+
+CODE = "import dagster\ndagster.AssetKey('a')."
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def _complete(project: jedi.Project) -> float:
+    start = time.time()
+    completions = jedi.Interpreter(CODE, [{}], project=project).complete(2, 22)
+    assert completions
+    return time.time() - start
+
+
+def _measure(shared: bool, preload_modules: List[str], num_completions: int) -> List[float]:
+    with tempfile.TemporaryDirectory() as workspace:
+        if shared:
+            from dagster_webserver.lsp import project_cache
+
+            start = time.time()
+            project = project_cache.get_project(workspace)
+            future = project_cache.preload_modules(project, preload_modules)
+            if future is not None:
+                future.result()
+            preload_time = time.time() - start
+        else:
+            project = jedi.Project(path=workspace, smart_sys_path=True)
+            preload_time = 0.0
+
+        return [preload_time] + [_complete(project) for _ in range(num_completions + 1)]
+
+
+def main(num_completions: int, preload_modules: List[str]) -> None:
+    session = ProfilingSession(
+        name="LSP completion latency",
+        experiment_settings={
+            "num_completions": num_completions,
+            "preload_modules": preload_modules,
+        },
+    ).start()
+
+    session.log_start_message()
+
+    ctx = multiprocessing.get_context("spawn")
+    results = {}
+    for shared in (False, True):
+        label = "shared project state" if shared else "per-session project"
+        with session.logged_execution_time(label):
+            with ctx.Pool(1) as pool:
+                results[label] = pool.apply(_measure, (shared, preload_modules, num_completions))
+
+    session.log_result_summary()
+    for label, (preload_time, first, *steady) in results.items():
+        print(
+            f"{label}: preload {preload_time * 1000:.0f}ms, first completion {first * 1000:.0f}ms,"
+            f" steady-state median {statistics.median(steady) * 1000:.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_completions, args.preload_modules)
@@ -0,0 +1,160 @@
+# ruff: noqa: T201
+import argparse
+import multiprocessing
+from statistics import mean
+from typing import Sequence
+
+from dagster import (
+    DynamicOut,
+    DynamicOutput,
+    In,
+    Nothing,
+    job,
+    multiprocess_executor,
+    op,
+    reconstructable,
+)
+from dagster._core.events import DagsterEventType
+from dagster._core.events.log import EventLogEntry
+from dagster._core.execution.api import execute_job
+from dagster._core.instance_for_test import instance_for_test
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Analyze execution time of a wide fan-out job run with the multiprocess executor. The job looks like
+this:
+
+            +--> (leaf[0]) ---+
+    (root) -+--> ...       ---+--> (sink)
+            +--> (leaf[N-1]) -+
+
+N is configurable via the `--num-ops` arg, and `--worker-pool` switches the executor from one process
+per step to its pool of reusable worker processes. Every op is trivial, so the run time is dominated by the
+executor's own overhead: launching step processes and noticing that they have finished.
+
+Besides the wall-clock time of the run, the script reports the hand-off latency, which is the delay
+between a step finishing in its child process and the executor launching a waiting step in the freed
+slot. It is measured from event log timestamps: for every step launched after the first
+`--max-concurrent`, the time between its STEP_WORKER_STARTING event and the latest STEP_SUCCESS event
+before it.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="multiprocess_fan_out",
+    description=DESC,
+)
+
+parser.add_argument(
+    "--num-ops",
+    type=int,
+    default=500,
+    help="Number of trivial ops the root op fans out to.",
+)
+
+parser.add_argument(
+    "--max-concurrent",
+    type=int,
+    default=multiprocessing.cpu_count(),
+    help="`max_concurrent` setting of the multiprocess executor.",
+)
+
+parser.add_argument(
+    "--worker-pool",
+    action=argparse.BooleanOptionalAction,  # type: ignore  # (3.9+ only)
+    default=False,
+    help="Execute steps in the executor's pool of reusable worker processes.",
+)
+
+# ########################
+# ##### DEFINITIONS
+# ########################
+
+
+@op(out=DynamicOut(int), config_schema={"num_ops": int})
+def root(context):
+    for i in range(context.op_config["num_ops"]):
+        yield DynamicOutput(i, mapping_key=str(i))
+
+
+@op
+def leaf(value: int) -> int:
+    return value
+
+
+@op(ins={"values": In(Nothing)})
+def sink() -> None:
+    pass
+
+
+@job(executor_def=multiprocess_executor)
+def fan_out_job():
+    sink(values=root().map(leaf).collect())
+
+
+def get_hand_off_latencies(
+    records: Sequence[EventLogEntry], max_concurrent: int
+) -> Sequence[float]:
+    latencies = []
+    last_success_time = None
+    num_started = 0
+    for record in records:
+        if record.dagster_event_type == DagsterEventType.STEP_SUCCESS:
+            last_success_time = record.timestamp
+        elif record.dagster_event_type == DagsterEventType.STEP_WORKER_STARTING:
+            num_started += 1
+            if num_started > max_concurrent and last_success_time is not None:
+                latencies.append(record.timestamp - last_success_time)
+    return latencies
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def main(num_ops: int, max_concurrent: int, worker_pool: bool) -> None:
+    executor_config = {
+        "max_concurrent": max_concurrent,
+        **({"worker_pool": {}} if worker_pool else {}),
+    }
+    with instance_for_test() as instance:
+        session = ProfilingSession(
+            name="Multiprocess executor fan-out",
+            experiment_settings={
+                "num_ops": num_ops,
+                "max_concurrent": max_concurrent,
+                "worker_pool": worker_pool,
+            },
+        ).start()
+
+        session.log_start_message()
+
+        with session.logged_execution_time(f"Execute job with {num_ops} fanned-out ops"):
+            with execute_job(
+                reconstructable(fan_out_job),
+                instance,
+                run_config={
+                    "ops": {"root": {"config": {"num_ops": num_ops}}},
+                    "execution": {"config": executor_config},
+                },
+            ) as result:
+                assert result.success
+                run_id = result.run_id
+
+        latencies = get_hand_off_latencies(
+            sorted(instance.all_logs(run_id), key=lambda record: record.timestamp),
+            max_concurrent,
+        )
+
+        session.log_result_summary()
+        if latencies:
+            print(
+                f"Step hand-off latency: mean {mean(latencies) * 1000:.1f} ms, "
+                f"max {max(latencies) * 1000:.1f} ms over {len(latencies)} steps"
+            )
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_ops, args.max_concurrent, args.worker_pool)
@@ -0,0 +1,174 @@
+# ruff: noqa: T201
+import argparse
+import random
+from datetime import timedelta
+from typing import Sequence
+
+from dagster import (
+    DailyPartitionsDefinition,
+    HourlyPartitionsDefinition,
+    MonthlyPartitionsDefinition,
+    StaticPartitionsDefinition,
+    WeeklyPartitionsDefinition,
+)
+from dagster._core.definitions.partition import PartitionsDefinition
+from dagster._core.definitions.partition_key_range import PartitionKeyRange
+from dagster._core.definitions.time_window_partitions import TimeWindowPartitionsDefinition
+from dagster._time import get_current_datetime
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Analyze execution time of the main operations on partitions definitions: counting partitions,
+listing partition keys, paging through them by index, validating keys, mapping keys to time windows
+and timestamps to keys, and taking unions and differences of partitions subsets.
+
+Each operation is run against hourly, daily, weekly, and monthly partitions definitions spanning the
+last `--years` years in `--timezone`, and against a static partitions definition with as many keys as
+the hourly one. Lookups of individual keys or timestamps are repeated `--num-lookups` times with keys
+sampled from the whole definition.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="partition_operations",
+    description=DESC,
+)
+
+parser.add_argument(
+    "--years",
+    type=int,
+    default=5,
+    help="Number of years spanned by the time window partitions definitions.",
+)
+
+parser.add_argument(
+    "--timezone",
+    type=str,
+    default="UTC",
+    help="Timezone of the time window partitions definitions.",
+)
+
+parser.add_argument(
+    "--num-lookups",
+    type=int,
+    default=200,
+    help="Number of keys or timestamps to look up in each lookup operation.",
+)
+
+parser.add_argument(
+    "--seed",
+    type=int,
+    default=0,
+    help="Seed for sampling the keys and timestamps that are looked up.",
+)
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def _profile_time_window_partitions_def(
+    session: ProfilingSession,
+    name: str,
+    partitions_def: TimeWindowPartitionsDefinition,
+    num_lookups: int,
+) -> None:
+    current_time = get_current_datetime()
+
+    with session.logged_execution_time(f"{name}: get_num_partitions"):
+        num_partitions = partitions_def.get_num_partitions(current_time)
+
+    with session.logged_execution_time(f"{name}: get_partition_keys ({num_partitions} keys)"):
+        partition_keys = partitions_def.get_partition_keys(current_time)
+
+    with session.logged_execution_time(f"{name}: get_partition_keys_between_indexes (last 100)"):
+        partitions_def.get_partition_keys_between_indexes(
+            max(num_partitions - 100, 0), num_partitions, current_time
+        )
+
+    sampled_keys = random.choices(partition_keys, k=num_lookups)
+    with session.logged_execution_time(f"{name}: has_partition_key x{num_lookups}"):
+        for partition_key in sampled_keys:
+            assert partitions_def.has_partition_key(partition_key, current_time)
+
+    with session.logged_execution_time(f"{name}: time_windows_for_partition_keys"):
+        partitions_def.time_windows_for_partition_keys(frozenset(sampled_keys))
+
+    with session.logged_execution_time(f"{name}: get_partition_keys_in_range (last 100)"):
+        partitions_def.get_partition_keys_in_range(
+            PartitionKeyRange(partition_keys[max(num_partitions - 100, 0)], partition_keys[-1])
+        )
+
+    start_timestamp = partitions_def.start.timestamp()
+    sampled_timestamps = [
+        random.uniform(start_timestamp, current_time.timestamp()) for _ in range(num_lookups)
+    ]
+    with session.logged_execution_time(f"{name}: get_partition_key_for_timestamp x{num_lookups}"):
+        for timestamp in sampled_timestamps:
+            partitions_def.get_partition_key_for_timestamp(timestamp)
+
+    _profile_subset_operations(session, name, partitions_def, partition_keys)
+
+
+def _profile_subset_operations(
+    session: ProfilingSession,
+    name: str,
+    partitions_def: PartitionsDefinition,
+    partition_keys: Sequence[str],
+) -> None:
+    with session.logged_execution_time(f"{name}: build subsets"):
+        even_subset = partitions_def.subset_with_partition_keys(partition_keys[::2])
+        first_half_subset = partitions_def.subset_with_partition_keys(
+            partition_keys[: len(partition_keys) // 2]
+        )
+
+    with session.logged_execution_time(f"{name}: subset union, intersection, and difference"):
+        even_subset | first_half_subset
+        even_subset & first_half_subset
+        even_subset - first_half_subset
+
+    with session.logged_execution_time(f"{name}: serialize subset"):
+        partitions_def.deserialize_subset(even_subset.serialize())
+
+
+def main(years: int, timezone: str, num_lookups: int, seed: int) -> None:
+    random.seed(seed)
+    start = get_current_datetime(tz=timezone) - timedelta(days=365 * years)
+    time_window_partitions_defs = {
+        "hourly": HourlyPartitionsDefinition(
+            start_date=start.strftime("%Y-%m-%d-%H:00"), timezone=timezone
+        ),
+        "daily": DailyPartitionsDefinition(
+            start_date=start.strftime("%Y-%m-%d"), timezone=timezone
+        ),
+        "weekly": WeeklyPartitionsDefinition(
+            start_date=start.strftime("%Y-%m-%d"), timezone=timezone
+        ),
+        "monthly": MonthlyPartitionsDefinition(
+            start_date=start.strftime("%Y-%m-01"), timezone=timezone
+        ),
+    }
+
+    session = ProfilingSession(
+        name="Partition operations",
+        experiment_settings={"years": years, "timezone": timezone, "num_lookups": num_lookups},
+    ).start()
+
+    session.log_start_message()
+
+    for name, partitions_def in time_window_partitions_defs.items():
+        _profile_time_window_partitions_def(session, name, partitions_def, num_lookups)
+
+    static_partition_keys = [
+        f"key_{i}" for i in range(time_window_partitions_defs["hourly"].get_num_partitions())
+    ]
+    _profile_subset_operations(
+        session, "static", StaticPartitionsDefinition(static_partition_keys), static_partition_keys
+    )
+
+    session.log_result_summary()
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.years, args.timezone, args.num_lookups, args.seed)
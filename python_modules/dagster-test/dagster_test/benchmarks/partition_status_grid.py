@@ -0,0 +1,135 @@
+# ruff: noqa: T201
+import argparse
+import datetime
+import random
+
+from dagster import (
+    DailyPartitionsDefinition,
+    MultiPartitionKey,
+    MultiPartitionsDefinition,
+    StaticPartitionsDefinition,
+)
+from dagster._core.instance import DagsterInstance
+from dagster_graphql.implementation.fetch_assets import get_2d_run_length_encoded_partitions
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Measure how long the partitions tab of a two-dimensional asset takes to compute its status grid,
+i.e. `get_2d_run_length_encoded_partitions`, for a synthetic daily x static multipartitions
+definition.
+
+Materializations are laid out in runs of days that share the same set of materialized regions, so
+the grid compresses into a realistic number of ranges. On a fraction of the days, some regions are
+marked failed or in progress.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="partition_status_grid",
+    description=DESC,
+)
+
+parser.add_argument(
+    "--num-days",
+    type=int,
+    default=2000,
+    help="Number of daily partitions of the primary dimension.",
+)
+parser.add_argument(
+    "--num-regions",
+    type=int,
+    default=500,
+    help="Number of static partitions of the secondary dimension.",
+)
+parser.add_argument(
+    "--run-length",
+    type=int,
+    default=30,
+    help="Average number of consecutive days with the same materialized regions.",
+)
+parser.add_argument(
+    "--failure-rate",
+    type=float,
+    default=0.05,
+    help="Fraction of days with failed or in progress regions.",
+)
+parser.add_argument(
+    "--num-iterations",
+    type=int,
+    default=3,
+    help="Number of times the grid is computed.",
+)
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def _build_subsets(partitions_def: MultiPartitionsDefinition, run_length: int, failure_rate: float):
+    rng = random.Random(0)
+    days = partitions_def.get_partitions_def_for_dimension("date").get_partition_keys()
+    regions = partitions_def.get_partitions_def_for_dimension("region").get_partition_keys()
+    num_regions = len(regions)
+
+    materialized, failed, in_progress = [], [], []
+    materialized_regions = []
+    for day in days:
+        if not materialized_regions or rng.random() < 1 / run_length:
+            materialized_regions = rng.sample(regions, rng.randint(0, num_regions))
+        for region in materialized_regions:
+            materialized.append(MultiPartitionKey({"date": day, "region": region}))
+        if rng.random() >= failure_rate:
+            continue
+        for region in rng.sample(regions, max(num_regions // 100, 1)):
+            if rng.random() < 0.5:
+                failed.append(MultiPartitionKey({"date": day, "region": region}))
+            else:
+                in_progress.append(MultiPartitionKey({"date": day, "region": region}))
+
+    return tuple(
+        partitions_def.empty_subset().with_partition_keys(keys)
+        for keys in (materialized, failed, in_progress)
+    )
+
+
+def main(
+    num_days: int, num_regions: int, run_length: int, failure_rate: float, num_iterations: int
+) -> None:
+    session = ProfilingSession(
+        name="2D partition status grid",
+        experiment_settings={
+            "num_days": num_days,
+            "num_regions": num_regions,
+            "num_cells": num_days * num_regions,
+            "run_length": run_length,
+            "failure_rate": failure_rate,
+        },
+    ).start()
+
+    session.log_start_message()
+
+    start_date = datetime.datetime(2000, 1, 1)
+    end_date = start_date + datetime.timedelta(days=num_days)
+    partitions_def = MultiPartitionsDefinition(
+        {
+            "date": DailyPartitionsDefinition(
+                start_date=start_date, end_date=end_date.strftime("%Y-%m-%d")
+            ),
+            "region": StaticPartitionsDefinition([f"region_{i}" for i in range(num_regions)]),
+        }
+    )
+    with session.logged_execution_time("build subsets"):
+        subsets = _build_subsets(partitions_def, run_length, failure_rate)
+
+    with DagsterInstance.ephemeral() as instance:
+        for i in range(num_iterations):
+            with session.logged_execution_time(f"compute grid {i}"):
+                statuses = get_2d_run_length_encoded_partitions(instance, *subsets, partitions_def)
+
+    session.log_result_summary()
+    print(f"{len(statuses.ranges)} primary dimension ranges")
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_days, args.num_regions, args.run_length, args.failure_rate, args.num_iterations)
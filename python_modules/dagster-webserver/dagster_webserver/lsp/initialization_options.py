@@ -72,6 +72,7 @@ class JediSettings:
     auto_import_modules: List[str] = field(default_factory=list)
     case_insensitive_completion: bool = True
     debug: bool = False
+    preload_modules: List[str] = field(default_factory=lambda: ["dagster"])
 
 
 @light_dataclass
@@ -0,0 +1,181 @@
+"""Lazily loaded asset values for the jedi interpreter namespace.
+
+Editing a flow step offers completions on the values of its upstream assets. Those
+values can be large, so instead of unpickling all of them when the editor connects,
+the namespace only records where each value is stored. A value is loaded on a worker
+thread the first time the edited source references it, and is reduced to a small stub
+that keeps what jedi introspects (class, columns, dtypes, the stub of the first element
+of a container) but not the data. Stubs are cached process-wide by the storage id of
+the materialization they were loaded from.
+"""
+
+import itertools
+import os
+import pickle
+import re
+import threading
+import typing
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, Mapping, NamedTuple, Optional, Set
+
+# maximum number of value stubs kept across all editor sessions
+MAX_CACHED_STUBS = 512
+
+# values of unknown types are only kept as-is when their pickle is smaller than this
+MAX_INLINE_VALUE_BYTES = 1024 * 1024
+
+# strings and bytes inside containers are cut to this length
+MAX_INLINE_ELEMENT_LENGTH = 64
+
+# containers nested deeper than this are stubbed as empty containers
+MAX_STUB_DEPTH = 8
+
+_SCALAR_TYPES = (type(None), bool, int, float, complex)
+
+_IDENTIFIER_RE = re.compile(r"[A-Za-z_]\w*")
+
+_NOT_LOADED = object()
+
+
+class AssetValueSource(NamedTuple):
+    """Location of the latest materialized value of an asset."""
+
+    storage_id: int
+    path: Optional[str]
+
+
+def make_value_stub(value: Any, size: Optional[int]) -> Any:
+    """Reduce a value to an object jedi can introspect the same way, without its data.
+
+    Containers keep the stub of their first element. ``size`` is the size of the pickled
+    value, None if it is not known. The elements of a large container are of unknown size,
+    so those of unknown types are only kept as their type.
+    """
+    return _make_value_stub(value, size, depth=0)
+
+
+def _make_value_stub(value: Any, size: Optional[int], depth: int) -> Any:
+    value_type = type(value)
+    if hasattr(value_type, "iloc"):
+        # pandas DataFrame / Series: an empty slice keeps the class, columns and dtypes
+        return value.iloc[:0]
+    if value_type.__module__ == "numpy" and getattr(value, "ndim", 0) > 0:
+        return value[:0]
+    if value_type in (list, tuple, dict) and depth >= MAX_STUB_DEPTH:
+        # deeply nested, or even recursive, containers are not followed any further
+        return value_type()
+    # the elements of a small container are no larger than the container itself
+    item_size = size if size is not None and size <= MAX_INLINE_VALUE_BYTES else None
+    if value_type in (list, tuple):
+        return value_type(_make_value_stub(item, item_size, depth + 1) for item in value[:1])
+    if value_type is dict:
+        return {
+            key: _make_value_stub(item, item_size, depth + 1)
+            for key, item in itertools.islice(value.items(), 1)
+        }
+    if value_type in (str, bytes) and size is None:
+        return value[:MAX_INLINE_ELEMENT_LENGTH]
+    if value_type in _SCALAR_TYPES or (size is not None and size <= MAX_INLINE_VALUE_BYTES):
+        return value
+    if size is None:
+        return value_type
+    return typing.Any
+
+
+def _load_value_stub(path: Optional[str]) -> Any:
+    if path is None:
+        return typing.Any
+    try:
+        with open(path, "rb") as f:
+            value = pickle.load(f)
+        return make_value_stub(value, os.path.getsize(path))
+    except Exception:
+        return typing.Any
+
+
+class ValueStubCache:
+    """LRU cache of value stubs by storage id, loading missing stubs on a thread pool."""
+
+    def __init__(self, max_size: int = MAX_CACHED_STUBS, max_workers: int = 2):
+        self._max_size = max_size
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="lsp_namespace"
+        )
+        self._lock = threading.Lock()
+        self._stubs: "OrderedDict[int, Any]" = OrderedDict()
+        self._pending: Dict[int, Future] = {}
+
+    def get(self, storage_id: int, default: Any = None) -> Any:
+        """Return the cached stub of the value, or the default if it has not been loaded."""
+        with self._lock:
+            if storage_id not in self._stubs:
+                return default
+            self._stubs.move_to_end(storage_id)
+            return self._stubs[storage_id]
+
+    def load(self, source: AssetValueSource) -> Future:
+        """Load the stub of the value in the background, unless it is cached or loading."""
+        with self._lock:
+            if source.storage_id in self._stubs:
+                future = Future()
+                future.set_result(self._stubs[source.storage_id])
+                return future
+            if source.storage_id in self._pending:
+                return self._pending[source.storage_id]
+            future = self._executor.submit(self._load, source)
+            self._pending[source.storage_id] = future
+            return future
+
+    def _load(self, source: AssetValueSource) -> Any:
+        stub = _load_value_stub(source.path)
+        with self._lock:
+            self._pending.pop(source.storage_id, None)
+            self._stubs[source.storage_id] = stub
+            while len(self._stubs) > self._max_size:
+                self._stubs.popitem(last=False)
+        return stub
+
+    def clear(self) -> None:
+        with self._lock:
+            self._stubs.clear()
+
+
+_value_stub_cache = ValueStubCache()
+
+
+class LazyNamespace:
+    """Namespace of upstream asset values for one editor session.
+
+    Args:
+        sources (Mapping[str, AssetValueSource]): Where the value of each name is stored.
+    """
+
+    def __init__(
+        self,
+        sources: Mapping[str, AssetValueSource],
+        cache: Optional[ValueStubCache] = None,
+    ):
+        self._sources = dict(sources)
+        self._cache = cache or _value_stub_cache
+
+    def referenced_names(self, code: str) -> Set[str]:
+        return set(_IDENTIFIER_RE.findall(code)).intersection(self._sources)
+
+    def prefetch(self, code: str) -> None:
+        """Start loading the values referenced by the code that are not loaded yet."""
+        for name in self.referenced_names(code):
+            self._cache.load(self._sources[name])
+
+    def resolve(self, code: str) -> Dict[str, Any]:
+        """Namespace to run jedi on the code with.
+
+        Values referenced by the code are loaded in the background if needed; names
+        whose value is not available yet resolve to ``typing.Any``.
+        """
+        self.prefetch(code)
+        namespace = {}
+        for name, source in self._sources.items():
+            stub = self._cache.get(source.storage_id, _NOT_LOADED)
+            namespace[name] = typing.Any if stub is _NOT_LOADED else stub
+        return namespace
@@ -0,0 +1,127 @@
+"""Jedi state shared by all LSP sessions of the webserver process.
+
+Jedi infers names from scratch for every ``Interpreter``, but the modules it parses
+to do so are kept in parso's process-wide module cache, which is keyed by path and
+invalidated when a file's mtime changes. The first completion of a session that
+touches ``dagster`` or pandas therefore takes seconds only while that cache is cold.
+
+This module shares ``Project`` instances between sessions, warms the module cache
+by preloading configured modules when a session starts, and caps the number of
+cached modules.
+
+Neither jedi nor parso's module cache is thread safe, so every jedi call, be it for
+an LSP request, a preload or trimming the cache, runs on the single thread of
+:py:func:`submit`. Preloading one module at a time lets requests run in between.
+"""
+
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Hashable, Iterable, Optional, Set, Tuple, TypeVar
+
+import jedi
+import parso.cache
+from jedi import Project
+
+# maximum number of distinct jedi projects kept across sessions
+MAX_CACHED_PROJECTS = 8
+
+# maximum number of parsed modules kept in parso's module cache
+MAX_CACHED_MODULES = 4000
+
+_lock = threading.Lock()
+_projects: "OrderedDict[Tuple[Hashable, ...], Project]" = OrderedDict()
+_preloaded: Set[Tuple[Optional[str], str]] = set()
+_jedi_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="jedi")
+
+T = TypeVar("T")
+
+
+def _project_key(
+    path: Optional[str], environment_path: Optional[str], extra_paths: Iterable[str]
+) -> Tuple[Hashable, ...]:
+    return (path, environment_path, tuple(extra_paths))
+
+
+def get_project(
+    path: str, environment_path: Optional[str] = None, extra_paths: Iterable[str] = ()
+) -> Project:
+    """Return the shared jedi project for the workspace, creating it if needed."""
+    extra_paths = list(extra_paths)
+    key = _project_key(path, environment_path, extra_paths)
+    with _lock:
+        project = _projects.get(key)
+        if project is not None:
+            _projects.move_to_end(key)
+            return project
+
+        project = Project(
+            path=path,
+            environment_path=environment_path,
+            added_sys_path=extra_paths,
+            smart_sys_path=True,
+            load_unsafe_extensions=False,
+        )
+        _projects[key] = project
+        while len(_projects) > MAX_CACHED_PROJECTS:
+            _projects.popitem(last=False)
+        return project
+
+
+def submit(fn: Callable[..., T], *args, **kwargs) -> "Future[T]":
+    """Run the function on the thread that makes every jedi call of the process."""
+    return _jedi_executor.submit(fn, *args, **kwargs)
+
+
+def _preload(project: Optional[Project], module: str) -> None:
+    # inferring the module's public names parses it and the modules they come from
+    code = f"import {module}\n{module}."
+    try:
+        for completion in jedi.Interpreter(code, [{}], project=project).complete(
+            2, len(module) + 1
+        ):
+            if not completion.name.startswith("_"):
+                completion.infer()
+    except Exception:
+        pass
+
+
+def preload_modules(project: Optional[Project], modules: Iterable[str]) -> Optional[Future]:
+    """Parse the modules in the background, unless they were already preloaded for the project.
+
+    Returns a future that resolves once the modules are parsed, or None if there was
+    nothing to preload.
+    """
+    # the module cache is shared by all projects, only where modules are found differs
+    key = str(project.path) if project is not None else None
+    with _lock:
+        pending = [module for module in modules if (key, module) not in _preloaded]
+        _preloaded.update((key, module) for module in pending)
+    if not pending:
+        return None
+    for module in pending:
+        submit(_preload, project, module)
+    return submit(trim_module_cache)
+
+
+def trim_module_cache(max_modules: int = MAX_CACHED_MODULES) -> None:
+    """Evict the least recently used modules from parso's cache beyond the maximum.
+
+    Must be called on the jedi thread, see :py:func:`submit`.
+    """
+    items = [
+        (item.last_used, grammar_cache, path)
+        for grammar_cache in parso.cache.parser_cache.values()
+        for path, item in grammar_cache.items()
+    ]
+    if len(items) <= max_modules:
+        return
+    items.sort(key=lambda entry: entry[0])
+    for _, grammar_cache, path in items[: len(items) - max_modules]:
+        grammar_cache.pop(path, None)
+
+
+def clear() -> None:
+    with _lock:
+        _projects.clear()
+        _preloaded.clear()
@@ -69,7 +69,8 @@
 from pygls.server import LanguageServer
 from starlette.websockets import WebSocket
 
-from . import jedi_utils, pygls_utils, text_edit_utils
+from . import jedi_utils, project_cache, pygls_utils, text_edit_utils
+from .namespace import LazyNamespace
 from .initialization_options import (
     InitializationOptions,
     initialization_options_converter,
@@ -108,16 +109,17 @@ def lsp_initialize(self, params: InitializeParams) -> InitializeResult:
         initialize_result: InitializeResult = super().lsp_initialize(params)
         workspace_options = initialization_options.workspace
         server.project = (
-            Project(
+            project_cache.get_project(
                 path=server.workspace.root_path,
                 environment_path=workspace_options.environment_path,
-                added_sys_path=workspace_options.extra_paths,
-                smart_sys_path=True,
-                load_unsafe_extensions=False,
+                extra_paths=workspace_options.extra_paths,
             )
             if server.workspace.root_path
             else None
         )
+        project_cache.preload_modules(
+            server.project, initialization_options.jedi_settings.preload_modules
+        )
         return initialize_result
 
     @lsp_method(EXIT)
@@ -150,10 +152,16 @@ async def _warm_close(self):
         await self._ws.close()
 
     def write(self, data) -> None:
-        """Create a task to write specified data into a WebSocket."""
+        """Create a task to write specified data into a WebSocket.
+
+        Features run on the jedi thread, so this may be called from any thread.
+        """
         if isinstance(data, bytes):
             data = data.decode()
 
+        self._loop.call_soon_threadsafe(self._send, data)
+
+    def _send(self, data: str) -> None:
         task = self._loop.create_task(self._ws.send_text(data))
         self._pending_writes.add(task)
         task.add_done_callback(lambda t: self._pending_writes.discard(t))
@@ -164,14 +172,14 @@ class JediServer(LanguageServer):
     _commands = {}
     initialization_options: InitializationOptions
     project: Optional[Project]
-    namespaces: Optional[List[Dict]]
+    namespace: Optional[LazyNamespace]
 
     def __init__(
         self,
         name: str,
         version: str,
         websocket: WebSocket,
-        namespaces: List[Dict],
+        namespace: Optional[LazyNamespace],
         loop=None,
         **kwargs,
     ):
@@ -181,7 +189,17 @@ def __init__(
             self.lsp.fm.feature(*payload[1:])(payload[0])
         for payload in self._commands.values():
             self.lsp.fm.command(*payload[1:])(payload[0])
-        self.namespaces = namespaces
+        self.namespace = namespace
+
+    def namespaces_for(self, code: str) -> List[Dict]:
+        """Namespaces to run the jedi interpreter on the code with."""
+        if self.namespace is None:
+            return []
+        return [self.namespace.resolve(code)]
+
+    def prefetch_namespace(self, code: str) -> None:
+        if self.namespace is not None:
+            self.namespace.prefetch(code)
 
     @classmethod
     def feature(
@@ -206,9 +224,12 @@ def deco(func):
                 async def wrapper(*args, **kwargs):
                     return await func(*args, **kwargs)
             else:
+                # jedi is not thread safe, so run on the thread of all jedi calls
                 @functools.wraps(func)
-                def wrapper(*args, **kwargs):
-                    return func(*args, **kwargs)
+                async def wrapper(*args, **kwargs):
+                    return await asyncio.wrap_future(
+                        project_cache.submit(func, *args, **kwargs)
+                    )
             cls._features[feature_name] = (wrapper, feature_name, options)
             return wrapper
 
@@ -232,8 +253,10 @@ def deco(func):
                 async def wrapper(*args, **kwargs):
                     return await func(*args, **kwargs)
             else:
-                def wrapper(*args, **kwargs):
-                    return func(*args, **kwargs)
+                async def wrapper(*args, **kwargs):
+                    return await asyncio.wrap_future(
+                        project_cache.submit(func, *args, **kwargs)
+                    )
             cls._commands[command_name] = (wrapper, command_name)
             return wrapper
 
@@ -749,6 +772,8 @@ def did_change_diagnostics(
     server: JediServer, params: DidChangeTextDocumentParams
 ) -> None:
     """Actions run on textDocument/didChange: diagnostics."""
+    document = server.workspace.get_text_document(params.text_document.uri)
+    server.prefetch_namespace(document.source)
     _publish_diagnostics(server, params.text_document.uri)
 
 
@@ -757,6 +782,7 @@ def did_open_diagnostics(
     server: JediServer, params: DidOpenTextDocumentParams
 ) -> None:
     """Actions run on textDocument/didOpen: diagnostics."""
+    server.prefetch_namespace(params.text_document.text)
     _publish_diagnostics(server, params.text_document.uri)
 
 
@@ -784,14 +810,10 @@ def _choose_markup(server: JediServer) -> MarkupKind:
     )
 
 
-def get_server(websocket, namespace=None):
-    if namespace is not None:
-        namespaces = [namespace]
-    else:
-        namespaces = []
+def get_server(websocket, namespace: Optional[LazyNamespace] = None):
     return JediServer(
         "lsp-server", "v0.1", websocket,
         loop=asyncio.get_running_loop(),
         protocol_cls=JediLanguageServerProtocol,
-        namespaces=namespaces
+        namespace=namespace
     )
@@ -0,0 +1,106 @@
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from enum import Enum
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+
+# number of finished publish jobs whose status can still be looked up
+MAX_FINISHED_PUBLISH_JOBS = 100
+
+
+class PublishStatus(Enum):
+    QUEUED = "QUEUED"
+    RUNNING = "RUNNING"
+    SUCCESS = "SUCCESS"
+    FAILURE = "FAILURE"
+
+
+class PublishJob:
+    def __init__(self, flow_names: Tuple[str, ...]):
+        self.job_id = str(uuid.uuid4())
+        self.flow_names = flow_names
+        self.status = PublishStatus.QUEUED
+        self.error: Optional[str] = None
+        self.future: Future = Future()
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status in (PublishStatus.SUCCESS, PublishStatus.FAILURE)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "job_id": self.job_id,
+            "flow_name": self.flow_names[0] if len(self.flow_names) == 1 else None,
+            "flow_names": list(self.flow_names),
+            "status": self.status.value,
+            "error": self.error,
+        }
+
+
+class FlowPublisher:
+    """Publishes flows on a background thread, off the webserver event loop.
+
+    Publishes run one at a time, since they all generate and import the same package. Publishing
+    flows that already have a queued publish job returns that job instead of queueing another one:
+    the queued job reads the flow definitions when it starts, so it also covers the later request.
+
+    Args:
+        publish_fn (Callable[[Tuple[str, ...]], None]): Publishes the flows with the given names,
+            raising an exception if they cannot be published.
+    """
+
+    def __init__(self, publish_fn: Callable[[Tuple[str, ...]], None]):
+        self._publish_fn = publish_fn
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="publish_flow")
+        self._lock = threading.Lock()
+        self._jobs: "OrderedDict[str, PublishJob]" = OrderedDict()
+        self._queued_jobs_by_flow: Dict[Tuple[str, ...], PublishJob] = {}
+
+    def submit(self, flow_names: Sequence[str]) -> PublishJob:
+        flow_names = tuple(flow_names)
+        with self._lock:
+            queued_job = self._queued_jobs_by_flow.get(flow_names)
+            if queued_job is not None:
+                return queued_job
+
+            job = PublishJob(flow_names)
+            # submitted first, since the executor refuses new jobs once the publisher is shut down
+            job.future = self._executor.submit(self._run, job)
+            self._jobs[job.job_id] = job
+            self._queued_jobs_by_flow[flow_names] = job
+            return job
+
+    def get_job(self, job_id: str) -> Optional[PublishJob]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def _run(self, job: PublishJob) -> None:
+        with self._lock:
+            del self._queued_jobs_by_flow[job.flow_names]
+            job.status = PublishStatus.RUNNING
+
+        try:
+            self._publish_fn(job.flow_names)
+            status, error = PublishStatus.SUCCESS, None
+        except Exception as e:
+            status, error = PublishStatus.FAILURE, str(e)
+
+        with self._lock:
+            job.status = status
+            job.error = error
+            finished_job_ids = [job_id for job_id, job in self._jobs.items() if job.is_finished]
+            for job_id in finished_job_ids[
+                : max(len(finished_job_ids) - MAX_FINISHED_PUBLISH_JOBS, 0)
+            ]:
+                del self._jobs[job_id]
+
+    def shutdown(self) -> None:
+        """Cancels the queued publish jobs and waits for the running one to finish."""
+        with self._lock:
+            for flow_names, job in list(self._queued_jobs_by_flow.items()):
+                if job.future.cancel():
+                    del self._queued_jobs_by_flow[flow_names]
+                    job.status = PublishStatus.FAILURE
+                    job.error = "The publisher was shut down before the flows were published"
+        self._executor.shutdown(wait=True)
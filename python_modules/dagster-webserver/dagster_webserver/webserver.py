@@ -1,19 +1,22 @@
+import asyncio
 import gzip
 import io
 import mimetypes
 import pathlib
-import pickle
-import typing
 import uuid
+from contextlib import asynccontextmanager
 from os import path, walk
-from typing import Generic, List, Optional, TypeVar
+from typing import Dict, Generic, List, Optional, Sequence, TypeVar
 
 import dagster._check as check
 from dagster import __version__ as dagster_version
 from dagster._annotations import deprecated
 from dagster._core.debug import DebugRunPayload
 from dagster._core.remote_representation.code_location import (
-    load_repositories_from_definitions, dump_codes
+    InProcessCodeLocation, load_repositories_from_definitions, dump_codes
+)
+from dagster._core.remote_representation.flow_compilation import (
+    flow_compile_workers, get_flow_compilation_service, save_flow_compilation_results
 )
 from dagster._core.storage.cloud_storage_compute_log_manager import CloudStorageComputeLogManager
 from dagster._core.storage.compute_log_manager import ComputeIOType
@@ -24,7 +27,9 @@
 from dagster._utils import Counter, traced_counter
 from dagster_graphql import __version__ as dagster_graphql_version
 from dagster_graphql.schema import create_schema
+from fastapi import FastAPI
 from graphene import Schema
+from starlette.concurrency import run_in_threadpool
 from starlette.datastructures import MutableHeaders
 from starlette.exceptions import HTTPException
 from starlette.middleware import Middleware
@@ -48,6 +53,8 @@
 )
 from .graphql import GraphQLServer
 from .lsp import get_server
+from .lsp.namespace import AssetValueSource, LazyNamespace
+from .publish import FlowPublisher
 from .version import __version__
 
 mimetypes.init()
@@ -75,6 +82,7 @@ def __init__(
         self._process_context = process_context
         self._live_data_poll_rate = live_data_poll_rate
         self._uses_app_path_prefix = uses_app_path_prefix
+        self._flow_publisher = FlowPublisher(self._publish_flows)
         super().__init__(app_path_prefix)
 
     def build_graphql_schema(self) -> Schema:
@@ -92,6 +100,22 @@ def make_request_context(self, conn: HTTPConnection) -> BaseWorkspaceRequestCont
     def build_middleware(self) -> List[Middleware]:
         return [Middleware(DagsterTracedCounterMiddleware)]
 
+    def create_asgi_app(self, **kwargs) -> FastAPI:
+        app = super().create_asgi_app(**kwargs)
+        lifespan_context = app.router.lifespan_context
+
+        # stop publishing flows when the app shuts down, after any lifespan passed in
+        @asynccontextmanager
+        async def lifespan(app):
+            try:
+                async with lifespan_context(app) as state:
+                    yield state
+            finally:
+                await run_in_threadpool(self._flow_publisher.shutdown)
+
+        app.router.lifespan_context = lifespan
+        return app
+
     def make_security_headers(self) -> dict:
         return {
             "Cache-Control": "no-store",
@@ -340,6 +364,16 @@ def build_routes(self) -> List[BaseRoute]:
                     self.publish_flow,
                     methods=["POST", "OPTIONS"]
                 ),
+                Route(
+                    "/publish-flows",
+                    self.publish_flows,
+                    methods=["POST", "OPTIONS"]
+                ),
+                Route(
+                    "/publish-flow-status",
+                    self.publish_flow_status,
+                    methods=["GET", "OPTIONS"]
+                ),
                 Route(
                     "/all-flows",
                     self.all_flows,
@@ -423,33 +457,40 @@ async def lsp_ws_endpoint(self, websocket: WebSocket):
         """
 
         context = self.make_request_context(websocket)
-        module_name = pathlib.Path(context.instance.root_directory).name
         flow = websocket.path_params['flow']
+        sources = await run_in_threadpool(self._get_flow_value_sources, context, flow)
+
+        await websocket.accept()
 
+        server = get_server(websocket, namespace=LazyNamespace(sources))
+        try:
+            await server.start_serve()
+        except WebSocketDisconnect:
+            pass
+
+    def _get_flow_value_sources(
+        self, context: BaseWorkspaceRequestContext, flow: str
+    ) -> Dict[str, AssetValueSource]:
+        """Where the latest value of each asset of the flow is stored, by asset name."""
+        module_name = pathlib.Path(context.instance.root_directory).name
         prefix = [module_name, flow]
         asset_keys = [
             key for key in context.asset_graph.all_asset_keys
             if key.has_prefix(prefix)
         ]
-        namespace = {}
-
-        for key, material in context.instance.get_latest_materialization_events(asset_keys).items():
+        sources = {}
+        for record in context.instance.get_asset_records(asset_keys):
+            material = record.asset_entry.last_materialization_record
+            if material is None:
+                continue
             try:
                 path = material.asset_materialization.metadata['path'].path
-                with open(path, 'rb') as f:
-                    value = pickle.load(f)
             except Exception:
-                value = typing.Any
-
-            namespace[key.path[-1]] = value
-
-        await websocket.accept()
-
-        server = get_server(websocket, namespace=namespace)
-        try:
-            await server.start_serve()
-        except WebSocketDisconnect:
-            pass
+                path = None
+            sources[record.asset_entry.asset_key.path[-1]] = AssetValueSource(
+                storage_id=material.storage_id, path=path
+            )
+        return sources
 
     async def save_flow(self, request: Request) -> JSONResponse:
         if request.method == 'OPTIONS':
@@ -479,7 +520,6 @@ async def publish_flow(self, request: Request) -> JSONResponse:
         if request.method == 'OPTIONS':
             return JSONResponse({}, headers=HEADER)
 
-        context = self.make_request_context(request)
         body_content_type = request.headers.get("content-type")
         if body_content_type == "application/json":
             body = await request.json()
@@ -495,22 +535,134 @@ async def publish_flow(self, request: Request) -> JSONResponse:
                 headers=HEADER
             )
 
+        job = self._flow_publisher.submit([body['name']])
+        if not body.get('wait', True):
+            return JSONResponse({'status': 'queued', 'job_id': job.job_id}, headers=HEADER)
+
+        # wait for the publish without blocking the event loop
+        await asyncio.wrap_future(job.future)
+        if job.error is not None:
+            return JSONResponse(
+                {'error': job.error, 'job_id': job.job_id},
+                status_code=200,
+                headers=HEADER
+            )
+        return JSONResponse({'status': 'ok', 'job_id': job.job_id}, headers=HEADER)
+
+    async def publish_flows(self, request: Request) -> JSONResponse:
+        """Publish many flows in one job, by default all saved flows."""
+        if request.method == 'OPTIONS':
+            return JSONResponse({}, headers=HEADER)
+
+        body_content_type = request.headers.get("content-type")
+        if body_content_type == "application/json":
+            body = await request.json()
+        else:
+            return JSONResponse(
+                {
+                    "error": (
+                        f"Unhandled content type {body_content_type}, "
+                        f"expect application/json"
+                    ),
+                },
+                status_code=400,
+                headers=HEADER
+            )
+
+        flow_names = body.get('names')
+        if flow_names is not None and (
+            not isinstance(flow_names, list)
+            or not all(isinstance(name, str) for name in flow_names)
+        ):
+            return JSONResponse(
+                {"error": "Expected names to be a list of flow names"},
+                status_code=400,
+                headers=HEADER
+            )
+        if flow_names is None:
+            context = self.make_request_context(request)
+            flows = await run_in_threadpool(context.instance.run_storage.all_definitions)
+            flow_names = [flow['name'] for flow in flows]
+
+        job = self._flow_publisher.submit(sorted(set(flow_names)))
+        if not body.get('wait', True):
+            return JSONResponse({'status': 'queued', 'job_id': job.job_id}, headers=HEADER)
+
+        await asyncio.wrap_future(job.future)
+        if job.error is not None:
+            return JSONResponse(
+                {'error': job.error, 'job_id': job.job_id},
+                status_code=200,
+                headers=HEADER
+            )
+        return JSONResponse({'status': 'ok', 'job_id': job.job_id}, headers=HEADER)
+
+    async def publish_flow_status(self, request: Request) -> JSONResponse:
+        if request.method == 'OPTIONS':
+            return JSONResponse({}, headers=HEADER)
+
+        job_id = request.query_params.get("job_id")
+        job = self._flow_publisher.get_job(job_id) if job_id else None
+        if job is None:
+            return JSONResponse(
+                {'error': f"Unknown publish job {job_id}"},
+                status_code=404,
+                headers=HEADER
+            )
+        return JSONResponse(job.to_dict(), headers=HEADER)
+
+    def _publish_flows(self, flow_names: Sequence[str]) -> None:
+        """Load, dump and reload saved flows. Runs on the publisher thread."""
+        max_workers = flow_compile_workers()
+        if len(flow_names) == 1 and max_workers <= 1:
+            self._publish_flow(flow_names[0])
+            return
+
+        context = self._process_context.create_request_context()
+        code_folder = pathlib.Path(context.instance.root_directory)
+        storage = context.instance.run_storage
+        flows = [flow for flow_name in flow_names if (flow := storage.get_definition(flow_name))]
+        location_name = next(
+            (
+                name for name in context.code_location_names
+                if context.has_code_location(name)
+                and isinstance(context.get_code_location(name), InProcessCodeLocation)
+            ),
+            None,
+        )
+        if not flows or location_name is None:
+            return
+
+        package_name = code_folder.name
+        results = get_flow_compilation_service(max_workers).compile_flows(
+            flows, package_name, location_name, storage
+        )
+        save_flow_compilation_results(storage, results)
+        dump_codes(
+            [flow for flow in flows if results[flow['name']].repository_rows is not None],
+            code_folder,
+            package_name,
+            storage,
+        )
+        context.reload_workspace()
+
+        errors = [
+            f"{flow_name}: {result.error.message.strip()}"
+            for flow_name, result in results.items() if result.error is not None
+        ]
+        if errors:
+            raise Exception("\n".join(errors))
+
+    def _publish_flow(self, flow_name: str) -> None:
+        """Load, dump and reload a saved flow in the webserver process."""
+        context = self._process_context.create_request_context()
         code_folder = pathlib.Path(context.instance.root_directory)
         storage = context.instance.run_storage
-        flow_name = body['name']
         if flow := storage.get_definition(flow_name):
             package_name = code_folder.name
-            try:
-                loaded = load_repositories_from_definitions([flow], package_name)
-            except Exception as e:
-                return JSONResponse(
-                    {'error': str(e)},
-                    status_code=200,
-                    headers=HEADER
-                )
-            dump_codes([flow], code_folder, package_name)
+            loaded = load_repositories_from_definitions([flow], package_name, storage)
+            dump_codes([flow], code_folder, package_name, storage)
             context.reload_workspace(flow=flow, loaded_repo=loaded)
-        return JSONResponse({'status': 'ok'}, headers=HEADER)
 
     async def all_flows(self, request: Request) -> JSONResponse:
         if request.method == 'OPTIONS':
@@ -543,6 +695,7 @@ async def drop_flow(self, request: Request) -> JSONResponse:
             )
         storage = context.instance.run_storage
         storage.drop_definition(**body)
+        storage.drop_compiled_flows(body['name'])
         return JSONResponse({'status': 'ok'}, headers=HEADER)
 
 
@@ -0,0 +1,107 @@
+import pickle
+import typing
+
+import pytest
+from dagster_webserver.lsp import namespace
+from dagster_webserver.lsp.namespace import (
+    AssetValueSource,
+    LazyNamespace,
+    ValueStubCache,
+    make_value_stub,
+)
+
+
+class _Value:
+    pass
+
+
+def _write_value(tmp_path, name, value):
+    path = tmp_path / name
+    path.write_bytes(pickle.dumps(value))
+    return str(path)
+
+
+def test_make_value_stub_small_values():
+    value = _Value()
+    assert make_value_stub(value, 10) is value
+    assert make_value_stub([value, _Value()], 10) == [value]
+    assert make_value_stub((1, 2, 3), 10) == (1,)
+    assert make_value_stub({"a": 1, "b": 2}, 10) == {"a": 1}
+    assert make_value_stub([], 10) == []
+
+
+def test_make_value_stub_large_values():
+    size = namespace.MAX_INLINE_VALUE_BYTES + 1
+    assert make_value_stub(_Value(), size) is typing.Any
+    # the first element of a large container may itself be large
+    assert make_value_stub([_Value()], size) == [_Value]
+    assert make_value_stub({"a": ("x" * size, 1)}, size) == {
+        "a": ("x" * namespace.MAX_INLINE_ELEMENT_LENGTH,)
+    }
+    assert make_value_stub([[1.5, 2.5]], size) == [[1.5]]
+
+
+def test_make_value_stub_recursive_value():
+    value = []
+    value.append(value)
+    stub = make_value_stub(value, namespace.MAX_INLINE_VALUE_BYTES + 1)
+    for _ in range(namespace.MAX_STUB_DEPTH):
+        (stub,) = stub
+    assert stub == []
+
+
+def test_make_value_stub_dataframe():
+    pd = pytest.importorskip("pandas")
+    stub = make_value_stub(pd.DataFrame({"a": [1, 2], "b": ["x", "y"]}), 10)
+    assert list(stub.columns) == ["a", "b"]
+    assert len(stub) == 0
+
+
+def test_value_stub_cache(tmp_path):
+    cache = ValueStubCache(max_size=2)
+    sources = [
+        AssetValueSource(storage_id, _write_value(tmp_path, str(storage_id), [storage_id]))
+        for storage_id in range(3)
+    ]
+    assert cache.get(0, "missing") == "missing"
+
+    assert cache.load(sources[0]).result(timeout=5) == [0]
+    assert cache.load(sources[1]).result(timeout=5) == [1]
+    # touch 0, so that 1 is the least recently used
+    assert cache.get(0) == [0]
+    assert cache.load(sources[2]).result(timeout=5) == [2]
+    assert cache.get(1, "missing") == "missing"
+    assert cache.get(0) == [0]
+    assert cache.get(2) == [2]
+
+    # unreadable values resolve to Any
+    assert cache.load(AssetValueSource(3, None)).result(timeout=5) is typing.Any
+    assert cache.load(AssetValueSource(4, str(tmp_path / "missing"))).result(timeout=5) is (
+        typing.Any
+    )
+
+    cache.clear()
+    assert cache.get(0, "missing") == "missing"
+
+
+def test_lazy_namespace(tmp_path):
+    cache = ValueStubCache()
+    lazy_namespace = LazyNamespace(
+        {
+            "orders": AssetValueSource(1, _write_value(tmp_path, "orders", {"id": 1})),
+            "customers": AssetValueSource(2, _write_value(tmp_path, "customers", ["ann"])),
+        },
+        cache,
+    )
+    code = "orders.items()\ncustomers_count = 1"
+    assert lazy_namespace.referenced_names(code) == {"orders"}
+
+    # values are loaded in the background, and resolve to Any until they are loaded
+    namespace_before_load = lazy_namespace.resolve(code)
+    assert namespace_before_load["customers"] is typing.Any
+    cache.load(AssetValueSource(1, None)).result(timeout=5)
+    assert lazy_namespace.resolve(code) == {"orders": {"id": 1}, "customers": typing.Any}
+
+    lazy_namespace.prefetch("customers")
+    cache.load(AssetValueSource(2, None)).result(timeout=5)
+    assert lazy_namespace.resolve("") == {"orders": {"id": 1}, "customers": ["ann"]}
@@ -0,0 +1,90 @@
+import asyncio
+import threading
+from types import SimpleNamespace
+
+import pytest
+from dagster_webserver.lsp import project_cache
+from dagster_webserver.lsp.server import JediServer, WebSocketTransportAdapter
+
+
+def _jedi_thread():
+    return project_cache.submit(threading.current_thread).result()
+
+
+@pytest.fixture
+def clean_project_cache():
+    project_cache.clear()
+    yield
+    project_cache.clear()
+
+
+def test_get_project_shared(clean_project_cache, tmp_path):
+    project = project_cache.get_project(str(tmp_path))
+    assert project_cache.get_project(str(tmp_path)) is project
+    assert project_cache.get_project(str(tmp_path), extra_paths=["foo"]) is not project
+
+
+def test_preload_runs_on_jedi_thread(clean_project_cache, monkeypatch):
+    threads = []
+
+    class _Interpreter:
+        def __init__(self, code, namespaces, project=None):
+            threads.append(threading.current_thread())
+
+        def complete(self, line, column):
+            return []
+
+    monkeypatch.setattr(project_cache.jedi, "Interpreter", _Interpreter)
+    monkeypatch.setattr(
+        project_cache,
+        "trim_module_cache",
+        lambda: threads.append(threading.current_thread()),
+    )
+
+    future = project_cache.preload_modules(None, ["foo", "bar"])
+    assert future is not None
+    future.result()
+    assert threads == [_jedi_thread()] * 3
+
+    # modules are only preloaded once per project
+    assert project_cache.preload_modules(None, ["foo", "bar"]) is None
+
+
+def test_trim_module_cache(monkeypatch):
+    grammar_cache = {f"module_{i}": SimpleNamespace(last_used=i) for i in range(5)}
+    monkeypatch.setattr(project_cache.parso.cache, "parser_cache", {"grammar": grammar_cache})
+
+    project_cache.trim_module_cache(max_modules=5)
+    assert len(grammar_cache) == 5
+
+    project_cache.trim_module_cache(max_modules=2)
+    assert set(grammar_cache) == {"module_3", "module_4"}
+
+
+def test_sync_features_run_on_jedi_thread():
+    @JediServer.feature("test/syncFeature")
+    def sync_feature(server, params):
+        return threading.current_thread()
+
+    try:
+        assert asyncio.iscoroutinefunction(sync_feature)
+        assert asyncio.run(sync_feature(None, None)) == _jedi_thread()
+    finally:
+        JediServer._features.pop("test/syncFeature")  # noqa: SLF001
+
+
+def test_transport_write_from_other_thread():
+    sent = []
+
+    class _WebSocket:
+        async def send_text(self, data):
+            sent.append(data)
+
+    async def _write_from_thread():
+        transport = WebSocketTransportAdapter(_WebSocket(), asyncio.get_running_loop())
+        await asyncio.wrap_future(project_cache.submit(transport.write, b"message"))
+        while not sent:
+            await asyncio.sleep(0.01)
+
+    asyncio.run(asyncio.wait_for(_write_from_thread(), timeout=5))
+    assert sent == ["message"]
@@ -0,0 +1,49 @@
+import pytest
+from dagster import __version__
+from dagster._cli.workspace.cli_target import get_workspace_process_context_from_kwargs
+from dagster._core.test_utils import instance_for_test
+from dagster_webserver.webserver import DagsterWebserver
+from starlette.testclient import TestClient
+
+
+@pytest.fixture
+def flows_client():
+    with instance_for_test() as instance:
+        process_context = get_workspace_process_context_from_kwargs(
+            instance=instance,
+            version=__version__,
+            read_only=False,
+            kwargs={"empty_workspace": True},
+        )
+        webserver = DagsterWebserver(process_context)
+        yield TestClient(webserver.create_asgi_app(debug=True))
+
+
+@pytest.mark.parametrize("names", ["flow", ["flow", 1], {"flow": True}])
+def test_publish_flows_invalid_names(flows_client: TestClient, names):
+    response = flows_client.post("/publish-flows", json={"names": names})
+    assert response.status_code == 400
+    assert "error" in response.json()
+
+
+def test_publish_flows_unknown_names(flows_client: TestClient):
+    response = flows_client.post("/publish-flows", json={"names": ["missing"]})
+    assert response.status_code == 200
+    assert response.json()["status"] == "ok"
+
+
+def test_publisher_shut_down_with_app():
+    with instance_for_test() as instance:
+        process_context = get_workspace_process_context_from_kwargs(
+            instance=instance,
+            version=__version__,
+            read_only=False,
+            kwargs={"empty_workspace": True},
+        )
+        webserver = DagsterWebserver(process_context)
+        with TestClient(webserver.create_asgi_app(debug=True)) as client:
+            response = client.post("/publish-flows", json={"names": ["missing"]})
+            assert response.json()["status"] == "ok"
+
+        with pytest.raises(RuntimeError):
+            webserver._flow_publisher.submit(["missing"])  # noqa: SLF001
@@ -0,0 +1,103 @@
+import threading
+
+import pytest
+from dagster_webserver import publish
+from dagster_webserver.publish import FlowPublisher, PublishStatus
+
+
+class _BlockingPublish:
+    def __init__(self):
+        self.calls = []
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def __call__(self, flow_names):
+        self.calls.append(flow_names)
+        self.started.set()
+        assert self.release.wait(timeout=5)
+        if "bad" in flow_names:
+            raise Exception("cannot publish bad")
+
+
+@pytest.fixture
+def blocking_publish():
+    publish_fn = _BlockingPublish()
+    yield publish_fn
+    publish_fn.release.set()
+
+
+def test_queued_jobs_coalesce(blocking_publish):
+    publisher = FlowPublisher(blocking_publish)
+    try:
+        running = publisher.submit(["a"])
+        assert blocking_publish.started.wait(timeout=5)
+        assert running.status == PublishStatus.RUNNING
+
+        queued = publisher.submit(["b"])
+        assert publisher.submit(["b"]) is queued
+        # the running job already read its flow definitions, so it does not cover a new request
+        queued_again = publisher.submit(["a"])
+        assert queued_again is not running
+        assert publisher.submit(["a"]) is queued_again
+        assert queued.status == queued_again.status == PublishStatus.QUEUED
+
+        blocking_publish.release.set()
+        for job in [running, queued, queued_again]:
+            job.future.result(timeout=5)
+            assert job.status == PublishStatus.SUCCESS
+            assert publisher.get_job(job.job_id) is job
+        assert blocking_publish.calls == [("a",), ("b",), ("a",)]
+    finally:
+        publisher.shutdown()
+
+
+def test_finished_jobs_evicted(monkeypatch):
+    monkeypatch.setattr(publish, "MAX_FINISHED_PUBLISH_JOBS", 2)
+    publisher = FlowPublisher(lambda flow_names: None)
+    try:
+        jobs = []
+        for flow_name in ["a", "b", "c", "d"]:
+            job = publisher.submit([flow_name])
+            job.future.result(timeout=5)
+            jobs.append(job)
+
+        assert [publisher.get_job(job.job_id) for job in jobs] == [None, None, *jobs[2:]]
+    finally:
+        publisher.shutdown()
+
+
+def test_failed_job(blocking_publish):
+    blocking_publish.release.set()
+    publisher = FlowPublisher(blocking_publish)
+    try:
+        job = publisher.submit(["bad"])
+        job.future.result(timeout=5)
+        assert job.to_dict() == {
+            "job_id": job.job_id,
+            "flow_name": "bad",
+            "flow_names": ["bad"],
+            "status": "FAILURE",
+            "error": "cannot publish bad",
+        }
+    finally:
+        publisher.shutdown()
+
+
+def test_shutdown_cancels_queued_jobs(blocking_publish):
+    publisher = FlowPublisher(blocking_publish)
+    running = publisher.submit(["a"])
+    assert blocking_publish.started.wait(timeout=5)
+    queued = publisher.submit(["b"])
+
+    shutdown = threading.Thread(target=publisher.shutdown)
+    shutdown.start()
+    blocking_publish.release.set()
+    shutdown.join(timeout=5)
+    assert not shutdown.is_alive()
+
+    assert running.status == PublishStatus.SUCCESS
+    assert queued.status == PublishStatus.FAILURE
+    assert queued.future.cancelled()
+    assert blocking_publish.calls == [("a",)]
+    with pytest.raises(RuntimeError):
+        publisher.submit(["c"])
@@ -1,4 +1,6 @@
-from typing import TYPE_CHECKING, Mapping
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Mapping, Tuple
 
 import dagster._check as check
 from dagster._core.errors import DagsterUserCodeProcessError
@@ -12,6 +14,18 @@
     from dagster._core.remote_representation import CodeLocation
     from dagster._grpc.client import DagsterGrpcClient
 
+# maximum number of repositories whose most recently fetched data is kept
+MAX_CACHED_REPOSITORY_DATAS = 32
+
+# (location name, repository name) -> (snapshot id, repository data) of the most recently fetched
+# repository data, least recently used first. Code servers skip resending repository data whose
+# snapshot id the caller already holds, so reloading an unchanged code location does not
+# re-transfer or re-deserialize it.
+_repository_data_cache: "OrderedDict[Tuple[str, str], Tuple[str, ExternalRepositoryData]]" = (
+    OrderedDict()
+)
+_repository_data_cache_lock = threading.Lock()
+
 
 def sync_get_streaming_external_repositories_data_grpc(
     api_client: "DagsterGrpcClient", code_location: "CodeLocation"
@@ -22,15 +36,26 @@ def sync_get_streaming_external_repositories_data_grpc(
 
     repo_datas = {}
     for repository_name in code_location.repository_names:  # type: ignore
+        cache_key = (code_location.origin.location_name, repository_name)
+        with _repository_data_cache_lock:
+            cached = _repository_data_cache.get(cache_key)
+            if cached:
+                _repository_data_cache.move_to_end(cache_key)
+
         external_repository_chunks = list(
             api_client.streaming_external_repository(
                 external_repository_origin=RemoteRepositoryOrigin(
                     code_location.origin,
                     repository_name,
-                )
+                ),
+                known_snapshot_id=cached[0] if cached else None,
             )
         )
 
+        if cached and any(chunk.get("not_modified") for chunk in external_repository_chunks):
+            repo_datas[repository_name] = cached[1]
+            continue
+
         result = deserialize_value(
             "".join(
                 [
@@ -42,7 +67,26 @@ def sync_get_streaming_external_repositories_data_grpc(
         )
 
         if isinstance(result, ExternalRepositoryErrorData):
+            with _repository_data_cache_lock:
+                _repository_data_cache.pop(cache_key, None)
             raise DagsterUserCodeProcessError.from_error_info(result.error)
 
+        snapshot_id = next(
+            (
+                chunk["snapshot_id"]
+                for chunk in external_repository_chunks
+                if chunk.get("snapshot_id")
+            ),
+            None,
+        )
+        with _repository_data_cache_lock:
+            if snapshot_id:
+                _repository_data_cache[cache_key] = (snapshot_id, result)
+                _repository_data_cache.move_to_end(cache_key)
+                while len(_repository_data_cache) > MAX_CACHED_REPOSITORY_DATAS:
+                    _repository_data_cache.popitem(last=False)
+            else:
+                _repository_data_cache.pop(cache_key, None)
+
         repo_datas[repository_name] = result
     return repo_datas
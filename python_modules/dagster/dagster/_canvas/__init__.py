@@ -1,22 +1,59 @@
-from typing import Dict, List
+import hashlib
+import json
+from typing import Dict, List, NamedTuple, Optional
 
 import pydantic
 from . import context, dispatch
 from .steps import Step
 from .codegen import Import
+from .incremental import StepCache, default_step_cache
 
 
 __all__ = [
     'convert_to_code',
+    'compile_flow',
+    'compute_cache_key',
+    'CompiledFlow',
+    'StepCache',
 ]
 
+#: bump whenever the code generated for the same flow definition changes, so that
+#: compile cache entries of older versions are no longer hit
+COMPILER_VERSION = 2
 
-def convert_to_code(data: List[Dict], namespace: List[str] = None) -> str:
 
+class CompiledFlow(NamedTuple):
+    #: generated module source
+    code: str
+    #: step name -> names of the steps it depends on, by kind of dependency
+    dependencies: Dict[str, Dict[str, List[str]]]
+
+
+def compute_cache_key(data: List[Dict], namespace: Optional[List[str]] = None) -> str:
+    """Stable hash of a flow definition and namespace, used as the key of the compile cache."""
+    payload = json.dumps(
+        [COMPILER_VERSION, namespace, data],
+        sort_keys=True,
+        separators=(',', ':'),
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def compile_flow(
+    data: List[Dict],
+    namespace: Optional[List[str]] = None,
+    step_cache: Optional[StepCache] = default_step_cache,
+) -> CompiledFlow:
+    """Generate the module of a flow.
+
+    Per-step results are reused from ``step_cache`` for steps whose code has not
+    changed since an earlier compilation; pass None to compile every step anew.
+    """
     ctx = context.ContextLevel(
         None,
         None,
-        namespace=namespace
+        namespace=namespace,
+        step_cache=step_cache,
     )
     context.Context(ctx)
     ctx.code_block.add_imports(
@@ -40,4 +77,11 @@ def convert_to_code(data: List[Dict], namespace: List[str] = None) -> str:
     for step in data:
         dispatch.compile(pydantic.parse_obj_as(Step, step), ctx=ctx)
 
-    return ctx.code_block.generate()
+    return CompiledFlow(
+        code=ctx.code_block.generate(),
+        dependencies=ctx.code_block.dependencies(),
+    )
+
+
+def convert_to_code(data: List[Dict], namespace: Optional[List[str]] = None) -> str:
+    return compile_flow(data, namespace).code
@@ -2,16 +2,19 @@
 import builtins
 import contextlib
 import itertools
-from typing import List, FrozenSet
+from typing import List, FrozenSet, Tuple
+
+_BUILTIN_NAMES = frozenset(dir(builtins))
 
 
 class DependencyCollector(ast.NodeVisitor):
-    def __init__(self, locals: FrozenSet[str] = frozenset()):
+    def __init__(self, visible_names: FrozenSet[str] = frozenset()):
         self._stack = [set(), ]
         self._deps = set()
-        self._locals = locals
+        self._locals = visible_names
         self._globals = set(dir(builtins))
         self._dangling_refs = set()
+        self._free_names = {}
 
     @contextlib.contextmanager
     def enter_function(self, fundef: ast.FunctionDef):
@@ -62,6 +65,7 @@ def visit_NamedExpr(self, node: ast.NamedExpr):
 
     def visit_Name(self, node: ast.Name):
         if not self.is_identifier_visible(node.id):
+            self._free_names[node.id] = None
             if node.id in self._locals:
                 self._deps.add(node.id)
             elif node.id not in self._globals:
@@ -88,3 +92,31 @@ def dependencies(self) -> List[str]:
     def dangling_refs(self) -> FrozenSet[str]:
         return frozenset(self._dangling_refs)
 
+    @property
+    def free_names(self) -> Tuple[str, ...]:
+        """Names the code reads without binding them, in order of first use.
+
+        Unlike dependencies and dangling refs, these do not depend on the
+        visible locals, so they can be computed once per code.
+        """
+        return tuple(self._free_names)
+
+
+def collect_free_names(code: str) -> Tuple[str, ...]:
+    collector = DependencyCollector()
+    collector.visit(ast.parse(code))
+    return collector.free_names
+
+
+def resolve_free_names(
+    free_names: Tuple[str, ...],
+    visible_names: FrozenSet[str],
+) -> Tuple[List[str], FrozenSet[str]]:
+    """Split free names into dependencies on visible locals and dangling refs."""
+    deps = [name for name in free_names if name in visible_names]
+    dangling = frozenset(
+        name for name in free_names
+        if name not in visible_names and name not in _BUILTIN_NAMES
+    )
+    return deps, dangling
+
@@ -2,7 +2,7 @@
 import itertools
 
 import textwrap
-from typing import List, Optional, Dict, NamedTuple, Any, TYPE_CHECKING, Iterable
+from typing import List, Optional, Dict, NamedTuple, Any, TYPE_CHECKING, Iterable, Hashable
 
 from .steps import Step
 from . import node
@@ -47,6 +47,10 @@ def call(self) -> str:
     def into_asset(self, prefix: List[str]) -> Optional[str]:
         return None
 
+    def fragment_key(self) -> Optional[Hashable]:
+        """Everything :attr:`code` is generated from, or None if it is not worth caching."""
+        return None
+
 
 class FunctionCode(CodeObject):
     def __init__(
@@ -79,6 +83,9 @@ def code(self) -> str:
     def dependencies(self) -> Iterable[str]:
         return self._args
 
+    def fragment_key(self) -> Optional[Hashable]:
+        return (type(self).__name__, self.name, self._body, tuple(self._args))
+
     def call(self) -> str:
         args = (
             f"{arg}={CONTEXT}.{arg}"
@@ -111,10 +118,24 @@ def __init__(
     def add_dep(self, dep: str):
         self._deps.append(dep)
 
+    def dependency_info(self) -> Dict[str, List[str]]:
+        return {
+            'arguments': list(self._args),
+            'runtime': list(self._deps),
+            'optional': list(self._optdeps),
+        }
+
     @property
     def dependencies(self) -> Iterable[str]:
         return itertools.chain(self._args, self._optdeps, self._deps, )
 
+    def fragment_key(self) -> Optional[Hashable]:
+        return super().fragment_key() + (
+            tuple(self._namespace),
+            tuple(self._deps),
+            tuple(self._optdeps),
+        )
+
     @functools.cached_property
     def _deco_args(self) -> List[str]:
         deco_args = [f"name={self._qualname!r}"]
@@ -211,6 +232,9 @@ def __init__(
         self._key_prefix = key_prefix
         self._dep = dep
 
+    def fragment_key(self) -> Optional[Hashable]:
+        return super().fragment_key() + (tuple(self._key_prefix), self._dep)
+
     @functools.cached_property
     def _deco_args(self) -> List[str]:
         deco_args = [f"key_prefix={self._key_prefix}"]
@@ -230,6 +254,9 @@ def __init__(self, *args, **kwargs):
         self._outs = []
         self._counter = itertools.count(1).__next__
 
+    def fragment_key(self) -> Optional[Hashable]:
+        return super().fragment_key() + (tuple(self._outs), )
+
     def create_out(self, hint: str = None) -> str:
         if not hint:
             hint = f"{self._counter():03}"
@@ -287,7 +314,13 @@ def add(self, step: Step, code: CodeObject):
 
     def generate(self) -> str:
         imports = '\n'.join(map(str, self._imports))
-        body = '\n\n'.join(blk.code for blk in self._codes.values())
+        if (step_cache := self._ctx.step_cache) is None:
+            body = '\n\n'.join(blk.code for blk in self._codes.values())
+        else:
+            body = '\n\n'.join(
+                step_cache.fragment(step.id, blk)
+                for step, blk in self._codes.items()
+            )
         return '\n'.join((
             imports,
             body,
@@ -298,6 +331,13 @@ def generate(self) -> str:
     def get(self, step: Step) -> Optional[CodeObject]:
         return self._codes.get(step, None)
 
+    def dependencies(self) -> Dict[str, Dict[str, List[str]]]:
+        return {
+            code.name: code.dependency_info()
+            for code in self._codes.values()
+            if isinstance(code, OpCode)
+        }
+
     def add_imports(self, *imps: Import):
         self._imports.extend(imps)
 
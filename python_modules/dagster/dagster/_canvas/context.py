@@ -20,11 +20,23 @@
 from __future__ import annotations
 
 import enum
-from typing import *
-
-from .codegen import CodeBlock, NodeRef, CodeObject
-from .steps import Step
-
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ContextManager,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Set,
+    Type,
+)
+
+from .codegen import CodeBlock, NodeRef
+
+if TYPE_CHECKING:
+    from .incremental import StepCache
+    from .steps import Step
 
 class Mode(enum.Enum):
     NEW_BRANCH = enum.auto()
@@ -58,6 +70,8 @@ class ContextLevel:
     current_step: Optional[Step]
     #: step -> step's parent
     step_hierarchy: Dict[Step, Step]
+    #: per-step results reused from earlier compilations, if any
+    step_cache: Optional[StepCache]
 
     def __init__(
         self,
@@ -65,6 +79,7 @@ def __init__(
         mode: Optional[Mode], *,
         top_step: Step = None,
         namespace: List[str] = None,
+        step_cache: StepCache = None,
     ) -> None:
         self.locals = set()
 
@@ -77,6 +92,7 @@ def __init__(
             self.top_step = top_step
             self.step_hierarchy = {}
             self.current_step = None
+            self.step_cache = step_cache
         else:
             self.globals = prevlevel.globals
             self.namespace = prevlevel.namespace
@@ -86,6 +102,7 @@ def __init__(
             self.top_step = prevlevel.top_step
             self.step_hierarchy = prevlevel.step_hierarchy
             self.current_step = prevlevel.current_step
+            self.step_cache = prevlevel.step_cache
 
         if mode is Mode.NEW_BRANCH:
             self.globals |= prevlevel.locals
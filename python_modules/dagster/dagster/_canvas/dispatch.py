@@ -1,8 +1,7 @@
-import ast
 import dataclasses
 from typing import Callable
 
-from .analyzer import DependencyCollector
+from .analyzer import collect_free_names, resolve_free_names
 from .codegen import *
 from .context import ContextLevel, NodeRef, Branch
 from .steps import Step, CodeStep, MapStep, IfElseStep
@@ -45,20 +44,25 @@ def inspect_code(
     step: Step,
     ctx: ContextLevel
 ) -> Dependency:
-    collector = DependencyCollector(locals=ctx.globals | ctx.locals)
-    collector.visit(ast.parse(code))
+    if ctx.step_cache is None:
+        free_names = collect_free_names(code)
+    else:
+        free_names = ctx.step_cache.free_names(step.id, code)
 
-    if dangling_refs := collector.dangling_refs:
+    dependencies, dangling_refs = resolve_free_names(
+        free_names, ctx.globals | ctx.locals
+    )
+    if dangling_refs:
         raise DagsterInvalidDefinitionError(
             f"step: {step.name} contains unknown reference: {dangling_refs}"
         )
 
-    dep = Dependency(argument=collector.dependencies)
+    dep = Dependency(argument=dependencies)
 
     if (
         ctx.last_step is not None
         and not isinstance(ctx.last_step, (MapStep, IfElseStep))
-        and ctx.last_step.name not in collector.dependencies
+        and ctx.last_step.name not in dependencies
     ):
         dep.runtime.append(ctx.last_step.name)
 
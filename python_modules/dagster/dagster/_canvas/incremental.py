@@ -0,0 +1,79 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Callable, Hashable, Tuple, TypeVar
+
+from .analyzer import collect_free_names
+from .codegen import CodeObject
+
+__all__ = ["StepCache", "default_step_cache"]
+
+#: maximum number of steps whose results are kept, across all flows
+MAX_CACHED_STEPS = 10000
+
+T = TypeVar("T")
+
+_MISSING = object()
+
+
+class _StepResults:
+    """Latest result of one kind per step id, tagged with the key it was computed for."""
+
+    def __init__(self, max_size: int):
+        self._max_size = max_size
+        self._lock = threading.Lock()
+        self._results: "OrderedDict[str, Tuple[Hashable, object]]" = OrderedDict()
+
+    def get_or_compute(self, step_id: str, key: Hashable, compute: Callable[[], T]) -> T:
+        with self._lock:
+            cached_key, result = self._results.get(step_id, (_MISSING, None))
+            if cached_key == key:
+                self._results.move_to_end(step_id)
+                return result
+
+        # computed outside of the lock, so that flows compile concurrently
+        result = compute()
+        with self._lock:
+            self._results[step_id] = (key, result)
+            self._results.move_to_end(step_id)
+            while len(self._results) > self._max_size:
+                self._results.popitem(last=False)
+        return result
+
+    def clear(self):
+        with self._lock:
+            self._results.clear()
+
+
+class StepCache:
+    """Per-step compile results reused across compilations of flows.
+
+    A flow is still compiled step by step, but the two costly parts of a step
+    are looked up by step id: the names its code reads, which need an
+    ``ast.parse``, and its generated source fragment. An entry is reused only
+    while the step's code (or the inputs of its fragment) are unchanged. The
+    dependency edges of a step are then derived from its free names and the
+    names visible at the step, which is cheap, so an edit of one step only
+    re-parses and re-renders that step.
+    """
+
+    def __init__(self, max_size: int = MAX_CACHED_STEPS):
+        self._free_names = _StepResults(max_size)
+        self._fragments = _StepResults(max_size)
+
+    def free_names(self, step_id: str, code: str) -> Tuple[str, ...]:
+        code_hash = hashlib.sha1(code.encode()).hexdigest()
+        return self._free_names.get_or_compute(step_id, code_hash, lambda: collect_free_names(code))
+
+    def fragment(self, step_id: str, code: CodeObject) -> str:
+        key = code.fragment_key()
+        if key is None:
+            return code.code
+        return self._fragments.get_or_compute(step_id, key, lambda: code.code)
+
+    def clear(self):
+        self._free_names.clear()
+        self._fragments.clear()
+
+
+default_step_cache = StepCache()
@@ -89,6 +89,7 @@ def __init__(
         logger: logging.Logger,
         evaluation_time: Optional[datetime.datetime] = None,
         request_backfills: bool = False,
+        num_evaluation_workers: Optional[int] = None,
     ):
         from dagster._utils.caching_instance_queryer import CachingInstanceQueryer
 
@@ -117,6 +118,7 @@ def __init__(
         self._respect_materialization_data_versions = respect_materialization_data_versions
         self._logger = logger
         self._request_backfills = request_backfills
+        self._num_evaluation_workers = num_evaluation_workers
 
     @property
     def logger(self) -> logging.Logger:
@@ -175,6 +177,7 @@ def get_asset_condition_evaluations(
             respect_materialization_data_versions=self.respect_materialization_data_versions,
             auto_materialize_run_tags=self.auto_materialize_run_tags,
             request_backfills=self._request_backfills,
+            num_evaluation_workers=self._num_evaluation_workers,
         )
         return evaluator.evaluate()
 
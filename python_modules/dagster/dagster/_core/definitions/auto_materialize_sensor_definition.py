@@ -70,6 +70,7 @@ def evaluate_automation_conditions(context: SensorEvaluationContext):
         respect_materialization_data_versions=True,
         auto_materialize_run_tags={},
         request_backfills=context.instance.da_request_backfills(),
+        num_evaluation_workers=context.instance.auto_materialize_num_evaluation_workers,
     )
     results, to_request = evaluator.evaluate()
     new_cursor = cursor.with_updates(
@@ -11,6 +11,7 @@
 from dagster._core.definitions.declarative_automation.automation_context import AutomationContext
 from dagster._core.definitions.events import AssetKey, AssetKeyPartitionKey
 from dagster._core.errors import DagsterInvalidDefinitionError
+from dagster._core.utils import InheritContextThreadPoolExecutor
 
 from ..asset_daemon_cursor import AssetDaemonCursor
 from ..base_asset_graph import BaseAssetGraph
@@ -41,6 +42,9 @@ def __init__(
         # Should this be a supported feature in DS?
         auto_materialize_run_tags: Mapping[str, str],
         request_backfills: bool,
+        # When greater than 1, assets in the same topological level of the asset graph are
+        # evaluated concurrently in a pool of this many threads
+        num_evaluation_workers: Optional[int] = None,
     ):
         self.asset_graph = asset_graph
         self.asset_keys = asset_keys
@@ -58,6 +62,7 @@ def __init__(
         self.num_checked_assets = 0
         self.num_asset_keys = len(asset_keys)
         self.request_backfills = request_backfills
+        self.num_evaluation_workers = num_evaluation_workers
 
     asset_graph: BaseAssetGraph
     asset_keys: AbstractSet[AssetKey]
@@ -73,6 +78,7 @@ def __init__(
     respect_materialization_data_versions: bool
     auto_materialize_run_tags: Mapping[str, str]
     request_backfills: bool
+    num_evaluation_workers: Optional[int]
 
     @property
     def instance_queryer(self) -> "CachingInstanceQueryer":
@@ -104,72 +110,109 @@ def prefetch(self) -> None:
 
     def evaluate(self) -> Tuple[Sequence[AutomationResult], AbstractSet[AssetKeyPartitionKey]]:
         self.prefetch()
-        for asset_key in self.asset_graph.toposorted_asset_keys:
-            # an asset may have already been visited if it was part of a non-subsettable multi-asset
-            if asset_key not in self.asset_keys:
-                continue
-
-            self.num_checked_assets = self.num_checked_assets + 1
-            start_time = time.time()
-            self.logger.debug(
-                "Evaluating asset"
-                f" {asset_key.to_user_string()} ({self.num_checked_assets}/{self.num_asset_keys})"
-            )
+        if self.num_evaluation_workers is not None and self.num_evaluation_workers > 1:
+            self._evaluate_levels_in_parallel(self.num_evaluation_workers)
+        else:
+            for asset_key in self.asset_graph.toposorted_asset_keys:
+                # an asset may have already been visited if it was part of a non-subsettable multi-asset
+                if asset_key not in self.asset_keys:
+                    continue
 
-            try:
-                (result, expected_data_time) = self.evaluate_asset(
-                    asset_key, self.expected_data_time_mapping, self.current_results_by_key
-                )
-            except Exception as e:
-                raise Exception(
-                    f"Error while evaluating conditions for asset {asset_key.to_user_string()}"
-                ) from e
-
-            num_requested = result.true_subset.size
-            log_fn = self.logger.info if num_requested > 0 else self.logger.debug
-
-            to_request_asset_partitions = result.true_subset.asset_partitions
-            to_request_str = ",".join(
-                [(ap.partition_key or "No partition") for ap in to_request_asset_partitions]
-            )
-            self.to_request |= to_request_asset_partitions
+                self._log_evaluation_start(asset_key)
+                self._record_evaluation(asset_key, *self._evaluate_asset_and_time(asset_key))
+
+        return list(self.current_results_by_key.values()), self.to_request
+
+    def _evaluate_levels_in_parallel(self, num_workers: int) -> None:
+        """Evaluates the assets of each topological level of the asset graph concurrently. An
+        asset's evaluation only reads the results of its parents, which are all in earlier levels,
+        so the results of a level are recorded once all of its assets have been evaluated, in the
+        same order as a serial evaluation would record them.
+        """
+        with InheritContextThreadPoolExecutor(
+            max_workers=num_workers, thread_name_prefix="automation_condition_evaluator"
+        ) as executor:
+            for level in self.asset_graph.toposorted_asset_keys_by_level:
+                asset_keys = sorted(level & self.asset_keys)
+                futures = []
+                for asset_key in asset_keys:
+                    self._log_evaluation_start(asset_key)
+                    futures.append(executor.submit(self._evaluate_asset_and_time, asset_key))
+
+                for asset_key, future in zip(asset_keys, futures):
+                    self._record_evaluation(asset_key, *future.result())
+
+    def _log_evaluation_start(self, asset_key: AssetKey) -> None:
+        self.num_checked_assets = self.num_checked_assets + 1
+        self.logger.debug(
+            "Evaluating asset"
+            f" {asset_key.to_user_string()} ({self.num_checked_assets}/{self.num_asset_keys})"
+        )
 
-            log_fn(
-                f"Asset {asset_key.to_user_string()} evaluation result: {num_requested}"
-                f" requested ({to_request_str}) ({format(time.time()-start_time, '.3f')} seconds)"
+    def _evaluate_asset_and_time(
+        self, asset_key: AssetKey
+    ) -> Tuple[AutomationResult, Optional[datetime.datetime], float]:
+        start_time = time.time()
+        try:
+            (result, expected_data_time) = self.evaluate_asset(
+                asset_key, self.expected_data_time_mapping, self.current_results_by_key
             )
+        except Exception as e:
+            raise Exception(
+                f"Error while evaluating conditions for asset {asset_key.to_user_string()}"
+            ) from e
+        return result, expected_data_time, time.time() - start_time
 
-            self.current_results_by_key[asset_key] = result
-            self.expected_data_time_mapping[asset_key] = expected_data_time
-
-            # if we need to materialize any partitions of a non-subsettable multi-asset, we need to
-            # materialize all of them
-            execution_set_keys = self.asset_graph.get(asset_key).execution_set_asset_keys
-            if len(execution_set_keys) > 1 and num_requested > 0:
-                for neighbor_key in execution_set_keys:
-                    self.expected_data_time_mapping[neighbor_key] = expected_data_time
-
-                    # make sure that the true_subset of the neighbor is accurate -- when it was
-                    # evaluated it may have had a different requested AssetSubset. however, because
-                    # all these neighbors must be executed as a unit, we need to union together
-                    # the subset of all required neighbors
-                    if neighbor_key in self.current_results_by_key:
-                        neighbor_result = self.current_results_by_key[neighbor_key]
-                        neighbor_true_subset = result.serializable_evaluation.true_subset._replace(
-                            asset_key=neighbor_key
-                        )
-                        neighbor_evaluation = result.serializable_evaluation._replace(
-                            true_subset=neighbor_true_subset
-                        )
-                        self.current_results_by_key[neighbor_key] = neighbor_result._replace(
-                            serializable_evaluation=neighbor_evaluation
-                        )
-                    self.to_request |= {
-                        ap._replace(asset_key=neighbor_key)
-                        for ap in result.true_subset.asset_partitions
-                    }
+    def _record_evaluation(
+        self,
+        asset_key: AssetKey,
+        result: AutomationResult,
+        expected_data_time: Optional[datetime.datetime],
+        elapsed_seconds: float,
+    ) -> None:
+        num_requested = result.true_subset.size
+        log_fn = self.logger.info if num_requested > 0 else self.logger.debug
 
-        return list(self.current_results_by_key.values()), self.to_request
+        to_request_asset_partitions = result.true_subset.asset_partitions
+        to_request_str = ",".join(
+            [(ap.partition_key or "No partition") for ap in to_request_asset_partitions]
+        )
+        self.to_request |= to_request_asset_partitions
+
+        log_fn(
+            f"Asset {asset_key.to_user_string()} evaluation result: {num_requested}"
+            f" requested ({to_request_str}) ({format(elapsed_seconds, '.3f')} seconds)"
+        )
+
+        self.current_results_by_key[asset_key] = result
+        self.expected_data_time_mapping[asset_key] = expected_data_time
+
+        # if we need to materialize any partitions of a non-subsettable multi-asset, we need to
+        # materialize all of them
+        execution_set_keys = self.asset_graph.get(asset_key).execution_set_asset_keys
+        if len(execution_set_keys) > 1 and num_requested > 0:
+            for neighbor_key in execution_set_keys:
+                self.expected_data_time_mapping[neighbor_key] = expected_data_time
+
+                # make sure that the true_subset of the neighbor is accurate -- when it was
+                # evaluated it may have had a different requested AssetSubset. however, because
+                # all these neighbors must be executed as a unit, we need to union together
+                # the subset of all required neighbors
+                if neighbor_key in self.current_results_by_key:
+                    neighbor_result = self.current_results_by_key[neighbor_key]
+                    neighbor_true_subset = result.serializable_evaluation.true_subset._replace(
+                        asset_key=neighbor_key
+                    )
+                    neighbor_evaluation = result.serializable_evaluation._replace(
+                        true_subset=neighbor_true_subset
+                    )
+                    self.current_results_by_key[neighbor_key] = neighbor_result._replace(
+                        serializable_evaluation=neighbor_evaluation
+                    )
+                self.to_request |= {
+                    ap._replace(asset_key=neighbor_key)
+                    for ap in result.true_subset.asset_partitions
+                }
 
     def evaluate_asset(
         self,
@@ -332,12 +332,25 @@ def _core_multiprocess_executor_creation(config: ExecutorConfig) -> "Multiproces
     if start_selector:
         start_method, start_cfg = next(iter(start_selector.items()))
 
+    worker_pool_cfg = check.opt_nullable_dict_elem(config, "worker_pool")
+
     return MultiprocessExecutor(
         max_concurrent=check.opt_int_elem(config, "max_concurrent"),
         tag_concurrency_limits=check.opt_list_elem(config, "tag_concurrency_limits"),
         retries=RetryMode.from_config(check.dict_elem(config, "retries")),  # type: ignore
         start_method=start_method,
         explicit_forkserver_preload=check.opt_list_elem(start_cfg, "preload_modules", of_type=str),
+        use_worker_pool=worker_pool_cfg is not None,
+        max_steps_per_worker=(
+            check.opt_int_elem(worker_pool_cfg, "max_steps_per_worker")
+            if worker_pool_cfg is not None
+            else None
+        ),
+        max_worker_memory_growth_mb=(
+            check.opt_int_elem(worker_pool_cfg, "max_memory_growth_mb")
+            if worker_pool_cfg is not None
+            else None
+        ),
     )
 
 
@@ -391,6 +404,34 @@ def _core_multiprocess_executor_creation(config: ExecutorConfig) -> "Multiproces
             ),
         ),
         "retries": get_retries_config(),
+        "worker_pool": Field(
+            {
+                "max_steps_per_worker": Field(
+                    Noneable(Int),
+                    default_value=None,
+                    description=(
+                        "Replace a worker process after it has executed this many steps. By"
+                        " default, workers are kept for the whole run."
+                    ),
+                ),
+                "max_memory_growth_mb": Field(
+                    Noneable(Int),
+                    default_value=None,
+                    description=(
+                        "Replace a worker process once its peak memory usage has grown by more"
+                        " than this many megabytes since it started."
+                    ),
+                ),
+            },
+            is_required=False,
+            description=(
+                "Execute steps in a pool of reusable worker processes instead of starting a new"
+                " process for each step. Each worker loads the job once and then executes steps"
+                " one after another, which avoids paying for process startup and code loading on"
+                " every step. At most `max_concurrent` workers are started. A worker is replaced"
+                " after a step fails with a system error."
+            ),
+        ),
     },
     description="Execute each step in an individual process.",
 )
@@ -419,6 +460,17 @@ def multiprocess_executor(init_context):
     concurrently. By default, or if you set ``max_concurrent`` to be None or 0, this is the return value of
     :py:func:`python:multiprocessing.cpu_count`.
 
+    Setting ``worker_pool`` makes the executor reuse a bounded pool of worker processes across
+    steps instead of launching a new process per step:
+
+    .. code-block:: yaml
+
+        execution:
+          config:
+            multiprocess:
+              worker_pool:
+                max_steps_per_worker: 100
+
     Execution priority can be configured using the ``dagster/priority`` tag via op metadata,
     where the higher the number the higher the priority. 0 is the default and both positive
     and negative numbers can be used.
@@ -1,6 +1,9 @@
+import base64
 import copy
 import hashlib
 import json
+import os
+import zlib
 from abc import ABC, abstractmethod
 from collections import defaultdict
 from datetime import datetime
@@ -16,6 +19,7 @@
     NamedTuple,
     Optional,
     Sequence,
+    Tuple,
     Type,
     Union,
     cast,
@@ -33,11 +37,13 @@
 from dagster._core.instance import DagsterInstance, DynamicPartitionsStore
 from dagster._core.storage.tags import PARTITION_NAME_TAG, PARTITION_SET_TAG
 from dagster._serdes import whitelist_for_serdes
+from dagster._serdes.serdes import NamedTupleSerializer
 from dagster._utils import xor
 from dagster._utils.cached_method import cached_method
 from dagster._utils.warnings import normalize_renamed_param
 
 from ..errors import (
+    DagsterDefinitionChangedDeserializationError,
     DagsterInvalidDefinitionError,
     DagsterInvalidDeserializationVersionError,
     DagsterInvalidInvocationError,
@@ -57,12 +63,24 @@
     covariant=True,
 )
 
+# StaticPartitionsDefinitions with at least this many partitions represent their subsets as bitmaps
+# over the partition keys (see BitmapPartitionsSubset) rather than as sets of partition keys.
+BITMAP_PARTITIONS_SUBSET_MIN_PARTITIONS = 1000
+
 # In the Dagster UI users can select partition ranges following the format '2022-01-13...2022-01-14'
 # "..." is an invalid substring in partition keys
 # The other escape characters are characters that may not display in the Dagster UI.
 INVALID_PARTITION_SUBSTRINGS = ["...", "\a", "\b", "\f", "\n", "\r", "\t", "\v", "\0"]
 
 
+def serialize_partitions_subsets_as_bitmaps() -> bool:
+    """Whether BitmapPartitionsSubsets serialize to their bitmap, rather than to the list of their
+    partition keys. Off by default: processes running a version that predates the bitmap format
+    cannot read it, so it should only be turned on once all of them have been upgraded.
+    """
+    return os.getenv("DAGSTER_BITMAP_PARTITIONS_SUBSET_SERIALIZATION", "").lower() in ("1", "true")
+
+
 @deprecated(breaking_version="2.0", additional_warn_text="Use string partition keys instead.")
 class Partition(Generic[T_cov]):
     """A Partition represents a single slice of the entire set of a job's possible work. It consists
@@ -330,6 +348,12 @@ def __init__(self, partition_keys: Sequence[str]):
 
         self._partition_keys = partition_keys
 
+    @property
+    def partitions_subset_class(self) -> Type["PartitionsSubset"]:
+        if len(self._partition_keys) >= BITMAP_PARTITIONS_SUBSET_MIN_PARTITIONS:
+            return BitmapPartitionsSubset
+        return DefaultPartitionsSubset
+
     @public
     def get_partition_keys(
         self,
@@ -372,6 +396,28 @@ def get_num_partitions(
         # This ensures that partition counts are correct in the Dagster UI.
         return len(set(self.get_partition_keys(current_time, dynamic_partitions_store)))
 
+    def has_partition_key(
+        self,
+        partition_key: str,
+        current_time: Optional[datetime] = None,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
+    ) -> bool:
+        return partition_key in self.get_partition_key_indices()
+
+    @cached_method
+    def get_partition_key_indices(self) -> Mapping[str, int]:
+        """Returns a mapping from each partition key to its position in the partition keys."""
+        return {partition_key: i for i, partition_key in enumerate(self._partition_keys)}
+
+    def get_serializable_unique_identifier(
+        self, dynamic_partitions_store: Optional[DynamicPartitionsStore] = None
+    ) -> str:
+        return self._get_serializable_unique_identifier()
+
+    @cached_method
+    def _get_serializable_unique_identifier(self) -> str:
+        return super().get_serializable_unique_identifier()
+
 
 class CachingDynamicPartitionsLoader(DynamicPartitionsStore):
     """A batch loader that caches the partition keys for a given dynamic partitions definition,
@@ -1164,6 +1210,14 @@ def from_serialized(
         if isinstance(data, list):
             # backwards compatibility
             return cls(subset=set(data))
+        elif "bitmap" in data:
+            return cls(
+                subset=set(
+                    BitmapPartitionsSubset.from_serialized(
+                        partitions_def, serialized
+                    ).get_partition_keys()
+                )
+            )
         else:
             if data.get("version") != cls.SERIALIZATION_VERSION:
                 raise DagsterInvalidDeserializationVersionError(
@@ -1180,15 +1234,25 @@ def can_deserialize(
         serialized_partitions_def_unique_id: Optional[str],
         serialized_partitions_def_class_name: Optional[str],
     ) -> bool:
+        data = json.loads(serialized)
+        if not isinstance(data, list) and "bitmap" in data:
+            return BitmapPartitionsSubset.can_deserialize(
+                partitions_def,
+                serialized,
+                serialized_partitions_def_unique_id,
+                serialized_partitions_def_class_name,
+            )
+
         if serialized_partitions_def_class_name is not None:
             return serialized_partitions_def_class_name == partitions_def.__class__.__name__
 
-        data = json.loads(serialized)
         return isinstance(data, list) or (
             data.get("subset") is not None and data.get("version") == cls.SERIALIZATION_VERSION
         )
 
     def __eq__(self, other: object) -> bool:
+        if isinstance(other, BitmapPartitionsSubset):
+            return other == self
         return isinstance(other, DefaultPartitionsSubset) and self.subset == other.subset
 
     def __len__(self) -> int:
@@ -1207,6 +1271,242 @@ def empty_subset(
         return cls()
 
 
+class BitmapPartitionsSubsetSerializer(NamedTupleSerializer):
+    """Stores BitmapPartitionsSubsets as the DefaultPartitionsSubsets of their partition keys."""
+
+    def get_storage_name(self) -> str:
+        return "DefaultPartitionsSubset"
+
+    def before_pack(self, value: "BitmapPartitionsSubset") -> DefaultPartitionsSubset:  # type: ignore
+        return value.to_serializable_subset()
+
+
+@whitelist_for_serdes(serializer=BitmapPartitionsSubsetSerializer)
+class BitmapPartitionsSubset(
+    NamedTuple(
+        "_BitmapPartitionsSubset",
+        [("partitions_def", StaticPartitionsDefinition), ("bitmap", int)],
+    ),
+    PartitionsSubset,
+):
+    """An in-memory PartitionsSubset of a StaticPartitionsDefinition that represents the included
+    partitions as a bitmap over the ordered partition keys of the definition: bit i is set if the
+    i-th partition key is in the subset. Set operations between subsets of the same definition are
+    bitwise operations on Python ints, so they take time proportional to the number of partitions
+    divided by the word size rather than to the number of included partition keys.
+
+    Subsets are stored with serdes as the DefaultPartitionsSubset of their partition keys (see
+    to_serializable_subset). `serialize` writes the same list of partition keys, unless
+    serialize_partitions_subsets_as_bitmaps is turned on: then it writes the bitmap, compressed,
+    along with the unique identifier of the partitions definition it indexes into.
+    """
+
+    # Distinct from the version of the partition key list format, so that readers of that format
+    # which do not know about bitmaps reject the bitmap format as an unsupported version
+    SERIALIZATION_VERSION = 2
+
+    def __new__(cls, partitions_def: StaticPartitionsDefinition, bitmap: int = 0):
+        return super(BitmapPartitionsSubset, cls).__new__(
+            cls,
+            partitions_def=check.inst_param(
+                partitions_def, "partitions_def", StaticPartitionsDefinition
+            ),
+            bitmap=check.int_param(bitmap, "bitmap"),
+        )
+
+    @property
+    def num_partitions(self) -> int:
+        return len(self.partitions_def.get_partition_keys())
+
+    @property
+    def is_empty(self) -> bool:
+        return self.bitmap == 0
+
+    def _all_partitions_bitmap(self) -> int:
+        return (1 << self.num_partitions) - 1
+
+    def _get_partition_keys_in_bitmap(self, bitmap: int) -> Sequence[str]:
+        partition_keys = self.partitions_def.get_partition_keys()
+        # bin() lists the bits from most to least significant, so reverse it to get them by index
+        return [partition_keys[i] for i, bit in enumerate(bin(bitmap)[:1:-1]) if bit == "1"]
+
+    def _bitmap_for_partition_keys(
+        self, partition_keys: Iterable[str]
+    ) -> Tuple[int, AbstractSet[str]]:
+        """Returns the bitmap of the given partition keys, as well as any of the keys that do not
+        belong to the partitions definition.
+        """
+        partition_key_indices = self.partitions_def.get_partition_key_indices()
+        bits = bytearray((self.num_partitions + 7) // 8)
+        unknown_partition_keys = set()
+        for partition_key in partition_keys:
+            i = partition_key_indices.get(partition_key)
+            if i is None:
+                unknown_partition_keys.add(partition_key)
+            else:
+                bits[i >> 3] |= 1 << (i & 7)
+        return int.from_bytes(bits, "little"), unknown_partition_keys
+
+    def _bitmap_for_subset(self, other: PartitionsSubset) -> int:
+        if (
+            isinstance(other, BitmapPartitionsSubset)
+            and other.partitions_def == self.partitions_def
+        ):
+            return other.bitmap
+        return self._bitmap_for_partition_keys(other.get_partition_keys())[0]
+
+    def get_partition_keys_not_in_subset(
+        self,
+        partitions_def: PartitionsDefinition,
+        current_time: Optional[datetime] = None,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
+    ) -> Iterable[str]:
+        return self._get_partition_keys_in_bitmap(self._all_partitions_bitmap() & ~self.bitmap)
+
+    def get_partition_keys(self) -> Sequence[str]:
+        return self._get_partition_keys_in_bitmap(self.bitmap)
+
+    def get_partition_key_ranges(
+        self,
+        partitions_def: PartitionsDefinition,
+        current_time: Optional[datetime] = None,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
+    ) -> Sequence[PartitionKeyRange]:
+        partition_keys = self.partitions_def.get_partition_keys()
+        result = []
+        bitmap = self.bitmap
+        while bitmap:
+            # index of the lowest set bit, and the length of the run of set bits starting there
+            start = (bitmap & -bitmap).bit_length() - 1
+            run = bitmap >> start
+            length = ((run + 1) & ~run).bit_length() - 1
+            result.append(
+                PartitionKeyRange(partition_keys[start], partition_keys[start + length - 1])
+            )
+            bitmap &= ~(((1 << length) - 1) << start)
+        return result
+
+    def with_partition_keys(self, partition_keys: Iterable[str]) -> PartitionsSubset:
+        bitmap, unknown_partition_keys = self._bitmap_for_partition_keys(partition_keys)
+        if unknown_partition_keys:
+            # keys outside of the partitions definition can't be represented in the bitmap
+            return DefaultPartitionsSubset(
+                set(self.get_partition_keys()) | unknown_partition_keys
+            ).with_partition_keys(self._get_partition_keys_in_bitmap(bitmap))
+        return BitmapPartitionsSubset(self.partitions_def, self.bitmap | bitmap)
+
+    def __or__(self, other: PartitionsSubset) -> PartitionsSubset:
+        if (
+            isinstance(other, BitmapPartitionsSubset)
+            and other.partitions_def == self.partitions_def
+        ):
+            return BitmapPartitionsSubset(self.partitions_def, self.bitmap | other.bitmap)
+        return super().__or__(other)
+
+    def __sub__(self, other: PartitionsSubset) -> PartitionsSubset:
+        if isinstance(other, AllPartitionsSubset):
+            return BitmapPartitionsSubset(self.partitions_def, 0)
+        return BitmapPartitionsSubset(
+            self.partitions_def, self.bitmap & ~self._bitmap_for_subset(other)
+        )
+
+    def __and__(self, other: PartitionsSubset) -> PartitionsSubset:
+        if isinstance(other, AllPartitionsSubset):
+            return self
+        return BitmapPartitionsSubset(
+            self.partitions_def, self.bitmap & self._bitmap_for_subset(other)
+        )
+
+    def serialize(self) -> str:
+        if not serialize_partitions_subsets_as_bitmaps():
+            return self.to_serializable_subset().serialize()
+
+        bitmap_bytes = self.bitmap.to_bytes((self.num_partitions + 7) // 8, "little")
+        return json.dumps(
+            {
+                "version": self.SERIALIZATION_VERSION,
+                "partitions_def_id": self.partitions_def.get_serializable_unique_identifier(),
+                "num_partitions": self.num_partitions,
+                "bitmap": base64.b64encode(zlib.compress(bitmap_bytes)).decode("ascii"),
+            }
+        )
+
+    @classmethod
+    def from_serialized(
+        cls, partitions_def: PartitionsDefinition, serialized: str
+    ) -> PartitionsSubset:
+        partitions_def = check.inst(partitions_def, StaticPartitionsDefinition)
+        data = json.loads(serialized)
+
+        if isinstance(data, list) or "bitmap" not in data:
+            # subsets serialized as a list of partition keys
+            return partitions_def.subset_with_partition_keys(
+                DefaultPartitionsSubset.from_serialized(partitions_def, serialized).subset
+            )
+
+        if data.get("version") != cls.SERIALIZATION_VERSION:
+            raise DagsterInvalidDeserializationVersionError(
+                f"Attempted to deserialize partition subset with version {data.get('version')},"
+                f" but only version {cls.SERIALIZATION_VERSION} is supported."
+            )
+        if data["partitions_def_id"] != partitions_def.get_serializable_unique_identifier():
+            raise DagsterDefinitionChangedDeserializationError(
+                "Cannot deserialize a partitions bitmap serialized for different partition keys."
+            )
+        bitmap = int.from_bytes(zlib.decompress(base64.b64decode(data["bitmap"])), "little")
+        return cls(partitions_def, bitmap)
+
+    @classmethod
+    def can_deserialize(
+        cls,
+        partitions_def: PartitionsDefinition,
+        serialized: str,
+        serialized_partitions_def_unique_id: Optional[str],
+        serialized_partitions_def_class_name: Optional[str],
+    ) -> bool:
+        data = json.loads(serialized)
+        if isinstance(data, list) or "bitmap" not in data:
+            return DefaultPartitionsSubset.can_deserialize(
+                partitions_def,
+                serialized,
+                serialized_partitions_def_unique_id,
+                serialized_partitions_def_class_name,
+            )
+        return (
+            isinstance(partitions_def, StaticPartitionsDefinition)
+            and data.get("version") == cls.SERIALIZATION_VERSION
+            and data.get("partitions_def_id") == partitions_def.get_serializable_unique_identifier()
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, BitmapPartitionsSubset):
+            return self.partitions_def == other.partitions_def and self.bitmap == other.bitmap
+        return isinstance(other, DefaultPartitionsSubset) and set(self.get_partition_keys()) == set(
+            other.get_partition_keys()
+        )
+
+    def __len__(self) -> int:
+        return bin(self.bitmap).count("1")
+
+    def __contains__(self, value) -> bool:
+        i = self.partitions_def.get_partition_key_indices().get(value)
+        return i is not None and bool(self.bitmap >> i & 1)
+
+    def __repr__(self) -> str:
+        return f"BitmapPartitionsSubset({self.get_partition_key_ranges(self.partitions_def)})"
+
+    @classmethod
+    def empty_subset(
+        cls, partitions_def: Optional[PartitionsDefinition] = None
+    ) -> "BitmapPartitionsSubset":
+        if not isinstance(partitions_def, StaticPartitionsDefinition):
+            check.failed("Partitions definition must be a StaticPartitionsDefinition")
+        return cls(partitions_def)
+
+    def to_serializable_subset(self) -> PartitionsSubset:
+        return DefaultPartitionsSubset(set(self.get_partition_keys()))
+
+
 class AllPartitionsSubset(
     NamedTuple(
         "_AllPartitionsSubset",
@@ -2,8 +2,9 @@
 import hashlib
 import json
 import re
+import sys
 from abc import abstractmethod, abstractproperty
-from datetime import date, datetime, timedelta
+from datetime import date, datetime, timedelta, tzinfo
 from enum import Enum
 from functools import cached_property
 from typing import (
@@ -36,6 +37,7 @@
     PRE_TRANSITION,
     PendulumDateTime,
     create_pendulum_time,
+    pendulum_create_timezone,
     to_timezone,
 )
 from dagster._utils.cronstring import get_fixed_minute_interval, is_basic_daily, is_basic_hourly
@@ -60,6 +62,8 @@
 from .partition_key_range import PartitionKeyRange
 from .timestamp import TimestampWithTimezone
 
+_EPOCH = datetime(1970, 1, 1)
+
 
 def is_second_ambiguous_time(dt: datetime, tz: str):
     """Returns if a datetime is the second instance of an ambiguous time in the given timezone due
@@ -408,6 +412,11 @@ def get_num_partitions_in_window(self, time_window: TimeWindow) -> int:
             minutes_in_window = (time_window.end.timestamp() - time_window.start.timestamp()) / 60
             return int(minutes_in_window // fixed_minute_interval)
 
+        start_index = self._fast_first_index_at_or_after(time_window.start.timestamp())
+        end_index = self._fast_first_index_at_or_after(time_window.end.timestamp())
+        if start_index is not None and end_index is not None:
+            return end_index - start_index
+
         return len(self.get_partition_keys_in_time_window(time_window))
 
     def get_num_partitions(
@@ -432,6 +441,12 @@ def get_partition_keys_between_indexes(
         # Start index is inclusive, end index is exclusive.
         # Method added for performance reasons, to only string format
         # partition keys included within the indices.
+        partition_keys = self._fast_get_partition_keys_between_indexes(
+            start_idx, end_idx, current_time
+        )
+        if partition_keys is not None:
+            return partition_keys
+
         current_timestamp = self.get_current_timestamp(current_time=current_time)
 
         partitions_past_current_time = 0
@@ -470,6 +485,12 @@ def get_partition_keys(
         current_time: Optional[datetime] = None,
         dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
     ) -> Sequence[str]:
+        fast_partition_keys = self._fast_get_partition_keys_between_indexes(
+            0, sys.maxsize, current_time
+        )
+        if fast_partition_keys is not None:
+            return fast_partition_keys
+
         current_timestamp = self.get_current_timestamp(current_time=current_time)
 
         partitions_past_current_time = 0
@@ -525,6 +546,11 @@ def __hash__(self):
 
     @functools.lru_cache(maxsize=100)
     def time_window_for_partition_key(self, partition_key: str) -> TimeWindow:
+        index = self._fast_index_for_partition_key(partition_key)
+        time_window = self._fast_time_window_for_index(index) if index is not None else None
+        if time_window is not None:
+            return time_window
+
         partition_key_dt = dst_safe_strptime(partition_key, self.timezone, self.fmt)
         return next(iter(self._iterate_time_windows(partition_key_dt)))
 
@@ -537,6 +563,52 @@ def time_windows_for_partition_keys(
         if len(partition_keys) == 0:
             return []
 
+        partition_key_time_windows = self._fast_time_windows_for_partition_keys(partition_keys)
+        if partition_key_time_windows is None:
+            partition_key_time_windows = self._iterate_time_windows_for_partition_keys(
+                partition_keys
+            )
+
+        if validate:
+            start_time_window = self.get_first_partition_window()
+            end_time_window = self.get_last_partition_window()
+
+            if start_time_window is None or end_time_window is None:
+                check.failed("No partitions in the PartitionsDefinition")
+
+            start_timestamp = start_time_window.start.timestamp()
+            end_timestamp = end_time_window.end.timestamp()
+
+            partition_key_time_windows = [
+                tw
+                for tw in partition_key_time_windows
+                if tw.start.timestamp() >= start_timestamp and tw.end.timestamp() <= end_timestamp
+            ]
+        return partition_key_time_windows
+
+    def _fast_time_windows_for_partition_keys(
+        self, partition_keys: AbstractSet[str]
+    ) -> Optional[Sequence[TimeWindow]]:
+        if self._fixed_period_anchor is None:
+            return None
+        indexes = []
+        for partition_key in partition_keys:
+            index = self._fast_index_for_partition_key(partition_key)
+            if index is None:
+                return None
+            indexes.append(index)
+
+        time_windows = []
+        for index in sorted(indexes):
+            time_window = self._fast_time_window_for_index(index)
+            if time_window is None:
+                return None
+            time_windows.append(time_window)
+        return time_windows
+
+    def _iterate_time_windows_for_partition_keys(
+        self, partition_keys: AbstractSet[str]
+    ) -> Sequence[TimeWindow]:
         sorted_pks = sorted(
             partition_keys,
             key=lambda pk: dst_safe_strptime(pk, self.timezone, self.fmt).timestamp(),
@@ -559,25 +631,21 @@ def time_windows_for_partition_keys(
                     )
                 )
                 partition_key_time_windows.append(next(cur_windows_iterator))
-
-        if validate:
-            start_time_window = self.get_first_partition_window()
-            end_time_window = self.get_last_partition_window()
-
-            if start_time_window is None or end_time_window is None:
-                check.failed("No partitions in the PartitionsDefinition")
-
-            start_timestamp = start_time_window.start.timestamp()
-            end_timestamp = end_time_window.end.timestamp()
-
-            partition_key_time_windows = [
-                tw
-                for tw in partition_key_time_windows
-                if tw.start.timestamp() >= start_timestamp and tw.end.timestamp() <= end_timestamp
-            ]
         return partition_key_time_windows
 
     def start_time_for_partition_key(self, partition_key: str) -> datetime:
+        if self._fixed_period_anchor is not None:
+            partition_key_timestamp = self._partition_key_to_timestamp(partition_key)
+            index = self._fast_first_index_at_or_after(partition_key_timestamp)
+            start = self._fast_datetime_for_index(index) if index is not None else None
+            if start is not None and (
+                # basic hourly and daily partition keys are returned as parsed below, even if they
+                # don't represent the start of a partition
+                not (self.is_basic_hourly or self.is_basic_daily)
+                or start.timestamp() == partition_key_timestamp
+            ):
+                return start
+
         partition_key_dt = pendulum.instance(
             dst_safe_strptime(partition_key, self.timezone, self.fmt)
         )
@@ -641,7 +709,7 @@ def get_prev_partition_window(
     def _get_first_partition_window(self, *, current_time: datetime) -> Optional[TimeWindow]:
         current_timestamp = current_time.timestamp()
 
-        time_window = next(iter(self._iterate_time_windows(self.start)))
+        time_window = self._first_time_window
 
         if self.end_offset == 0:
             return time_window if time_window.end.timestamp() <= current_timestamp else None
@@ -698,6 +766,10 @@ def _get_last_partition_window(self, *, current_time: datetime) -> Optional[Time
             current_time = self.end
 
         if self.end_offset == 0:
+            index = self._fast_index_for_timestamp(current_time.timestamp())
+            time_window = self._fast_time_window_for_index(index - 1) if index is not None else None
+            if time_window is not None:
+                return time_window
             return next(iter(self._reverse_iterate_time_windows(current_time)))
         else:
             # TODO: make this efficient
@@ -748,6 +820,15 @@ def end_time_for_partition_key(self, partition_key: str) -> datetime:
 
     @functools.lru_cache(maxsize=5)
     def get_partition_keys_in_time_window(self, time_window: TimeWindow) -> Sequence[str]:
+        start_index = self._fast_first_index_at_or_after(time_window.start.timestamp())
+        end_index = self._fast_first_index_at_or_after(time_window.end.timestamp())
+        if start_index is not None and end_index is not None:
+            partition_keys = [
+                self._fast_partition_key_for_index(i) for i in range(start_index, end_index)
+            ]
+            if None not in partition_keys:
+                return cast(List[str], partition_keys)
+
         result: List[str] = []
         time_window_end_timestamp = time_window.end.timestamp()
         for partition_time_window in self._iterate_time_windows(time_window.start):
@@ -966,11 +1047,211 @@ def _reverse_iterate_time_windows(self, end: datetime) -> Iterable[TimeWindow]:
             yield TimeWindow(next_time, prev_time)
             prev_time = next_time
 
+    @cached_property
+    def _first_time_window(self) -> TimeWindow:
+        return next(iter(self._iterate_time_windows(self.start)))
+
+    # Partitions on daily, weekly, or monthly schedules, and on sub-daily schedules with a fixed
+    # number of minutes between ticks in UTC, all span the same amount of wall clock time. For these,
+    # the methods below convert between partition indexes, timestamps, and partition keys
+    # arithmetically, relative to the first partition (index 0), instead of iterating over the cron
+    # schedule. They return None when the conversion can't be done arithmetically, e.g. within a day
+    # of a DST transition, in which case callers fall back to iterating over the cron schedule.
+
+    @cached_property
+    def _is_utc(self) -> bool:
+        return self.timezone.upper() == "UTC"
+
+    @cached_property
+    def _tzinfo(self) -> tzinfo:
+        return pendulum_create_timezone(self.timezone)
+
+    @cached_property
+    def _fixed_period(self) -> Optional[Union[timedelta, int]]:
+        """The wall clock length of each partition, either as a timedelta or as 1 for monthly
+        partitions, or None if the partitions are not all the same length.
+        """
+        schedule_type = self.schedule_type
+        fixed_minute_interval = get_fixed_minute_interval(self.cron_schedule)
+        if fixed_minute_interval or schedule_type == ScheduleType.HOURLY:
+            # wall clock hours are skipped or repeated at DST transitions, so sub-daily partitions
+            # only all have the same length in UTC
+            return timedelta(minutes=fixed_minute_interval or 60) if self._is_utc else None
+        elif schedule_type == ScheduleType.DAILY:
+            return timedelta(days=1)
+        elif schedule_type == ScheduleType.WEEKLY:
+            return timedelta(weeks=1)
+        elif schedule_type == ScheduleType.MONTHLY and self.day_offset <= 28:
+            return 1
+        return None
+
+    @cached_property
+    def _fixed_period_anchor(self) -> Optional[datetime]:
+        """The naive wall clock start time of the first partition."""
+        if self._fixed_period is None:
+            return None
+        first_window_start = self._first_time_window.start
+        anchor = datetime(
+            first_window_start.year,
+            first_window_start.month,
+            first_window_start.day,
+            first_window_start.hour,
+            first_window_start.minute,
+        )
+        if self._is_utc:
+            return anchor
+        # the first window may have been shifted by a DST transition
+        return anchor.replace(hour=self.hour_offset, minute=self.minute_offset)
+
+    def _wall_clock_to_timestamp(self, wall_clock: datetime) -> Optional[float]:
+        if self._is_utc:
+            return (wall_clock - _EPOCH).total_seconds()
+
+        dt = wall_clock.replace(tzinfo=self._tzinfo)
+        timestamp = dt.timestamp()
+        # fromtimestamp does not support negative timestamps on Windows
+        if timestamp < 86400:
+            return None
+        # wall clock times within a day of a change in UTC offset may not exist, be ambiguous, or be
+        # an hour away from where arithmetic on the wall clock would put them
+        offset = dt.utcoffset()
+        for neighbor_timestamp in (timestamp - 86400, timestamp + 86400):
+            if datetime.fromtimestamp(neighbor_timestamp, self._tzinfo).utcoffset() != offset:
+                return None
+        return timestamp
+
+    def _timestamp_to_wall_clock(self, timestamp: float) -> Optional[datetime]:
+        if self._is_utc:
+            return _EPOCH + timedelta(seconds=timestamp)
+        if timestamp < 86400:
+            return None
+        return datetime.fromtimestamp(timestamp, self._tzinfo).replace(tzinfo=None)
+
+    def _fast_wall_clock_for_index(self, index: int) -> datetime:
+        anchor = check.not_none(self._fixed_period_anchor)
+        period = check.not_none(self._fixed_period)
+        if isinstance(period, timedelta):
+            return anchor + index * period
+        month = anchor.month - 1 + index
+        return anchor.replace(year=anchor.year + month // 12, month=month % 12 + 1)
+
+    def _fast_start_timestamp_for_index(self, index: int) -> Optional[float]:
+        return self._wall_clock_to_timestamp(self._fast_wall_clock_for_index(index))
+
+    def _fast_datetime_for_index(self, index: int) -> Optional[datetime]:
+        wall_clock = self._fast_wall_clock_for_index(index)
+        if self._wall_clock_to_timestamp(wall_clock) is None:
+            return None
+        return PendulumDateTime(
+            wall_clock.year,
+            wall_clock.month,
+            wall_clock.day,
+            wall_clock.hour,
+            wall_clock.minute,
+            tzinfo=self._tzinfo,
+        )
+
+    def _fast_time_window_for_index(self, index: int) -> Optional[TimeWindow]:
+        start = self._fast_datetime_for_index(index)
+        end = self._fast_datetime_for_index(index + 1)
+        if start is None or end is None:
+            return None
+        return TimeWindow(start, end)
+
+    def _fast_partition_key_for_index(self, index: int) -> Optional[str]:
+        start = self._fast_datetime_for_index(index)
+        if start is None:
+            return None
+        return dst_safe_strftime(start, self.timezone, self.fmt, self.cron_schedule)
+
+    def _fast_index_for_timestamp(self, timestamp: float) -> Optional[int]:
+        """Returns the index of the partition whose time window contains the timestamp."""
+        anchor = self._fixed_period_anchor
+        if anchor is None:
+            return None
+        wall_clock = self._timestamp_to_wall_clock(timestamp)
+        if wall_clock is None:
+            return None
+
+        period = check.not_none(self._fixed_period)
+        if isinstance(period, timedelta):
+            index = (wall_clock - anchor) // period
+        else:
+            index = (wall_clock.year - anchor.year) * 12 + wall_clock.month - anchor.month
+            if (wall_clock.day, wall_clock.time()) < (anchor.day, anchor.time()):
+                index -= 1
+
+        start_timestamp = self._fast_start_timestamp_for_index(index)
+        end_timestamp = self._fast_start_timestamp_for_index(index + 1)
+        if (
+            start_timestamp is None
+            or end_timestamp is None
+            or not start_timestamp <= timestamp < end_timestamp
+        ):
+            return None
+        return index
+
+    def _fast_first_index_at_or_after(self, timestamp: float) -> Optional[int]:
+        """Returns the index of the first partition that starts at or after the timestamp."""
+        index = self._fast_index_for_timestamp(timestamp)
+        if index is None:
+            return None
+        return index if self._fast_start_timestamp_for_index(index) == timestamp else index + 1
+
+    def _partition_key_to_timestamp(self, partition_key: str) -> float:
+        if not self._is_utc:
+            return dst_safe_strptime(partition_key, self.timezone, self.fmt).timestamp()
+        # equivalent to dst_safe_strptime, without constructing a pendulum datetime
+        try:
+            dt = datetime.strptime(partition_key, self.fmt)
+        except ValueError:
+            dt = datetime.strptime(partition_key, dst_safe_fmt(self.fmt))
+        return dt.timestamp() if dt.tzinfo else (dt - _EPOCH).total_seconds()
+
+    def _fast_index_for_partition_key(self, partition_key: str) -> Optional[int]:
+        """Returns the index of the partition that the partition key belongs to: the first partition
+        that starts at or after the time the key represents. Raises a ValueError if the key can't be
+        parsed.
+        """
+        if self._fixed_period_anchor is None:
+            return None
+        return self._fast_first_index_at_or_after(self._partition_key_to_timestamp(partition_key))
+
+    def _fast_get_partition_keys_between_indexes(
+        self, start_idx: int, end_idx: int, current_time: Optional[datetime]
+    ) -> Optional[List[str]]:
+        if self._fixed_period_anchor is None or self.end_offset != 0:
+            return None
+        first_window = self.get_first_partition_window(current_time)
+        last_window = self.get_last_partition_window(current_time)
+        if first_window is None or last_window is None:
+            return []
+        first_index = self._fast_first_index_at_or_after(first_window.start.timestamp())
+        last_index = self._fast_first_index_at_or_after(last_window.start.timestamp())
+        if first_index is None or last_index is None:
+            return None
+
+        partition_keys = []
+        for index in range(first_index + start_idx, min(first_index + end_idx, last_index + 1)):
+            partition_key = self._fast_partition_key_for_index(index)
+            if partition_key is None:
+                return None
+            partition_keys.append(partition_key)
+        return partition_keys
+
     def get_partition_key_for_timestamp(self, timestamp: float, end_closed: bool = False) -> str:
         """Args:
         timestamp (float): Timestamp from the unix epoch, UTC.
         end_closed (bool): Whether the interval is closed at the end or at the beginning.
         """
+        index = self._fast_index_for_timestamp(timestamp)
+        if index is not None:
+            if end_closed and self._fast_start_timestamp_for_index(index) == timestamp:
+                index -= 1
+            partition_key = self._fast_partition_key_for_index(index)
+            if partition_key is not None:
+                return partition_key
+
         iterator = cron_string_iterator(
             timestamp, self.cron_schedule, self.timezone, start_offset=-1
         )
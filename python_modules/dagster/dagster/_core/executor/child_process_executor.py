@@ -1,18 +1,21 @@
 """Facilities for running arbitrary commands in child processes."""
 
 import os
-import queue
 import sys
+import threading
 from abc import ABC, abstractmethod
-from multiprocessing import Queue
+from contextlib import ExitStack
+from multiprocessing.connection import Connection, wait
 from multiprocessing.context import BaseContext as MultiprocessingBaseContext
 from multiprocessing.process import BaseProcess
-from typing import TYPE_CHECKING, Iterator, NamedTuple, Optional, Union
+from typing import TYPE_CHECKING, Any, Iterator, List, NamedTuple, Optional, Sequence, Tuple, Union
 
 from typing_extensions import Literal
 
 import dagster._check as check
+import dagster._seven as seven
 from dagster._core.errors import DagsterExecutionInterruptedError
+from dagster._utils import start_termination_thread
 from dagster._utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
 from dagster._utils.interrupts import capture_interrupts
 
@@ -43,6 +46,15 @@ class ChildProcessSystemErrorEvent(
     pass
 
 
+class ChildProcessWorkerIdleEvent(
+    NamedTuple("ChildProcessWorkerIdleEvent", [("pid", int), ("exiting", bool)]),
+    ChildProcessEvent,
+):
+    """Sent by a pooled worker process after it has finished a command. `exiting` is set if the
+    worker is being recycled and will not accept another command.
+    """
+
+
 class ChildProcessCommand(ABC):
     """Inherit from this class in order to use this library.
 
@@ -65,31 +77,125 @@ def __init__(self, exit_code=None):
         super().__init__()
 
 
-def _execute_command_in_child_process(event_queue: Queue, command: ChildProcessCommand):
+def _close_inherited_connections(connections: Sequence[Connection]) -> None:
+    # A child started with the fork method holds a copy of every connection that was open in the
+    # parent. Those of other children are closed, so that the reader of another child's pipe sees
+    # end-of-file as soon as that child exits, rather than once this one does as well.
+    for connection in connections:
+        connection.close()
+
+
+def _execute_command_in_child_process(
+    event_connection: Connection,
+    command: ChildProcessCommand,
+    inherited_connections: Sequence[Connection] = (),
+) -> bool:
     """Wraps the execution of a ChildProcessCommand.
 
-    Handles errors and communicates across a queue with the parent process.
+    Handles errors and communicates across a pipe with the parent process. Returns whether the
+    command completed without error. Sending an event blocks while the pipe is full, so the
+    command only makes progress as long as the parent keeps receiving its events.
     """
     check.inst_param(command, "command", ChildProcessCommand)
+    _close_inherited_connections(inherited_connections)
 
     with capture_interrupts():
         pid = os.getpid()
-        event_queue.put(ChildProcessStartEvent(pid=pid))
+        event_connection.send(ChildProcessStartEvent(pid=pid))
         try:
             for step_event in command.execute():
-                event_queue.put(step_event)
-            event_queue.put(ChildProcessDoneEvent(pid=pid))
+                event_connection.send(step_event)
+            event_connection.send(ChildProcessDoneEvent(pid=pid))
+            return True
 
         except (
             Exception,
             KeyboardInterrupt,
             DagsterExecutionInterruptedError,
         ):
-            event_queue.put(
+            event_connection.send(
                 ChildProcessSystemErrorEvent(
                     pid=pid, error_info=serializable_error_info_from_exc_info(sys.exc_info())
                 )
             )
+            return False
+
+
+_worker_exit_stack: Optional[ExitStack] = None
+
+
+def get_child_process_worker_exit_stack() -> Optional[ExitStack]:
+    """When called from a command executing in a pooled worker process, returns an ExitStack that
+    is closed when the worker exits. Commands can use it to hold on to state (e.g. a loaded
+    instance) across the commands executed by the same worker. Returns None otherwise.
+    """
+    return _worker_exit_stack
+
+
+def _get_max_rss_mb() -> float:
+    if seven.IS_WINDOWS:
+        import psutil
+
+        return psutil.Process().memory_info().rss / (1024 * 1024)
+
+    import resource
+
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and kilobytes elsewhere
+    return max_rss / (1024 * 1024) if sys.platform == "darwin" else max_rss / 1024
+
+
+def _execute_commands_in_worker_process(
+    command_connection: Connection,
+    event_connection: Connection,
+    term_event: Any,
+    max_commands: Optional[int],
+    max_memory_growth_mb: Optional[int],
+    inherited_connections: Sequence[Connection] = (),
+) -> None:
+    """Executes the commands sent over `command_connection` one at a time, until the parent sends
+    None or closes the pipe, or until the worker is recycled.
+
+    A worker is recycled after it has executed `max_commands` commands, once its peak resident
+    memory has grown by more than `max_memory_growth_mb` since it started, or after a command fails
+    with a system error (which includes being interrupted through `term_event`).
+    """
+    global _worker_exit_stack  # noqa: PLW0603
+
+    _close_inherited_connections(inherited_connections)
+    with capture_interrupts(), ExitStack() as stack:
+        pid = os.getpid()
+        done_event = threading.Event()
+        start_termination_thread(term_event, done_event)
+        _worker_exit_stack = stack
+        try:
+            initial_rss_mb = _get_max_rss_mb()
+            num_commands = 0
+            while True:
+                try:
+                    command = command_connection.recv()
+                except EOFError:
+                    return
+                if command is None:
+                    return
+
+                succeeded = _execute_command_in_child_process(event_connection, command)
+                num_commands += 1
+
+                exiting = (
+                    not succeeded
+                    or (max_commands is not None and num_commands >= max_commands)
+                    or (
+                        max_memory_growth_mb is not None
+                        and _get_max_rss_mb() - initial_rss_mb > max_memory_growth_mb
+                    )
+                )
+                event_connection.send(ChildProcessWorkerIdleEvent(pid=pid, exiting=exiting))
+                if exiting:
+                    return
+        finally:
+            _worker_exit_stack = None
+            done_event.set()
 
 
 TICK = 20.0 * 1.0 / 1000.0
@@ -100,26 +206,56 @@ def _execute_command_in_child_process(event_queue: Queue, command: ChildProcessC
 
 
 def _poll_for_event(
-    process, event_queue
+    process: BaseProcess, event_connection: Connection, timeout: float
 ) -> Optional[Union["DagsterEvent", Literal["PROCESS_DEAD_AND_QUEUE_EMPTY"]]]:
-    try:
-        return event_queue.get(block=True, timeout=TICK)
-    except queue.Empty:
-        if not process.is_alive():
-            # There is a possibility that after the last queue.get the
-            # process created another event and then died. In that case
-            # we want to continue draining the queue.
+    if event_connection.poll(timeout):
+        try:
+            return event_connection.recv()
+        except EOFError:
+            # The child process (the only other holder of the write end) has exited and every
+            # event it sent has already been received
+            return PROCESS_DEAD_AND_QUEUE_EMPTY
+
+    if not process.is_alive():
+        # There is a possibility that after the last poll the process sent another event and
+        # then died. In that case we want to continue draining the pipe.
+        if event_connection.poll():
             try:
-                return event_queue.get(block=False)
-            except queue.Empty:
-                # If the queue empty we know that there are no more events
-                # and that the process has died.
-                return PROCESS_DEAD_AND_QUEUE_EMPTY
+                return event_connection.recv()
+            except EOFError:
+                pass
+        return PROCESS_DEAD_AND_QUEUE_EMPTY
     return None
 
 
+def wait_for_child_process_events(
+    event_connections: Sequence[Connection], timeout: float = TICK
+) -> None:
+    """Blocks until at least one of the given pipes has an event (or end-of-file) ready to be
+    received, or until the timeout elapses.
+
+    Used by callers that multiplex several execute_child_process_command iterators with
+    `blocking=False`, so that they wake up as soon as any child produces an event rather than
+    polling each child in turn.
+    """
+    if event_connections:
+        wait(event_connections, timeout=timeout)
+
+
+def _forked_child_connections(
+    multiprocessing_ctx: MultiprocessingBaseContext, connections: Sequence[Connection]
+) -> Sequence[Connection]:
+    # only a forked child inherits the connections of the parent; with spawn or forkserver, passing
+    # them to the child would instead send it copies of them
+    return connections if multiprocessing_ctx.get_start_method() == "fork" else ()
+
+
 def execute_child_process_command(
-    multiprocessing_ctx: MultiprocessingBaseContext, command: ChildProcessCommand
+    multiprocessing_ctx: MultiprocessingBaseContext,
+    command: ChildProcessCommand,
+    event_pipe: Optional[Tuple[Connection, Connection]] = None,
+    blocking: bool = True,
+    inherited_pipes: Sequence[Tuple[Connection, Connection]] = (),
 ) -> Iterator[Optional[Union["DagsterEvent", ChildProcessEvent, BaseProcess]]]:
     """Execute a ChildProcessCommand in a new process.
 
@@ -140,24 +276,47 @@ def execute_child_process_command(
     Args:
         multiprocessing_ctx: The multiprocessing context to execute in (spawn, forkserver, fork)
         command (ChildProcessCommand): The command to execute in the child process.
+        event_pipe (Optional[Tuple[Connection, Connection]]): A (reader, writer) pair created with
+            `multiprocessing_ctx.Pipe(duplex=False)` over which the child sends its events. Pass
+            one in to be able to wait on the reader with wait_for_child_process_events.
+        blocking (bool): Whether to wait up to TICK for an event before yielding None. Callers
+            that multiplex many iterators should pass False and wait on all of the event pipes at
+            once instead.
+        inherited_pipes (Sequence[Tuple[Connection, Connection]]): The event pipes of other child
+            processes that are open in this process. A child started with the fork method closes
+            its copies of them right away.
+
+    The child blocks on sending an event while its pipe is full, so callers must keep advancing
+    the iterator, which receives the events, until it is exhausted.
 
     Warning: if the child process is in an infinite loop, this will
     also infinitely loop.
     """
     check.inst_param(command, "command", ChildProcessCommand)
 
-    event_queue = multiprocessing_ctx.Queue()
+    reader, writer = event_pipe if event_pipe else multiprocessing_ctx.Pipe(duplex=False)  # type: ignore
+    poll_timeout = TICK if blocking else 0
     try:
         process = multiprocessing_ctx.Process(  # type: ignore
-            target=_execute_command_in_child_process, args=(event_queue, command)
+            target=_execute_command_in_child_process,
+            args=(
+                writer,
+                command,
+                _forked_child_connections(
+                    multiprocessing_ctx,
+                    [reader, *(connection for pipe in inherited_pipes for connection in pipe)],
+                ),
+            ),
         )
         process.start()
+        # Only the child should hold the write end, so that the reader sees end-of-file when it exits
+        writer.close()
         yield process
 
         completed_properly = False
 
         while not completed_properly:
-            event = _poll_for_event(process, event_queue)
+            event = _poll_for_event(process, reader, poll_timeout)
 
             if event == PROCESS_DEAD_AND_QUEUE_EMPTY:
                 break
@@ -168,9 +327,169 @@ def execute_child_process_command(
                 completed_properly = True
 
         if not completed_properly:
+            # The pipe can reach end-of-file before the dead process has been reaped, so wait for
+            # it in order to report its exit code
+            process.join()
             # TODO Figure out what to do about stderr/stdout
             raise ChildProcessCrashException(exit_code=process.exitcode)
 
         process.join()
     finally:
-        event_queue.close()
+        writer.close()
+        reader.close()
+
+
+class ChildProcessWorker:
+    """A long-lived child process that executes ChildProcessCommands one at a time.
+
+    Commands are sent to the worker over a pipe, and its events are sent back over a second pipe
+    (`event_connection`). The worker's `term_event` interrupts whichever command it is executing.
+    A worker started with the fork method closes the `inherited_connections`, e.g. those of other
+    workers, right away.
+    """
+
+    def __init__(
+        self,
+        multiprocessing_ctx: MultiprocessingBaseContext,
+        max_commands: Optional[int] = None,
+        max_memory_growth_mb: Optional[int] = None,
+        inherited_connections: Sequence[Connection] = (),
+    ):
+        command_reader, self._command_writer = multiprocessing_ctx.Pipe(duplex=False)  # type: ignore
+        self.event_connection, event_writer = multiprocessing_ctx.Pipe(duplex=False)  # type: ignore
+        self.term_event = multiprocessing_ctx.Event()  # type: ignore
+        self.process: BaseProcess = multiprocessing_ctx.Process(  # type: ignore
+            target=_execute_commands_in_worker_process,
+            args=(
+                command_reader,
+                event_writer,
+                self.term_event,
+                max_commands,
+                max_memory_growth_mb,
+                _forked_child_connections(
+                    multiprocessing_ctx,
+                    [self._command_writer, self.event_connection, *inherited_connections],
+                ),
+            ),
+        )
+        self.process.start()
+        command_reader.close()
+        event_writer.close()
+
+        # Set once the worker has said it will exit, has crashed, or has been interrupted
+        self.is_retired = False
+
+    def execute(
+        self, command: ChildProcessCommand, blocking: bool = True
+    ) -> Iterator[Optional[Union["DagsterEvent", ChildProcessEvent, BaseProcess]]]:
+        """Executes a command in the worker. Yields the same sequence of objects as
+        execute_child_process_command, ending once the worker is ready for its next command.
+        """
+        check.inst_param(command, "command", ChildProcessCommand)
+        check.invariant(not self.is_retired, "Cannot execute a command in a retired worker")
+
+        poll_timeout = TICK if blocking else 0
+        try:
+            self._command_writer.send(command)
+        except (BrokenPipeError, EOFError, OSError):
+            self.is_retired = True
+            raise ChildProcessCrashException(exit_code=self.process.exitcode)
+
+        yield self.process
+
+        while True:
+            event = _poll_for_event(self.process, self.event_connection, poll_timeout)
+
+            if event == PROCESS_DEAD_AND_QUEUE_EMPTY:
+                self.is_retired = True
+                self.process.join()
+                raise ChildProcessCrashException(exit_code=self.process.exitcode)
+
+            yield event
+
+            if isinstance(event, ChildProcessWorkerIdleEvent):
+                if event.exiting:
+                    self.is_retired = True
+                return
+
+    @property
+    def connections(self) -> Sequence[Connection]:
+        """The ends of the worker's pipes held by this process."""
+        return [self._command_writer, self.event_connection]
+
+    def shutdown(self) -> None:
+        try:
+            self._command_writer.send(None)
+        except (BrokenPipeError, EOFError, OSError):
+            pass
+        self._command_writer.close()
+        self.process.join()
+        self.event_connection.close()
+
+
+class ChildProcessWorkerPool:
+    """A pool of ChildProcessWorkers. Workers are started on demand, returned to the pool once the
+    command they were given is done, and shut down when they are recycled or the pool is closed.
+    """
+
+    def __init__(
+        self,
+        multiprocessing_ctx: MultiprocessingBaseContext,
+        max_commands_per_worker: Optional[int] = None,
+        max_memory_growth_mb: Optional[int] = None,
+    ):
+        self._multiprocessing_ctx = multiprocessing_ctx
+        self._max_commands_per_worker = check.opt_int_param(
+            max_commands_per_worker, "max_commands_per_worker"
+        )
+        self._max_memory_growth_mb = check.opt_int_param(
+            max_memory_growth_mb, "max_memory_growth_mb"
+        )
+        self._idle_workers: List[ChildProcessWorker] = []
+        self._busy_workers: List[ChildProcessWorker] = []
+
+    def __enter__(self) -> "ChildProcessWorkerPool":
+        return self
+
+    def __exit__(self, *_args: Any) -> None:
+        self.shutdown()
+
+    def acquire_worker(self) -> ChildProcessWorker:
+        worker = None
+        while self._idle_workers and worker is None:
+            idle_worker = self._idle_workers.pop()
+            if idle_worker.process.is_alive():
+                worker = idle_worker
+            else:
+                idle_worker.shutdown()
+
+        if worker is None:
+            worker = ChildProcessWorker(
+                self._multiprocessing_ctx,
+                max_commands=self._max_commands_per_worker,
+                max_memory_growth_mb=self._max_memory_growth_mb,
+                inherited_connections=[
+                    connection
+                    for other_worker in [*self._idle_workers, *self._busy_workers]
+                    for connection in other_worker.connections
+                ],
+            )
+
+        self._busy_workers.append(worker)
+        return worker
+
+    def release_worker(self, worker: ChildProcessWorker) -> None:
+        self._busy_workers.remove(worker)
+        if worker.is_retired or worker.term_event.is_set() or not worker.process.is_alive():
+            worker.shutdown()
+        else:
+            self._idle_workers.append(worker)
+
+    def shutdown(self) -> None:
+        for worker in self._busy_workers:
+            # interrupt anything still running so that the worker can exit
+            worker.term_event.set()
+        for worker in [*self._idle_workers, *self._busy_workers]:
+            worker.shutdown()
+        self._idle_workers = []
+        self._busy_workers = []
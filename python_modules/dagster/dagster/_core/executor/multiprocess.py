@@ -3,9 +3,10 @@
 import sys
 import threading
 from contextlib import ExitStack
+from multiprocessing.connection import Connection
 from multiprocessing.context import BaseContext as MultiprocessingBaseContext
 from multiprocessing.process import BaseProcess
-from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Mapping, Optional, Sequence
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
 
 from dagster import _check as check
 from dagster._core.definitions.metadata import MetadataValue
@@ -38,7 +39,11 @@
     ChildProcessCrashException,
     ChildProcessEvent,
     ChildProcessSystemErrorEvent,
+    ChildProcessWorker,
+    ChildProcessWorkerPool,
     execute_child_process_command,
+    get_child_process_worker_exit_stack,
+    wait_for_child_process_events,
 )
 
 if TYPE_CHECKING:
@@ -47,6 +52,26 @@
 
 DELEGATE_MARKER = "multiprocess_subprocess_init"
 
+# The instance used by the steps executed in a pooled worker process, loaded for the first of them
+_worker_instance: Optional[DagsterInstance] = None
+
+
+def _get_worker_instance(
+    instance_ref: "InstanceRef", worker_exit_stack: ExitStack
+) -> DagsterInstance:
+    global _worker_instance  # noqa: PLW0603
+
+    if _worker_instance is None:
+        _worker_instance = worker_exit_stack.enter_context(DagsterInstance.from_ref(instance_ref))
+        worker_exit_stack.callback(_clear_worker_instance)
+    return _worker_instance
+
+
+def _clear_worker_instance() -> None:
+    global _worker_instance  # noqa: PLW0603
+
+    _worker_instance = None
+
 
 class MultiprocessExecutorChildProcessCommand(ChildProcessCommand):
     def __init__(
@@ -73,9 +98,17 @@ def __init__(
 
     def execute(self) -> Iterator[DagsterEvent]:
         recon_job = self.recon_pipeline
-        with DagsterInstance.from_ref(self.instance_ref) as instance:
+        with ExitStack() as stack:
+            worker_exit_stack = get_child_process_worker_exit_stack()
+            instance = (
+                _get_worker_instance(self.instance_ref, worker_exit_stack)
+                if worker_exit_stack
+                else stack.enter_context(DagsterInstance.from_ref(self.instance_ref))
+            )
             done_event = threading.Event()
-            start_termination_thread(self.term_event, done_event)
+            # Pooled workers have no term_event of their own; the worker process handles it
+            if self.term_event is not None:
+                start_termination_thread(self.term_event, done_event)
             try:
                 log_manager = create_context_free_log_manager(instance, self.dagster_run)
 
@@ -106,7 +139,8 @@ def execute(self) -> Iterator[DagsterEvent]:
             finally:
                 # set events to stop the termination thread on exit
                 done_event.set()  # waiting on term_event so set done first
-                self.term_event.set()
+                if self.term_event is not None:
+                    self.term_event.set()
 
 
 class MultiprocessExecutor(Executor):
@@ -117,6 +151,9 @@ def __init__(
         tag_concurrency_limits: Optional[List[Dict[str, Any]]] = None,
         start_method: Optional[str] = None,
         explicit_forkserver_preload: Optional[Sequence[str]] = None,
+        use_worker_pool: bool = False,
+        max_steps_per_worker: Optional[int] = None,
+        max_worker_memory_growth_mb: Optional[int] = None,
     ):
         self._retries = check.inst_param(retries, "retries", RetryMode)
         if not max_concurrent:
@@ -142,6 +179,13 @@ def __init__(
             )
         self._start_method = start_method
         self._explicit_forkserver_preload = explicit_forkserver_preload
+        self._use_worker_pool = check.bool_param(use_worker_pool, "use_worker_pool")
+        self._max_steps_per_worker = check.opt_int_param(
+            max_steps_per_worker, "max_steps_per_worker"
+        )
+        self._max_worker_memory_growth_mb = check.opt_int_param(
+            max_worker_memory_growth_mb, "max_worker_memory_growth_mb"
+        )
 
     @property
     def retries(self) -> RetryMode:
@@ -204,10 +248,23 @@ def execute(
                     instance_concurrency_context=instance_concurrency_context,
                 )
             )
+            worker_pool = (
+                stack.enter_context(
+                    ChildProcessWorkerPool(
+                        multiproc_ctx,
+                        max_commands_per_worker=self._max_steps_per_worker,
+                        max_memory_growth_mb=self._max_worker_memory_growth_mb,
+                    )
+                )
+                if self._use_worker_pool
+                else None
+            )
             active_iters: Dict[str, Iterator[Optional[DagsterEvent]]] = {}
             errors: Dict[int, SerializableErrorInfo] = {}
             processes: Dict[str, BaseProcess] = {}
             term_events: Dict[str, Any] = {}
+            event_pipes: Dict[str, Tuple[Connection, Connection]] = {}
+            event_connections: Dict[str, Connection] = {}
             stopping: bool = False
 
             try:
@@ -237,7 +294,27 @@ def execute(
 
                         for step in steps:
                             step_context = plan_context.for_step(step)
+                            if worker_pool:
+                                worker = worker_pool.acquire_worker()
+                                term_events[step.key] = worker.term_event
+                                event_connections[step.key] = worker.event_connection
+                                active_iters[step.key] = execute_step_in_worker(
+                                    worker_pool,
+                                    worker,
+                                    job,
+                                    step_context,
+                                    step,
+                                    errors,
+                                    processes,
+                                    self.retries,
+                                    active_execution.get_known_state(),
+                                    execution_plan.repository_load_data,
+                                )
+                                continue
+
                             term_events[step.key] = multiproc_ctx.Event()
+                            event_pipes[step.key] = multiproc_ctx.Pipe(duplex=False)
+                            event_connections[step.key] = event_pipes[step.key][0]
                             active_iters[step.key] = execute_step_out_of_process(
                                 multiproc_ctx,
                                 job,
@@ -246,6 +323,7 @@ def execute(
                                 errors,
                                 processes,
                                 term_events,
+                                event_pipes,
                                 self.retries,
                                 active_execution.get_known_state(),
                                 execution_plan.repository_load_data,
@@ -253,12 +331,14 @@ def execute(
 
                     # process active iterators
                     empty_iters = []
+                    received_event = False
                     for key, step_iter in active_iters.items():
                         try:
                             event_or_none = next(step_iter)
                             if event_or_none is None:
                                 continue
                             else:
+                                received_event = True
                                 yield event_or_none
                                 active_execution.handle_event(event_or_none)
 
@@ -295,8 +375,14 @@ def execute(
                     for key in empty_iters:
                         del active_iters[key]
                         del term_events[key]
+                        del event_connections[key]
+                        event_pipes.pop(key, None)
                         active_execution.verify_complete(plan_context, key)
 
+                    # if no child had an event ready, sleep until any of them does
+                    if active_iters and not received_event and not empty_iters:
+                        wait_for_child_process_events(list(event_connections.values()))
+
                     # process skipped and abandoned steps
                     yield from active_execution.plan_events_iterator(plan_context)
             except Exception:
@@ -367,6 +453,7 @@ def execute_step_out_of_process(
     errors: Dict[int, SerializableErrorInfo],
     processes: Dict[str, BaseProcess],
     term_events: Dict[str, Any],
+    event_pipes: Dict[str, Tuple[Connection, Connection]],
     retries: RetryMode,
     known_state: KnownExecutionState,
     repository_load_data: Optional[RepositoryLoadData],
@@ -389,7 +476,17 @@ def execute_step_out_of_process(
         metadata={},
     )
 
-    for ret in execute_child_process_command(multiproc_ctx, command):
+    # the child process stores its own events, so write out what this process buffered for the run
+    # first to keep it ahead of them in the event log
+    step_context.instance.flush_buffered_events(step_context.run_id)
+
+    for ret in execute_child_process_command(
+        multiproc_ctx,
+        command,
+        event_pipe=event_pipes[step.key],
+        blocking=False,
+        inherited_pipes=[pipe for key, pipe in event_pipes.items() if key != step.key],
+    ):
         if ret is None or isinstance(ret, DagsterEvent):
             yield ret
         elif isinstance(ret, ChildProcessEvent):
@@ -399,3 +496,50 @@ def execute_step_out_of_process(
             processes[step.key] = ret
         else:
             check.failed(f"Unexpected return value from child process {type(ret)}")
+
+
+def execute_step_in_worker(
+    worker_pool: ChildProcessWorkerPool,
+    worker: ChildProcessWorker,
+    recon_job: ReconstructableJob,
+    step_context: IStepContext,
+    step: ExecutionStep,
+    errors: Dict[int, SerializableErrorInfo],
+    processes: Dict[str, BaseProcess],
+    retries: RetryMode,
+    known_state: KnownExecutionState,
+    repository_load_data: Optional[RepositoryLoadData],
+) -> Iterator[Optional[DagsterEvent]]:
+    command = MultiprocessExecutorChildProcessCommand(
+        run_config=step_context.run_config,
+        dagster_run=step_context.dagster_run,
+        step_key=step.key,
+        instance_ref=step_context.instance.get_ref(),
+        term_event=None,
+        recon_pipeline=recon_job,
+        retry_mode=retries,
+        known_state=known_state,
+        repository_load_data=repository_load_data,
+    )
+
+    yield DagsterEvent.step_worker_starting(
+        step_context,
+        f'Sending "{step.key}" to worker process (pid: {worker.process.pid}).',
+        metadata={},
+    )
+
+    step_context.instance.flush_buffered_events(step_context.run_id)
+
+    try:
+        for ret in worker.execute(command, blocking=False):
+            if ret is None or isinstance(ret, DagsterEvent):
+                yield ret
+            elif isinstance(ret, ChildProcessEvent):
+                if isinstance(ret, ChildProcessSystemErrorEvent):
+                    errors[ret.pid] = ret.error_info
+            elif isinstance(ret, BaseProcess):
+                processes[step.key] = ret
+            else:
+                check.failed(f"Unexpected return value from worker process {type(ret)}")
+    finally:
+        worker_pool.release_worker(worker)
@@ -128,6 +128,7 @@
     from dagster._core.execution.plan.plan import ExecutionPlan
     from dagster._core.execution.plan.resume_retry import ReexecutionStrategy
     from dagster._core.execution.stats import RunStepKeyStatsSnapshot
+    from dagster._core.instance.event_buffer import EventWriteBuffer
     from dagster._core.launcher import RunLauncher
     from dagster._core.remote_representation import (
         CodeLocation,
@@ -198,6 +199,19 @@ def _is_batch_writing_enabled() -> bool:
     return _get_event_batch_size() > 0
 
 
+# Sets the maximum number of events of a run that will be held in the write-behind buffer before
+# being written to the event log in a single batch. Unlike DAGSTER_EVENT_BATCH_SIZE, this applies
+# to all events handled by the instance, not just explicitly batched ones. Buffered events are
+# also written once they have been held for DAGSTER_EVENT_WRITE_BUFFER_INTERVAL seconds, and
+# whenever a step or run boundary event is handled. Defaults to 0, which disables the buffer.
+def _get_event_write_buffer_size() -> int:
+    return int(os.getenv("DAGSTER_EVENT_WRITE_BUFFER_SIZE", "0"))
+
+
+def _get_event_write_buffer_interval() -> float:
+    return float(os.getenv("DAGSTER_EVENT_WRITE_BUFFER_INTERVAL", "1.0"))
+
+
 def _check_run_equality(
     pipeline_run: DagsterRun, candidate_run: DagsterRun
 ) -> Mapping[str, Tuple[Any, Any]]:
@@ -501,6 +515,15 @@ def __init__(
 
         # Used for batched event handling
         self._event_buffer: Dict[str, List[EventLogEntry]] = defaultdict(list)
+        self._event_write_buffer: Optional["EventWriteBuffer"] = None
+        if _get_event_write_buffer_size() > 0:
+            from dagster._core.instance.event_buffer import EventWriteBuffer
+
+            self._event_write_buffer = EventWriteBuffer(
+                self._write_events,
+                max_size=_get_event_write_buffer_size(),
+                max_age_seconds=_get_event_write_buffer_interval(),
+            )
         self._redis = redis
 
     # ctors
@@ -958,6 +981,10 @@ def auto_materialize_respect_materialization_data_versions(self) -> bool:
     def auto_materialize_max_tick_retries(self) -> int:
         return self.get_settings("auto_materialize").get("max_tick_retries", 3)
 
+    @property
+    def auto_materialize_num_evaluation_workers(self) -> Optional[int]:
+        return self.get_settings("auto_materialize").get("num_evaluation_workers")
+
     @property
     def auto_materialize_use_sensors(self) -> int:
         return self.get_settings("auto_materialize").get("use_sensors", True)
@@ -1023,6 +1050,8 @@ def reindex(self, print_fn: PrintFn = lambda _: None) -> None:
         print_fn("Done.")
 
     def dispose(self) -> None:
+        if self._event_write_buffer:
+            self._event_write_buffer.dispose()
         self._local_artifact_storage.dispose()
         self._run_storage.dispose()
         if self._run_coordinator:
@@ -1107,12 +1136,14 @@ def get_execution_plan_snapshot(self, snapshot_id: str) -> "ExecutionPlanSnapsho
 
     @traced
     def get_run_stats(self, run_id: str) -> DagsterRunStatsSnapshot:
+        self.flush_buffered_events(run_id)
         return self._event_storage.get_stats_for_run(run_id)
 
     @traced
     def get_run_step_stats(
         self, run_id: str, step_keys: Optional[Sequence[str]] = None
     ) -> Sequence["RunStepKeyStatsSnapshot"]:
+        self.flush_buffered_events(run_id)
         return self._event_storage.get_step_stats_for_run(run_id, step_keys)
 
     @traced
@@ -1894,6 +1925,7 @@ def logs_after(
         of_type: Optional["DagsterEventType"] = None,
         limit: Optional[int] = None,
     ) -> Sequence["EventLogEntry"]:
+        self.flush_buffered_events(run_id)
         return self._event_storage.get_logs_for_run(
             run_id,
             cursor=cursor,
@@ -1907,6 +1939,7 @@ def all_logs(
         run_id: str,
         of_type: Optional[Union["DagsterEventType", Set["DagsterEventType"]]] = None,
     ) -> Sequence["EventLogEntry"]:
+        self.flush_buffered_events(run_id)
         return self._event_storage.get_logs_for_run(run_id, of_type=of_type)
 
     @traced
@@ -1918,9 +1951,11 @@ def get_records_for_run(
         limit: Optional[int] = None,
         ascending: bool = True,
     ) -> "EventLogConnection":
+        self.flush_buffered_events(run_id)
         return self._event_storage.get_records_for_run(run_id, cursor, of_type, limit, ascending)
 
     def watch_event_logs(self, run_id: str, cursor: Optional[str], cb: "EventHandlerFn") -> None:
+        self.flush_buffered_events(run_id)
         return self._event_storage.watch(run_id, cursor, cb)
 
     def end_watch_event_logs(self, run_id: str, cb: "EventHandlerFn") -> None:
@@ -1982,6 +2017,7 @@ def has_asset_key(self, asset_key: AssetKey) -> bool:
     def get_latest_materialization_events(
         self, asset_keys: Iterable[AssetKey]
     ) -> Mapping[AssetKey, Optional["EventLogEntry"]]:
+        self.flush_buffered_events()
         return self._event_storage.get_latest_materialization_events(asset_keys)
 
     @public
@@ -1996,12 +2032,14 @@ def get_latest_materialization_event(self, asset_key: AssetKey) -> Optional["Eve
             Optional[EventLogEntry]: The latest materialization event for the given asset
                 key, or `None` if the asset has not been materialized.
         """
+        self.flush_buffered_events()
         return self._event_storage.get_latest_materialization_events([asset_key]).get(asset_key)
 
     @traced
     def get_latest_asset_check_evaluation_record(
         self, asset_check_key: "AssetCheckKey"
     ) -> Optional["AssetCheckExecutionRecord"]:
+        self.flush_buffered_events()
         return self._event_storage.get_latest_asset_check_execution_by_key([asset_check_key]).get(
             asset_check_key
         )
@@ -2037,6 +2075,7 @@ def get_event_records(
                 "returned when the event records filter contains the asset_partitions argument"
             )
 
+        self.flush_buffered_events()
         return self._event_storage.get_event_records(event_records_filter, limit, ascending)
 
     @public
@@ -2061,6 +2100,7 @@ def fetch_materializations(
         Returns:
             EventRecordsResult: Object containing a list of event log records and a cursor string
         """
+        self.flush_buffered_events()
         return self._event_storage.fetch_materializations(records_filter, limit, cursor, ascending)
 
     @traced
@@ -2096,6 +2136,7 @@ def fetch_planned_materializations(
                 DagsterEventType.ASSET_MATERIALIZATION_PLANNED, cursor=cursor, ascending=ascending
             )
         )
+        self.flush_buffered_events()
         records = self._event_storage.get_event_records(
             event_records_filter, limit=limit, ascending=ascending
         )
@@ -2130,6 +2171,7 @@ def fetch_observations(
         Returns:
             EventRecordsResult: Object containing a list of event log records and a cursor string
         """
+        self.flush_buffered_events()
         return self._event_storage.fetch_observations(records_filter, limit, cursor, ascending)
 
     @public
@@ -2154,6 +2196,7 @@ def fetch_run_status_changes(
         Returns:
             EventRecordsResult: Object containing a list of event log records and a cursor string
         """
+        self.flush_buffered_events()
         return self._event_storage.fetch_run_status_changes(
             records_filter, limit, cursor, ascending
         )
@@ -2222,6 +2265,7 @@ def get_asset_records(
         Returns:
             Sequence[AssetRecord]: List of asset records.
         """
+        self.flush_buffered_events()
         return self._event_storage.get_asset_records(asset_keys)
 
     @traced
@@ -2264,6 +2308,7 @@ def get_materialized_partitions(
         before_cursor: Optional[int] = None,
         after_cursor: Optional[int] = None,
     ) -> Set[str]:
+        self.flush_buffered_events()
         return self._event_storage.get_materialized_partitions(
             asset_key, before_cursor=before_cursor, after_cursor=after_cursor
         )
@@ -2276,6 +2321,7 @@ def get_latest_storage_id_by_partition(
 
         Returns a mapping of partition to storage id.
         """
+        self.flush_buffered_events()
         return self._event_storage.get_latest_storage_id_by_partition(asset_key, event_type)
 
     @traced
@@ -2284,6 +2330,7 @@ def get_latest_planned_materialization_info(
         asset_key: AssetKey,
         partition: Optional[str] = None,
     ) -> Optional["PlannedMaterializationInfo"]:
+        self.flush_buffered_events()
         return self._event_storage.get_latest_planned_materialization_info(asset_key, partition)
 
     @public
@@ -2411,6 +2458,9 @@ def handle_new_event(
             batch_metadata (Optional[DagsterEventBatchMetadata]): Metadata for batch writing.
         """
         if batch_metadata is None or not _is_batch_writing_enabled():
+            if self._event_write_buffer:
+                self._event_write_buffer.add(event)
+                return
             events = [event]
         else:
             batch_id, is_batch_end = batch_metadata.id, batch_metadata.is_end
@@ -2421,6 +2471,23 @@ def handle_new_event(
             else:
                 return
 
+        # Explicit batches bypass the write-behind buffer, so write out anything buffered for the
+        # run first to preserve event ordering
+        self.flush_buffered_events(event.run_id)
+        self._write_events(events)
+
+    def flush_buffered_events(self, run_id: Optional[str] = None) -> None:
+        """Write any events held in the write-behind buffer (see DAGSTER_EVENT_WRITE_BUFFER_SIZE) to
+        the event log.
+
+        Args:
+            run_id (Optional[str]): Only flush the events of this run. Defaults to flushing the
+                buffered events of all runs.
+        """
+        if self._event_write_buffer:
+            self._event_write_buffer.flush(run_id)
+
+    def _write_events(self, events: Sequence["EventLogEntry"]) -> None:
         if len(events) == 1:
             self._event_storage.store_event(events[0])
         else:
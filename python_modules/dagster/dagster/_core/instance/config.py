@@ -418,6 +418,15 @@ def dagster_instance_config_schema() -> Mapping[str, Field]:
                         "How many threads to use to process ticks from multiple automation policy sensors in parallel"
                     ),
                 ),
+                "num_evaluation_workers": Field(
+                    int,
+                    is_required=False,
+                    description=(
+                        "How many threads to use to evaluate the conditions of independent assets"
+                        " within a single tick in parallel. By default, assets are evaluated one at"
+                        " a time"
+                    ),
+                ),
             }
         ),
         "concurrency": Field(
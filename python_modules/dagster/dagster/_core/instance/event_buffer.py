@@ -0,0 +1,130 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Sequence
+
+import dagster._check as check
+from dagster._core.events import PIPELINE_EVENTS, DagsterEventType
+
+if TYPE_CHECKING:
+    from dagster._core.events.log import EventLogEntry
+
+# Events that mark a step or run boundary. When one of these is handled, it is written together with
+# everything buffered before it for the same run, so that readers never observe a step or run
+# transition before the events that led up to it.
+FLUSH_BOUNDARY_EVENTS = {
+    *PIPELINE_EVENTS,
+    DagsterEventType.STEP_START,
+    DagsterEventType.STEP_SUCCESS,
+    DagsterEventType.STEP_FAILURE,
+    DagsterEventType.STEP_SKIPPED,
+    DagsterEventType.STEP_UP_FOR_RETRY,
+    DagsterEventType.STEP_RESTARTED,
+}
+
+
+class EventWriteBuffer:
+    """Write-behind buffer that groups the events of each run into batches before they are handed
+    to `write_fn`.
+
+    The buffered events of a run are written, in order, when the buffer for that run reaches
+    `max_size` events, when its oldest event has been buffered for longer than `max_age_seconds`,
+    or when a step or run boundary event is added. A background thread flushes runs whose buffers
+    have aged out even if no further events arrive for them.
+
+    Buffered events get their storage ids when they are written, so events that this process
+    buffered can be stored after events written by other processes in the meantime, such as the
+    step events of child processes launched by an executor. Executors write out the buffer of a run
+    before handing a step to another process (see `DagsterInstance.flush_buffered_events`).
+    """
+
+    def __init__(
+        self,
+        write_fn: Callable[[Sequence["EventLogEntry"]], None],
+        max_size: int,
+        max_age_seconds: float,
+    ):
+        self._write_fn = check.callable_param(write_fn, "write_fn")
+        self._max_size = check.int_param(max_size, "max_size")
+        self._max_age_seconds = check.numeric_param(max_age_seconds, "max_age_seconds")
+
+        # run_id -> buffered events, and run_id -> time the oldest buffered event was added
+        self._buffers: Dict[str, List["EventLogEntry"]] = OrderedDict()
+        self._buffer_start_times: Dict[str, float] = {}
+
+        # Reentrant so that write_fn may itself trigger a flush (e.g. via an instance read)
+        self._lock = threading.RLock()
+        self._shutdown_event = threading.Event()
+        self._flush_thread: Optional[threading.Thread] = None
+
+    def add(self, event: "EventLogEntry") -> None:
+        with self._lock:
+            run_id = event.run_id
+            if run_id not in self._buffers:
+                self._buffers[run_id] = []
+                self._buffer_start_times[run_id] = time.monotonic()
+            self._buffers[run_id].append(event)
+
+            if (
+                len(self._buffers[run_id]) >= self._max_size
+                or self._is_expired(run_id)
+                or (event.is_dagster_event and event.dagster_event_type in FLUSH_BOUNDARY_EVENTS)
+            ):
+                self.flush(run_id)
+
+            self._ensure_flush_thread()
+
+    def flush(self, run_id: Optional[str] = None) -> None:
+        """Writes out the buffered events for the given run, or for all runs if no run is given.
+
+        Events are removed from the buffer before they are written and are not retried if the
+        write fails, as `write_fn` may have stored some of them before failing. The first error is
+        raised once the other runs have been flushed.
+        """
+        with self._lock:
+            run_ids = [run_id] if run_id is not None else list(self._buffers.keys())
+            error: Optional[Exception] = None
+            for buffered_run_id in run_ids:
+                events = self._buffers.pop(buffered_run_id, None)
+                self._buffer_start_times.pop(buffered_run_id, None)
+                if not events:
+                    continue
+                try:
+                    self._write_fn(events)
+                except Exception as e:
+                    error = error or e
+            if error is not None:
+                raise error
+
+    def dispose(self) -> None:
+        self._shutdown_event.set()
+        if self._flush_thread:
+            self._flush_thread.join()
+            self._flush_thread = None
+        self.flush()
+
+    def _is_expired(self, run_id: str) -> bool:
+        return time.monotonic() - self._buffer_start_times[run_id] >= self._max_age_seconds
+
+    def _ensure_flush_thread(self) -> None:
+        if self._flush_thread or self._shutdown_event.is_set():
+            return
+
+        self._flush_thread = threading.Thread(
+            target=self._flush_expired_loop,
+            name="event-write-buffer-flush",
+            daemon=True,
+        )
+        self._flush_thread.start()
+
+    def _flush_expired_loop(self) -> None:
+        while not self._shutdown_event.wait(self._max_age_seconds):
+            with self._lock:
+                for run_id in [run_id for run_id in self._buffers if self._is_expired(run_id)]:
+                    try:
+                        self.flush(run_id)
+                    except Exception:
+                        logging.getLogger("dagster").exception(
+                            f"Error while flushing buffered events for run {run_id}"
+                        )
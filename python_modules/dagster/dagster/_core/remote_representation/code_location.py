@@ -1,13 +1,18 @@
+import hashlib
 import json
 import os
 import pathlib
 import sys
 import tempfile
 import threading
+import warnings
+import weakref
 from abc import abstractmethod
 from contextlib import AbstractContextManager
+from types import ModuleType
 from typing import (
-    TYPE_CHECKING, Any, Dict, Mapping, Optional, Sequence, Tuple, Union, cast, List
+    TYPE_CHECKING, AbstractSet, Any, Dict, Iterable, Mapping, Optional, Sequence, Tuple, Union,
+    cast, List
 )
 
 import dagster._check as check
@@ -24,19 +29,27 @@
 )
 from dagster._api.snapshot_repository import sync_get_streaming_external_repositories_data_grpc
 from dagster._api.snapshot_schedule import sync_get_external_schedule_execution_data_grpc
-from dagster._canvas import convert_to_code
-from dagster._core.code_pointer import CodePointer
-from dagster._core.definitions.asset_job import ASSET_BASE_JOB_PREFIX
+from dagster._canvas import compile_flow, compute_cache_key
+from dagster._core.code_pointer import CodePointer, load_python_module
+from dagster._core.definitions.asset_graph import AssetGraph
+from dagster._core.definitions.asset_job import (
+    ASSET_BASE_JOB_PREFIX,
+    get_base_asset_jobs,
+    is_base_asset_job_name,
+)
+from dagster._core.definitions.job_definition import JobDefinition
 from dagster._core.definitions.partition import PartitionsDefinition
 from dagster._core.definitions.reconstruct import ReconstructableJob
-from dagster._core.definitions.repository_definition import RepositoryDefinition
+from dagster._core.definitions.repository_definition import (
+    SINGLETON_REPOSITORY_NAME,
+    RepositoryDefinition,
+)
 from dagster._core.definitions.selector import JobSubsetSelector
 from dagster._core.definitions.timestamp import TimestampWithTimezone
 from dagster._core.errors import (
     DagsterInvalidSubsetError,
     DagsterInvariantViolationError,
     DagsterUserCodeProcessError,
-    DagsterInvalidDefinitionError,
 )
 from dagster._core.execution.api import create_execution_plan
 from dagster._core.execution.plan.state import KnownExecutionState
@@ -55,8 +68,14 @@
     ExternalScheduleExecutionErrorData,
     ExternalSensorExecutionErrorData,
     external_partition_set_name_for_job_name,
+    external_job_data_from_def,
     external_repository_data_from_def,
+    ExternalAssetCheck,
+    ExternalAssetNode,
+    ExternalJobData,
+    ExternalJobRef,
     ExternalRepositoryData,
+    PartitionSetSnap,
 )
 from dagster._core.remote_representation.grpc_server_registry import GrpcServerRegistry
 from dagster._core.remote_representation.handle import JobHandle, RepositoryHandle
@@ -79,6 +98,7 @@
 from dagster._grpc.server import LoadedRepositories
 from dagster._grpc.types import GetCurrentImageResult, GetCurrentRunsResult
 from dagster._serdes import deserialize_value, serialize_value
+from dagster._utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
 from dagster._utils.merger import merge_dicts
 
 if TYPE_CHECKING:
@@ -90,6 +110,7 @@
         ExternalPartitionSetExecutionParamData,
         ExternalPartitionTagsData,
     )
+    from dagster._core.storage.runs.base import RunStorage
 
 
 class CodeLocation(AbstractContextManager):
@@ -340,10 +361,14 @@ def clean_package(pkg):
             sys.modules.pop(key)
 
 
-def load_repositories_from_definitions(flows: List[Dict], package_name: str):
+def load_repositories_from_definitions(
+    flows: List[Dict],
+    package_name: str,
+    storage: Optional["RunStorage"] = None,
+):
     clean_package(package_name)
     with tempfile.TemporaryDirectory() as tmpdir:
-        dump_codes(flows, tmpdir, package_name)
+        dump_codes(flows, tmpdir, package_name, storage)
         tmp_origin = LoadableTargetOrigin(
             working_directory=tmpdir,
             module_name=package_name
@@ -353,18 +378,272 @@ def load_repositories_from_definitions(flows: List[Dict], package_name: str):
     return loaded
 
 
-def dump_codes(flows, path: Union[str, pathlib.Path], package_name):
-    base_dir = pathlib.Path(path) / package_name
-    os.makedirs(base_dir, exist_ok=True)
-    for body in flows:
-        module_name = body['name']
-        code = convert_to_code(
-            json.loads(body['definition']), [package_name, module_name]
+def load_repository_rows_from_definitions(
+    flows: List[Dict],
+    package_name: str,
+    location_name: str,
+    root_directory: str,
+    storage: Optional["RunStorage"] = None,
+) -> Tuple[
+    Dict[str, List[Dict[str, str]]],
+    Mapping[str, CodePointer],
+    Dict[str, SerializableErrorInfo],
+]:
+    """Load the repo_definitions rows of many flows from a single import of their package.
+
+    The flows are compiled into modules of one package, each module is imported once, and a single
+    repository is built from the definitions of all of them, which is then split back into the rows
+    of every flow. A flow whose code cannot be generated or imported, or whose definitions are
+    invalid, is left out of the result without affecting the other flows. The package of the
+    loaded flows is published into ``root_directory``, so that runs can be launched from it.
+
+    Returns:
+        The rows of every flow that was loaded, by flow name, the code pointers of the
+        repositories, and the error of every flow that was left out, by flow name.
+    """
+    codes = {}
+    errors = {}
+    for flow in flows:
+        module_name = flow['name']
+        try:
+            codes[module_name] = get_flow_code(flow, [package_name, module_name], storage)
+        except Exception:
+            errors[module_name] = serializable_error_info_from_exc_info(sys.exc_info())
+
+    clean_package(package_name)
+    try:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            # the published package imports all of its modules, so the flows are loaded from a
+            # package which does not, letting a module that fails to import drop only its flow
+            write_flow_package(tmpdir, package_name, codes, init_code="")
+            modules = {}
+            for module_name in codes:
+                try:
+                    modules[module_name] = load_python_module(
+                        f"{package_name}.{module_name}", tmpdir
+                    )
+                except Exception:
+                    errors[module_name] = serializable_error_info_from_exc_info(sys.exc_info())
+            rows_by_flow, definition_errors = flow_repository_rows(modules, location_name)
+            errors.update(definition_errors)
+    finally:
+        clean_package(package_name)
+
+    if not rows_by_flow:
+        return {}, {}, errors
+    write_flow_package(
+        root_directory,
+        package_name,
+        {module_name: codes[module_name] for module_name in rows_by_flow},
+    )
+    code_pointers = {
+        SINGLETON_REPOSITORY_NAME: CodePointer.from_module(package_name, "defs", root_directory)
+    }
+    return rows_by_flow, code_pointers, errors
+
+
+def flow_repository_rows(
+    modules: Mapping[str, ModuleType],
+    location_name: str,
+) -> Tuple[Dict[str, List[Dict[str, str]]], Dict[str, SerializableErrorInfo]]:
+    """Build one repository of the assets and jobs of the given flow modules, and split its data
+    into the rows of every flow, as if each flow had been loaded into a repository of its own.
+
+    Definitions are only validated flow by flow if the repository of all flows cannot be built,
+    to leave out the flows that are invalid. Flows that are valid on their own but conflict with
+    each other, e.g. by defining the same asset, are then added one by one, leaving out those
+    that conflict with the flows added before them.
+
+    Returns:
+        The rows of every flow, by flow name, and the error of every flow that was left out.
+    """
+    from dagster import load_assets_from_modules
+
+    definitions_by_flow = {}
+    errors = {}
+    for module_name, module in modules.items():
+        try:
+            definitions_by_flow[module_name] = (load_assets_from_modules([module]), module.job)
+        except Exception:
+            errors[module_name] = serializable_error_info_from_exc_info(sys.exc_info())
+
+    try:
+        repo_def = _build_flows_repository_def(definitions_by_flow.values())
+    except Exception:
+        valid_flows = {}
+        for module_name, definitions in definitions_by_flow.items():
+            try:
+                _build_flows_repository_def([definitions])
+            except Exception:
+                errors[module_name] = serializable_error_info_from_exc_info(sys.exc_info())
+                continue
+            valid_flows[module_name] = definitions
+        try:
+            repo_def = _build_flows_repository_def(valid_flows.values())
+        except Exception:
+            valid_flows, repo_def = _add_compatible_flows(valid_flows, errors)
+        definitions_by_flow = valid_flows
+
+    repo_data = external_repository_data_from_def(repo_def)
+    base_jobs = [job for job in repo_def.get_all_jobs() if is_base_asset_job_name(job.name)]
+    flow_by_key = {}
+    for module_name, (assets, job) in definitions_by_flow.items():
+        flow_by_key[job.name] = module_name
+        for asset in assets:
+            flow_by_key.update({key: module_name for key in asset.keys})
+
+    rows_by_flow = {}
+    for module_name, (assets, _) in definitions_by_flow.items():
+        flow_base_jobs = _build_flow_base_jobs(assets, base_jobs)
+        flow_data = {}
+        for field in ExternalRepositoryData._fields:
+            datas = getattr(repo_data, field)
+            if not isinstance(datas, list):
+                continue
+            flow_data[field] = [
+                data for data in datas
+                if (key := _flow_key(data)) is None or flow_by_key.get(key) == module_name
+            ]
+        flow_data["external_job_datas"] = sorted(
+            [
+                *flow_data["external_job_datas"],
+                *(
+                    external_job_data_from_def(job, include_parent_snapshot=True)
+                    for job in flow_base_jobs
+                ),
+            ],
+            key=lambda job_data: job_data.name,
         )
-        with open(base_dir / f"{module_name}.py", "wt") as f:
-            f.write(code)
-    with open(base_dir / "__init__.py", "wt") as f:
-        f.write("""
+        flow_data["external_partition_set_datas"] = sorted(
+            [
+                *flow_data["external_partition_set_datas"],
+                *(
+                    PartitionSetSnap.from_job_def(job)
+                    for job in flow_base_jobs if job.partitions_def is not None
+                ),
+            ],
+            key=lambda partition_set: partition_set.name,
+        )
+        rows_by_flow[module_name] = repository_data_rows(
+            location_name, repo_data._replace(**flow_data)
+        )
+    return rows_by_flow, errors
+
+
+def _warn_flow_errors(errors: Mapping[str, SerializableErrorInfo]) -> None:
+    for flow_name, error in errors.items():
+        warnings.warn(f"Error loading flow {flow_name}:{error.to_string()}")
+
+
+def _add_compatible_flows(
+    definitions_by_flow: Mapping[str, Tuple[Sequence[Any], Any]],
+    errors: Dict[str, SerializableErrorInfo],
+) -> Tuple[Dict[str, Tuple[Sequence[Any], Any]], RepositoryDefinition]:
+    """Add flows to a repository one by one, leaving out every flow the repository cannot be
+    built with, and recording its error.
+    """
+    compatible_flows = {}
+    repo_def = _build_flows_repository_def([])
+    for module_name, definitions in definitions_by_flow.items():
+        try:
+            repo_def = _build_flows_repository_def([*compatible_flows.values(), definitions])
+        except Exception:
+            errors[module_name] = serializable_error_info_from_exc_info(sys.exc_info())
+            continue
+        compatible_flows[module_name] = definitions
+    return compatible_flows, repo_def
+
+
+def _build_flows_repository_def(
+    definitions: Iterable[Tuple[Sequence[Any], Any]],
+) -> RepositoryDefinition:
+    from dagster import Definitions
+
+    definitions = list(definitions)
+    repo_def = Definitions(
+        assets=[asset for assets, _ in definitions for asset in assets],
+        jobs=[job for _, job in definitions],
+    ).get_repository_def()
+    repo_def.load_all_definitions()
+    return repo_def
+
+
+def _build_flow_base_jobs(
+    assets: Sequence[Any],
+    base_jobs: Sequence[JobDefinition],
+) -> List[JobDefinition]:
+    """Build the base asset jobs the repository of a single flow would have, with the executor,
+    resources and loggers of the base asset jobs of the repository of all flows.
+    """
+    if not base_jobs:
+        return []
+    job_fns = get_base_asset_jobs(
+        asset_graph=AssetGraph.from_assets(assets),
+        executor_def=base_jobs[0].executor_def,
+        resource_defs=base_jobs[0].resource_defs,
+        logger_defs=base_jobs[0].loggers,
+    )
+    return [job_fn() for job_fn in job_fns.values()]
+
+
+def _flow_key(data: Any) -> Any:
+    """The key by which a part of the repository data is attributed to a flow: the key of an asset,
+    or the name of a job. Data without a key, like resources, is shared by all flows. The base
+    asset jobs have no flow, they are rebuilt for every flow instead.
+    """
+    if isinstance(data, (ExternalAssetNode, ExternalAssetCheck)):
+        return data.asset_key
+    if isinstance(data, (ExternalJobData, ExternalJobRef)):
+        return data.name
+    if isinstance(data, PartitionSetSnap):
+        return data.job_name
+    return None
+
+
+def load_flow_repository_def(
+    package_name: str,
+    module_name: str,
+    working_directory: str,
+) -> RepositoryDefinition:
+    """Import the generated module of a flow and build the repository of its assets and job."""
+    from dagster import Definitions, load_assets_from_modules
+
+    module = load_python_module(f"{package_name}.{module_name}", working_directory)
+    repo_def = Definitions(
+        assets=load_assets_from_modules([module]),
+        jobs=[module.job],
+    ).get_repository_def()
+    repo_def.load_all_definitions()
+    return repo_def
+
+
+def get_flow_code(
+    flow: Dict,
+    namespace: List[str],
+    storage: Optional["RunStorage"] = None,
+) -> str:
+    """Generate the module source of a flow. If a storage is given, the code compiled from an
+    identical definition and namespace is reused from its compile cache.
+    """
+    data = json.loads(flow['definition'])
+    if storage is None:
+        return compile_flow(data, namespace).code
+
+    cache_key = compute_cache_key(data, namespace)
+    if (cached := storage.get_compiled_flow(cache_key)) is not None:
+        return cached['code']
+
+    compiled = compile_flow(data, namespace)
+    storage.save_compiled_flow(
+        cache_key,
+        flow['name'],
+        compiled.code,
+        json.dumps(compiled.dependencies),
+    )
+    return compiled.code
+
+
+FLOW_PACKAGE_INIT = """
 import importlib
 import os
 import pathlib
@@ -391,7 +670,48 @@ def collect_modules():
 
 if __name__ == '__main__':
     defs.get_job_def("entry").execute_in_process()
-            """)
+            """
+
+
+def write_flow_package(
+    path: Union[str, pathlib.Path],
+    package_name: str,
+    codes: Mapping[str, str],
+    init_code: str = FLOW_PACKAGE_INIT,
+):
+    """Write the generated modules of flows, by module name, into a package under ``path``."""
+    base_dir = pathlib.Path(path) / package_name
+    os.makedirs(base_dir, exist_ok=True)
+    for module_name, code in codes.items():
+        with open(base_dir / f"{module_name}.py", "wt") as f:
+            f.write(code)
+    with open(base_dir / "__init__.py", "wt") as f:
+        f.write(init_code)
+
+
+def dump_codes(
+    flows,
+    path: Union[str, pathlib.Path],
+    package_name,
+    storage: Optional["RunStorage"] = None,
+):
+    write_flow_package(path, package_name, {
+        body['name']: get_flow_code(body, [package_name, body['name']], storage)
+        for body in flows
+    })
+
+
+def publish_flow_package(
+    flows: List[Dict],
+    instance: DagsterInstance,
+    package_name: str,
+    storage: Optional["RunStorage"] = None,
+) -> CodePointer:
+    """Write the modules of flows into the package in the instance directory, returning the code
+    pointer of the repository of the package.
+    """
+    dump_codes(flows, instance.root_directory, package_name, storage)
+    return CodePointer.from_module(package_name, "defs", instance.root_directory)
 
 
 def save_repo_data(
@@ -399,57 +719,165 @@ def save_repo_data(
     instance: DagsterInstance,
     loaded_repo: LoadedRepositories,
     flow_name: str
+):
+    save_repository_defs(origin, instance, loaded_repo.definitions_by_name, flow_name)
+
+
+def save_repository_defs(
+    origin: InProcessCodeLocationOrigin,
+    instance: DagsterInstance,
+    definitions_by_name: Mapping[str, RepositoryDefinition],
+    flow_name: str
 ):
     storage = instance.run_storage
-    for repo_name, repo_def in loaded_repo.definitions_by_name.items():
-        repo_data = external_repository_data_from_def(repo_def)
-        main_keys = {
-            "name": repo_data.name,
-            "location_name": origin.location_name,
-            "metadata": serialize_value(repo_data.metadata),
-            "utilized_env_vars": serialize_value(repo_data.utilized_env_vars)
-        }
-        for snap_type in repo_data._fields:
-            if snap_type in main_keys:
-                continue
-            if (datas := getattr(repo_data, snap_type)) is None:
-                continue
-            for data in datas:
-                storage.save_repo_definition(
-                    **main_keys,
-                    flow_name=flow_name,
-                    main_key=data.get_main_key(),
-                    snap_type=snap_type,
-                    definition=serialize_value(data)
-                )
+    rows = []
+    for repo_def in definitions_by_name.values():
+        rows.extend(repository_data_rows(
+            origin.location_name, external_repository_data_from_def(repo_def)
+        ))
+    storage.save_repo_definitions(flow_name, rows)
+
+
+def repository_data_rows(
+    location_name: str,
+    repo_data: ExternalRepositoryData,
+) -> List[Dict[str, str]]:
+    """Split repository data into the serialized rows stored in repo_definitions."""
+    rows = []
+    main_keys = {
+        "name": repo_data.name,
+        "location_name": location_name,
+        "metadata": serialize_value(repo_data.metadata),
+        "utilized_env_vars": serialize_value(repo_data.utilized_env_vars)
+    }
+    for snap_type in repo_data._fields:
+        if snap_type in main_keys:
+            continue
+        if (datas := getattr(repo_data, snap_type)) is None:
+            continue
+        for data in datas:
+            rows.append(dict(
+                **main_keys,
+                main_key=data.get_main_key(),
+                snap_type=snap_type,
+                definition=serialize_value(data)
+            ))
+    return rows
+
+
+class RepoDataCache:
+    """Cache of the deserialized repo definition rows of one instance, see
+    :py:func:`get_repo_data_cache`.
+
+    Rows are keyed by (location, flow, repository, snap type, main key) and remember a hash of
+    their serialized content, so a row is only deserialized again once it was rewritten, e.g. by
+    publishing its flow. Rows of dropped flows are evicted when their location is read next.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._rows: Dict[Tuple[str, ...], Tuple[bytes, Any]] = {}
+        self._merged_base_jobs: Dict[Tuple[str, str], Tuple[Tuple[bytes, ...], Any]] = {}
+
+    def deserialize_row(self, key: Tuple[str, ...], serialized: str) -> Tuple[bytes, Any]:
+        digest = hashlib.sha1(serialized.encode()).digest()
+        with self._lock:
+            cached = self._rows.get(key)
+        if cached is not None and cached[0] == digest:
+            return cached
+
+        value = (digest, deserialize_value(serialized))
+        with self._lock:
+            self._rows[key] = value
+        return value
+
+    def merge_base_jobs(
+        self,
+        location_name: str,
+        repo_name: str,
+        digests: Tuple[bytes, ...],
+        job_datas: Sequence[ExternalJobData],
+    ) -> ExternalJobData:
+        key = (location_name, repo_name)
+        with self._lock:
+            cached = self._merged_base_jobs.get(key)
+        if cached is not None and cached[0] == digests:
+            return cached[1]
+
+        merged = job_datas[0]
+        for job_data in job_datas[1:]:
+            merged = merged.merge(job_data)
+        with self._lock:
+            self._merged_base_jobs[key] = (digests, merged)
+        return merged
+
+    def evict(self, location_name: str, keep: AbstractSet[Tuple[str, ...]]) -> None:
+        with self._lock:
+            for key in [
+                key for key in self._rows if key[0] == location_name and key not in keep
+            ]:
+                del self._rows[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._rows.clear()
+            self._merged_base_jobs.clear()
+
+
+# instance -> cache of its repo definition rows. Rows are only shared between code locations of
+# the same instance, since other instances may store different rows for a location of the same
+# name, and the cache of an instance is dropped along with it.
+_repo_data_caches: "weakref.WeakKeyDictionary[DagsterInstance, RepoDataCache]" = (
+    weakref.WeakKeyDictionary()
+)
+_repo_data_caches_lock = threading.Lock()
+
+
+def get_repo_data_cache(instance: DagsterInstance) -> RepoDataCache:
+    with _repo_data_caches_lock:
+        cache = _repo_data_caches.get(instance)
+        if cache is None:
+            cache = _repo_data_caches[instance] = RepoDataCache()
+        return cache
 
 
 def get_repo_data(name, instance):
     storage = instance.run_storage
+    repo_data_cache = get_repo_data_cache(instance)
     repos = {}
     global_job_data = {}
     main_fields = {'metadata', 'utilized_env_vars'}
+    seen_keys = set()
     for snap_row in storage.get_repo_definition(name):
         repo_name = snap_row['name']
         cur = repos.setdefault(repo_name, {})
         cur.setdefault('name', repo_name)
         for main_field in main_fields:
-            cur.setdefault(main_field, deserialize_value(snap_row[main_field]))
+            if main_field not in cur:
+                cur[main_field] = deserialize_value(snap_row[main_field])
         attr_name = snap_row['snap_type']
-        definition = deserialize_value(snap_row['definition'])
+        row_key = (name, snap_row['flow_name'], repo_name, attr_name, snap_row['main_key'])
+        seen_keys.add(row_key)
+        digest, definition = repo_data_cache.deserialize_row(row_key, snap_row['definition'])
         if (
             snap_row['main_key'] == ASSET_BASE_JOB_PREFIX
             and attr_name == 'external_job_datas'
         ):
-            if repo_name not in global_job_data:
-                global_job_data[repo_name] = definition
-            else:
-                global_job_data[repo_name] = global_job_data[repo_name].merge(definition)
+            global_job_data.setdefault(repo_name, []).append((digest, definition))
         else:
             cur.setdefault(attr_name, []).append(definition)
+    repo_data_cache.evict(name, seen_keys)
+
     if global_job_data:
-        for repo_name, job_data in global_job_data.items():
-            repos[repo_name]['external_job_datas'].append(job_data)
+        for repo_name, job_datas in global_job_data.items():
+            repos[repo_name].setdefault('external_job_datas', []).append(
+                repo_data_cache.merge_base_jobs(
+                    name,
+                    repo_name,
+                    tuple(digest for digest, _ in job_datas),
+                    [job_data for _, job_data in job_datas],
+                )
+            )
 
     for repo in repos.values():
         for field in ExternalRepositoryData._fields:
@@ -482,23 +910,16 @@ def new(
             origin, "origin", InProcessCodeLocationOrigin
         )
         storage = instance.run_storage
-        loaded_repo = None
-        for flow in storage.all_definitions():
-            storage.drop_repo_definition_by_flow(flow['name'])
-            package_name = pathlib.Path(instance.root_directory).name
-            try:
-                loaded_repo = load_repositories_from_definitions(
-                    [flow], package_name
-                )
-                save_repo_data(origin, instance, loaded_repo, flow['name'])
-            except DagsterInvalidDefinitionError:
-                pass
+        flows = storage.all_definitions()
+        package_name = pathlib.Path(instance.root_directory).name
+        code_pointers_by_repo_name = cls._load_flows(origin, instance, flows, package_name)
 
-        if loaded_repo is not None:
-            for repo_name, code_pointer in loaded_repo.code_pointers_by_repo_name.items():
-                code_pointer = code_pointer._asdict()
-                storage.save_code_pointer(repo_name, json.dumps(code_pointer))
-            ins._repository_code_pointer_dict = loaded_repo.code_pointers_by_repo_name
+        if code_pointers_by_repo_name:
+            storage.save_code_pointers({
+                repo_name: json.dumps(code_pointer._asdict())
+                for repo_name, code_pointer in code_pointers_by_repo_name.items()
+            })
+            ins._repository_code_pointer_dict = code_pointers_by_repo_name
 
         ins._repositories = {
             name: ExternalRepository(
@@ -514,6 +935,61 @@ def new(
         ins._loaded_repositories = None
         return ins
 
+    @staticmethod
+    def _load_flows(
+        origin: InProcessCodeLocationOrigin,
+        instance: DagsterInstance,
+        flows: List[Dict],
+        package_name: str,
+    ) -> Mapping[str, CodePointer]:
+        """Load and save the repository data of every flow, returning the code pointers of the
+        loaded repositories. With ``DAGSTER_FLOW_COMPILE_WORKERS`` set, flows are compiled and
+        loaded in parallel worker processes. A warning is issued with the error of every flow that
+        could not be loaded.
+        """
+        from dagster._core.remote_representation.flow_compilation import (
+            flow_compile_workers,
+            get_flow_compilation_service,
+            save_flow_compilation_results,
+        )
+
+        storage = instance.run_storage
+        if (max_workers := flow_compile_workers()) > 1:
+            results = get_flow_compilation_service(max_workers).compile_flows(
+                flows, package_name, origin.location_name, storage
+            )
+            save_flow_compilation_results(storage, results)
+            _warn_flow_errors(
+                {name: result.error for name, result in results.items() if result.error}
+            )
+            loaded_flows = [
+                flow for flow in flows
+                if results[flow['name']].repository_rows is not None
+            ]
+        else:
+            rows_by_flow, code_pointers_by_repo_name, errors = (
+                load_repository_rows_from_definitions(
+                    flows, package_name, origin.location_name, instance.root_directory, storage
+                )
+            )
+            _warn_flow_errors(errors)
+            for flow in flows:
+                if (rows := rows_by_flow.get(flow['name'])) is None:
+                    storage.drop_repo_definition_by_flow(flow['name'])
+                else:
+                    storage.save_repo_definitions(flow['name'], rows)
+            return code_pointers_by_repo_name
+
+        if not loaded_flows:
+            return {}
+        # flows are compiled in temporary packages; runs are launched from the package of the
+        # loaded flows published into the instance directory, as the webserver does on publish
+        return {
+            SINGLETON_REPOSITORY_NAME: publish_flow_package(
+                loaded_flows, instance, package_name, storage
+            )
+        }
+
     @classmethod
     def reload(
         cls,
@@ -522,9 +998,7 @@ def reload(
         flow: Dict[str, str] = None,
         loaded_repo: LoadedRepositories = None,
     ):
-        storage = instance.run_storage
         if flow is not None and loaded_repo is not None:
-            storage.drop_repo_definition_by_flow(flow['name'])
             save_repo_data(origin, instance, loaded_repo, flow['name'])
         origin = check.inst_param(
             origin, "origin", InProcessCodeLocationOrigin
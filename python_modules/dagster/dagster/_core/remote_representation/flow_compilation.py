@@ -0,0 +1,228 @@
+"""Compile and validate canvas flows in parallel worker processes.
+
+Generating, importing and snapshotting a flow is CPU-bound Python, so loading hundreds of flows in
+the webserver process does not scale with the number of cores. Here every flow is compiled in a
+worker process of its own package copy; the worker returns the generated source and the serialized
+repo_definitions rows of the flow, which the parent persists without deserializing them.
+"""
+
+import json
+import multiprocessing
+import os
+import pathlib
+import sys
+import tempfile
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import TYPE_CHECKING, Dict, List, Mapping, NamedTuple, Optional, Sequence
+
+from dagster._canvas import compile_flow, compute_cache_key
+from dagster._core.remote_representation.code_location import (
+    clean_package,
+    load_flow_repository_def,
+    repository_data_rows,
+)
+from dagster._core.remote_representation.external_data import external_repository_data_from_def
+from dagster._utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
+
+if TYPE_CHECKING:
+    from dagster._core.storage.runs.base import RunStorage
+
+
+def flow_compile_workers() -> int:
+    # Opt-in: compile flows in this many worker processes when loading the canvas code location.
+    # Unset, or 1, loads all flows in the webserver process.
+    env_set = os.getenv("DAGSTER_FLOW_COMPILE_WORKERS")
+    if env_set:
+        return int(env_set)
+
+    return 0
+
+
+class FlowCompilationResult(NamedTuple):
+    flow_name: str
+    #: generated module source, None if the flow could not be compiled
+    code: Optional[str]
+    #: step dependencies as JSON, only set if the code was generated rather than read from the
+    #: compile cache
+    dependencies: Optional[str]
+    #: repo_definitions rows of the flow, without flow_name; None if the flow is invalid
+    repository_rows: Optional[List[Dict[str, str]]]
+    error: Optional[SerializableErrorInfo]
+
+
+def compile_and_load_flow(
+    flow: Mapping[str, str],
+    package_name: str,
+    location_name: str,
+    cached_code: Optional[str] = None,
+) -> FlowCompilationResult:
+    """Generate the module of a flow, load its definitions and snapshot them.
+
+    Runs in a worker process, but works the same in the calling process. The module is loaded
+    from a temporary package of its own, so flows do not see each other's modules.
+    """
+    flow_name = flow["name"]
+    code, dependencies = cached_code, None
+    try:
+        if code is None:
+            compiled = compile_flow(json.loads(flow["definition"]), [package_name, flow_name])
+            code, dependencies = compiled.code, json.dumps(compiled.dependencies)
+    except Exception:
+        # any error is confined to its flow, so that the other flows are still loaded
+        error = serializable_error_info_from_exc_info(sys.exc_info())
+        return FlowCompilationResult(flow_name, None, None, None, error)
+
+    clean_package(package_name)
+    try:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            base_dir = pathlib.Path(tmpdir) / package_name
+            os.makedirs(base_dir)
+            (base_dir / "__init__.py").touch()
+            with open(base_dir / f"{flow_name}.py", "wt") as f:
+                f.write(code)
+
+            try:
+                repo_def = load_flow_repository_def(package_name, flow_name, tmpdir)
+                rows = repository_data_rows(
+                    location_name, external_repository_data_from_def(repo_def)
+                )
+            except Exception:
+                error = serializable_error_info_from_exc_info(sys.exc_info())
+                return FlowCompilationResult(flow_name, code, dependencies, None, error)
+    finally:
+        clean_package(package_name)
+
+    return FlowCompilationResult(flow_name, code, dependencies, rows, None)
+
+
+def _get_result(flow_name: str, future: "Future[FlowCompilationResult]") -> FlowCompilationResult:
+    try:
+        return future.result()
+    except Exception:
+        # the worker process died, or the result could not be sent back
+        error = serializable_error_info_from_exc_info(sys.exc_info())
+        return FlowCompilationResult(flow_name, None, None, None, error)
+
+
+class FlowCompilationService:
+    """Process pool compiling flows with :py:func:`compile_and_load_flow`.
+
+    Workers are started with the ``spawn`` method, since the webserver process runs threads, and
+    are kept alive between calls.
+
+    Args:
+        max_workers (int): Number of worker processes. With 1 or less, flows are compiled one by one
+            in the calling process instead.
+    """
+
+    def __init__(self, max_workers: int):
+        self._max_workers = max_workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    @property
+    def max_workers(self) -> int:
+        return self._max_workers
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self._max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._executor
+
+    def compile_flows(
+        self,
+        flows: Sequence[Mapping[str, str]],
+        package_name: str,
+        location_name: str,
+        storage: Optional["RunStorage"] = None,
+    ) -> Dict[str, FlowCompilationResult]:
+        """Compile and load flows, returning the result of each by flow name. Errors are returned
+        in the result of their flow rather than raised.
+
+        If a storage is given, workers reuse code from its compile cache, and newly generated code
+        is added to it.
+        """
+        cached_codes = {}
+        cache_keys = {}
+        if storage is not None:
+            for flow in flows:
+                namespace = [package_name, flow["name"]]
+                cache_key = compute_cache_key(json.loads(flow["definition"]), namespace)
+                cache_keys[flow["name"]] = cache_key
+                if (cached := storage.get_compiled_flow(cache_key)) is not None:
+                    cached_codes[flow["name"]] = cached["code"]
+
+        if self._max_workers <= 1 or len(flows) <= 1:
+            results = [
+                compile_and_load_flow(
+                    flow, package_name, location_name, cached_codes.get(flow["name"])
+                )
+                for flow in flows
+            ]
+        else:
+            executor = self._get_executor()
+            futures = [
+                (
+                    flow["name"],
+                    executor.submit(
+                        compile_and_load_flow,
+                        flow,
+                        package_name,
+                        location_name,
+                        cached_codes.get(flow["name"]),
+                    ),
+                )
+                for flow in flows
+            ]
+            results = [_get_result(flow_name, future) for flow_name, future in futures]
+
+        if storage is not None:
+            for result in results:
+                if result.code is not None and result.dependencies is not None:
+                    storage.save_compiled_flow(
+                        cache_keys[result.flow_name],
+                        result.flow_name,
+                        result.code,
+                        result.dependencies,
+                    )
+
+        return {result.flow_name: result for result in results}
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+
+_services: Dict[int, FlowCompilationService] = {}
+_services_lock = threading.Lock()
+
+
+def get_flow_compilation_service(max_workers: Optional[int] = None) -> FlowCompilationService:
+    """Return the process-wide compilation service with the given number of workers, by default
+    the number set by ``DAGSTER_FLOW_COMPILE_WORKERS``.
+    """
+    if max_workers is None:
+        max_workers = flow_compile_workers()
+    with _services_lock:
+        if max_workers not in _services:
+            _services[max_workers] = FlowCompilationService(max_workers)
+        return _services[max_workers]
+
+
+def save_flow_compilation_results(
+    storage: "RunStorage",
+    results: Mapping[str, FlowCompilationResult],
+) -> None:
+    """Persist the repo_definitions rows of compiled flows, dropping those of invalid flows."""
+    for flow_name, result in results.items():
+        if result.repository_rows is None:
+            storage.drop_repo_definition_by_flow(flow_name)
+        else:
+            storage.save_repo_definitions(flow_name, result.repository_rows)
@@ -0,0 +1,35 @@
+"""add flow_compile_cache table
+
+Revision ID: e48310d75115
+Revises: 46b412388816
+Create Date: 2026-10-19 09:12:31.402817
+
+"""
+
+import sqlalchemy as db
+from alembic import op
+from dagster._core.storage.migration.utils import has_table
+
+# revision identifiers, used by Alembic.
+revision = "e48310d75115"
+down_revision = "46b412388816"
+branch_labels = None
+depends_on = None
+
+TABLE_NAME = "flow_compile_cache"
+
+
+def upgrade():
+    if not has_table(TABLE_NAME):
+        op.create_table(
+            TABLE_NAME,
+            db.Column("cache_key", db.String(64), primary_key=True),
+            db.Column("flow_name", db.Text),
+            db.Column("code", db.Text),
+            db.Column("dependencies", db.Text),
+        )
+
+
+def downgrade():
+    if has_table(TABLE_NAME):
+        op.drop_table(TABLE_NAME)
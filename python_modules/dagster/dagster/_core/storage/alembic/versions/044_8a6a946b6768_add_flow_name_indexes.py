@@ -0,0 +1,39 @@
+"""add flow_name indexes to repo_definitions and flow_compile_cache
+
+Revision ID: 8a6a946b6768
+Revises: e48310d75115
+Create Date: 2026-10-19 10:02:47.118304
+
+"""
+
+from alembic import op
+from dagster._core.storage.migration.utils import has_index, has_table
+
+# revision identifiers, used by Alembic.
+revision = "8a6a946b6768"
+down_revision = "e48310d75115"
+branch_labels = None
+depends_on = None
+
+FLOW_NAME_INDEXES = {
+    "repo_definitions": "idx_repo_definitions_flow_name",
+    "flow_compile_cache": "idx_flow_compile_cache_flow_name",
+}
+
+
+def upgrade():
+    for table_name, index_name in FLOW_NAME_INDEXES.items():
+        if has_table(table_name) and not has_index(table_name, index_name):
+            op.create_index(
+                index_name,
+                table_name,
+                ["flow_name"],
+                unique=False,
+                mysql_length={"flow_name": 64},
+            )
+
+
+def downgrade():
+    for table_name, index_name in FLOW_NAME_INDEXES.items():
+        if has_index(table_name, index_name):
+            op.drop_index(index_name, table_name)
@@ -1,3 +1,4 @@
+import threading
 from typing import TYPE_CHECKING, Iterable, Mapping, Optional, Sequence, Set
 
 import dagster._check as check
@@ -11,17 +12,20 @@
 
 class BatchAssetRecordLoader:
     """A batch loader that fetches asset records.  This loader is expected to be
-    instantiated with a set of asset keys.
+    instantiated with a set of asset keys. It may be shared between threads, e.g. when evaluating
+    automation conditions of independent assets in parallel.
     """
 
     def __init__(self, instance: DagsterInstance, asset_keys: Iterable[AssetKey]):
         self._instance = instance
         self._unfetched_asset_keys: Set[AssetKey] = set(asset_keys)
         self._asset_records: Mapping[AssetKey, Optional["AssetRecord"]] = {}
+        self._lock = threading.RLock()
 
     def add_asset_keys(self, asset_keys: Iterable[AssetKey]):
-        unfetched_asset_keys = set(asset_keys).difference(self._asset_records)
-        self._unfetched_asset_keys = self._unfetched_asset_keys.union(unfetched_asset_keys)
+        with self._lock:
+            unfetched_asset_keys = set(asset_keys).difference(self._asset_records)
+            self._unfetched_asset_keys = self._unfetched_asset_keys.union(unfetched_asset_keys)
 
     def get_asset_record(self, asset_key: AssetKey) -> Optional["AssetRecord"]:
         if asset_key not in self._asset_records and asset_key not in self._unfetched_asset_keys:
@@ -37,8 +41,11 @@ def get_asset_record(self, asset_key: AssetKey) -> Optional["AssetRecord"]:
 
     def clear_cache(self):
         """For use in tests."""
-        self._unfetched_asset_keys = self._unfetched_asset_keys.union(self._asset_records.keys())
-        self._asset_records = {}
+        with self._lock:
+            self._unfetched_asset_keys = self._unfetched_asset_keys.union(
+                self._asset_records.keys()
+            )
+            self._asset_records = {}
 
     def has_cached_asset_record(self, asset_key: AssetKey):
         return asset_key in self._asset_records
@@ -69,16 +76,20 @@ def get_latest_observation_for_asset_key(self, asset_key: AssetKey) -> Optional[
         return asset_record.asset_entry.last_observation
 
     def fetch(self) -> None:
-        if not self._unfetched_asset_keys:
-            return
-
-        new_records = {
-            record.asset_entry.asset_key: record
-            for record in self._instance.get_asset_records(list(self._unfetched_asset_keys))
-        }
-
-        self._asset_records = {
-            **self._asset_records,
-            **{asset_key: new_records.get(asset_key) for asset_key in self._unfetched_asset_keys},
-        }
-        self._unfetched_asset_keys = set()
+        with self._lock:
+            if not self._unfetched_asset_keys:
+                return
+
+            new_records = {
+                record.asset_entry.asset_key: record
+                for record in self._instance.get_asset_records(list(self._unfetched_asset_keys))
+            }
+
+            self._asset_records = {
+                **self._asset_records,
+                **{
+                    asset_key: new_records.get(asset_key)
+                    for asset_key in self._unfetched_asset_keys
+                },
+            }
+            self._unfetched_asset_keys = set()
@@ -1,15 +1,34 @@
+import logging
 import os
 import threading
-from typing import Callable, List, MutableMapping, NamedTuple, Optional
+from collections import defaultdict
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    List,
+    MutableMapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+)
 
 import dagster._check as check
 from dagster._core.events.log import EventLogEntry
-from dagster._core.storage.event_log.base import EventLogCursor, EventLogStorage
+from dagster._core.storage.event_log.base import EventLogCursor, EventLogRecord, EventLogStorage
+
+if TYPE_CHECKING:
+    from dagster._core.storage.event_log.sql_event_log import SqlEventLogStorage
 
 INIT_POLL_PERIOD = 0.250  # 250ms
 MAX_POLL_PERIOD = 16.0  # 16s
 
 
+def polling_event_watcher_multiplex_enabled() -> bool:
+    # Opt-in: poll all watched runs from a single thread instead of one thread per run
+    return str(os.getenv("DAGSTER_POLLING_EVENT_WATCHER_MULTIPLEX")).lower() in ("1", "true", "t")
+
+
 class CallbackAfterCursor(NamedTuple):
     """Callback passed from Observer class in event polling.
 
@@ -22,29 +41,60 @@ class CallbackAfterCursor(NamedTuple):
     callback: Callable[[EventLogEntry, str], None]
 
 
+def _call_callbacks(callbacks: Sequence[CallbackAfterCursor], event_record: EventLogRecord) -> None:
+    for callback_with_cursor in callbacks:
+        if (
+            callback_with_cursor.cursor is None
+            or EventLogCursor.parse(callback_with_cursor.cursor).storage_id()
+            < event_record.storage_id
+        ):
+            callback_with_cursor.callback(
+                event_record.event_log_entry,
+                str(EventLogCursor.from_storage_id(event_record.storage_id)),
+            )
+
+
 class SqlPollingEventWatcher:
     """Event Log Watcher that uses a multithreaded polling approach to retrieving new events for run_ids
     This class' job is to manage a collection of threads that each poll the event log for a given run_id
     Uses one thread (SqlPollingRunIdEventWatcherThread) per watched run_id.
 
+    In multiplexed mode, a single thread (SqlPollingMultiplexedEventWatcherThread) polls the event
+    log for all watched runs instead, so that the number of queries does not grow with the number of
+    watched runs. Multiplexing is enabled by the ``multiplexed`` argument or by setting
+    ``DAGSTER_POLLING_EVENT_WATCHER_MULTIPLEX``, and requires an event log storage that is not
+    run-sharded.
+
     LOCKING INFO:
         ORDER: _dict_lock -> run_id_thread.callback_fn_list_lock
-        INVARIANTS: _dict_lock protects _run_id_to_watcher_dict
+        INVARIANTS: _dict_lock protects _run_id_to_watcher_dict and _multiplexed_thread
     """
 
-    def __init__(self, event_log_storage: EventLogStorage):
+    def __init__(self, event_log_storage: EventLogStorage, multiplexed: Optional[bool] = None):
         self._event_log_storage = check.inst_param(
             event_log_storage, "event_log_storage", EventLogStorage
         )
+        if multiplexed is None:
+            multiplexed = polling_event_watcher_multiplex_enabled()
+        self._multiplexed = multiplexed and not event_log_storage.is_run_sharded
 
         # INVARIANT: dict_lock protects _run_id_to_watcher_dict
         self._dict_lock: threading.Lock = threading.Lock()
         self._run_id_to_watcher_dict: MutableMapping[str, SqlPollingRunIdEventWatcherThread] = {}
+        self._multiplexed_thread: Optional[SqlPollingMultiplexedEventWatcherThread] = None
         self._disposed = False
 
+    @property
+    def is_multiplexed(self) -> bool:
+        return self._multiplexed
+
     def has_run_id(self, run_id: str) -> bool:
         run_id = check.str_param(run_id, "run_id")
         with self._dict_lock:
+            if self._multiplexed:
+                return self._multiplexed_thread is not None and self._multiplexed_thread.has_run_id(
+                    run_id
+                )
             _has_run_id = run_id in self._run_id_to_watcher_dict
         return _has_run_id
 
@@ -60,6 +110,16 @@ def watch_run(
         check.invariant(not self._disposed, "Attempted to watch_run after close")
 
         with self._dict_lock:
+            if self._multiplexed:
+                if self._multiplexed_thread is None:
+                    self._multiplexed_thread = SqlPollingMultiplexedEventWatcherThread(
+                        self._event_log_storage  # type: ignore  # (checked not run-sharded)
+                    )
+                    self._multiplexed_thread.daemon = True
+                    self._multiplexed_thread.start()
+                self._multiplexed_thread.add_callback(run_id, cursor, callback)
+                return
+
             if run_id not in self._run_id_to_watcher_dict:
                 self._run_id_to_watcher_dict[run_id] = SqlPollingRunIdEventWatcherThread(
                     self._event_log_storage, run_id
@@ -76,6 +136,8 @@ def unwatch_run(
         run_id = check.str_param(run_id, "run_id")
         handler = check.callable_param(handler, "handler")
         with self._dict_lock:
+            if self._multiplexed_thread is not None:
+                self._multiplexed_thread.remove_callback(run_id, handler)
             if run_id in self._run_id_to_watcher_dict:
                 self._run_id_to_watcher_dict[run_id].remove_callback(handler)
                 if self._run_id_to_watcher_dict[run_id].should_thread_exit.is_set():
@@ -85,6 +147,11 @@ def close(self) -> None:
         if not self._disposed:
             self._disposed = True
             with self._dict_lock:
+                if self._multiplexed_thread is not None:
+                    self._multiplexed_thread.should_thread_exit.set()
+                    self._multiplexed_thread.wake()
+                    self._multiplexed_thread.join()
+                    self._multiplexed_thread = None
                 for watcher_thread in self._run_id_to_watcher_dict.values():
                     if not watcher_thread.should_thread_exit.is_set():
                         watcher_thread.should_thread_exit.set()
@@ -174,14 +241,183 @@ def run(self) -> None:
             cursor = conn.cursor
             for event_record in conn.records:
                 with self._callback_fn_list_lock:
-                    for callback_with_cursor in self._callback_fn_list:
-                        if (
-                            callback_with_cursor.cursor is None
-                            or EventLogCursor.parse(callback_with_cursor.cursor).storage_id()
-                            < event_record.storage_id
-                        ):
-                            callback_with_cursor.callback(
-                                event_record.event_log_entry,
-                                str(EventLogCursor.from_storage_id(event_record.storage_id)),
-                            )
+                    _call_callbacks(self._callback_fn_list, event_record)
             wait_time = INIT_POLL_PERIOD if conn.records else min(wait_time * 2, MAX_POLL_PERIOD)
+
+
+class _WatchedRun:
+    """Callbacks of a run watched by SqlPollingMultiplexedEventWatcherThread.
+
+    storage_id is the cursor of the run: the id of the last event passed to the callbacks, or
+    before the run has been polled, the earliest cursor of its callbacks. None fetches all events of
+    the run.
+    """
+
+    def __init__(self, storage_id: Optional[int]):
+        self.callbacks: List[CallbackAfterCursor] = []
+        self.storage_id = storage_id
+        self.polled = False
+
+
+def _cursor_storage_id(cursor: Optional[str]) -> Optional[int]:
+    return EventLogCursor.parse(cursor).storage_id() if cursor is not None else None
+
+
+class SqlPollingMultiplexedEventWatcherThread(threading.Thread):
+    """subclass of Thread that watches many run_ids for new Events with a single poll loop.
+
+    Every poll fetches the new events of all watched runs with a single query, handing each event
+    to the callbacks of its run. Each run keeps a cursor of its own, like the per-run threads do:
+    storage ids are handed out at insert time but concurrent runs may commit in a different order,
+    so a cursor shared by all runs could move past an event that is committed later. The number of
+    queries therefore does not grow with the number of watched runs. The poll period is reset when
+    events are passed to callbacks or a run starts being watched, and backs off up to
+    MAX_POLL_PERIOD otherwise.
+
+    LOCKING INFO:
+        INVARIANTS: _runs_lock protects _runs and the callbacks of each run
+    """
+
+    def __init__(self, event_log_storage: "SqlEventLogStorage"):
+        super(SqlPollingMultiplexedEventWatcherThread, self).__init__()
+        self._event_log_storage = check.inst_param(
+            event_log_storage, "event_log_storage", EventLogStorage
+        )
+        check.invariant(
+            not event_log_storage.is_run_sharded,
+            "Cannot watch runs of a run-sharded storage from a single thread",
+        )
+        self._runs_lock: threading.Lock = threading.Lock()
+        self._runs: Dict[str, _WatchedRun] = {}
+        self._should_thread_exit = threading.Event()
+        self._wake_event = threading.Event()
+        self.name = "sql-event-watch-multiplexed"
+
+    @property
+    def should_thread_exit(self) -> threading.Event:
+        return self._should_thread_exit
+
+    def wake(self) -> None:
+        """Poll immediately instead of waiting for the current poll period to pass."""
+        self._wake_event.set()
+
+    def has_run_id(self, run_id: str) -> bool:
+        with self._runs_lock:
+            return run_id in self._runs
+
+    def add_callback(
+        self,
+        run_id: str,
+        cursor: Optional[str],
+        callback: Callable[[EventLogEntry, str], None],
+    ) -> None:
+        """Observer has started watching a run.
+        Add a callback to execute on new EventLogEntrys of the run after the given cursor.
+        """
+        run_id = check.str_param(run_id, "run_id")
+        cursor = check.opt_str_param(cursor, "cursor")
+        callback = check.callable_param(callback, "callback")
+        storage_id = _cursor_storage_id(cursor)
+        with self._runs_lock:
+            run = self._runs.get(run_id)
+            if run is None:
+                run = self._runs[run_id] = _WatchedRun(storage_id)
+            elif not run.polled:
+                # no callback wants events before the earliest callback cursor
+                run.storage_id = (
+                    min(run.storage_id, storage_id)
+                    if run.storage_id is not None and storage_id is not None
+                    else None
+                )
+            run.callbacks.append(CallbackAfterCursor(cursor, callback))
+        self.wake()
+
+    def remove_callback(self, run_id: str, callback: Callable[[EventLogEntry, str], None]) -> None:
+        """Observer has stopped watching a run.
+        Stop polling for the run if no callbacks remain.
+        """
+        callback = check.callable_param(callback, "callback")
+        with self._runs_lock:
+            if run_id not in self._runs:
+                return
+            run = self._runs[run_id]
+            run.callbacks = [
+                callback_with_cursor
+                for callback_with_cursor in run.callbacks
+                if callback_with_cursor.callback != callback
+            ]
+            if not run.callbacks:
+                del self._runs[run_id]
+
+    def _dispatch(self, run_id: str, event_records: Sequence[EventLogRecord]) -> bool:
+        """Pass events of a run to its callbacks, skipping those already passed. Returns whether
+        any event was passed.
+        """
+        dispatched = False
+        with self._runs_lock:
+            run = self._runs.get(run_id)
+            if run is None:
+                return False
+            for event_record in event_records:
+                if run.storage_id is not None and event_record.storage_id <= run.storage_id:
+                    continue
+                _call_callbacks(run.callbacks, event_record)
+                run.storage_id = event_record.storage_id
+                dispatched = True
+        return dispatched
+
+    def _poll(self, chunk_limit: int) -> bool:
+        """Pass new events of all watched runs to their callbacks. Returns whether any event was
+        passed.
+        """
+        dispatched = False
+        while True:
+            with self._runs_lock:
+                cursors_by_run_id = {}
+                for run_id, run in self._runs.items():
+                    run.polled = True
+                    cursors_by_run_id[run_id] = (
+                        EventLogCursor.from_storage_id(run.storage_id).to_string()
+                        if run.storage_id is not None
+                        else None
+                    )
+            if not cursors_by_run_id:
+                return dispatched
+
+            conn = self._event_log_storage.get_records_for_runs(
+                cursors_by_run_id, limit=chunk_limit
+            )
+            records_by_run_id = defaultdict(list)
+            for event_record in conn.records:
+                records_by_run_id[event_record.run_id].append(event_record)
+            for run_id, event_records in records_by_run_id.items():
+                dispatched = self._dispatch(run_id, event_records) or dispatched
+            if not conn.has_more:
+                return dispatched
+
+    def run(self) -> None:
+        """Polling function to update Observers with EventLogEntrys from Event Log DB.
+        Wakes every poll period, or when a run starts being watched, and passes new events of the
+        watched runs to their callbacks. Sleeps until woken while no run is watched.
+        """
+        wait_time = INIT_POLL_PERIOD
+
+        chunk_limit = int(os.getenv("DAGSTER_POLLING_EVENT_WATCHER_BATCH_SIZE", "1000"))
+
+        while True:
+            with self._runs_lock:
+                timeout = wait_time if self._runs else None
+            woken = self._wake_event.wait(timeout)
+            self._wake_event.clear()
+            if self._should_thread_exit.is_set():
+                break
+
+            try:
+                dispatched = self._poll(chunk_limit)
+            except Exception:
+                logging.exception("Error polling the event log for watched runs")
+                dispatched = False
+
+            wait_time = (
+                INIT_POLL_PERIOD if dispatched or woken else min(wait_time * 2, MAX_POLL_PERIOD)
+            )
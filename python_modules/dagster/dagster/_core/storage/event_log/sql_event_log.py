@@ -8,6 +8,7 @@
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
     ContextManager,
     Dict,
     Iterable,
@@ -64,6 +65,7 @@
 from dagster._core.storage.sqlalchemy_compat import (
     db_case,
     db_fetch_mappings,
+    db_scalar_subquery,
     db_select,
     db_subquery,
 )
@@ -456,10 +458,183 @@ def store_event(self, event: EventLogEntry) -> None:
                 )
 
             self.store_asset_event_tags([event], [event_id])
+            self._update_asset_cached_status_for_events([(event, event_id)])
 
         if event.is_dagster_event and event.dagster_event_type in ASSET_CHECK_EVENTS:
             self.store_asset_check_event(event, event_id)
 
+    def store_event_batch(self, events: Sequence[EventLogEntry]) -> None:
+        """Store a batch of events, possibly spanning multiple runs.
+
+        Events for each run are written over a single connection, with consecutive events that do
+        not need a storage id collapsed into multi-row INSERTs. The asset index and asset event tag
+        rows for the whole batch are written afterwards in bulk. Events are inserted in the order
+        they are given, so readers observe the same ordering as with repeated `store_event` calls.
+
+        Args:
+            events (Sequence[EventLogEntry]): The events to store.
+        """
+        check.sequence_param(events, "events", of_type=EventLogEntry)
+
+        stored: List[Tuple[EventLogEntry, Optional[int]]] = []
+        for run_id, run_events in _group_events_by_run(events):
+            with self.run_connection(run_id) as conn:
+                stored.extend(
+                    self._insert_event_rows(
+                        conn,
+                        run_events,
+                        needs_event_id=lambda event: _is_asset_event(event)
+                        or _is_asset_check_event(event),
+                    )
+                )
+
+        self._store_asset_index_batch(stored)
+        for event, event_id in stored:
+            if _is_asset_check_event(event):
+                self.store_asset_check_event(event, event_id)
+
+    def _insert_event_rows(
+        self,
+        conn: Connection,
+        events: Sequence[EventLogEntry],
+        needs_event_id: Callable[[EventLogEntry], bool],
+    ) -> Sequence[Tuple[EventLogEntry, Optional[int]]]:
+        """Inserts the given events in order over a single connection, returning each event paired
+        with its storage id. Storage ids are only fetched for events matching `needs_event_id`; the
+        remaining events are written with multi-row INSERTs.
+        """
+        stored: List[Tuple[EventLogEntry, Optional[int]]] = []
+        pending: List[EventLogEntry] = []
+
+        def _flush_pending() -> None:
+            if pending:
+                conn.execute(self.prepare_insert_event_batch(pending))
+                stored.extend((event, None) for event in pending)
+                pending.clear()
+
+        for event in events:
+            if not needs_event_id(event):
+                pending.append(event)
+                continue
+
+            _flush_pending()
+            result = conn.execute(self.prepare_insert_event(event))
+            stored.append((event, result.inserted_primary_key[0]))
+
+        _flush_pending()
+        return stored
+
+    def _store_asset_index_batch(
+        self, stored: Sequence[Tuple[EventLogEntry, Optional[int]]]
+    ) -> None:
+        asset_events = [(event, event_id) for event, event_id in stored if _is_asset_event(event)]
+        if not asset_events:
+            return
+
+        if any(event_id is None for _, event_id in asset_events):
+            raise DagsterInvariantViolationError("Cannot store asset event tags for null event id.")
+
+        for event, event_id in _get_asset_index_writes(asset_events):
+            self.store_asset_event(event, event_id)
+
+        self.store_asset_event_tags(
+            [event for event, _ in asset_events],
+            [cast(int, event_id) for _, event_id in asset_events],
+        )
+        self._update_asset_cached_status_for_events(
+            [(event, cast(int, event_id)) for event, event_id in asset_events]
+        )
+
+    @cached_property
+    def _has_asset_status_cache_column(self) -> bool:
+        # checked once per storage, so that writes don't inspect the schema for every event
+        return self.can_write_asset_status_cache()
+
+    def _update_asset_cached_status_for_events(
+        self, asset_events: Sequence[Tuple[EventLogEntry, int]]
+    ) -> None:
+        """Applies newly stored asset events to the cached status of their assets when
+        DAGSTER_ASSET_STATUS_CACHE_ON_WRITE is set, so that reads can serve the cached status
+        without scanning the event log.
+
+        For each asset, a single query reads the cached value under its row lock, together with the
+        latest materialization or planned event stored before the given ones and the number of such
+        events stored among them. A cached value is left untouched, to be rebuilt on the next read,
+        if the asset has other such events after its `latest_storage_id` than the given ones, e.g.
+        because they were written while the setting was off. The value is only written back if it
+        changed.
+        """
+        from dagster._core.storage.partition_status_cache import (
+            AssetStatusCacheValue,
+            maintain_asset_status_cache_on_write,
+        )
+
+        if not maintain_asset_status_cache_on_write():
+            return
+
+        events_by_asset_key: Dict[AssetKey, List[Tuple[EventLogEntry, int]]] = defaultdict(list)
+        for event, event_id in asset_events:
+            if event.dagster_event_type in _ASSET_STATUS_CACHE_EVENTS:
+                asset_key = check.not_none(event.get_dagster_event().asset_key)
+                events_by_asset_key[asset_key].append((event, event_id))
+
+        if not events_by_asset_key or not self._has_asset_status_cache_column:
+            return
+
+        for asset_key, unsorted_events in events_by_asset_key.items():
+            events = sorted(unsorted_events, key=lambda event_and_id: event_and_id[1])
+            first_event_id, last_event_id = events[0][1], events[-1][1]
+            asset_status_events = db.and_(
+                SqlEventLogStorageTable.c.asset_key == asset_key.to_string(),
+                SqlEventLogStorageTable.c.dagster_event_type.in_(
+                    [event_type.value for event_type in _ASSET_STATUS_CACHE_EVENTS]
+                ),
+            )
+            previous_event_id = db_scalar_subquery(
+                db_select([db.func.max(SqlEventLogStorageTable.c.id)]).where(
+                    db.and_(asset_status_events, SqlEventLogStorageTable.c.id < first_event_id)
+                )
+            )
+            num_stored_events = db_scalar_subquery(
+                db_select([db.func.count()])
+                .select_from(SqlEventLogStorageTable)
+                .where(
+                    db.and_(
+                        asset_status_events,
+                        SqlEventLogStorageTable.c.id >= first_event_id,
+                        SqlEventLogStorageTable.c.id <= last_event_id,
+                    )
+                )
+            )
+            with self.index_transaction() as conn:
+                row = conn.execute(
+                    db_select(
+                        [
+                            AssetKeyTable.c.cached_status_data,
+                            previous_event_id.label("previous_event_id"),
+                            num_stored_events.label("num_stored_events"),
+                        ]
+                    )
+                    .where(AssetKeyTable.c.asset_key == asset_key.to_string())
+                    .with_for_update()
+                ).fetchone()
+                cached_status = AssetStatusCacheValue.from_db_string(row[0]) if row else None
+                if (
+                    cached_status is None
+                    or first_event_id <= cached_status.latest_storage_id
+                    or (row[1] or 0) > cached_status.latest_storage_id
+                    or row[2] != len(events)
+                ):
+                    continue
+
+                updated_status = cached_status.with_asset_events(events, self)
+                if updated_status is not None and updated_status != cached_status:
+                    conn.execute(
+                        AssetKeyTable.update()
+                        .where(AssetKeyTable.c.asset_key == asset_key.to_string())
+                        .values(cached_status_data=serialize_value(updated_status))
+                    )
+
     def get_records_for_run(
         self,
         run_id,
@@ -553,6 +728,73 @@ def get_records_for_run(
             has_more=bool(limit and len(results) == limit),
         )
 
+    def get_records_for_runs(
+        self,
+        cursors_by_run_id: Mapping[str, Optional[str]],
+        limit: Optional[int] = None,
+    ) -> EventLogConnection:
+        """Get the logs of many runs with a single query, in storage id order.
+
+        Each run has a cursor of its own, so that events committed out of storage id order are
+        not skipped for one run because a later event of another run was already returned. Only
+        supported by storages that are not run-sharded, since storage ids are compared across runs.
+
+        Args:
+            cursors_by_run_id (Mapping[str, Optional[str]]): The ids of the runs for which to fetch
+                logs, with the storage id cursor of each run, logs after which are returned.
+            limit (Optional[int]): the maximum number of events to fetch
+        """
+        check.mapping_param(cursors_by_run_id, "cursors_by_run_id", key_type=str)
+        check.invariant(
+            not self.is_run_sharded, "Cannot fetch the logs of many runs from a run-sharded storage"
+        )
+
+        run_ids_without_cursor = []
+        conditions = []
+        for run_id, cursor in cursors_by_run_id.items():
+            if cursor is None:
+                run_ids_without_cursor.append(run_id)
+                continue
+            cursor_obj = EventLogCursor.parse(cursor)
+            check.invariant(cursor_obj.is_id_cursor(), "Expected a storage id cursor")
+            conditions.append(
+                db.and_(
+                    SqlEventLogStorageTable.c.run_id == run_id,
+                    SqlEventLogStorageTable.c.id > cursor_obj.storage_id(),
+                )
+            )
+        if run_ids_without_cursor:
+            conditions.append(SqlEventLogStorageTable.c.run_id.in_(run_ids_without_cursor))
+
+        query = (
+            db_select([SqlEventLogStorageTable.c.id, SqlEventLogStorageTable.c.event])
+            .where(db.or_(*conditions) if conditions else db.false())
+            .order_by(SqlEventLogStorageTable.c.id.asc())
+        )
+        if limit:
+            query = query.limit(limit)
+
+        with self.index_connection() as conn:
+            results = conn.execute(query).fetchall()
+
+        records = []
+        for record_id, json_str in results:
+            try:
+                event_log_entry = deserialize_value(json_str, EventLogEntry)
+            except (seven.JSONDecodeError, DeserializationError):
+                logging.warning(
+                    "Could not resolve event record as EventLogEntry for id `%s`.", record_id
+                )
+                continue
+            records.append(EventLogRecord(storage_id=record_id, event_log_entry=event_log_entry))
+
+        # the cursor of each run moves separately, so the connection cursor is only the last id
+        return EventLogConnection(
+            records=records,
+            cursor=EventLogCursor.from_storage_id(results[-1][0] if results else -1).to_string(),
+            has_more=bool(limit and len(results) == limit),
+        )
+
     def get_stats_for_run(self, run_id: str) -> DagsterRunStatsSnapshot:
         check.str_param(run_id, "run_id")
 
@@ -2996,3 +3238,62 @@ def _get_from_row(row: SqlAlchemyRow, column: str) -> object:
     if column not in row.keys():
         return None
     return row[column]
+
+
+def _is_asset_event(event: EventLogEntry) -> bool:
+    return bool(
+        event.is_dagster_event
+        and event.dagster_event_type in ASSET_EVENTS
+        and event.get_dagster_event().asset_key
+    )
+
+
+def _is_asset_check_event(event: EventLogEntry) -> bool:
+    return event.is_dagster_event and event.dagster_event_type in ASSET_CHECK_EVENTS
+
+
+def _group_events_by_run(
+    events: Sequence[EventLogEntry],
+) -> Sequence[Tuple[str, Sequence[EventLogEntry]]]:
+    """Splits a batch of events into consecutive groups sharing a run id, preserving order."""
+    groups: List[Tuple[str, List[EventLogEntry]]] = []
+    for event in events:
+        if groups and groups[-1][0] == event.run_id:
+            groups[-1][1].append(event)
+        else:
+            groups.append((event.run_id, [event]))
+    return groups
+
+
+# Asset event types that change the cached partition status of an asset.
+_ASSET_STATUS_CACHE_EVENTS = {
+    DagsterEventType.ASSET_MATERIALIZATION,
+    DagsterEventType.ASSET_MATERIALIZATION_PLANNED,
+}
+
+# Each asset event type writes a superset of the asset index columns written by the types ranked
+# below it: observations only bump the timestamp, planned materializations also set the last run id,
+# and materializations additionally store the full materialization record.
+_ASSET_INDEX_WRITE_RANK = {
+    DagsterEventType.ASSET_OBSERVATION: 0,
+    DagsterEventType.ASSET_MATERIALIZATION_PLANNED: 1,
+    DagsterEventType.ASSET_MATERIALIZATION: 2,
+}
+
+
+def _get_asset_index_writes(
+    asset_events: Sequence[Tuple[EventLogEntry, Optional[int]]],
+) -> Sequence[Tuple[EventLogEntry, int]]:
+    """Returns the minimal subset of asset events that must be written to the asset index to end up
+    in the same state as writing every event in order. An event can be skipped whenever a later
+    event for the same asset key overwrites all of the columns it would write.
+    """
+    max_later_rank: Dict[str, int] = {}
+    writes: List[Tuple[EventLogEntry, int]] = []
+    for event, event_id in reversed(asset_events):
+        asset_key_str = check.not_none(event.get_dagster_event().asset_key).to_string()
+        rank = _ASSET_INDEX_WRITE_RANK.get(event.get_dagster_event().event_type, 0)
+        if rank > max_later_rank.get(asset_key_str, -1):
+            writes.append((event, check.not_none(event_id)))
+            max_later_rank[asset_key_str] = rank
+    return list(reversed(writes))
@@ -50,7 +50,13 @@
 from dagster._utils import mkdir_p
 
 from ..schema import SqlEventLogStorageMetadata, SqlEventLogStorageTable
-from ..sql_event_log import RunShardedEventsCursor, SqlEventLogStorage
+from ..sql_event_log import (
+    RunShardedEventsCursor,
+    SqlEventLogStorage,
+    _group_events_by_run,
+    _is_asset_check_event,
+    _is_asset_event,
+)
 
 if TYPE_CHECKING:
     from dagster._core.storage.sqlite_storage import SqliteStorageConfig
@@ -261,6 +267,7 @@ def store_event(self, event: EventLogEntry) -> None:
                 )
 
             self.store_asset_event_tags([event], [event_id])
+            self._update_asset_cached_status_for_events([(event, event_id)])
 
         if event.is_dagster_event and event.dagster_event_type in ASSET_CHECK_EVENTS:
             self.store_asset_check_event(event, None)
@@ -270,6 +277,38 @@ def store_event(self, event: EventLogEntry) -> None:
             with self.index_connection() as conn:
                 conn.execute(insert_event_statement)
 
+    def store_event_batch(self, events: Sequence[EventLogEntry]) -> None:
+        """Overridden method to write each run shard and the mirrored index shard rows for a batch
+        of events in a single transaction per shard.
+
+        Args:
+            events (Sequence[EventLogEntry]): The events to store.
+        """
+        check.sequence_param(events, "events", of_type=EventLogEntry)
+
+        for run_id, run_events in _group_events_by_run(events):
+            with self.run_connection(run_id) as conn:
+                self._insert_event_rows(conn, run_events, needs_event_id=lambda _: False)
+
+        # mirror asset events and run status change events in the cross-run index database
+        index_events = [
+            event
+            for event in events
+            if _is_asset_event(event)
+            or (
+                event.is_dagster_event
+                and event.dagster_event_type in EVENT_TYPE_TO_PIPELINE_RUN_STATUS
+            )
+        ]
+        if index_events:
+            with self.index_connection() as conn:
+                stored = self._insert_event_rows(conn, index_events, needs_event_id=_is_asset_event)
+            self._store_asset_index_batch(stored)
+
+        for event in events:
+            if _is_asset_check_event(event):
+                self.store_asset_check_event(event, None)
+
     def get_event_records(
         self,
         event_records_filter: EventRecordsFilter,
@@ -1,6 +1,8 @@
+import mmap
 import os
 import pickle
-from typing import TYPE_CHECKING, Any, Optional
+import uuid
+from typing import TYPE_CHECKING, Any, List, NamedTuple, Optional, Tuple
 
 from pydantic import Field
 
@@ -122,6 +124,13 @@ def job():
     """
 
     base_dir: Optional[str] = Field(default=None, description="Base directory for storing files.")
+    memory_map_buffers: bool = Field(
+        default=False,
+        description=(
+            "Write large buffers, such as the data of NumPy arrays, out of band after the pickle and"
+            " memory-map them on load instead of copying them."
+        ),
+    )
 
     @classmethod
     def _is_dagster_maintained(cls) -> bool:
@@ -129,7 +138,9 @@ def _is_dagster_maintained(cls) -> bool:
 
     def create_io_manager(self, context: InitResourceContext) -> "PickledObjectFilesystemIOManager":
         base_dir = self.base_dir or check.not_none(context.instance).storage_directory()
-        return PickledObjectFilesystemIOManager(base_dir=base_dir)
+        return PickledObjectFilesystemIOManager(
+            base_dir=base_dir, memory_map_buffers=self.memory_map_buffers
+        )
 
 
 @dagster_maintained_io_manager
@@ -234,6 +245,76 @@ def job():
     return FilesystemIOManager.from_resource_context(init_context)
 
 
+# Buffers smaller than this are kept in the pickle, since mapping them costs more than copying.
+MIN_OUT_OF_BAND_BUFFER_SIZE = 64 * 1024
+# Out-of-band buffers start at multiples of this many bytes, so that arrays mapped from them are
+# aligned for vectorized operations.
+OUT_OF_BAND_BUFFER_ALIGNMENT = 64
+
+
+class _OutOfBandBuffersHeader(NamedTuple):
+    """Pickled at the start of files written with out-of-band buffers. The pickle of the value
+    follows, then each buffer at the next aligned offset.
+    """
+
+    pickle_size: int
+    buffer_sizes: Tuple[int, ...]
+
+
+def _is_local_path(path: "UPath") -> bool:
+    # paths with a protocol, including file://, can't be passed to os functions
+    return not getattr(path, "protocol", "")
+
+
+def _aligned(offset: int) -> int:
+    return -(-offset // OUT_OF_BAND_BUFFER_ALIGNMENT) * OUT_OF_BAND_BUFFER_ALIGNMENT
+
+
+def _dump_with_out_of_band_buffers(obj: Any, file) -> None:
+    buffers: List[memoryview] = []
+
+    def buffer_callback(buffer: pickle.PickleBuffer) -> bool:
+        raw = buffer.raw()
+        if raw.nbytes < MIN_OUT_OF_BAND_BUFFER_SIZE:
+            return True
+        buffers.append(raw)
+        return False
+
+    # large buffers are written from the memory of the value, without copying them into the pickle
+    data = pickle.dumps(obj, protocol=5, buffer_callback=buffer_callback)
+    pickle.dump(
+        _OutOfBandBuffersHeader(len(data), tuple(buffer.nbytes for buffer in buffers)),
+        file,
+        PICKLE_PROTOCOL,
+    )
+    file.write(data)
+    offset = file.tell()
+    for buffer in buffers:
+        file.write(b"\0" * (_aligned(offset) - offset))
+        file.write(buffer)
+        offset = _aligned(offset) + buffer.nbytes
+
+
+def _load_out_of_band_buffers(header: _OutOfBandBuffersHeader, file, fileno: Optional[int]) -> Any:
+    data = file.read(header.pickle_size)
+    offset = file.tell()
+    buffers = []
+    if fileno is not None and header.buffer_sizes:
+        # Copy-on-write mapping: the pages are shared with the page cache until the loaded value is
+        # modified in place, which then only changes this process's copy.
+        mapped = memoryview(mmap.mmap(fileno, 0, access=mmap.ACCESS_COPY))
+        for size in header.buffer_sizes:
+            offset = _aligned(offset)
+            buffers.append(mapped[offset : offset + size])
+            offset += size
+    else:
+        for size in header.buffer_sizes:
+            file.read(_aligned(offset) - offset)
+            buffers.append(bytearray(file.read(size)))
+            offset = _aligned(offset) + size
+    return pickle.loads(data, buffers=buffers)
+
+
 class PickledObjectFilesystemIOManager(UPathIOManager):
     """Built-in filesystem IO manager that stores and retrieves values using pickling.
     Is compatible with local and remote filesystems via `universal-pathlib` and `fsspec`.
@@ -242,22 +323,49 @@ class PickledObjectFilesystemIOManager(UPathIOManager):
     Args:
         base_dir (Optional[str]): base directory where all the step outputs which use this object
             manager will be stored in.
+        memory_map_buffers (bool): Pickle values with protocol 5 and write large out-of-band
+            buffers, such as the data of NumPy arrays and pandas DataFrames, after the pickle
+            without copying them. On load, the buffers of local files are memory-mapped, so
+            the loaded arrays share the page cache instead of being read into memory. Files
+            written either way can be loaded regardless of this setting.
         **kwargs: additional keyword arguments for `universal_pathlib.UPath`.
     """
 
     extension: str = ""  # TODO: maybe change this to .pickle? Leaving blank for compatibility.
 
-    def __init__(self, base_dir=None, **kwargs):
+    def __init__(self, base_dir=None, memory_map_buffers: bool = False, **kwargs):
         from upath import UPath
 
         self.base_dir = check.opt_str_param(base_dir, "base_dir")
+        self.memory_map_buffers = check.bool_param(memory_map_buffers, "memory_map_buffers")
 
         super().__init__(base_path=UPath(base_dir, **kwargs))
 
+    def _dump_memory_mapped(self, obj: Any, path: "UPath") -> None:
+        if not _is_local_path(path):
+            with path.open("wb") as file:
+                _dump_with_out_of_band_buffers(obj, file)
+            return
+
+        # Other processes may have mapped the previous file, so replace it rather than truncating
+        # it under them.
+        tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}")
+        try:
+            with open(tmp_path, "xb") as file:
+                _dump_with_out_of_band_buffers(obj, file)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if tmp_path.exists():
+                tmp_path.unlink()
+            raise
+
     def dump_to_path(self, context: OutputContext, obj: Any, path: "UPath"):
         try:
-            with path.open("wb") as file:
-                pickle.dump(obj, file, PICKLE_PROTOCOL)
+            if self.memory_map_buffers:
+                self._dump_memory_mapped(obj, path)
+            else:
+                with path.open("wb") as file:
+                    pickle.dump(obj, file, PICKLE_PROTOCOL)
         except (AttributeError, RecursionError, ImportError, pickle.PicklingError) as e:
             executor = context.step_context.job_def.executor_def
 
@@ -281,7 +389,11 @@ def dump_to_path(self, context: OutputContext, obj: Any, path: "UPath"):
 
     def load_from_path(self, context: InputContext, path: "UPath") -> Any:
         with path.open("rb") as file:
-            return pickle.load(file)
+            obj = pickle.load(file)
+            if isinstance(obj, _OutOfBandBuffersHeader):
+                fileno = file.fileno() if _is_local_path(path) else None
+                return _load_out_of_band_buffers(obj, file, fileno)
+            return obj
 
 
 class CustomPathPickledObjectFilesystemIOManager(IOManager):
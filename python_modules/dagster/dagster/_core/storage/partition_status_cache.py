@@ -1,3 +1,4 @@
+import os
 from enum import Enum
 from typing import TYPE_CHECKING, List, NamedTuple, Optional, Sequence, Set, Tuple
 
@@ -20,6 +21,7 @@
     StaticPartitionsDefinition,
 )
 from dagster._core.definitions.time_window_partitions import TimeWindowPartitionsDefinition
+from dagster._core.events import DagsterEventType
 from dagster._core.instance import DynamicPartitionsStore
 from dagster._core.storage.dagster_run import FINISHED_STATUSES, RunsFilter
 from dagster._core.storage.tags import (
@@ -31,6 +33,8 @@
 from dagster._serdes.serdes import deserialize_value
 
 if TYPE_CHECKING:
+    from dagster._core.events.log import EventLogEntry
+    from dagster._core.remote_representation.external_data import ExternalPartitionsDefinitionData
     from dagster._core.storage.batch_asset_record_loader import BatchAssetRecordLoader
     from dagster._core.storage.event_log.base import AssetRecord
 
@@ -44,6 +48,13 @@
 RUN_FETCH_BATCH_SIZE = 100
 
 
+def maintain_asset_status_cache_on_write() -> bool:
+    """Whether event log storages should update the asset status cache as asset events are
+    written, instead of leaving it to be rebuilt on the next read.
+    """
+    return os.getenv("DAGSTER_ASSET_STATUS_CACHE_ON_WRITE", "").lower() in ("1", "true")
+
+
 class AssetPartitionStatus(Enum):
     """The status of asset partition."""
 
@@ -68,7 +79,10 @@ def is_cacheable_partition_type(partitions_def: PartitionsDefinition) -> bool:
     )
 
 
-@whitelist_for_serdes
+# partitions_def_data is left out of the stored value unless set, so that values written with
+# DAGSTER_ASSET_STATUS_CACHE_ON_WRITE off are identical to those written by versions without the
+# field. Those versions ignore the field when reading values written with the setting on.
+@whitelist_for_serdes(skip_when_empty_fields={"partitions_def_data"})
 class AssetStatusCacheValue(
     NamedTuple(
         "_AssetPartitionsStatusCacheValue",
@@ -79,6 +93,7 @@ class AssetStatusCacheValue(
             ("serialized_failed_partition_subset", Optional[str]),
             ("serialized_in_progress_partition_subset", Optional[str]),
             ("earliest_in_progress_materialization_event_id", Optional[int]),
+            ("partitions_def_data", Optional["ExternalPartitionsDefinitionData"]),
         ],
     )
 ):
@@ -100,6 +115,10 @@ class AssetStatusCacheValue(
         earliest_in_progress_materialization_event_id (Optional(int)): The event id of the earliest
             materialization planned event for a run that is still in progress. This is used to check
             on the status of runs that are still in progress.
+        partitions_def_data (Optional(ExternalPartitionsDefinitionData)): A snapshot of the
+            partitions definition the subsets were computed with. Only stored when the cache is
+            maintained on write (see DAGSTER_ASSET_STATUS_CACHE_ON_WRITE), so that the event log
+            storage can update the subsets without access to the asset definition.
     """
 
     def __new__(
@@ -110,7 +129,12 @@ def __new__(
         serialized_failed_partition_subset: Optional[str] = None,
         serialized_in_progress_partition_subset: Optional[str] = None,
         earliest_in_progress_materialization_event_id: Optional[int] = None,
+        partitions_def_data: Optional["ExternalPartitionsDefinitionData"] = None,
     ):
+        from dagster._core.remote_representation.external_data import (
+            ExternalPartitionsDefinitionData,
+        )
+
         check.int_param(latest_storage_id, "latest_storage_id")
         check.opt_str_param(partitions_def_id, "partitions_def_id")
         check.opt_str_param(
@@ -122,6 +146,9 @@ def __new__(
         check.opt_str_param(
             serialized_in_progress_partition_subset, "serialized_in_progress_partition_subset"
         )
+        check.opt_inst_param(
+            partitions_def_data, "partitions_def_data", ExternalPartitionsDefinitionData
+        )
         return super(AssetStatusCacheValue, cls).__new__(
             cls,
             latest_storage_id,
@@ -130,6 +157,7 @@ def __new__(
             serialized_failed_partition_subset,
             serialized_in_progress_partition_subset,
             earliest_in_progress_materialization_event_id,
+            partitions_def_data,
         )
 
     @staticmethod
@@ -168,6 +196,75 @@ def deserialize_in_progress_partition_subsets(
 
         return partitions_def.deserialize_subset(self.serialized_in_progress_partition_subset)
 
+    def with_asset_events(
+        self,
+        events: Sequence[Tuple["EventLogEntry", int]],
+        dynamic_partitions_store: DynamicPartitionsStore,
+    ) -> Optional["AssetStatusCacheValue"]:
+        """Returns the cache value updated with newly stored materialization and materialization
+        planned events for the asset, given with their storage ids in ascending order.
+
+        The caller must ensure that the events are all the such events stored for the asset after
+        `latest_storage_id`. Returns None if the cache value cannot be updated without access to the
+        asset's partitions definition, in which case it will be rebuilt on the next read.
+
+        Run failures are not asset events, so partitions planned by runs that later fail stay in
+        progress here until the next read checks on the runs after
+        `earliest_in_progress_materialization_event_id`.
+        """
+        if not events:
+            return self
+
+        latest_storage_id = events[-1][1]
+        if self.partitions_def_id is None:
+            return self._replace(latest_storage_id=latest_storage_id)
+
+        if self.partitions_def_data is None:
+            return None
+
+        partitions_def = self.partitions_def_data.get_partitions_definition()
+        materialized_subset = self.deserialize_materialized_partition_subsets(partitions_def)
+        failed_subset = self.deserialize_failed_partition_subsets(partitions_def)
+        in_progress_subset = self.deserialize_in_progress_partition_subsets(partitions_def)
+        earliest_in_progress_materialization_event_id = (
+            self.earliest_in_progress_materialization_event_id
+        )
+
+        valid_partitions = get_validated_partition_keys(
+            dynamic_partitions_store,
+            partitions_def,
+            {
+                check.not_none(event.get_dagster_event().partition)
+                for event, _ in events
+                if event.get_dagster_event().partition is not None
+            },
+        )
+        for event, storage_id in events:
+            dagster_event = event.get_dagster_event()
+            partition = dagster_event.partition
+            if partition not in valid_partitions:
+                continue
+
+            if dagster_event.event_type == DagsterEventType.ASSET_MATERIALIZATION:
+                materialized_subset = materialized_subset.with_partition_keys([partition])
+                partition_subset = partitions_def.empty_subset().with_partition_keys([partition])
+                failed_subset = failed_subset - partition_subset
+                in_progress_subset = in_progress_subset - partition_subset
+            else:
+                in_progress_subset = in_progress_subset.with_partition_keys([partition])
+                if earliest_in_progress_materialization_event_id is None:
+                    earliest_in_progress_materialization_event_id = storage_id
+
+        return self._replace(
+            latest_storage_id=latest_storage_id,
+            serialized_materialized_partition_subset=materialized_subset.serialize(),
+            serialized_failed_partition_subset=failed_subset.serialize(),
+            serialized_in_progress_partition_subset=in_progress_subset.serialize(),
+            earliest_in_progress_materialization_event_id=(
+                earliest_in_progress_materialization_event_id if len(in_progress_subset) else None
+            ),
+        )
+
 
 def get_materialized_multipartitions(
     instance: DagsterInstance, asset_key: AssetKey, partitions_def: MultiPartitionsDefinition
@@ -252,6 +349,10 @@ def _build_status_cache(
     """This method refreshes the asset status cache for a given asset key. It recalculates
     the materialized partition subset for the asset key and updates the cache value.
     """
+    from dagster._core.remote_representation.external_data import (
+        external_partitions_definition_from_def,
+    )
+
     last_materialization_storage_id = (
         asset_record.asset_entry.last_materialization_storage_id if asset_record else None
     )
@@ -350,6 +451,11 @@ def _build_status_cache(
         serialized_failed_partition_subset=failed_subset.serialize(),
         serialized_in_progress_partition_subset=in_progress_subset.serialize(),
         earliest_in_progress_materialization_event_id=earliest_in_progress_materialization_event_id,
+        partitions_def_data=(
+            external_partitions_definition_from_def(partitions_def)
+            if maintain_asset_status_cache_on_write()
+            else None
+        ),
     )
 
 
@@ -429,6 +535,32 @@ def build_failed_and_in_progress_partition_subset(
     )
 
 
+def _is_cached_value_current(
+    instance: DagsterInstance,
+    asset_key: AssetKey,
+    stored_cache_value: AssetStatusCacheValue,
+    asset_record: Optional["AssetRecord"],
+) -> bool:
+    """Whether the stored cache value already reflects all materialization and planned events of the
+    asset, e.g. because it was maintained on write, so that rebuilding it would not change it.
+    Values with partitions in progress are rebuilt, to check on the status of their runs.
+    """
+    if stored_cache_value.earliest_in_progress_materialization_event_id is not None:
+        return False
+
+    if maintain_asset_status_cache_on_write() and stored_cache_value.partitions_def_data is None:
+        # rebuild to store the partitions definition snapshot that writers need
+        return False
+
+    last_materialization_storage_id = (
+        asset_record.asset_entry.last_materialization_storage_id if asset_record else None
+    )
+    return stored_cache_value.latest_storage_id >= max(
+        last_materialization_storage_id or 0,
+        get_last_planned_storage_id(instance, asset_key, asset_record),
+    )
+
+
 def get_and_update_asset_status_cache_value(
     instance: DagsterInstance,
     asset_key: AssetKey,
@@ -455,6 +587,11 @@ def get_and_update_asset_status_cache_value(
             dynamic_partitions_store=dynamic_partitions_store
         )
     )
+    if use_cached_value and _is_cached_value_current(
+        instance, asset_key, check.not_none(stored_cache_value), asset_record
+    ):
+        return stored_cache_value
+
     updated_cache_value = _build_status_cache(
         instance=instance,
         asset_key=asset_key,
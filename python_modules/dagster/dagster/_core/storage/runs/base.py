@@ -398,11 +398,11 @@ def replace_job_origin(self, run: "DagsterRun", job_origin: "RemoteJobOrigin") -
 
     @abstractmethod
     def add_definition(self, name: str, version: int, definition: str) -> None:
-        """Add new definition to flow_definitions"""
+        """Add new definition to flow_definitions."""
 
     @abstractmethod
     def get_definition(self, name: str, version: int = 0) -> Optional[Dict[str, str]]:
-        """Get definition from flow_definitions by name
+        """Get definition from flow_definitions by name.
 
         Args:
             name: definition name
@@ -412,7 +412,7 @@ def get_definition(self, name: str, version: int = 0) -> Optional[Dict[str, str]
 
     @abstractmethod
     def all_definitions(self, version: int = 0) -> List[Dict[str, str]]:
-        """All definition from flow_definitions by version
+        """All definition from flow_definitions by version.
 
         Args:
             version: definition version, None means all
@@ -421,7 +421,7 @@ def all_definitions(self, version: int = 0) -> List[Dict[str, str]]:
 
     @abstractmethod
     def drop_definition(self, name: str, version: int = 0) -> None:
-        """Drop definition from flow_definitions by name & version
+        """Drop definition from flow_definitions by name & version.
 
         Args:
             name: definition name
@@ -447,6 +447,27 @@ def save_repo_definition(
     ) -> None:
         pass
 
+    @abstractmethod
+    def upsert_repo_definitions(self, rows: Sequence[Mapping[str, str]]) -> None:
+        """Insert or update many repo definitions in one transaction.
+
+        Args:
+            rows: the repo definitions, each with the columns of ``save_repo_definition``
+
+        """
+
+    @abstractmethod
+    def save_repo_definitions(self, flow_name: str, rows: Sequence[Mapping[str, str]]) -> None:
+        """Replace all repo definitions of a flow in one transaction. Only rows whose content
+        changed are written, and rows that are no longer present are deleted.
+
+        Args:
+            flow_name: flow name
+            rows: the repo definitions of the flow, each with the columns of ``save_repo_definition``
+                except ``flow_name``
+
+        """
+
     @abstractmethod
     def get_repo_definition(self, name) -> List[Dict[str, str]]:
         pass
@@ -459,6 +480,48 @@ def save_code_pointer(
     ) -> None:
         pass
 
+    @abstractmethod
+    def save_code_pointers(self, code_pointers: Mapping[str, str]) -> None:
+        """Insert or update many code pointers in one transaction.
+
+        Args:
+            code_pointers: serialized code pointer by repository name
+
+        """
+
     @abstractmethod
     def get_code_pointers(self) -> Dict[str, ModuleCodePointer]:
         pass
+
+    @abstractmethod
+    def get_compiled_flow(self, cache_key: str) -> Optional[Dict[str, str]]:
+        """Get the generated code of a flow from the compile cache.
+
+        Args:
+            cache_key: hash of the flow definition and namespace, see
+                ``dagster._canvas.compute_cache_key``
+
+        """
+
+    @abstractmethod
+    def save_compiled_flow(
+        self,
+        cache_key: str,
+        flow_name: str,
+        code: str,
+        dependencies: str,
+    ) -> None:
+        """Save the generated code of a flow to the compile cache, replacing the entries of
+        earlier versions of the flow.
+
+        Args:
+            cache_key: hash of the flow definition and namespace
+            flow_name: flow name
+            code: generated module source
+            dependencies: json encoded dependencies of the steps of the flow
+
+        """
+
+    @abstractmethod
+    def drop_compiled_flows(self, flow_name: str) -> None:
+        """Drop all compile cache entries of a flow."""
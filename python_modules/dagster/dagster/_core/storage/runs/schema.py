@@ -172,6 +172,16 @@
     db.Column("code_pointer", db.Text),
 )
 
+# generated module source of canvas flows, keyed by a hash of the flow definition and namespace
+FlowCompileCacheTable = db.Table(
+    "flow_compile_cache",
+    RunStorageSqlMetadata,
+    db.Column("cache_key", db.String(64), primary_key=True),
+    db.Column("flow_name", db.Text),
+    db.Column("code", db.Text),
+    db.Column("dependencies", db.Text),
+)
+
 db.Index("idx_run_tags", RunTagsTable.c.key, RunTagsTable.c.value, mysql_length=64)
 db.Index("idx_run_partitions", RunsTable.c.partition_set, RunsTable.c.partition, mysql_length=64)
 db.Index(
@@ -199,3 +209,5 @@
     },
 )
 db.Index("idx_kvs_keys_unique", KeyValueStoreTable.c.key, unique=True, mysql_length=64)
+db.Index("idx_repo_definitions_flow_name", RepoDefinitionsTable.c.flow_name, mysql_length=64)
+db.Index("idx_flow_compile_cache_flow_name", FlowCompileCacheTable.c.flow_name, mysql_length=64)
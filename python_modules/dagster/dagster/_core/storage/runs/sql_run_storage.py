@@ -4,6 +4,7 @@
 import zlib
 from abc import abstractmethod
 from collections import defaultdict
+from contextlib import contextmanager
 from datetime import datetime
 from enum import Enum
 from typing import (
@@ -12,6 +13,7 @@
     ContextManager,
     Dict,
     Iterable,
+    Iterator,
     Mapping,
     NamedTuple,
     Optional,
@@ -97,6 +99,7 @@
     FlowDefinitionsTable,
     RepoDefinitionsTable,
     CodePointerTable,
+    FlowCompileCacheTable,
 )
 from dagster._core.code_pointer import ModuleCodePointer
 
@@ -113,6 +116,16 @@ class SqlRunStorage(RunStorage):
     def connect(self) -> ContextManager[Connection]:
         """Context manager yielding a sqlalchemy.engine.Connection."""
 
+    @contextmanager
+    def transaction(self) -> Iterator[Connection]:
+        """Context manager yielding a connection that has begun a transaction."""
+        with self.connect() as conn:
+            if conn.in_transaction():
+                yield conn
+            else:
+                with conn.begin():
+                    yield conn
+
     @abstractmethod
     def upgrade(self) -> None:
         """This method should perform any schema or data migrations necessary to bring an
@@ -966,18 +979,38 @@ def replace_job_origin(self, run: DagsterRun, job_origin: RemoteJobOrigin) -> No
                 .values(value=new_label)
             )
 
+    def _upsert_rows(
+        self,
+        conn: Connection,
+        table: db.Table,
+        rows: Sequence[Mapping[str, Any]],
+        key_columns: Sequence[str],
+        update_columns: Sequence[str],
+    ) -> None:
+        """Insert rows, updating ``update_columns`` of the rows whose key already exists.
+
+        Dialect specific storages override this with native upserts, which are atomic and
+        written in a single statement. This fallback updates each row first and inserts it if
+        nothing was updated, so that it never relies on an IntegrityError inside a transaction.
+        """
+        for row in rows:
+            result = conn.execute(
+                table.update()
+                .where(db.and_(*(table.c[column] == row[column] for column in key_columns)))
+                .values({column: row[column] for column in update_columns})
+            )
+            if result.rowcount == 0:
+                conn.execute(table.insert().values(**row))
+
     def add_definition(self, name: str, version: int, definition: str) -> None:
-        tbl = FlowDefinitionsTable
-        col = tbl.c
-        insert = tbl.insert().values(name=name, version=version, definition=definition)
-        with self.connect() as conn:
-            try:
-                conn.execute(insert)
-            except db_exc.IntegrityError:
-                # on_conflict_do_update equivalent
-                tbl.update().where(col.name == name).values(
-                    version=version, definition=definition
-                )
+        with self.transaction() as conn:
+            self._upsert_rows(
+                conn,
+                FlowDefinitionsTable,
+                [dict(name=name, version=version, definition=definition)],
+                key_columns=['name'],
+                update_columns=['version', 'definition'],
+            )
 
     def get_definition(self, name: str, version: int = 0) -> Optional[Dict[str, str]]:
         tbl = FlowDefinitionsTable
@@ -1025,36 +1058,84 @@ def save_repo_definition(
         snap_type: str,
         definition: str,
     ) -> None:
-        tbl = RepoDefinitionsTable
-        insert = tbl.insert().values(
-            flow_name=flow_name,
-            metadata=metadata,
-            utilized_env_vars=utilized_env_vars,
-            location_name=location_name,
-            name=name,
-            snap_type=snap_type,
-            definition=definition,
-            main_key=main_key,
+        self.upsert_repo_definitions([
+            dict(
+                flow_name=flow_name,
+                metadata=metadata,
+                utilized_env_vars=utilized_env_vars,
+                location_name=location_name,
+                name=name,
+                snap_type=snap_type,
+                definition=definition,
+                main_key=main_key,
+            )
+        ])
+
+    def upsert_repo_definitions(self, rows: Sequence[Mapping[str, str]]) -> None:
+        with self.transaction() as conn:
+            self._upsert_repo_definition_rows(conn, rows)
+
+    def _upsert_repo_definition_rows(
+        self, conn: Connection, rows: Sequence[Mapping[str, str]]
+    ) -> None:
+        self._upsert_rows(
+            conn,
+            RepoDefinitionsTable,
+            rows,
+            key_columns=['location_name', 'flow_name', 'name', 'main_key', 'snap_type'],
+            update_columns=['metadata', 'utilized_env_vars', 'definition'],
         )
-        with self.connect() as conn:
-            try:
-                conn.execute(insert)
-            except db_exc.IntegrityError:
-                # on_conflict_do_update equivalent
-                tbl.update().where(
-                    db.and_(
-                        tbl.c.flow_name == flow_name,
-                        tbl.c.location_name == location_name,
-                        tbl.c.name == name,
-                        tbl.c.main_key == main_key,
-                        tbl.c.snap_type == snap_type,
+
+    def save_repo_definitions(self, flow_name: str, rows: Sequence[Mapping[str, str]]) -> None:
+        tbl = RepoDefinitionsTable
+        col = tbl.c
+
+        def _row_key(row):
+            return row['location_name'], row['name'], row['main_key'], row['snap_type']
+
+        new_rows = {_row_key(row): row for row in rows}
+        with self.transaction() as conn:
+            existing_rows = {
+                _row_key(row): row
+                for row in db_fetch_mappings(
+                    conn,
+                    db_select([
+                        col.location_name,
+                        col.name,
+                        col.main_key,
+                        col.snap_type,
+                        col.metadata,
+                        col.utilized_env_vars,
+                        col.definition,
+                    ]).where(col.flow_name == flow_name),
+                )
+            }
+
+            for location_name, name, main_key, snap_type in existing_rows.keys() - new_rows.keys():
+                conn.execute(
+                    tbl.delete().where(
+                        db.and_(
+                            col.flow_name == flow_name,
+                            col.location_name == location_name,
+                            col.name == name,
+                            col.main_key == main_key,
+                            col.snap_type == snap_type,
+                        )
                     )
-                ).values(
-                    metadata=metadata,
-                    utilized_env_vars=utilized_env_vars,
-                    definition=definition,
                 )
 
+            changed_rows = [
+                {**row, 'flow_name': flow_name}
+                for key, row in new_rows.items()
+                if (existing_row := existing_rows.get(key)) is None
+                or any(
+                    existing_row[field] != row[field]
+                    for field in ('metadata', 'utilized_env_vars', 'definition')
+                )
+            ]
+            if changed_rows:
+                self._upsert_repo_definition_rows(conn, changed_rows)
+
     def drop_repo_definition_by_flow(self, flow_name: str) -> None:
         tbl = RepoDefinitionsTable
         col = tbl.c
@@ -1084,19 +1165,22 @@ def save_code_pointer(
         repo_name: str,
         code_pointer: str
     ) -> None:
-        tbl = CodePointerTable
-        insert = tbl.insert().values(
-            repo_name=repo_name,
-            code_pointer=code_pointer
-        )
-        with self.connect() as conn:
-            try:
-                conn.execute(insert)
-            except db_exc.IntegrityError:
-                # on_conflict_do_update equivalent
-                tbl.update().where(
-                    tbl.c.repo_name == repo_name
-                ).values(code_pointer=code_pointer)
+        self.save_code_pointers({repo_name: code_pointer})
+
+    def save_code_pointers(self, code_pointers: Mapping[str, str]) -> None:
+        if not code_pointers:
+            return
+        with self.transaction() as conn:
+            self._upsert_rows(
+                conn,
+                CodePointerTable,
+                [
+                    dict(repo_name=repo_name, code_pointer=code_pointer)
+                    for repo_name, code_pointer in code_pointers.items()
+                ],
+                key_columns=['repo_name'],
+                update_columns=['code_pointer'],
+            )
 
     def get_code_pointers(self) -> Dict[str, ModuleCodePointer]:
         tbl = CodePointerTable
@@ -1107,6 +1191,55 @@ def get_code_pointers(self) -> Dict[str, ModuleCodePointer]:
             for row in rows
         }
 
+    def get_compiled_flow(self, cache_key: str) -> Optional[Dict[str, str]]:
+        tbl = FlowCompileCacheTable
+        col = tbl.c
+        query = db_select(
+            [col.flow_name, col.code, col.dependencies]
+        ).select_from(tbl).where(col.cache_key == cache_key)
+        row = self.fetchone(query)
+        if row is None:
+            return
+
+        return {
+            'flow_name': row['flow_name'],
+            'code': row['code'],
+            'dependencies': row['dependencies'],
+        }
+
+    def save_compiled_flow(
+        self,
+        cache_key: str,
+        flow_name: str,
+        code: str,
+        dependencies: str,
+    ) -> None:
+        tbl = FlowCompileCacheTable
+        col = tbl.c
+        insert = tbl.insert().values(
+            cache_key=cache_key,
+            flow_name=flow_name,
+            code=code,
+            dependencies=dependencies,
+        )
+        with self.connect() as conn:
+            # entries of earlier versions of the flow will never be hit again
+            conn.execute(
+                tbl.delete().where(db.and_(col.flow_name == flow_name, col.cache_key != cache_key))
+            )
+            try:
+                conn.execute(insert)
+            except db_exc.IntegrityError:
+                # the same definition was compiled concurrently, entries with the same key are
+                # identical
+                pass
+
+    def drop_compiled_flows(self, flow_name: str) -> None:
+        tbl = FlowCompileCacheTable
+        delete = tbl.delete().where(tbl.c.flow_name == flow_name)
+        with self.connect() as conn:
+            conn.execute(delete)
+
 
 GET_PIPELINE_SNAPSHOT_QUERY_ID = "get-pipeline-snapshot"
 
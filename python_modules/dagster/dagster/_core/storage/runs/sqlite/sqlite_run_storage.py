@@ -1,12 +1,12 @@
 import os
 from contextlib import contextmanager
-from typing import TYPE_CHECKING, Iterator, Optional
+from typing import TYPE_CHECKING, Any, Iterator, Mapping, Optional, Sequence
 from urllib.parse import urljoin, urlparse
 
 import sqlalchemy as db
+from sqlalchemy.dialects.sqlite import insert
 from sqlalchemy.engine import Connection
 from sqlalchemy.pool import NullPool
-from sqlalchemy.dialects.sqlite import insert
 from typing_extensions import Self
 
 from dagster import (
@@ -28,9 +28,12 @@
 from dagster._utils import mkdir_p
 
 from ..schema import (
+    FlowCompileCacheTable,
     InstanceInfo,
-    RunsTable, RunStorageSqlMetadata, RunTagsTable,
-    FlowDefinitionsTable
+    RepoDefinitionsTable,
+    RunsTable,
+    RunStorageSqlMetadata,
+    RunTagsTable,
 )
 from ..sql_run_storage import SqlRunStorage
 
@@ -102,6 +105,15 @@ def from_local(cls, base_dir: str, inst_data: Optional[ConfigurableClassData] =
             table_names = db.inspect(engine).get_table_names()
             if "instance_info" not in table_names:
                 InstanceInfo.create(engine)
+            if "flow_compile_cache" not in table_names:
+                FlowCompileCacheTable.create(engine)
+                table_names.append(FlowCompileCacheTable.name)
+
+        # indexes added to flow tables after they were first created
+        for table in (RepoDefinitionsTable, FlowCompileCacheTable):
+            if table.name in table_names:
+                for index in table.indexes:
+                    index.create(engine, checkfirst=True)
 
         run_storage = cls(conn_string, inst_data)
 
@@ -165,13 +177,21 @@ def alembic_version(self) -> AlembicVersion:
         with self.connect() as conn:
             return check_alembic_revision(alembic_config, conn)
 
-    def add_definition(self, name: str, version: int, definition: str) -> None:
-        tbl = FlowDefinitionsTable
-        query = insert(tbl).values(
-            name=name, version=version, definition=definition
-        ).on_conflict_do_update(
-            index_elements=['name'],
-            set_=dict(version=version, definition=definition)
+    def _upsert_rows(
+        self,
+        conn: Connection,
+        table: db.Table,
+        rows: Sequence[Mapping[str, Any]],
+        key_columns: Sequence[str],
+        update_columns: Sequence[str],
+    ) -> None:
+        if not rows:
+            return
+        stmt = insert(table)
+        conn.execute(
+            stmt.on_conflict_do_update(
+                index_elements=list(key_columns),
+                set_={column: stmt.excluded[column] for column in update_columns},
+            ),
+            list(rows),
         )
-        with self.connect() as conn:
-            conn.execute(query)
@@ -971,6 +971,7 @@ def _evaluate_auto_materialize_tick(
                     respect_materialization_data_versions=instance.auto_materialize_respect_materialization_data_versions,
                     logger=self._logger,
                     request_backfills=request_backfills,
+                    num_evaluation_workers=instance.auto_materialize_num_evaluation_workers,
                 ).evaluate()
 
             check.invariant(new_cursor.evaluation_id == evaluation_id)
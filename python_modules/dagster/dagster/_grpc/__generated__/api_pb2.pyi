@@ -422,19 +422,27 @@ class ExternalRepositoryRequest(google.protobuf.message.Message):
 
     SERIALIZED_REPOSITORY_PYTHON_ORIGIN_FIELD_NUMBER: builtins.int
     DEFER_SNAPSHOTS_FIELD_NUMBER: builtins.int
+    KNOWN_SNAPSHOT_ID_FIELD_NUMBER: builtins.int
     serialized_repository_python_origin: builtins.str
     defer_snapshots: builtins.bool
+    known_snapshot_id: builtins.str
+    """Snapshot id of the repository data the client already holds, if any. When it matches the
+    server's current snapshot, the server replies with not_modified instead of the data.
+    """
     def __init__(
         self,
         *,
         serialized_repository_python_origin: builtins.str = ...,
         defer_snapshots: builtins.bool = ...,
+        known_snapshot_id: builtins.str = ...,
     ) -> None: ...
     def ClearField(
         self,
         field_name: typing_extensions.Literal[
             "defer_snapshots",
             b"defer_snapshots",
+            "known_snapshot_id",
+            b"known_snapshot_id",
             "serialized_repository_python_origin",
             b"serialized_repository_python_origin",
         ],
@@ -447,16 +455,27 @@ class ExternalRepositoryReply(google.protobuf.message.Message):
     DESCRIPTOR: google.protobuf.descriptor.Descriptor
 
     SERIALIZED_EXTERNAL_REPOSITORY_DATA_FIELD_NUMBER: builtins.int
+    SNAPSHOT_ID_FIELD_NUMBER: builtins.int
+    NOT_MODIFIED_FIELD_NUMBER: builtins.int
     serialized_external_repository_data: builtins.str
+    snapshot_id: builtins.str
+    not_modified: builtins.bool
     def __init__(
         self,
         *,
         serialized_external_repository_data: builtins.str = ...,
+        snapshot_id: builtins.str = ...,
+        not_modified: builtins.bool = ...,
     ) -> None: ...
     def ClearField(
         self,
         field_name: typing_extensions.Literal[
-            "serialized_external_repository_data", b"serialized_external_repository_data"
+            "not_modified",
+            b"not_modified",
+            "serialized_external_repository_data",
+            b"serialized_external_repository_data",
+            "snapshot_id",
+            b"snapshot_id",
         ],
     ) -> None: ...
 
@@ -468,21 +487,31 @@ class StreamingExternalRepositoryEvent(google.protobuf.message.Message):
 
     SEQUENCE_NUMBER_FIELD_NUMBER: builtins.int
     SERIALIZED_EXTERNAL_REPOSITORY_CHUNK_FIELD_NUMBER: builtins.int
+    SNAPSHOT_ID_FIELD_NUMBER: builtins.int
+    NOT_MODIFIED_FIELD_NUMBER: builtins.int
     sequence_number: builtins.int
     serialized_external_repository_chunk: builtins.str
+    snapshot_id: builtins.str
+    not_modified: builtins.bool
     def __init__(
         self,
         *,
         sequence_number: builtins.int = ...,
         serialized_external_repository_chunk: builtins.str = ...,
+        snapshot_id: builtins.str = ...,
+        not_modified: builtins.bool = ...,
     ) -> None: ...
     def ClearField(
         self,
         field_name: typing_extensions.Literal[
+            "not_modified",
+            b"not_modified",
             "sequence_number",
             b"sequence_number",
             "serialized_external_repository_chunk",
             b"serialized_external_repository_chunk",
+            "snapshot_id",
+            b"snapshot_id",
         ],
     ) -> None: ...
 
@@ -1,8 +1,9 @@
 import os
 import sys
+import threading
 from contextlib import contextmanager
 from threading import Event
-from typing import Any, Dict, Iterator, NoReturn, Optional, Sequence, Tuple, Type, cast
+from typing import Any, Callable, Dict, Iterator, NoReturn, Optional, Sequence, Tuple, Type, cast
 
 import google.protobuf.message
 import grpc
@@ -38,6 +39,9 @@
     default_repository_grpc_timeout,
     default_schedule_grpc_timeout,
     default_sensor_grpc_timeout,
+    grpc_channel_reuse_enabled,
+    grpc_keepalive_time_ms,
+    grpc_max_reconnect_backoff_ms,
     max_rx_bytes,
     max_send_bytes,
 )
@@ -62,6 +66,90 @@ def client_heartbeat_thread(client: "DagsterGrpcClient", shutdown_event: Event)
             continue
 
 
+ChannelKey = Tuple[str, bool]
+
+
+class _PooledChannel:
+    def __init__(self, channel: grpc.Channel):
+        self.channel = channel
+        self.users = 0
+        self.evicted = False
+
+
+class GrpcChannelPool:
+    """Process-wide pool of long-lived gRPC channels, keyed by server address.
+
+    gRPC channels are thread-safe and multiplex concurrent calls over a single HTTP/2 connection, so
+    every client in the process talking to the same server (the daemon, the webserver, and code
+    locations alike) can share one channel. Channels are not fork-safe, so a forked child process
+    starts with an empty pool rather than reusing its parent's channels.
+
+    Channels are leased for the duration of each call. Evicting a channel removes it from the pool
+    right away, so that new calls get a new channel, but only closes it once the calls still using
+    it have released it.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._channels: Dict[ChannelKey, _PooledChannel] = {}
+        self._pid = os.getpid()
+
+    @contextmanager
+    def lease_channel(
+        self, key: ChannelKey, create_fn: Callable[[], grpc.Channel]
+    ) -> Iterator[grpc.Channel]:
+        with self._lock:
+            if self._pid != os.getpid():
+                # Inherited from the parent process, so don't close them from here
+                self._channels = {}
+                self._pid = os.getpid()
+
+            if key not in self._channels:
+                self._channels[key] = _PooledChannel(create_fn())
+            pooled = self._channels[key]
+            pooled.users += 1
+            pid = self._pid
+
+        try:
+            yield pooled.channel
+        finally:
+            with self._lock:
+                pooled.users -= 1
+                should_close = pooled.evicted and pooled.users == 0
+            if should_close and pid == os.getpid():
+                pooled.channel.close()
+
+    def evict(self, key: ChannelKey) -> None:
+        with self._lock:
+            pooled = self._channels.pop(key, None)
+            if pooled is None:
+                return
+            pooled.evicted = True
+            should_close = pooled.users == 0 and self._pid == os.getpid()
+        if should_close:
+            pooled.channel.close()
+
+    def close_all(self) -> None:
+        with self._lock:
+            evicted, self._channels = self._channels, {}
+            for pooled in evicted.values():
+                pooled.evicted = True
+            to_close = (
+                [pooled for pooled in evicted.values() if pooled.users == 0]
+                if self._pid == os.getpid()
+                else []
+            )
+        for pooled in to_close:
+            pooled.channel.close()
+
+
+_channel_pool = GrpcChannelPool()
+
+
+def get_grpc_channel_pool() -> GrpcChannelPool:
+    return _channel_pool
+
+
 class DagsterGrpcClient:
     def __init__(
         self,
@@ -70,6 +158,7 @@ def __init__(
         host: str = "localhost",
         use_ssl: bool = False,
         metadata: Optional[Sequence[Tuple[str, str]]] = None,
+        reuse_channel: Optional[bool] = None,
     ):
         self.port = check.opt_int_param(port, "port")
 
@@ -81,6 +170,10 @@ def __init__(
 
         self._metadata = check.opt_sequence_param(metadata, "metadata")
 
+        self._reuse_channel = check.opt_bool_param(
+            reuse_channel, "reuse_channel", default=grpc_channel_reuse_enabled()
+        )
+
         check.invariant(
             port is not None if seven.IS_WINDOWS else True,
             "You must pass a valid `port` on Windows: `socket` not supported.",
@@ -108,37 +201,81 @@ def metadata(self) -> Sequence[Tuple[str, str]]:
     def use_ssl(self) -> bool:
         return self._use_ssl
 
-    @contextmanager
-    def _channel(self) -> Iterator[grpc.Channel]:
+    @property
+    def reuse_channel(self) -> bool:
+        return self._reuse_channel
+
+    @property
+    def _channel_key(self) -> ChannelKey:
+        return (self._server_address, self._use_ssl)
+
+    def _create_channel(self) -> grpc.Channel:
         options = [
             ("grpc.max_receive_message_length", max_rx_bytes()),
             ("grpc.max_send_message_length", max_send_bytes()),
         ]
-        with (
-            grpc.secure_channel(
+        if self._reuse_channel:
+            options += [
+                # Detect dead connections on long-lived channels, only pinging while calls are
+                # in flight so that idle channels don't trip the server's ping rate limits
+                ("grpc.keepalive_time_ms", grpc_keepalive_time_ms()),
+                ("grpc.keepalive_permit_without_calls", 0),
+                # Reconnect quickly when a code server restarts on the same address
+                ("grpc.initial_reconnect_backoff_ms", 100),
+                ("grpc.max_reconnect_backoff_ms", grpc_max_reconnect_backoff_ms()),
+            ]
+
+        if self._use_ssl:
+            return grpc.secure_channel(
                 self._server_address,
                 self._ssl_creds,
                 options=options,
                 compression=grpc.Compression.Gzip,
             )
-            if self._use_ssl
-            else grpc.insecure_channel(
+        else:
+            return grpc.insecure_channel(
                 self._server_address,
                 options=options,
                 compression=grpc.Compression.Gzip,
             )
-        ) as channel:
-            yield channel
+
+    @contextmanager
+    def _channel(self) -> Iterator[grpc.Channel]:
+        if self._reuse_channel:
+            with _channel_pool.lease_channel(self._channel_key, self._create_channel) as channel:
+                yield channel
+        else:
+            with self._create_channel() as channel:
+                yield channel
+
+    @property
+    def _small_message_compression(self) -> Optional[grpc.Compression]:
+        # Gzip costs more than it saves on tiny messages, but only skip it for pooled channels so
+        # that the default per-call channels keep sending exactly what they always have
+        return grpc.Compression.NoCompression if self._reuse_channel else None
+
+    def _evict_channel_on_error(self, e: Exception) -> None:
+        # A pooled channel keeps retrying its connection with backoff, so drop it on connectivity
+        # errors to make sure the next call connects to whatever server is now at the address
+        if (
+            self._reuse_channel
+            and isinstance(e, grpc.RpcError)
+            and e.code() == grpc.StatusCode.UNAVAILABLE  # type: ignore  # (bad stubs)
+        ):
+            _channel_pool.evict(self._channel_key)
 
     def _get_response(
         self,
         method: str,
         request: google.protobuf.message.Message,
         timeout: int = DEFAULT_GRPC_TIMEOUT,
+        compression: Optional[grpc.Compression] = None,
     ):
         with self._channel() as channel:
             stub = DagsterApiStub(channel)
-            return getattr(stub, method)(request, metadata=self._metadata, timeout=timeout)
+            return getattr(stub, method)(
+                request, metadata=self._metadata, timeout=timeout, compression=compression
+            )
 
     def _raise_grpc_exception(
         self,
@@ -165,11 +302,15 @@ def _query(
         request_type: Type[google.protobuf.message.Message],
         timeout: int = DEFAULT_GRPC_TIMEOUT,
         custom_timeout_message: Optional[str] = None,
+        compression: Optional[grpc.Compression] = None,
         **kwargs,
     ):
         try:
-            return self._get_response(method, request=request_type(**kwargs), timeout=timeout)
+            return self._get_response(
+                method, request=request_type(**kwargs), timeout=timeout, compression=compression
+            )
         except Exception as e:
+            self._evict_channel_on_error(e)
             self._raise_grpc_exception(
                 e, timeout=timeout, custom_timeout_message=custom_timeout_message
             )
@@ -179,10 +320,13 @@ def _get_streaming_response(
         method: str,
         request: google.protobuf.message.Message,
         timeout: int = DEFAULT_GRPC_TIMEOUT,
+        compression: Optional[grpc.Compression] = None,
     ) -> Iterator[Any]:
         with self._channel() as channel:
             stub = DagsterApiStub(channel)
-            yield from getattr(stub, method)(request, metadata=self._metadata, timeout=timeout)
+            yield from getattr(stub, method)(
+                request, metadata=self._metadata, timeout=timeout, compression=compression
+            )
 
     def _streaming_query(
         self,
@@ -190,20 +334,24 @@ def _streaming_query(
         request_type: Type[google.protobuf.message.Message],
         timeout=DEFAULT_GRPC_TIMEOUT,
         custom_timeout_message=None,
+        compression: Optional[grpc.Compression] = None,
         **kwargs,
     ) -> Iterator[Any]:
         try:
             yield from self._get_streaming_response(
-                method, request=request_type(**kwargs), timeout=timeout
+                method, request=request_type(**kwargs), timeout=timeout, compression=compression
             )
         except Exception as e:
+            self._evict_channel_on_error(e)
             self._raise_grpc_exception(
                 e, timeout=timeout, custom_timeout_message=custom_timeout_message
             )
 
     def ping(self, echo: str) -> Dict[str, Any]:
         check.str_param(echo, "echo")
-        res = self._query("Ping", api_pb2.PingRequest, echo=echo)
+        res = self._query(
+            "Ping", api_pb2.PingRequest, compression=self._small_message_compression, echo=echo
+        )
         return {
             "echo": res.echo,
             "serialized_server_utilization_metrics": res.serialized_server_utilization_metrics,
@@ -211,7 +359,9 @@ def ping(self, echo: str) -> Dict[str, Any]:
 
     def heartbeat(self, echo: str = "") -> str:
         check.str_param(echo, "echo")
-        res = self._query("Heartbeat", api_pb2.PingRequest, echo=echo)
+        res = self._query(
+            "Heartbeat", api_pb2.PingRequest, compression=self._small_message_compression, echo=echo
+        )
         return res.echo
 
     def streaming_ping(self, sequence_length: int, echo: str) -> Iterator[dict]:
@@ -230,7 +380,12 @@ def streaming_ping(self, sequence_length: int, echo: str) -> Iterator[dict]:
             }
 
     def get_server_id(self, timeout: int = DEFAULT_GRPC_TIMEOUT) -> str:
-        res = self._query("GetServerId", api_pb2.Empty, timeout=timeout)
+        res = self._query(
+            "GetServerId",
+            api_pb2.Empty,
+            timeout=timeout,
+            compression=self._small_message_compression,
+        )
         return res.server_id
 
     def execution_plan_snapshot(
@@ -366,6 +521,7 @@ def streaming_external_repository(
         external_repository_origin: RemoteRepositoryOrigin,
         defer_snapshots: bool = False,
         timeout=DEFAULT_REPOSITORY_GRPC_TIMEOUT,
+        known_snapshot_id: Optional[str] = None,
     ) -> Iterator[dict]:
         for res in self._streaming_query(
             "StreamingExternalRepository",
@@ -373,11 +529,14 @@ def streaming_external_repository(
             # Rename parameter
             serialized_repository_python_origin=serialize_value(external_repository_origin),
             defer_snapshots=defer_snapshots,
+            known_snapshot_id=check.opt_str_param(known_snapshot_id, "known_snapshot_id") or "",
             timeout=timeout,
         ):
             yield {
                 "sequence_number": res.sequence_number,
                 "serialized_external_repository_chunk": res.serialized_external_repository_chunk,
+                "snapshot_id": res.snapshot_id or None,
+                "not_modified": res.not_modified,
             }
 
     def _is_unimplemented_error(self, e: Exception) -> bool:
@@ -576,6 +735,7 @@ def health_check_query(self):
                 )
         except grpc.RpcError as e:
             print(e)  # noqa: T201
+            self._evict_channel_on_error(e)
             return health_pb2.HealthCheckResponse.UNKNOWN
 
         status_number = response.status
@@ -1,3 +1,4 @@
+import hashlib
 import json
 import logging
 import math
@@ -10,7 +11,7 @@
 import uuid
 import warnings
 from contextlib import ExitStack
-from functools import update_wrapper
+from functools import cached_property, update_wrapper
 from threading import Event as ThreadingEventType
 from time import sleep
 from typing import (
@@ -213,6 +214,21 @@ def wrapper(self: "DagsterApiServer", request: Any, context: grpc.ServicerContex
     return _MetricsRetriever()
 
 
+class SerializedRepositorySnapshot:
+    """A serialized ExternalRepositoryData, identified by a hash of its contents."""
+
+    def __init__(self, serialized_data: str):
+        self.serialized_data = serialized_data
+        self.snapshot_id = hashlib.sha1(serialized_data.encode("utf-8")).hexdigest()
+
+    @cached_property
+    def chunks(self) -> Sequence[str]:
+        return [
+            self.serialized_data[start_index : start_index + STREAMING_CHUNK_SIZE]
+            for start_index in range(0, len(self.serialized_data), STREAMING_CHUNK_SIZE)
+        ]
+
+
 class LoadedRepositories:
     def __init__(
         self,
@@ -397,6 +413,11 @@ def __init__(
         self._enable_metrics = check.bool_param(enable_metrics, "enable_metrics")
         self._server_threadpool_executor = server_threadpool_executor
 
+        # Loaded code does not change over the lifetime of the server, so each repository snapshot
+        # is computed and serialized once, keyed by (repository name, defer_snapshots)
+        self._repository_snapshots: Dict[Tuple[str, bool], SerializedRepositorySnapshot] = {}
+        self._repository_snapshots_lock = threading.Lock()
+
         try:
             if inject_env_vars_from_instance:
                 from dagster._cli.utils import get_instance_for_cli
@@ -757,33 +778,58 @@ def ExternalPipelineSubsetSnapshot(
             serialized_external_pipeline_subset_result=serialized_external_pipeline_subset_result
         )
 
+    def _get_repository_snapshot(
+        self, request: api_pb2.ExternalRepositoryRequest
+    ) -> SerializedRepositorySnapshot:
+        repository_origin = deserialize_value(
+            request.serialized_repository_python_origin,
+            RemoteRepositoryOrigin,
+        )
+        key = (repository_origin.repository_name, request.defer_snapshots)
+
+        with self._repository_snapshots_lock:
+            if key not in self._repository_snapshots:
+                self._repository_snapshots[key] = SerializedRepositorySnapshot(
+                    serialize_value(
+                        external_repository_data_from_def(
+                            self._get_repo_for_origin(repository_origin),
+                            defer_snapshots=request.defer_snapshots,
+                        )
+                    )
+                )
+            return self._repository_snapshots[key]
+
     def _get_serialized_external_repository_data(
         self, request: api_pb2.ExternalRepositoryRequest
-    ) -> str:
+    ) -> Tuple[str, Optional[SerializedRepositorySnapshot]]:
         try:
-            repository_origin = deserialize_value(
-                request.serialized_repository_python_origin,
-                RemoteRepositoryOrigin,
-            )
-
-            return serialize_value(
-                external_repository_data_from_def(
-                    self._get_repo_for_origin(repository_origin),
-                    defer_snapshots=request.defer_snapshots,
-                )
-            )
+            snapshot = self._get_repository_snapshot(request)
+            return snapshot.serialized_data, snapshot
         except Exception:
-            return serialize_value(
-                ExternalRepositoryErrorData(serializable_error_info_from_exc_info(sys.exc_info()))
+            return (
+                serialize_value(
+                    ExternalRepositoryErrorData(
+                        serializable_error_info_from_exc_info(sys.exc_info())
+                    )
+                ),
+                None,
             )
 
     def ExternalRepository(
         self, request: api_pb2.ExternalRepositoryRequest, _context: grpc.ServicerContext
     ) -> api_pb2.ExternalRepositoryReply:
-        serialized_external_repository_data = self._get_serialized_external_repository_data(request)
+        serialized_external_repository_data, snapshot = (
+            self._get_serialized_external_repository_data(request)
+        )
+
+        if snapshot and request.known_snapshot_id == snapshot.snapshot_id:
+            return api_pb2.ExternalRepositoryReply(
+                snapshot_id=snapshot.snapshot_id, not_modified=True
+            )
 
         return api_pb2.ExternalRepositoryReply(
             serialized_external_repository_data=serialized_external_repository_data,
+            snapshot_id=snapshot.snapshot_id if snapshot else "",
         )
 
     def ExternalJob(
@@ -810,24 +856,31 @@ def ExternalJob(
     def StreamingExternalRepository(
         self, request: api_pb2.ExternalRepositoryRequest, _context: grpc.ServicerContext
     ) -> Iterable[api_pb2.StreamingExternalRepositoryEvent]:
-        serialized_external_repository_data = self._get_serialized_external_repository_data(request)
-
-        num_chunks = int(
-            math.ceil(float(len(serialized_external_repository_data)) / STREAMING_CHUNK_SIZE)
+        serialized_external_repository_data, snapshot = (
+            self._get_serialized_external_repository_data(request)
         )
 
-        for i in range(num_chunks):
-            start_index = i * STREAMING_CHUNK_SIZE
-            end_index = min(
-                (i + 1) * STREAMING_CHUNK_SIZE,
-                len(serialized_external_repository_data),
+        if not snapshot:
+            for i, chunk_event in enumerate(
+                self._split_serialized_data_into_chunk_events(serialized_external_repository_data)
+            ):
+                yield api_pb2.StreamingExternalRepositoryEvent(
+                    sequence_number=i,
+                    serialized_external_repository_chunk=chunk_event.serialized_chunk,
+                )
+            return
+
+        if request.known_snapshot_id == snapshot.snapshot_id:
+            yield api_pb2.StreamingExternalRepositoryEvent(
+                sequence_number=0, snapshot_id=snapshot.snapshot_id, not_modified=True
             )
+            return
 
+        for i, chunk in enumerate(snapshot.chunks):
             yield api_pb2.StreamingExternalRepositoryEvent(
                 sequence_number=i,
-                serialized_external_repository_chunk=serialized_external_repository_data[
-                    start_index:end_index
-                ],
+                serialized_external_repository_chunk=chunk,
+                snapshot_id=snapshot.snapshot_id,
             )
 
     def _split_serialized_data_into_chunk_events(
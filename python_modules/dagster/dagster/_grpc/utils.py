@@ -128,3 +128,26 @@ def default_grpc_server_shutdown_grace_period():
     return max(
         default_grpc_timeout(), default_schedule_grpc_timeout(), default_sensor_grpc_timeout()
     )
+
+
+def grpc_channel_reuse_enabled() -> bool:
+    # Opt-in: share long-lived channels per server address across DagsterGrpcClient instances in
+    # the same process, instead of opening a new channel for every call
+    return os.getenv("DAGSTER_GRPC_REUSE_CHANNELS", "").lower() in ("1", "true")
+
+
+def grpc_keepalive_time_ms() -> int:
+    env_set = os.getenv("DAGSTER_GRPC_KEEPALIVE_TIME_MS")
+    if env_set:
+        return int(env_set)
+
+    # Matches the minimum interval between pings that grpc servers accept by default
+    return 5 * 60 * 1000
+
+
+def grpc_max_reconnect_backoff_ms() -> int:
+    env_set = os.getenv("DAGSTER_GRPC_MAX_RECONNECT_BACKOFF_MS")
+    if env_set:
+        return int(env_set)
+
+    return 5 * 1000
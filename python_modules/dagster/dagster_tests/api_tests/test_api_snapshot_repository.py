@@ -1,8 +1,10 @@
 import sys
+from collections import OrderedDict
 from contextlib import contextmanager
 
 import pytest
 from dagster import IntMetadataValue, TextMetadataValue, job, op, repository
+from dagster._api import snapshot_repository
 from dagster._api.snapshot_repository import sync_get_streaming_external_repositories_data_grpc
 from dagster._core.errors import DagsterUserCodeProcessError
 from dagster._core.instance import DagsterInstance
@@ -51,6 +53,64 @@ def test_streaming_external_repositories_error(instance):
             sync_get_streaming_external_repositories_data_grpc(code_location.client, code_location)
 
 
+def test_streaming_external_repositories_not_modified(instance):
+    with get_bar_repo_code_location(instance) as code_location:
+        repo_origin = RemoteRepositoryOrigin(code_location.origin, "bar_repo")
+
+        chunks = list(code_location.client.streaming_external_repository(repo_origin))
+        snapshot_id = chunks[0]["snapshot_id"]
+        assert snapshot_id
+        assert not chunks[0]["not_modified"]
+
+        not_modified_chunks = list(
+            code_location.client.streaming_external_repository(
+                repo_origin, known_snapshot_id=snapshot_id
+            )
+        )
+        assert len(not_modified_chunks) == 1
+        assert not_modified_chunks[0]["not_modified"]
+        assert not not_modified_chunks[0]["serialized_external_repository_chunk"]
+
+        stale_chunks = list(
+            code_location.client.streaming_external_repository(
+                repo_origin, known_snapshot_id="stale"
+            )
+        )
+        assert stale_chunks == chunks
+
+        # repeated loads of an unchanged location reuse the previously deserialized data
+        first = sync_get_streaming_external_repositories_data_grpc(
+            code_location.client, code_location
+        )
+        second = sync_get_streaming_external_repositories_data_grpc(
+            code_location.client, code_location
+        )
+        assert second["bar_repo"] is first["bar_repo"]
+
+
+def test_streaming_external_repositories_cache_bounded(instance, monkeypatch):
+    monkeypatch.setattr(snapshot_repository, "MAX_CACHED_REPOSITORY_DATAS", 1)
+    monkeypatch.setattr(snapshot_repository, "_repository_data_cache", OrderedDict())
+    repository_data_cache = snapshot_repository._repository_data_cache  # noqa: SLF001
+    repository_data_cache[("other_location", "other_repo")] = ("snapshot", None)
+
+    with get_bar_repo_code_location(instance) as code_location:
+        sync_get_streaming_external_repositories_data_grpc(code_location.client, code_location)
+        # the least recently used repository data was evicted
+        cache_key = (code_location.origin.location_name, "bar_repo")
+        assert list(repository_data_cache) == [cache_key]
+
+        code_location.repository_names = {"does_not_exist"}
+        repository_data_cache[(code_location.origin.location_name, "does_not_exist")] = (
+            "snapshot",
+            None,
+        )
+        with pytest.raises(DagsterUserCodeProcessError):
+            sync_get_streaming_external_repositories_data_grpc(code_location.client, code_location)
+        # data of a repository that failed to load is dropped
+        assert list(repository_data_cache) == [cache_key]
+
+
 @op
 def do_something():
     return 1
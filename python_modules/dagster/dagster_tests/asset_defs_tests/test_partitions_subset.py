@@ -1,16 +1,26 @@
+import json
 from typing import cast
 from unittest.mock import Mock
 
 import pytest
 from dagster import DailyPartitionsDefinition, MultiPartitionsDefinition, StaticPartitionsDefinition
-from dagster._core.definitions.partition import AllPartitionsSubset, DefaultPartitionsSubset
+from dagster._core.definitions.partition import (
+    BITMAP_PARTITIONS_SUBSET_MIN_PARTITIONS,
+    AllPartitionsSubset,
+    BitmapPartitionsSubset,
+    DefaultPartitionsSubset,
+)
+from dagster._core.definitions.partition_key_range import PartitionKeyRange
 from dagster._core.definitions.time_window_partitions import (
     PartitionKeysTimeWindowPartitionsSubset,
     PersistedTimeWindow,
     TimeWindowPartitionsDefinition,
     TimeWindowPartitionsSubset,
 )
-from dagster._core.errors import DagsterInvalidDeserializationVersionError
+from dagster._core.errors import (
+    DagsterDefinitionChangedDeserializationError,
+    DagsterInvalidDeserializationVersionError,
+)
 from dagster._core.test_utils import freeze_time
 from dagster._serdes import deserialize_value, serialize_value
 from dagster._time import create_datetime, get_current_datetime
@@ -213,3 +223,118 @@ def test_partitions_set_short_circuiting() -> None:
 
     # Test short-circuiting of -. Returns an empty DefaultPartitionsSubset
     assert (default_ps - all_ps) == DefaultPartitionsSubset.empty_subset()
+
+
+large_static_partitions = StaticPartitionsDefinition(
+    [f"key_{i}" for i in range(BITMAP_PARTITIONS_SUBSET_MIN_PARTITIONS + 5)]
+)
+
+
+def test_bitmap_partitions_subset_set_operations() -> None:
+    assert type(large_static_partitions.empty_subset()) is BitmapPartitionsSubset
+
+    evens = large_static_partitions.subset_with_partition_keys(
+        [f"key_{i}" for i in range(0, 20, 2)]
+    )
+    first_ten = large_static_partitions.subset_with_partition_keys([f"key_{i}" for i in range(10)])
+    assert isinstance(evens, BitmapPartitionsSubset)
+    assert len(evens) == 10
+    assert "key_4" in evens and "key_5" not in evens and "not_a_key" not in evens
+
+    assert set((evens | first_ten).get_partition_keys()) == {
+        *(f"key_{i}" for i in range(10)),
+        *(f"key_{i}" for i in range(10, 20, 2)),
+    }
+    assert set((evens & first_ten).get_partition_keys()) == {f"key_{i}" for i in range(0, 10, 2)}
+    assert set((evens - first_ten).get_partition_keys()) == {f"key_{i}" for i in range(10, 20, 2)}
+    assert (first_ten - first_ten).is_empty
+
+    # set operations with key-set subsets
+    assert evens & DefaultPartitionsSubset({"key_2", "key_3"}) == DefaultPartitionsSubset({"key_2"})
+    assert evens - DefaultPartitionsSubset({"key_2", "not_a_key"}) == DefaultPartitionsSubset(
+        {f"key_{i}" for i in range(4, 20, 2)} | {"key_0"}
+    )
+
+    all_keys = large_static_partitions.get_partition_keys()
+    assert list(large_static_partitions.subset_with_all_partitions().get_partition_keys()) == list(
+        all_keys
+    )
+    assert len(list(evens.get_partition_keys_not_in_subset(large_static_partitions))) == len(
+        all_keys
+    ) - len(evens)
+
+
+def test_bitmap_partitions_subset_unknown_keys() -> None:
+    subset = large_static_partitions.subset_with_partition_keys(["key_1", "not_a_key"])
+    assert isinstance(subset, DefaultPartitionsSubset)
+    assert subset.get_partition_keys() == {"key_1", "not_a_key"}
+
+
+def test_bitmap_partitions_subset_key_ranges() -> None:
+    subset = large_static_partitions.subset_with_partition_keys(
+        ["key_0", "key_1", "key_2", "key_5", "key_7", "key_8", "key_1004"]
+    )
+    assert subset.get_partition_key_ranges(large_static_partitions) == [
+        PartitionKeyRange("key_0", "key_2"),
+        PartitionKeyRange("key_5", "key_5"),
+        PartitionKeyRange("key_7", "key_8"),
+        PartitionKeyRange("key_1004", "key_1004"),
+    ]
+
+
+def test_bitmap_partitions_subset_default_serialization() -> None:
+    subset = large_static_partitions.subset_with_partition_keys(
+        [f"key_{i}" for i in range(0, BITMAP_PARTITIONS_SUBSET_MIN_PARTITIONS, 3)]
+    )
+    serialized = subset.serialize()
+    # without opting in, subsets are serialized in the format that older versions can read
+    assert serialized == subset.to_serializable_subset().serialize()
+    data = json.loads(serialized)
+    assert data["version"] == DefaultPartitionsSubset.SERIALIZATION_VERSION
+    assert set(data["subset"]) == set(subset.get_partition_keys())
+    assert large_static_partitions.deserialize_subset(serialized) == subset
+
+
+def test_bitmap_partitions_subset_serialization(monkeypatch) -> None:
+    monkeypatch.setenv("DAGSTER_BITMAP_PARTITIONS_SUBSET_SERIALIZATION", "1")
+    subset = large_static_partitions.subset_with_partition_keys(
+        [f"key_{i}" for i in range(0, BITMAP_PARTITIONS_SUBSET_MIN_PARTITIONS, 3)]
+    )
+    serialized = subset.serialize()
+    # readers of the key list format reject the bitmap format by its version
+    assert json.loads(serialized)["version"] != DefaultPartitionsSubset.SERIALIZATION_VERSION
+    assert len(serialized) < len(
+        DefaultPartitionsSubset(set(subset.get_partition_keys())).serialize()
+    )
+    assert large_static_partitions.can_deserialize_subset(serialized, None, None)
+    assert large_static_partitions.deserialize_subset(serialized) == subset
+
+    # the key-set serialization format is still readable
+    legacy_serialized = subset.to_serializable_subset().serialize()
+    assert large_static_partitions.deserialize_subset(legacy_serialized) == subset
+    assert large_static_partitions.deserialize_subset('["key_1", "key_2"]') == (
+        large_static_partitions.subset_with_partition_keys(["key_1", "key_2"])
+    )
+
+    # subsets are stored with serdes as key-set subsets
+    round_trip_subset = deserialize_value(serialize_value(subset.to_serializable_subset()))
+    assert isinstance(round_trip_subset, DefaultPartitionsSubset)
+    assert round_trip_subset == subset
+
+    changed_partitions = StaticPartitionsDefinition(
+        [f"other_key_{i}" for i in range(BITMAP_PARTITIONS_SUBSET_MIN_PARTITIONS)]
+    )
+    assert not changed_partitions.can_deserialize_subset(serialized, None, None)
+    with pytest.raises(DagsterDefinitionChangedDeserializationError):
+        changed_partitions.deserialize_subset(serialized)
+
+
+def test_bitmap_partitions_subset_serdes() -> None:
+    subset = large_static_partitions.subset_with_partition_keys(
+        [f"key_{i}" for i in range(0, BITMAP_PARTITIONS_SUBSET_MIN_PARTITIONS, 3)]
+    )
+    assert isinstance(subset, BitmapPartitionsSubset)
+    serialized = serialize_value(subset)
+    assert serialized == serialize_value(subset.to_serializable_subset())
+    deserialized = deserialize_value(serialized, DefaultPartitionsSubset)
+    assert set(deserialized.get_partition_keys()) == set(subset.get_partition_keys())
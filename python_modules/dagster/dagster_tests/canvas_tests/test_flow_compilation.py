@@ -0,0 +1,239 @@
+import json
+import os
+
+import pytest
+from dagster import Definitions
+from dagster._core.code_pointer import ModuleCodePointer
+from dagster._core.definitions.repository_definition import SINGLETON_REPOSITORY_NAME
+from dagster._core.remote_representation import code_location
+from dagster._core.remote_representation.code_location import (
+    InProcessCodeLocation,
+    clean_package,
+    get_repo_data,
+    get_repo_data_cache,
+    load_repository_rows_from_definitions,
+)
+from dagster._core.remote_representation.flow_compilation import (
+    FlowCompilationService,
+    compile_and_load_flow,
+)
+from dagster._core.remote_representation.origin import InProcessCodeLocationOrigin
+from dagster._core.test_utils import instance_for_test
+from dagster._core.types.loadable_target_origin import LoadableTargetOrigin
+from dagster._utils.error import SerializableErrorInfo
+
+
+def make_flow(name, code="return 1"):
+    return {
+        "name": name,
+        "definition": json.dumps(
+            [
+                {
+                    "id": f"{name}_a",
+                    "type": "code",
+                    "name": "a",
+                    "properties": {"code": code},
+                    "branches": None,
+                },
+                {
+                    "id": f"{name}_b",
+                    "type": "code",
+                    "name": "b",
+                    "properties": {"code": "return a + 1"},
+                    "branches": None,
+                },
+            ]
+        ),
+    }
+
+
+FLOWS = [
+    make_flow("good"),
+    # invalid generated code fails to import
+    make_flow("syntax_error", "return ("),
+    # invalid definitions are rejected by the compiler
+    make_flow("unknown_reference", "return nope"),
+]
+
+
+def test_compile_and_load_flow_errors():
+    result = compile_and_load_flow(make_flow("good"), "flow_pkg", "loc")
+    assert result.error is None
+    assert result.code
+    assert result.repository_rows
+
+    for flow in FLOWS[1:]:
+        result = compile_and_load_flow(flow, "flow_pkg", "loc")
+        assert result.repository_rows is None
+        assert isinstance(result.error, SerializableErrorInfo)
+
+
+def test_load_repository_rows_from_definitions(monkeypatch, tmp_path):
+    repository_builds = []
+    get_repository_def = Definitions.get_repository_def
+
+    def _get_repository_def(defs):
+        repository_builds.append(defs)
+        return get_repository_def(defs)
+
+    monkeypatch.setattr(Definitions, "get_repository_def", _get_repository_def)
+    flows = [*FLOWS, make_flow("other")]
+    rows_by_flow, code_pointers, errors = load_repository_rows_from_definitions(
+        flows, "flow_pkg", "loc", str(tmp_path)
+    )
+    # the repository of all flows is built once
+    assert len(repository_builds) == 1
+
+    # the flows left out are returned with their errors
+    assert set(errors) == {"syntax_error", "unknown_reference"}
+    assert "SyntaxError" in errors["syntax_error"].message
+    assert "unknown reference" in errors["unknown_reference"].message
+
+    # the rows of every flow are the same as if it had been loaded on its own
+    assert set(rows_by_flow) == {"good", "other"}
+    for flow in [FLOWS[0], flows[-1]]:
+        result = compile_and_load_flow(flow, "flow_pkg", "loc")
+        assert rows_by_flow[flow["name"]] == result.repository_rows
+
+    # the code pointer still resolves once the flows are loaded
+    assert code_pointers == {
+        SINGLETON_REPOSITORY_NAME: ModuleCodePointer("flow_pkg", "defs", str(tmp_path))
+    }
+    clean_package("flow_pkg")
+    try:
+        defs = code_pointers[SINGLETON_REPOSITORY_NAME].load_target()
+        assert {job_def.name for job_def in defs.get_all_job_defs()} == {
+            "__ASSET_JOB",
+            "flow_pkg_good_entry",
+            "flow_pkg_other_entry",
+        }
+    finally:
+        clean_package("flow_pkg")
+
+
+def test_load_repository_rows_invalid_definitions(monkeypatch, tmp_path):
+    get_flow_code = code_location.get_flow_code
+
+    def _get_flow_code(flow, namespace, storage=None):
+        code = get_flow_code(flow, namespace, storage)
+        # imports fine, but is rejected when the repository is built
+        return code + "\njob = None\n" if flow["name"] == "invalid_job" else code
+
+    monkeypatch.setattr(code_location, "get_flow_code", _get_flow_code)
+    rows_by_flow, _, errors = load_repository_rows_from_definitions(
+        [*FLOWS, make_flow("invalid_job")], "flow_pkg", "loc", str(tmp_path)
+    )
+    assert set(rows_by_flow) == {"good"}
+    assert (
+        rows_by_flow["good"] == compile_and_load_flow(FLOWS[0], "flow_pkg", "loc").repository_rows
+    )
+    assert set(errors) == {"syntax_error", "unknown_reference", "invalid_job"}
+    clean_package("flow_pkg")
+
+
+def test_load_repository_rows_conflicting_definitions(monkeypatch, tmp_path):
+    get_flow_code = code_location.get_flow_code
+
+    def _get_flow_code(flow, namespace, storage=None):
+        # valid on its own, but defines the same assets and job as the flow "good"
+        if flow["name"] == "conflict":
+            return get_flow_code(FLOWS[0], [namespace[0], "good"], storage)
+        return get_flow_code(flow, namespace, storage)
+
+    monkeypatch.setattr(code_location, "get_flow_code", _get_flow_code)
+    rows_by_flow, _, errors = load_repository_rows_from_definitions(
+        [FLOWS[0], make_flow("conflict"), make_flow("other")], "flow_pkg", "loc", str(tmp_path)
+    )
+    assert set(rows_by_flow) == {"good", "other"}
+    assert (
+        rows_by_flow["good"] == compile_and_load_flow(FLOWS[0], "flow_pkg", "loc").repository_rows
+    )
+    assert set(errors) == {"conflict"}
+    clean_package("flow_pkg")
+
+
+def test_repo_data_cache_per_instance(tmp_path):
+    rows_by_flow, _, _ = load_repository_rows_from_definitions(
+        [FLOWS[0], make_flow("other")], "flow_pkg", "loc", str(tmp_path)
+    )
+    clean_package("flow_pkg")
+    with instance_for_test() as instance, instance_for_test() as other_instance:
+        for flow_name, rows in rows_by_flow.items():
+            instance.run_storage.save_repo_definitions(flow_name, rows)
+        # a location of the same name, without the flow "other"
+        other_instance.run_storage.save_repo_definitions("good", rows_by_flow["good"])
+
+        assert get_repo_data_cache(instance) is get_repo_data_cache(instance)
+        assert get_repo_data_cache(instance) is not get_repo_data_cache(other_instance)
+
+        asset_nodes = get_repo_data("loc", instance)[
+            SINGLETON_REPOSITORY_NAME
+        ].external_asset_graph_data
+        assert len(asset_nodes) == 4
+        other_asset_nodes = get_repo_data("loc", other_instance)[
+            SINGLETON_REPOSITORY_NAME
+        ].external_asset_graph_data
+        assert len(other_asset_nodes) == 2
+
+        # reading the location of the other instance did not evict the rows of this one
+        cached_asset_nodes = get_repo_data("loc", instance)[
+            SINGLETON_REPOSITORY_NAME
+        ].external_asset_graph_data
+        assert all(
+            cached is asset_node for cached, asset_node in zip(cached_asset_nodes, asset_nodes)
+        )
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_compile_flows(max_workers):
+    service = FlowCompilationService(max_workers)
+    try:
+        results = service.compile_flows(FLOWS, "flow_pkg", "loc")
+    finally:
+        service.shutdown()
+
+    assert set(results) == {"good", "syntax_error", "unknown_reference"}
+    assert results["good"].error is None
+    assert results["good"].repository_rows
+    assert "SyntaxError" in results["syntax_error"].error.message  # type: ignore
+    assert "unknown reference" in results["unknown_reference"].error.message  # type: ignore
+    assert results["syntax_error"].repository_rows is None
+    assert results["unknown_reference"].repository_rows is None
+
+
+@pytest.mark.parametrize("max_workers", ["0", "2"])
+def test_load_flows_code_pointer(monkeypatch, max_workers):
+    monkeypatch.setenv("DAGSTER_FLOW_COMPILE_WORKERS", max_workers)
+    with instance_for_test() as instance:
+        for flow in FLOWS:
+            instance.run_storage.add_definition(flow["name"], 0, flow["definition"])
+
+        origin = InProcessCodeLocationOrigin(
+            LoadableTargetOrigin(module_name="flows"), location_name="flows"
+        )
+        with pytest.warns(UserWarning) as record:
+            location = InProcessCodeLocation.new(origin, instance)
+
+        # the errors of the flows that could not be loaded are surfaced
+        messages = [str(warning.message) for warning in record]
+        for flow_name in ["syntax_error", "unknown_reference"]:
+            assert any(f"Error loading flow {flow_name}:" in message for message in messages)
+        assert not any("Error loading flow good:" in message for message in messages)
+
+        # runs are launched from the package published into the instance directory
+        package_name = os.path.basename(instance.root_directory)
+        code_pointer = location.repository_code_pointer_dict[SINGLETON_REPOSITORY_NAME]
+        assert code_pointer == ModuleCodePointer(package_name, "defs", instance.root_directory)
+        package_dir = os.path.join(instance.root_directory, package_name)
+        assert sorted(name for name in os.listdir(package_dir) if name.endswith(".py")) == [
+            "__init__.py",
+            "good.py",
+        ]
+        clean_package(package_name)
+        try:
+            defs = code_pointer.load_target()
+            assert f"{package_name}_good_entry" in {
+                job_def.name for job_def in defs.get_all_job_defs()
+            }
+        finally:
+            clean_package(package_name)
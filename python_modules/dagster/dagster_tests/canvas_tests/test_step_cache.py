@@ -0,0 +1,89 @@
+from dagster._canvas import StepCache, compile_flow, incremental
+
+NAMESPACE = ["flow"]
+
+
+def make_steps(b_code="return a + 1"):
+    return [
+        {
+            "id": "a",
+            "type": "code",
+            "name": "a",
+            "properties": {"code": "return 1"},
+            "branches": None,
+        },
+        {
+            "id": "b",
+            "type": "code",
+            "name": "b",
+            "properties": {"code": b_code},
+            "branches": None,
+        },
+        {
+            "id": "c",
+            "type": "code",
+            "name": "c",
+            "properties": {"code": "return 3"},
+            "branches": None,
+        },
+    ]
+
+
+def test_step_cache_compiles_same_code():
+    step_cache = StepCache()
+    for steps in [make_steps(), make_steps(), make_steps("return a * 2"), make_steps()]:
+        assert compile_flow(steps, step_cache=step_cache, namespace=NAMESPACE) == compile_flow(
+            steps, step_cache=None, namespace=NAMESPACE
+        )
+
+
+def test_step_cache_reparses_changed_steps(monkeypatch):
+    parsed = []
+
+    def collect_free_names(code):
+        parsed.append(code)
+        return original(code)
+
+    original = incremental.collect_free_names
+    monkeypatch.setattr(incremental, "collect_free_names", collect_free_names)
+
+    step_cache = StepCache()
+    compile_flow(make_steps(), step_cache=step_cache, namespace=NAMESPACE)
+    assert len(parsed) == 3
+
+    parsed.clear()
+    compile_flow(make_steps(), step_cache=step_cache, namespace=NAMESPACE)
+    assert parsed == []
+
+    compiled = compile_flow(make_steps("return a + 2"), step_cache=step_cache, namespace=NAMESPACE)
+    assert len(parsed) == 1
+    assert "return a + 2" in parsed[0]
+    assert compiled == compile_flow(
+        make_steps("return a + 2"), step_cache=None, namespace=NAMESPACE
+    )
+
+
+def test_step_cache_eviction(monkeypatch):
+    parsed = []
+
+    def collect_free_names(code):
+        parsed.append(code)
+        return ()
+
+    monkeypatch.setattr(incremental, "collect_free_names", collect_free_names)
+
+    step_cache = StepCache(max_size=2)
+    step_cache.free_names("a", "return 1")
+    step_cache.free_names("b", "return 2")
+    # touch a, so that b is the least recently used
+    step_cache.free_names("a", "return 1")
+    step_cache.free_names("c", "return 3")
+    assert parsed == ["return 1", "return 2", "return 3"]
+
+    step_cache.free_names("a", "return 1")
+    step_cache.free_names("b", "return 2")
+    assert parsed == ["return 1", "return 2", "return 3", "return 2"]
+
+    step_cache.clear()
+    step_cache.free_names("a", "return 1")
+    assert parsed[-1] == "return 1"
@@ -0,0 +1,177 @@
+import time
+
+import pytest
+from dagster import (
+    AssetKey,
+    AssetMaterialization,
+    EventRecordsFilter,
+    execute_job,
+    job,
+    multiprocess_executor,
+    op,
+    reconstructable,
+)
+from dagster._core.events import DagsterEvent, DagsterEventType, EngineEventData
+from dagster._core.events.log import EventLogEntry
+from dagster._core.instance.event_buffer import EventWriteBuffer
+from dagster._core.test_utils import instance_for_test
+
+
+def _event(run_id, event_type=DagsterEventType.ENGINE_EVENT):
+    return EventLogEntry(
+        error_info=None,
+        user_message="",
+        level="debug",
+        run_id=run_id,
+        timestamp=time.time(),
+        dagster_event=DagsterEvent(
+            event_type.value,
+            "nonce",
+            event_specific_data=(
+                EngineEventData.in_process(999)
+                if event_type == DagsterEventType.ENGINE_EVENT
+                else None
+            ),
+        ),
+    )
+
+
+@op
+def noop_op():
+    pass
+
+
+@job(executor_def=multiprocess_executor)
+def multiprocess_job():
+    noop_op()
+
+
+def test_flush_on_size():
+    batches = []
+    buffer = EventWriteBuffer(batches.append, max_size=3, max_age_seconds=60)
+    try:
+        buffer.add(_event("a"))
+        buffer.add(_event("b"))
+        buffer.add(_event("a"))
+        assert batches == []
+
+        buffer.add(_event("a"))
+        assert len(batches) == 1
+        assert [event.run_id for event in batches[0]] == ["a", "a", "a"]
+
+        buffer.flush()
+        assert len(batches) == 2
+        assert [event.run_id for event in batches[1]] == ["b"]
+    finally:
+        buffer.dispose()
+
+
+def test_flush_on_step_boundary():
+    batches = []
+    buffer = EventWriteBuffer(batches.append, max_size=100, max_age_seconds=60)
+    try:
+        buffer.add(_event("a"))
+        buffer.add(_event("a"))
+        buffer.add(_event("a", DagsterEventType.STEP_START))
+        assert len(batches) == 1
+        assert [event.dagster_event_type for event in batches[0]] == [
+            DagsterEventType.ENGINE_EVENT,
+            DagsterEventType.ENGINE_EVENT,
+            DagsterEventType.STEP_START,
+        ]
+    finally:
+        buffer.dispose()
+
+
+def test_flush_on_interval():
+    batches = []
+    buffer = EventWriteBuffer(batches.append, max_size=100, max_age_seconds=0.1)
+    try:
+        buffer.add(_event("a"))
+        start = time.time()
+        while not batches and time.time() - start < 5:
+            time.sleep(0.05)
+        assert len(batches) == 1
+    finally:
+        buffer.dispose()
+
+
+def test_flush_on_dispose():
+    batches = []
+    buffer = EventWriteBuffer(batches.append, max_size=100, max_age_seconds=60)
+    buffer.add(_event("a"))
+    buffer.dispose()
+    assert len(batches) == 1
+
+
+def test_failed_write_is_not_retried():
+    batches = []
+    failures = [RuntimeError("write failed")]
+
+    def write_fn(events):
+        if failures:
+            raise failures.pop()
+        batches.append(events)
+
+    buffer = EventWriteBuffer(write_fn, max_size=100, max_age_seconds=60)
+    try:
+        buffer.add(_event("a"))
+        buffer.add(_event("b"))
+        with pytest.raises(RuntimeError, match="write failed"):
+            buffer.flush()
+        # the other run is still written when one run fails
+        assert [[event.run_id for event in batch] for batch in batches] == [["b"]]
+
+        # events of a failed write may have been partially stored, so they are not written again
+        buffer.add(_event("a", DagsterEventType.STEP_START))
+        assert [event.dagster_event_type for event in batches[1]] == [DagsterEventType.STEP_START]
+    finally:
+        buffer.dispose()
+
+
+def test_instance_reads_flush_buffer(monkeypatch):
+    monkeypatch.setenv("DAGSTER_EVENT_WRITE_BUFFER_SIZE", "100")
+    monkeypatch.setenv("DAGSTER_EVENT_WRITE_BUFFER_INTERVAL", "60")
+    with instance_for_test() as instance:
+        assert instance._event_write_buffer  # noqa: SLF001
+        instance.report_runless_asset_event(AssetMaterialization("foo"))
+
+        event = instance.get_latest_materialization_event(AssetKey("foo"))
+        assert event and event.asset_materialization
+        assert event.asset_materialization.asset_key == AssetKey("foo")
+        assert len(instance.get_asset_records([AssetKey("foo")])) == 1
+        records = instance.get_event_records(
+            EventRecordsFilter(DagsterEventType.ASSET_MATERIALIZATION)
+        )
+        assert len(records) == 1
+
+
+def test_instance_storage_access_does_not_flush(monkeypatch):
+    monkeypatch.setenv("DAGSTER_EVENT_WRITE_BUFFER_SIZE", "100")
+    monkeypatch.setenv("DAGSTER_EVENT_WRITE_BUFFER_INTERVAL", "60")
+    with instance_for_test() as instance:
+        instance.handle_new_event(_event("a"))
+        instance.handle_new_event(_event("b"))
+
+        assert not instance.event_log_storage.get_logs_for_run("a")
+        # per-run reads only flush the run being read
+        assert len(instance.all_logs("a")) == 1
+        assert not instance.event_log_storage.get_logs_for_run("b")
+        instance.flush_buffered_events()
+        assert len(instance.event_log_storage.get_logs_for_run("b")) == 1
+
+
+def test_step_handoff_flushes_buffer(monkeypatch):
+    monkeypatch.setenv("DAGSTER_EVENT_WRITE_BUFFER_SIZE", "100")
+    monkeypatch.setenv("DAGSTER_EVENT_WRITE_BUFFER_INTERVAL", "60")
+    with instance_for_test() as instance:
+        with execute_job(reconstructable(multiprocess_job), instance=instance) as result:
+            assert result.success
+            event_types = [
+                record.event_log_entry.dagster_event_type
+                for record in instance.get_records_for_run(result.run_id).records
+            ]
+            # events buffered by the executor are stored before those of its step processes
+            assert event_types.index(DagsterEventType.STEP_WORKER_STARTING) < event_types.index(
+                DagsterEventType.STEP_START
+            )
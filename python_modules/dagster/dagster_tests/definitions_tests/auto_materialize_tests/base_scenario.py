@@ -248,6 +248,7 @@ def do_sensor_scenario(
         scenario_name=None,
         with_external_asset_graph=False,
         respect_materialization_data_versions=False,
+        num_evaluation_workers=None,
     ):
         if (
             self.requires_respect_materialization_data_versions
@@ -333,6 +334,7 @@ def prior_repo():
                     instance,
                     scenario_name=scenario_name,
                     with_external_asset_graph=with_external_asset_graph,
+                    num_evaluation_workers=num_evaluation_workers,
                 )
                 for run_request in run_requests:
                     instance.create_run_for_job(
@@ -413,6 +415,7 @@ def test_time_fn():
                 },
                 respect_materialization_data_versions=respect_materialization_data_versions,
                 logger=logging.getLogger("dagster.amp"),
+                num_evaluation_workers=num_evaluation_workers,
             ).evaluate()
 
         for run_request in run_requests:
@@ -1,6 +1,8 @@
 import pytest
 from dagster import AssetMaterialization, AssetSelection, DagsterInstance, job, op
+from dagster._core.definitions.asset_graph import AssetGraph
 from dagster._core.definitions.time_window_partitions import HourlyPartitionsDefinition
+from dagster._core.instance_for_test import instance_for_test
 
 from .base_scenario import AssetReconciliationScenario, asset_def
 from .scenarios.scenarios import ASSET_RECONCILIATION_SCENARIOS
@@ -42,6 +44,38 @@ def sort_run_request_key_fn(run_request):
         assert run_request.partition_key == expected_run_request.partition_key
 
 
+@pytest.mark.parametrize(
+    "scenario",
+    list(ASSET_RECONCILIATION_SCENARIOS.values()),
+    ids=list(ASSET_RECONCILIATION_SCENARIOS.keys()),
+)
+def test_reconciliation_parallel_evaluation(scenario):
+    # the in-memory sqlite storage of an ephemeral instance does not support concurrent access
+    with instance_for_test() as instance:
+        run_requests, _, evaluations = scenario.do_sensor_scenario(
+            instance, num_evaluation_workers=4
+        )
+
+    assert len(run_requests) == len(scenario.expected_run_requests), evaluations
+
+    def sort_run_request_key_fn(run_request):
+        return (min(run_request.asset_selection), run_request.partition_key)
+
+    sorted_run_requests = sorted(run_requests, key=sort_run_request_key_fn)
+    sorted_expected_run_requests = sorted(
+        scenario.expected_run_requests, key=sort_run_request_key_fn
+    )
+
+    for run_request, expected_run_request in zip(sorted_run_requests, sorted_expected_run_requests):
+        assert set(run_request.asset_selection) == set(expected_run_request.asset_selection)
+        assert run_request.partition_key == expected_run_request.partition_key
+
+    # results are merged in the same order as a serial evaluation would produce them
+    toposorted_asset_keys = AssetGraph.from_assets(scenario.assets).toposorted_asset_keys
+    evaluated_asset_keys = [evaluation.asset_key for evaluation in evaluations]
+    assert evaluated_asset_keys == sorted(evaluated_asset_keys, key=toposorted_asset_keys.index)
+
+
 @pytest.mark.parametrize(
     "scenario",
     [ASSET_RECONCILIATION_SCENARIOS["freshness_complex_subsettable"]],
@@ -25,6 +25,7 @@
     ScheduleType,
     TimeWindow,
     TimeWindowPartitionsSubset,
+    dst_safe_strftime,
     dst_safe_strptime,
 )
 from dagster._core.definitions.timestamp import TimestampWithTimezone
@@ -1847,3 +1848,63 @@ def test_persisted_time_window_serdes():
     deserialized_time_window = deserialize_value(serialized_time_window, PersistedTimeWindow)
     assert isinstance(deserialized_time_window, PersistedTimeWindow)
     assert serialize_value(deserialized_time_window) == serialized_time_window
+
+
+@pytest.mark.parametrize(
+    "partitions_def",
+    [
+        HourlyPartitionsDefinition(start_date="2021-01-01-00:00", minute_offset=15),
+        TimeWindowPartitionsDefinition(
+            start="2021-01-01-00:00", cron_schedule="*/15 * * * *", fmt="%Y-%m-%d-%H:%M"
+        ),
+        DailyPartitionsDefinition(start_date="2021-01-01", timezone="America/Los_Angeles"),
+        DailyPartitionsDefinition(start_date="2021-01-01", hour_offset=7),
+        TimeWindowPartitionsDefinition(
+            start="2021-01-01-00:00",
+            cron_schedule="30 2 * * *",
+            timezone="America/New_York",
+            fmt="%Y-%m-%d-%H:%M",
+        ),
+        WeeklyPartitionsDefinition(start_date="2021-01-01", day_offset=3, timezone="Europe/Berlin"),
+        MonthlyPartitionsDefinition(
+            start_date="2021-01-01", day_offset=5, hour_offset=2, timezone="America/Los_Angeles"
+        ),
+        TimeWindowPartitionsDefinition(
+            start="2021-01-01", cron_schedule="0 0 31 * *", fmt="%Y-%m-%d"
+        ),
+    ],
+)
+def test_partition_index_arithmetic_matches_cron_schedule(
+    partitions_def: TimeWindowPartitionsDefinition,
+):
+    current_time = create_datetime(2021, 12, 31)
+    expected_time_windows = []
+    for tw in partitions_def._iterate_time_windows(partitions_def.start):  # noqa: SLF001
+        if tw.end.timestamp() > current_time.timestamp():
+            break
+        expected_time_windows.append(tw)
+    expected_partition_keys = [
+        dst_safe_strftime(
+            tw.start, partitions_def.timezone, partitions_def.fmt, partitions_def.cron_schedule
+        )
+        for tw in expected_time_windows
+    ]
+
+    assert partitions_def.get_partition_keys(current_time) == expected_partition_keys
+    assert partitions_def.get_num_partitions(current_time) == len(expected_partition_keys)
+    assert (
+        partitions_def.get_partition_keys_between_indexes(10, 20, current_time)
+        == expected_partition_keys[10:20]
+    )
+
+    for tw, partition_key in zip(expected_time_windows[::7], expected_partition_keys[::7]):
+        assert partitions_def.has_partition_key(partition_key, current_time)
+        assert partitions_def.time_window_for_partition_key(partition_key) == tw
+        assert partitions_def.start_time_for_partition_key(partition_key) == tw.start
+        assert partitions_def.get_partition_key_for_timestamp(tw.start.timestamp()) == partition_key
+        assert (
+            partitions_def.get_partition_key_for_timestamp(
+                (tw.start.timestamp() + tw.end.timestamp()) / 2
+            )
+            == partition_key
+        )
@@ -11,7 +11,10 @@
     ChildProcessEvent,
     ChildProcessStartEvent,
     ChildProcessSystemErrorEvent,
+    ChildProcessWorkerIdleEvent,
+    ChildProcessWorkerPool,
     execute_child_process_command,
+    wait_for_child_process_events,
 )
 from dagster._utils import segfault
 
@@ -45,6 +48,11 @@ def execute(self):
         segfault()
 
 
+class PidCommand(ChildProcessCommand):
+    def execute(self):
+        yield os.getpid()
+
+
 class LongRunningCommand(ChildProcessCommand):
     def execute(self):
         time.sleep(0.5)
@@ -81,6 +89,117 @@ def test_basic_child_process_command_with_process_events():
     assert events[3].pid == child_pid
 
 
+def test_non_blocking_child_process_commands():
+    pipes = [multiprocessing.Pipe(duplex=False) for _ in range(3)]
+    iters = [
+        execute_child_process_command(
+            multiprocessing,
+            DoubleAStringChildProcessCommand(str(i)),
+            event_pipe=pipe,
+            blocking=False,
+        )
+        for i, pipe in enumerate(pipes)
+    ]
+
+    results = []
+    active = dict(enumerate(iters))
+    while active:
+        for i, step_iter in list(active.items()):
+            try:
+                event = next(step_iter)
+            except StopIteration:
+                del active[i]
+                continue
+            if isinstance(event, str):
+                results.append(event)
+        wait_for_child_process_events([pipes[i][0] for i in active])
+
+    assert sorted(results) == ["00", "11", "22"]
+
+
+class WaitForEventCommand(ChildProcessCommand):
+    def __init__(self, event):
+        self.event = event
+
+    def execute(self):
+        assert self.event.wait(timeout=10)
+        yield 1
+
+
+@pytest.mark.skipif(os.name == "nt", reason="fork is not available on Windows")
+def test_forked_child_closes_inherited_pipes():
+    ctx = multiprocessing.get_context("fork")
+    other_reader, other_writer = ctx.Pipe(duplex=False)
+    event = ctx.Event()
+    step_iter = execute_child_process_command(
+        ctx,
+        WaitForEventCommand(event),
+        event_pipe=ctx.Pipe(duplex=False),
+        inherited_pipes=[(other_reader, other_writer)],
+    )
+    assert isinstance(next(step_iter), BaseProcess)
+
+    # the other pipe reaches end-of-file while the child that inherited it is still running
+    other_writer.close()
+    assert other_reader.poll(5)
+    with pytest.raises(EOFError):
+        other_reader.recv()
+
+    event.set()
+    assert 1 in list(step_iter)
+    other_reader.close()
+
+
+def _execute_in_pool(pool, command):
+    worker = pool.acquire_worker()
+    try:
+        return [
+            event
+            for event in worker.execute(command)
+            if event is not None and not isinstance(event, BaseProcess)
+        ]
+    finally:
+        pool.release_worker(worker)
+
+
+def test_child_process_worker_pool():
+    with ChildProcessWorkerPool(multiprocessing, max_commands_per_worker=2) as pool:
+        first = _execute_in_pool(pool, PidCommand())
+        assert isinstance(first[0], ChildProcessStartEvent)
+        assert isinstance(first[2], ChildProcessDoneEvent)
+        assert first[3] == ChildProcessWorkerIdleEvent(pid=first[1], exiting=False)
+        worker_pid = first[1]
+        assert worker_pid != os.getpid()
+
+        # the same worker executes the next command, and then exits
+        second = _execute_in_pool(pool, PidCommand())
+        assert second[1] == worker_pid
+        assert second[3] == ChildProcessWorkerIdleEvent(pid=worker_pid, exiting=True)
+
+        third = _execute_in_pool(pool, PidCommand())
+        assert third[1] != worker_pid
+
+
+def test_child_process_worker_pool_recycles_after_error():
+    with ChildProcessWorkerPool(multiprocessing) as pool:
+        events = _execute_in_pool(pool, ThrowAnErrorCommand())
+        assert isinstance(events[1], ChildProcessSystemErrorEvent)
+        assert events[2].exiting
+
+        events = _execute_in_pool(pool, DoubleAStringChildProcessCommand("aa"))
+        assert events[1] == "aaaa"
+
+
+def test_child_process_worker_pool_crash():
+    with ChildProcessWorkerPool(multiprocessing) as pool:
+        with pytest.raises(ChildProcessCrashException) as exc:
+            _execute_in_pool(pool, CrashyCommand())
+        assert exc.value.exit_code == 1
+
+        events = _execute_in_pool(pool, DoubleAStringChildProcessCommand("aa"))
+        assert events[1] == "aaaa"
+
+
 def test_child_process_uncaught_exception():
     results = list(
         filter(
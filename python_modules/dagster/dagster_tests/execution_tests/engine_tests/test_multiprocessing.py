@@ -108,6 +108,57 @@ def test_forkserver_preload():
             assert result.output_for_node("adder") == 11
 
 
+def test_worker_pool_execution():
+    with instance_for_test() as instance:
+        recon_job = reconstructable(define_diamond_job)
+        with execute_job(
+            recon_job,
+            run_config={
+                "execution": {"config": {"multiprocess": {"max_concurrent": 2, "worker_pool": {}}}},
+            },
+            instance=instance,
+        ) as result:
+            assert result.success
+            assert result.output_for_node("adder") == 11
+
+            worker_pids = {
+                event.event_specific_data.metadata["pid"].value
+                for event in result.all_events
+                if event.event_type == DagsterEventType.STEP_WORKER_STARTED
+            }
+            # four steps, executed by at most max_concurrent workers
+            assert 1 <= len(worker_pids) <= 2
+
+
+def test_worker_pool_recycling():
+    with instance_for_test() as instance:
+        recon_job = reconstructable(define_diamond_job)
+        with execute_job(
+            recon_job,
+            run_config={
+                "execution": {
+                    "config": {
+                        "multiprocess": {
+                            "max_concurrent": 1,
+                            "worker_pool": {"max_steps_per_worker": 2},
+                        }
+                    }
+                },
+            },
+            instance=instance,
+        ) as result:
+            assert result.success
+            assert result.output_for_node("adder") == 11
+
+            worker_pids = [
+                event.event_specific_data.metadata["pid"].value
+                for event in result.all_events
+                if event.event_type == DagsterEventType.STEP_WORKER_STARTED
+            ]
+            assert len(worker_pids) == 4
+            assert len(set(worker_pids)) == 2
+
+
 JUST_ADDER_CONFIG = {
     "ops": {"adder": {"inputs": {"left": {"value": 1}, "right": {"value": 1}}}},
 }
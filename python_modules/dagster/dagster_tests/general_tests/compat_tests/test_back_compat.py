@@ -4,6 +4,7 @@
 import os
 import re
 import sqlite3
+import tempfile
 import time
 from collections import namedtuple
 from enum import Enum
@@ -42,6 +43,9 @@
 from dagster._core.storage.event_log.migration import migrate_event_log_data
 from dagster._core.storage.event_log.sql_event_log import SqlEventLogStorage
 from dagster._core.storage.migration.utils import upgrading_instance
+from dagster._core.storage.runs.sqlite import sqlite_run_storage
+from dagster._core.storage.runs.sqlite.sqlite_run_storage import SqliteRunStorage
+from dagster._core.storage.sql import get_alembic_config, stamp_alembic_rev
 from dagster._core.storage.sqlalchemy_compat import db_select
 from dagster._core.storage.tags import (
     COMPUTE_KIND_TAG,
@@ -1320,3 +1324,59 @@ def legacy_op():
         GzipFile(legacy_snap_path, mode="r").read().decode("utf-8"), JobSnapshot
     )
     assert create_snapshot_id(legacy_snap) == "8db90f128b7eaa5c229bdde372e39d5cbecdc7e4"
+
+
+def test_add_flow_compile_cache_table():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = os.path.join(tmpdir, "runs.db")
+        run_storage = SqliteRunStorage.from_local(tmpdir)
+
+        # storage from before the table was added
+        with run_storage.connect() as conn:
+            conn.execute(db.text("DROP TABLE flow_compile_cache"))
+            stamp_alembic_rev(
+                get_alembic_config(sqlite_run_storage.__file__), conn, rev="46b412388816"
+            )
+        assert "flow_compile_cache" not in get_sqlite3_tables(db_path)
+
+        run_storage.upgrade()
+        assert "flow_compile_cache" in get_sqlite3_tables(db_path)
+        assert get_current_alembic_version(db_path) == "8a6a946b6768"
+
+        run_storage._alembic_downgrade(rev="46b412388816")
+        assert "flow_compile_cache" not in get_sqlite3_tables(db_path)
+
+
+def test_add_flow_name_indexes():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = os.path.join(tmpdir, "runs.db")
+        run_storage = SqliteRunStorage.from_local(tmpdir)
+
+        # storage from before the indexes were added
+        with run_storage.connect() as conn:
+            conn.execute(db.text("DROP INDEX idx_repo_definitions_flow_name"))
+            conn.execute(db.text("DROP INDEX idx_flow_compile_cache_flow_name"))
+            stamp_alembic_rev(
+                get_alembic_config(sqlite_run_storage.__file__), conn, rev="e48310d75115"
+            )
+        assert "idx_repo_definitions_flow_name" not in get_sqlite3_indexes(
+            db_path, "repo_definitions"
+        )
+        assert "idx_flow_compile_cache_flow_name" not in get_sqlite3_indexes(
+            db_path, "flow_compile_cache"
+        )
+
+        run_storage.upgrade()
+        assert get_current_alembic_version(db_path) == "8a6a946b6768"
+        assert "idx_repo_definitions_flow_name" in get_sqlite3_indexes(db_path, "repo_definitions")
+        assert "idx_flow_compile_cache_flow_name" in get_sqlite3_indexes(
+            db_path, "flow_compile_cache"
+        )
+
+        run_storage._alembic_downgrade(rev="e48310d75115")
+        assert "idx_repo_definitions_flow_name" not in get_sqlite3_indexes(
+            db_path, "repo_definitions"
+        )
+        assert "idx_flow_compile_cache_flow_name" not in get_sqlite3_indexes(
+            db_path, "flow_compile_cache"
+        )
@@ -0,0 +1,101 @@
+from contextlib import ExitStack
+from unittest import mock
+
+import grpc
+import pytest
+from dagster._core.errors import DagsterUserCodeUnreachableError
+from dagster._grpc import DagsterGrpcClient
+from dagster._grpc.client import GrpcChannelPool, get_grpc_channel_pool
+from dagster._utils import find_free_port
+
+
+@pytest.fixture(autouse=True)
+def clean_channel_pool():
+    yield
+    get_grpc_channel_pool().close_all()
+
+
+def test_pooled_channels_are_shared_per_address():
+    port = find_free_port()
+    other_port = find_free_port()
+
+    client = DagsterGrpcClient(port=port, reuse_channel=True)
+    other_client = DagsterGrpcClient(port=port, reuse_channel=True)
+    different_address_client = DagsterGrpcClient(port=other_port, reuse_channel=True)
+
+    with client._channel() as channel:  # noqa: SLF001
+        with other_client._channel() as other_channel:  # noqa: SLF001
+            assert channel is other_channel
+        with different_address_client._channel() as different_channel:  # noqa: SLF001
+            assert channel is not different_channel
+
+
+def test_unpooled_channels_are_not_shared():
+    client = DagsterGrpcClient(port=find_free_port(), reuse_channel=False)
+    with client._channel() as channel:  # noqa: SLF001
+        with client._channel() as other_channel:  # noqa: SLF001
+            assert channel is not other_channel
+
+
+def test_reuse_channel_env_var(monkeypatch):
+    assert not DagsterGrpcClient(port=find_free_port()).reuse_channel
+    monkeypatch.setenv("DAGSTER_GRPC_REUSE_CHANNELS", "1")
+    assert DagsterGrpcClient(port=find_free_port()).reuse_channel
+
+
+def test_pooled_channel_evicted_when_unavailable():
+    client = DagsterGrpcClient(port=find_free_port(), reuse_channel=True)
+    with client._channel() as channel:  # noqa: SLF001
+        pass
+
+    with pytest.raises(DagsterUserCodeUnreachableError):
+        client.ping("foobar")
+
+    with client._channel() as new_channel:  # noqa: SLF001
+        assert new_channel is not channel
+
+
+def test_evicted_channel_closed_after_last_lease():
+    pool = GrpcChannelPool()
+    key = ("localhost:1234", False)
+    channel = mock.MagicMock()
+
+    with pool.lease_channel(key, lambda: channel) as leased:
+        with pool.lease_channel(key, mock.MagicMock) as other_leased:
+            assert other_leased is leased is channel
+
+            pool.evict(key)
+            # new calls get a new channel while the evicted one is still in use
+            with pool.lease_channel(key, mock.MagicMock) as new_channel:
+                assert new_channel is not channel
+
+        assert not channel.close.called
+
+    assert channel.close.call_count == 1
+
+    # idle channels are closed right away
+    pool.evict(key)
+    assert new_channel.close.call_count == 1
+
+
+def test_close_all_waits_for_leases():
+    pool = GrpcChannelPool()
+    leased_channel, idle_channel = mock.MagicMock(), mock.MagicMock()
+    with pool.lease_channel(("idle", False), lambda: idle_channel):
+        pass
+
+    with ExitStack() as stack:
+        stack.enter_context(pool.lease_channel(("leased", False), lambda: leased_channel))
+        pool.close_all()
+        assert idle_channel.close.call_count == 1
+        assert not leased_channel.close.called
+
+    assert leased_channel.close.call_count == 1
+
+
+def test_small_message_compression():
+    pooled_client = DagsterGrpcClient(port=find_free_port(), reuse_channel=True)
+    client = DagsterGrpcClient(port=find_free_port(), reuse_channel=False)
+    # only pooled channels skip gzip for pings, so per-call channels keep their behavior
+    assert pooled_client._small_message_compression == grpc.Compression.NoCompression  # noqa: SLF001
+    assert client._small_message_compression is None  # noqa: SLF001
@@ -1,3 +1,4 @@
+import mmap
 import os
 import pickle
 import shutil
@@ -37,7 +38,7 @@
 from dagster._core.definitions.partition_mapping import UpstreamPartitionsResult
 from dagster._core.errors import DagsterInvariantViolationError
 from dagster._core.instance import DynamicPartitionsStore
-from dagster._core.storage.fs_io_manager import fs_io_manager
+from dagster._core.storage.fs_io_manager import PickledObjectFilesystemIOManager, fs_io_manager
 from dagster._core.storage.io_manager import IOManagerDefinition
 from dagster._core.test_utils import instance_for_test
 from dagster._utils import file_relative_path
@@ -107,6 +108,65 @@ def test_fs_io_manager_base_dir():
             assert pickle.load(read_obj) == [1, 2, 3]
 
 
+class LargeBuffer:
+    """Pickles its buffer out of band, like NumPy arrays do."""
+
+    def __init__(self, buffer):
+        self.buffer = buffer
+
+    def __reduce_ex__(self, protocol):
+        if protocol >= 5:
+            return LargeBuffer, (pickle.PickleBuffer(self.buffer),)
+        return LargeBuffer, (bytes(self.buffer),)
+
+
+def test_fs_io_manager_memory_map_buffers():
+    data = bytes(range(256)) * 1024
+
+    @op
+    def op_a():
+        return {"large": LargeBuffer(bytearray(data)), "small": LargeBuffer(bytearray(b"small"))}
+
+    @op
+    def op_b(value):
+        large, small = value["large"].buffer, value["small"].buffer
+        # the large buffer is mapped from the file, the small one is kept in the pickle
+        assert isinstance(large.obj, mmap.mmap)
+        assert large == data
+        assert bytes(small) == b"small"
+        # mapped buffers are copy-on-write
+        large[0] = 255
+        return 1
+
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        io_manager = fs_io_manager.configured({"base_dir": tmpdir_path, "memory_map_buffers": True})
+
+        @job(resource_defs={"io_manager": io_manager})
+        def memory_map_job():
+            op_b(op_a())
+
+        result = memory_map_job.execute_in_process()
+        assert result.success
+
+        filepath_a = os.path.join(tmpdir_path, result.run_id, "op_a", "result")
+        with open(filepath_a, "rb") as read_obj:
+            assert data in read_obj.read()
+        assert not [name for name in os.listdir(os.path.dirname(filepath_a)) if name != "result"]
+
+        # files written in band can still be loaded, and vice versa
+        in_band_manager = PickledObjectFilesystemIOManager(base_dir=tmpdir_path)
+        memory_map_manager = PickledObjectFilesystemIOManager(
+            base_dir=tmpdir_path, memory_map_buffers=True
+        )
+        path = in_band_manager._base_path / "value"  # noqa: SLF001
+        for dump_manager, load_manager in [
+            (in_band_manager, memory_map_manager),
+            (memory_map_manager, in_band_manager),
+        ]:
+            dump_manager.dump_to_path(None, LargeBuffer(bytearray(data)), path)  # type: ignore
+            assert load_manager.load_from_path(None, path).buffer == data  # type: ignore
+
+
 # lamdba functions can't be pickled (pickle.PicklingError)
 lam = lambda x: x * x
 
@@ -6,7 +6,11 @@
 import dagster._check as check
 from dagster._core.events import DagsterEvent, DagsterEventType, EngineEventData
 from dagster._core.events.log import EventLogEntry
-from dagster._core.storage.event_log import SqliteEventLogStorage, SqlPollingEventWatcher
+from dagster._core.storage.event_log import (
+    ConsolidatedSqliteEventLogStorage,
+    SqliteEventLogStorage,
+    SqlPollingEventWatcher,
+)
 from dagster._core.storage.event_log.base import EventLogCursor
 from dagster._core.utils import make_new_run_id
 from dagster._serdes.config_class import ConfigurableClassData
@@ -61,6 +65,41 @@ def dispose(self) -> None:
             self._watcher = None
 
 
+class ConsolidatedSqlitePollingEventLogStorage(ConsolidatedSqliteEventLogStorage):
+    """Consolidated SQLite event log storage that watches runs with a multiplexed
+    SqlPollingEventWatcher, polling all watched runs from a single thread.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super(ConsolidatedSqlitePollingEventLogStorage, self).__init__(*args, **kwargs)
+        self._watcher: Optional[SqlPollingEventWatcher] = None
+
+    def watch(
+        self,
+        run_id: str,
+        cursor: Optional[str],
+        callback: Callable[[EventLogEntry, str], None],
+    ):
+        if self._watcher is None:
+            self._watcher = SqlPollingEventWatcher(self, multiplexed=True)
+
+        self._watcher.watch_run(run_id, cursor, callback)
+
+    def end_watch(
+        self,
+        run_id: str,
+        handler: Callable[[EventLogEntry, str], None],
+    ):
+        if self._watcher:
+            self._watcher.unwatch_run(run_id, handler)
+
+    def dispose(self) -> None:
+        if self._watcher:
+            self._watcher.close()
+            self._watcher = None
+        super().dispose()
+
+
 RUN_ID = make_new_run_id()
 
 
@@ -79,6 +118,12 @@ def create_event(count: int, run_id: str = RUN_ID):
     )
 
 
+def _wait_for(condition: Callable[[], bool], attempts: int = 20) -> None:
+    while not condition() and attempts > 0:
+        time.sleep(0.1)
+        attempts -= 1
+
+
 @contextmanager
 def create_sqlite_run_event_logstorage():
     with tempfile.TemporaryDirectory() as tmpdir_path:
@@ -146,3 +191,110 @@ def watch_two(event, _cursor):
 
     # calling end_watch after dispose does not error
     storage.end_watch(RUN_ID, watch_two)
+
+
+def test_multiplexed_watcher_requires_unsharded_storage():
+    with create_sqlite_run_event_logstorage() as storage:
+        assert not SqlPollingEventWatcher(storage, multiplexed=True).is_multiplexed
+
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        storage = ConsolidatedSqlitePollingEventLogStorage(tmpdir_path)
+        assert SqlPollingEventWatcher(storage, multiplexed=True).is_multiplexed
+        assert not SqlPollingEventWatcher(storage, multiplexed=False).is_multiplexed
+        storage.dispose()
+
+
+def test_multiplexed_watcher():
+    run_id_1 = make_new_run_id()
+    run_id_2 = make_new_run_id()
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        storage = ConsolidatedSqlitePollingEventLogStorage(tmpdir_path)
+        watched_1 = []
+        watched_2 = []
+        watched_3 = []
+
+        def watch_one(event, _cursor):
+            watched_1.append(event)
+
+        def watch_two(event, _cursor):
+            watched_2.append(event)
+
+        def watch_three(event, _cursor):
+            watched_3.append(event)
+
+        storage.store_event(create_event(1, run_id_1))
+        storage.store_event(create_event(2, run_id_1))
+        first_records = storage.get_records_for_run(run_id_1).records
+
+        # existing events after the cursor are delivered when a run starts being watched
+        storage.watch(
+            run_id_1, str(EventLogCursor.from_storage_id(first_records[0].storage_id)), watch_one
+        )
+        storage.watch(run_id_2, None, watch_two)
+        _wait_for(lambda: len(watched_1) == 1)
+        assert [int(evt.message) for evt in watched_1] == [2]
+
+        storage.store_event(create_event(3, run_id_1))
+        storage.store_event(create_event(4, run_id_2))
+        storage.store_event(create_event(5, make_new_run_id()))
+        storage.store_event(create_event(6, run_id_2))
+        _wait_for(lambda: len(watched_1) == 2 and len(watched_2) == 2)
+
+        storage.watch(run_id_2, None, watch_three)
+        storage.store_event(create_event(7, run_id_2))
+        _wait_for(lambda: len(watched_2) == 3 and len(watched_3) == 1)
+
+        storage.end_watch(run_id_1, watch_one)
+        storage.end_watch(run_id_2, watch_two)
+        assert not storage._watcher.has_run_id(run_id_1)  # noqa: SLF001
+        assert storage._watcher.has_run_id(run_id_2)  # noqa: SLF001
+        storage.store_event(create_event(8, run_id_1))
+        storage.store_event(create_event(9, run_id_2))
+        _wait_for(lambda: len(watched_3) == 2)
+        time.sleep(0.3)
+
+        assert [int(evt.message) for evt in watched_1] == [2, 3]
+        assert [int(evt.message) for evt in watched_2] == [4, 6, 7]
+        assert [int(evt.message) for evt in watched_3] == [7, 9]
+
+        storage.end_watch(run_id_2, watch_three)
+        storage.dispose()
+
+
+def test_multiplexed_watcher_out_of_order_commits():
+    run_id_1 = make_new_run_id()
+    run_id_2 = make_new_run_id()
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        storage = ConsolidatedSqlitePollingEventLogStorage(tmpdir_path)
+        watched_1 = []
+        watched_2 = []
+
+        def watch_one(event, _cursor):
+            watched_1.append(event)
+
+        def watch_two(event, _cursor):
+            watched_2.append(event)
+
+        def store_event_with_id(event: EventLogEntry, storage_id: int) -> None:
+            # storage ids are handed out at insert time, so on databases with concurrent writers an
+            # event with a lower id can be committed after one with a higher id
+            with storage.index_connection() as conn:
+                conn.execute(storage.prepare_insert_event(event).values(id=storage_id))
+
+        storage.watch(run_id_1, None, watch_one)
+        storage.watch(run_id_2, None, watch_two)
+        storage.store_event(create_event(1, run_id_1))
+        storage.store_event(create_event(2, run_id_2))
+        _wait_for(lambda: len(watched_1) == 1 and len(watched_2) == 1)
+
+        store_event_with_id(create_event(3, run_id_2), 100)
+        _wait_for(lambda: len(watched_2) == 2)
+        store_event_with_id(create_event(4, run_id_1), 50)
+        _wait_for(lambda: len(watched_1) == 2)
+
+        assert [int(evt.message) for evt in watched_1] == [1, 4]
+        assert [int(evt.message) for evt in watched_2] == [2, 3]
+
+        storage.end_watch(run_id_1, watch_one)
+        storage.end_watch(run_id_2, watch_two)
+        storage.dispose()
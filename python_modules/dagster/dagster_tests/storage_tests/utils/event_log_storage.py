@@ -834,6 +834,32 @@ def test_event_log_step_stats(
         assert len(d_stats.expectation_results) == 2
         assert len(c_stats.attempts_list) == 1
 
+    def test_store_event_batch_mixed_events(
+        self,
+        test_run_id: str,
+        storage: EventLogStorage,
+    ):
+        other_run_id = make_new_run_id()
+        records = _stats_records(run_id=test_run_id)
+        other_records = [create_test_event_log_record("other", other_run_id)]
+
+        storage.store_event_batch(records[:5] + other_records + records[5:])
+
+        stored = storage.get_logs_for_run(test_run_id)
+        assert [(r.dagster_event_type, r.timestamp) for r in stored] == [
+            (r.dagster_event_type, r.timestamp) for r in records
+        ]
+        assert len(storage.get_logs_for_run(other_run_id)) == 1
+
+        step_stats = storage.get_step_stats_for_run(test_run_id)
+        assert len(step_stats) == 4
+
+        for asset_key in [AssetKey("mat_1"), AssetKey("mat_2"), AssetKey("mat_3")]:
+            assert storage.has_asset_key(asset_key)
+            [asset_record] = storage.get_asset_records([asset_key])
+            assert asset_record.asset_entry.last_materialization_record
+            assert asset_record.asset_entry.last_materialization_record.run_id == test_run_id
+
     def test_secondary_index(self, storage: EventLogStorage):
         if not isinstance(storage, SqlEventLogStorage) or isinstance(
             storage, InMemoryEventLogStorage
@@ -4814,6 +4840,9 @@ def yields_materialization():
                 serialized_failed_partition_subset="baz",
                 serialized_in_progress_partition_subset="qux",
                 earliest_in_progress_materialization_event_id=42,
+                partitions_def_data=external_partitions_definition_from_def(
+                    StaticPartitionsDefinition(["a", "b"])
+                ),
             )
 
             # Check that AssetStatusCacheValue has all fields set. This ensures that we test that the
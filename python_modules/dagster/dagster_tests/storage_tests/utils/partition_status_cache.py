@@ -21,15 +21,18 @@
     DagsterEvent,
     StepMaterializationData,
 )
+from dagster._core.storage import partition_status_cache
 from dagster._core.storage.dagster_run import DagsterRunStatus
 from dagster._core.storage.partition_status_cache import (
     RUN_FETCH_BATCH_SIZE,
+    AssetStatusCacheValue,
     build_failed_and_in_progress_partition_subset,
     get_and_update_asset_status_cache_value,
     get_last_planned_storage_id,
 )
 from dagster._core.test_utils import create_run_for_test
 from dagster._core.utils import make_new_run_id
+from dagster._serdes import serialize_value
 from dagster._utils import Counter, traced_counter
 
 from .event_log_storage import create_and_delete_test_runs
@@ -543,6 +546,138 @@ def asset1(context):
             == set()
         )
 
+    def test_cached_status_maintained_on_write(self, instance, monkeypatch):
+        if not instance.event_log_storage.can_write_asset_status_cache():
+            pytest.skip("storage cannot write asset status cache")
+
+        monkeypatch.setenv("DAGSTER_ASSET_STATUS_CACHE_ON_WRITE", "1")
+        partitions_def = DailyPartitionsDefinition(start_date="2022-01-01")
+
+        @asset(partitions_def=partitions_def)
+        def asset1():
+            return 1
+
+        asset_key = AssetKey("asset1")
+        asset_graph = AssetGraph.from_assets([asset1])
+        asset_job = define_asset_job("asset_job").resolve(asset_graph=asset_graph)
+
+        def _get_stored_cached_status():
+            return next(iter(instance.get_asset_records([asset_key]))).asset_entry.cached_status
+
+        asset_job.execute_in_process(instance=instance, partition_key="2022-02-01")
+        get_and_update_asset_status_cache_value(instance, asset_key, partitions_def)
+        assert _get_stored_cached_status().partitions_def_data
+
+        run = create_run_for_test(instance, status=DagsterRunStatus.STARTED)
+        instance.event_log_storage.store_event(
+            EventLogEntry(
+                error_info=None,
+                level="debug",
+                user_message="",
+                run_id=run.run_id,
+                timestamp=time.time(),
+                dagster_event=DagsterEvent(
+                    DagsterEventType.ASSET_MATERIALIZATION_PLANNED.value,
+                    "nonce",
+                    event_specific_data=AssetMaterializationPlannedData(
+                        asset_key=asset_key, partition="2022-02-02"
+                    ),
+                ),
+            )
+        )
+        asset_job.execute_in_process(instance=instance, partition_key="2022-02-03")
+
+        stored_status = _get_stored_cached_status()
+        assert (
+            stored_status.latest_storage_id
+            == next(
+                iter(instance.get_asset_records([asset_key]))
+            ).asset_entry.last_materialization_storage_id
+        )
+        assert set(
+            stored_status.deserialize_materialized_partition_subsets(
+                partitions_def
+            ).get_partition_keys()
+        ) == {"2022-02-01", "2022-02-03"}
+        assert set(
+            stored_status.deserialize_in_progress_partition_subsets(
+                partitions_def
+            ).get_partition_keys()
+        ) == {"2022-02-02"}
+
+        traced_counter.set(Counter())
+        cached_status = get_and_update_asset_status_cache_value(instance, asset_key, partitions_def)
+        assert cached_status == stored_status
+        assert not traced_counter.get().counts().get("DagsterInstance.get_materialized_partitions")
+
+        # events stored while the setting is off leave the cached status to be rebuilt on read
+        monkeypatch.delenv("DAGSTER_ASSET_STATUS_CACHE_ON_WRITE")
+        asset_job.execute_in_process(instance=instance, partition_key="2022-02-04")
+        monkeypatch.setenv("DAGSTER_ASSET_STATUS_CACHE_ON_WRITE", "1")
+        asset_job.execute_in_process(instance=instance, partition_key="2022-02-05")
+        assert _get_stored_cached_status() == stored_status
+
+        cached_status = get_and_update_asset_status_cache_value(instance, asset_key, partitions_def)
+        assert set(
+            cached_status.deserialize_materialized_partition_subsets(
+                partitions_def
+            ).get_partition_keys()
+        ) == {"2022-02-01", "2022-02-03", "2022-02-04", "2022-02-05"}
+
+    def test_cached_status_maintained_on_write_served_on_read(self, instance, monkeypatch):
+        if not instance.event_log_storage.can_write_asset_status_cache():
+            pytest.skip("storage cannot write asset status cache")
+
+        monkeypatch.setenv("DAGSTER_ASSET_STATUS_CACHE_ON_WRITE", "1")
+        partitions_def = StaticPartitionsDefinition(["a", "b", "c"])
+
+        @asset(partitions_def=partitions_def)
+        def asset1():
+            return 1
+
+        asset_key = AssetKey("asset1")
+        asset_graph = AssetGraph.from_assets([asset1])
+        asset_job = define_asset_job("asset_job").resolve(asset_graph=asset_graph)
+
+        asset_job.execute_in_process(instance=instance, partition_key="a")
+        get_and_update_asset_status_cache_value(instance, asset_key, partitions_def)
+
+        build_calls = []
+        build_status_cache = partition_status_cache._build_status_cache  # noqa: SLF001
+
+        def _build_status_cache(**kwargs):
+            build_calls.append(kwargs)
+            return build_status_cache(**kwargs)
+
+        monkeypatch.setattr(partition_status_cache, "_build_status_cache", _build_status_cache)
+
+        # the cached status updated on write is served as is
+        asset_job.execute_in_process(instance=instance, partition_key="b")
+        cached_status = get_and_update_asset_status_cache_value(instance, asset_key, partitions_def)
+        assert not build_calls
+        assert set(
+            cached_status.deserialize_materialized_partition_subsets(
+                partitions_def
+            ).get_partition_keys()
+        ) == {"a", "b"}
+
+        # events stored while the setting is off are picked up by rebuilding on read
+        monkeypatch.delenv("DAGSTER_ASSET_STATUS_CACHE_ON_WRITE")
+        asset_job.execute_in_process(instance=instance, partition_key="c")
+        cached_status = get_and_update_asset_status_cache_value(instance, asset_key, partitions_def)
+        assert len(build_calls) == 1
+        assert set(
+            cached_status.deserialize_materialized_partition_subsets(
+                partitions_def
+            ).get_partition_keys()
+        ) == {"a", "b", "c"}
+
+    def test_cached_status_serialization_without_partitions_def_data(self):
+        # values stored without the partitions definition snapshot match those of older versions
+        assert "partitions_def_data" not in serialize_value(
+            AssetStatusCacheValue(latest_storage_id=1, partitions_def_id="foo")
+        )
+
     def test_cache_deleted_runs(self, instance, delete_runs_instance):
         partitions_def = StaticPartitionsDefinition(["good1", "good2"])
 
@@ -1545,3 +1545,85 @@ def test_migrate_repo(self, storage):
         assert len(two_runs) == 1
         assert two_runs[0].run_id == one
         assert two_runs[0].tags[REPOSITORY_LABEL_TAG] == "fake_repo_two@fake:fake"
+
+    @staticmethod
+    def _repo_definition_row(name, definition="definition", location_name="location"):
+        return dict(
+            location_name=location_name,
+            name=name,
+            metadata="metadata",
+            utilized_env_vars="{}",
+            main_key="main_key",
+            snap_type="job",
+            definition=definition,
+        )
+
+    def _repo_definitions_by_flow(self, storage, location_name="location"):
+        return {
+            (row["flow_name"], row["name"]): row["definition"]
+            for row in storage.get_repo_definition(location_name)
+        }
+
+    def test_upsert_repo_definitions(self, storage):
+        row = self._repo_definition_row("one")
+        storage.upsert_repo_definitions([{**row, "flow_name": "flow"}])
+        storage.upsert_repo_definitions(
+            [
+                {**row, "flow_name": "flow", "definition": "updated"},
+                {**row, "flow_name": "other_flow"},
+            ]
+        )
+        assert self._repo_definitions_by_flow(storage) == {
+            ("flow", "one"): "updated",
+            ("other_flow", "one"): "definition",
+        }
+
+        storage.drop_repo_definition_by_flow("flow")
+        assert self._repo_definitions_by_flow(storage) == {("other_flow", "one"): "definition"}
+
+    def test_save_repo_definitions(self, storage):
+        storage.save_repo_definition(flow_name="other_flow", **self._repo_definition_row("one"))
+        storage.save_repo_definitions(
+            "flow", [self._repo_definition_row("one"), self._repo_definition_row("two")]
+        )
+        assert self._repo_definitions_by_flow(storage) == {
+            ("flow", "one"): "definition",
+            ("flow", "two"): "definition",
+            ("other_flow", "one"): "definition",
+        }
+
+        # only changed and new rows are written, rows that are gone are deleted
+        upserted = []
+        upsert_rows = storage._upsert_repo_definition_rows  # noqa: SLF001
+
+        def _upsert_rows(conn, rows):
+            upserted.extend((row["flow_name"], row["name"]) for row in rows)
+            upsert_rows(conn, rows)
+
+        storage._upsert_repo_definition_rows = _upsert_rows  # noqa: SLF001
+        storage.save_repo_definitions(
+            "flow",
+            [
+                self._repo_definition_row("one", definition="updated"),
+                self._repo_definition_row("three"),
+            ],
+        )
+        assert sorted(upserted) == [("flow", "one"), ("flow", "three")]
+        assert self._repo_definitions_by_flow(storage) == {
+            ("flow", "one"): "updated",
+            ("flow", "three"): "definition",
+            ("other_flow", "one"): "definition",
+        }
+
+        upserted.clear()
+        storage.save_repo_definitions(
+            "flow",
+            [
+                self._repo_definition_row("one", definition="updated"),
+                self._repo_definition_row("three"),
+            ],
+        )
+        assert upserted == []
+
+        storage.save_repo_definitions("flow", [])
+        assert self._repo_definitions_by_flow(storage) == {("other_flow", "one"): "definition"}
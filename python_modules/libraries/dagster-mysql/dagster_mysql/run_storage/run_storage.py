@@ -1,4 +1,4 @@
-from typing import ContextManager, Mapping, Optional, cast
+from typing import Any, ContextManager, Mapping, Optional, Sequence, cast
 
 import dagster._check as check
 import sqlalchemy as db
@@ -188,3 +188,21 @@ def alembic_version(self) -> AlembicVersion:
         alembic_config = mysql_alembic_config(__file__)
         with self.connect() as conn:
             return check_alembic_revision(alembic_config, conn)
+
+    def _upsert_rows(
+        self,
+        conn: Connection,
+        table: db.Table,
+        rows: Sequence[Mapping[str, Any]],
+        key_columns: Sequence[str],
+        update_columns: Sequence[str],
+    ) -> None:
+        if not rows:
+            return
+        insert_stmt = db_dialects.mysql.insert(table)
+        conn.execute(
+            insert_stmt.on_duplicate_key_update(
+                {column: insert_stmt.inserted[column] for column in update_columns}
+            ),
+            list(rows),
+        )
@@ -203,6 +203,7 @@ def store_event(self, event: EventLogEntry) -> None:
                 )
 
             self.store_asset_event_tags([event], [event_id])
+            self._update_asset_cached_status_for_events([(event, event_id)])
 
         if event.is_dagster_event and event.dagster_event_type in ASSET_CHECK_EVENTS:
             self.store_asset_check_event(event, event_id)
@@ -210,23 +211,44 @@ def store_event(self, event: EventLogEntry) -> None:
     def store_event_batch(self, events: Sequence[EventLogEntry]) -> None:
         check.sequence_param(events, "event", of_type=EventLogEntry)
 
-        check.invariant(
-            all(event.get_dagster_event().event_type in BATCH_WRITABLE_EVENTS for event in events),
-            f"{BATCH_WRITABLE_EVENTS} are the only currently supported events for batch writes.",
-        )
+        # Batches buffered from arbitrary run events (e.g. by the instance write-behind buffer) are
+        # written with a single multi-row insert, notifying each stored event like `store_event`.
+        if not all(
+            event.is_dagster_event and event.get_dagster_event().event_type in BATCH_WRITABLE_EVENTS
+            for event in events
+        ):
+            return self._store_mixed_event_batch(events)
 
         insert_event_statement = self.prepare_insert_event_batch(events)
         with self._connect() as conn:
             result = conn.execute(insert_event_statement.returning(SqlEventLogStorageTable.c.id))
             event_ids = [cast(int, row[0]) for row in result.fetchall()]
 
-        # We only update the asset table with the last event
-        self.store_asset_event(events[-1], event_ids[-1])
+        self._store_asset_index_batch(list(zip(events, event_ids)))
 
-        if any((event_id is None for event_id in event_ids)):
-            raise DagsterInvariantViolationError("Cannot store asset event tags for null event id.")
+    def _store_mixed_event_batch(self, events: Sequence[EventLogEntry]) -> None:
+        insert_event_statement = self.prepare_insert_event_batch(events)
+        with self._connect() as conn:
+            result = conn.execute(
+                insert_event_statement.returning(
+                    SqlEventLogStorageTable.c.run_id, SqlEventLogStorageTable.c.id
+                )
+            )
+            rows = result.fetchall()
+            result.close()
+
+            # LISTEN/NOTIFY no longer used for pg event watch - preserved here to support version skew
+            for run_id, event_id in rows:
+                conn.execute(
+                    db.text(f"""NOTIFY {CHANNEL_NAME}, :notify_id; """),
+                    {"notify_id": run_id + "_" + str(event_id)},
+                )
 
-        self.store_asset_event_tags(events, event_ids)
+        stored = [(entry, cast(int, row[1])) for entry, row in zip(events, rows)]
+        self._store_asset_index_batch(stored)
+        for entry, event_id in stored:
+            if entry.is_dagster_event and entry.dagster_event_type in ASSET_CHECK_EVENTS:
+                self.store_asset_check_event(entry, event_id)
 
     def store_asset_event(self, event: EventLogEntry, event_id: int) -> None:
         check.inst_param(event, "event", EventLogEntry)
@@ -1,5 +1,5 @@
 import zlib
-from typing import ContextManager, Mapping, Optional
+from typing import Any, ContextManager, Mapping, Optional, Sequence
 
 import dagster._check as check
 import sqlalchemy as db
@@ -16,9 +16,8 @@
 from dagster._core.storage.runs.schema import (
     KeyValueStoreTable,
     SnapshotsTable,
-    FlowDefinitionsTable,
     RepoDefinitionsTable,
-    CodePointerTable
+    FlowCompileCacheTable
 )
 from dagster._core.storage.runs.sql_run_storage import SnapshotType
 from dagster._core.storage.sql import (
@@ -110,6 +109,9 @@ def _init_db(self) -> None:
         with self.connect() as conn:
             with conn.begin():
                 RunStorageSqlMetadata.create_all(conn)
+                # indexes added to flow tables after they were first created
+                for index in RepoDefinitionsTable.indexes | FlowCompileCacheTable.indexes:
+                    index.create(conn, checkfirst=True)
                 # This revision may be shared by any other dagster storage classes using the same DB
                 stamp_alembic_rev(pg_alembic_config(__file__), conn)
 
@@ -246,61 +248,21 @@ def alembic_version(self) -> AlembicVersion:
         with self.connect() as conn:
             return check_alembic_revision(alembic_config, conn)
 
-    def add_definition(self, name: str, version: int, definition: str) -> None:
-        tbl = FlowDefinitionsTable
-        query = insert(tbl).values(
-            name=name, version=version, definition=definition
-        ).on_conflict_do_update(
-            index_elements=['name'],
-            set_=dict(version=version, definition=definition)
-        )
-        with self.connect() as conn:
-            conn.execute(query)
-
-    def save_repo_definition(
-        self,
-        flow_name: str,
-        location_name: str,
-        name: str,
-        metadata: str,
-        utilized_env_vars: str,
-        main_key: str,
-        snap_type: str,
-        definition: str,
-    ) -> None:
-        tbl = RepoDefinitionsTable
-        query = insert(tbl).values(
-            flow_name=flow_name,
-            metadata=metadata,
-            utilized_env_vars=utilized_env_vars,
-            location_name=location_name,
-            name=name,
-            snap_type=snap_type,
-            definition=definition,
-            main_key=main_key,
-        ).on_conflict_do_update(
-            index_elements=['name', 'main_key', 'snap_type', 'location_name', 'flow_name'],
-            set_=dict(
-                metadata=metadata,
-                utilized_env_vars=utilized_env_vars,
-                definition=definition,
-            )
-        )
-        with self.connect() as conn:
-            conn.execute(query)
-
-    def save_code_pointer(
+    def _upsert_rows(
         self,
-        repo_name: str,
-        code_pointer: str
+        conn: Connection,
+        table: db.Table,
+        rows: Sequence[Mapping[str, Any]],
+        key_columns: Sequence[str],
+        update_columns: Sequence[str],
     ) -> None:
-        tbl = CodePointerTable
-        query = insert(tbl).values(
-            repo_name=repo_name,
-            code_pointer=code_pointer
-        ).on_conflict_do_update(
-            index_elements=['repo_name'],
-            set_=dict(code_pointer=code_pointer)
+        if not rows:
+            return
+        stmt = insert(table)
+        conn.execute(
+            stmt.on_conflict_do_update(
+                index_elements=list(key_columns),
+                set_={column: stmt.excluded[column] for column in update_columns},
+            ),
+            list(rows),
         )
-        with self.connect() as conn:
-            conn.execute(query)